@@ -0,0 +1,17 @@
+"""
+Performance benchmarks for FinBrickLab.
+
+Run the end-to-end suite from the repository root::
+
+    python -m benchmarks                         # all workloads
+    python -m benchmarks -w household_40y        # one workload
+    python -m benchmarks --quick -o bench.json   # scaled-down smoke run
+
+Primitive micro-benchmarks live in ``benchmarks.micro``::
+
+    python -m benchmarks.micro run -o micro.json
+    python -m benchmarks.micro compare base.json micro.json
+
+Results are written as JSON (see ``harness.write_results``) so runs can be
+compared across commits and releases.
+"""
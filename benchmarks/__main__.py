@@ -0,0 +1,61 @@
+"""
+Command-line entry point: ``python -m benchmarks``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import warnings
+
+from .harness import BenchmarkRunner, results_payload, write_results
+from .workloads import WORKLOADS
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the selected workloads and write a result file."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run the FinBrickLab end-to-end benchmark suite",
+    )
+    parser.add_argument(
+        "-w",
+        "--workload",
+        action="append",
+        choices=sorted(WORKLOADS),
+        help="Workload to run (repeatable; default: all)",
+    )
+    parser.add_argument(
+        "-o", "--output", help="Write results to this JSON file (default: stdout)"
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=3, help="Timed repetitions per operation"
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Scaled-down workloads for smoke runs"
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip tracemalloc peak measurement"
+    )
+    args = parser.parse_args(argv)
+
+    runner = BenchmarkRunner(
+        repeat=args.repeat, memory=not args.no_memory, verbose=bool(args.output)
+    )
+    with warnings.catch_warnings():
+        # Engine warnings (e.g. deprecations) are not part of the measurement
+        warnings.simplefilter("ignore")
+        for name in args.workload or list(WORKLOADS):
+            WORKLOADS[name](runner, args.quick)
+
+    if args.output:
+        write_results(args.output, runner.records)
+    else:
+        json.dump(results_payload(runner.records), sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
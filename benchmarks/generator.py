@@ -0,0 +1,229 @@
+"""
+Synthetic scenario generator for benchmarks.
+
+Builds valid scenarios of arbitrary size from a ``ScenarioShape``: a brick
+count, a kind mix (cash accounts, annuity loans, ETFs, recurring flows and
+recurring transfers), a MacroBrick nesting depth and a horizon. Generation is
+deterministic for a given seed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+
+import numpy as np
+from finbricklab.core.bricks import ABrick, FBrick, LBrick, TBrick
+from finbricklab.core.entity import Entity
+from finbricklab.core.kinds import K
+from finbricklab.core.macrobrick import MacroBrick
+from finbricklab.core.scenario import Scenario
+
+BENCH_START = date(2026, 1, 1)
+
+
+@dataclass(frozen=True)
+class ScenarioShape:
+    """
+    Size and composition of a generated scenario.
+
+    Attributes:
+        bricks: Approximate number of bricks (at least one cash account and one
+            income per cash account are always added)
+        months: Simulation horizon in months
+        mix: Relative weights of 'cash', 'loan', 'etf', 'flow' and 'transfer' bricks
+        macro_depth: Levels of nested MacroBricks over the non-cash bricks (0 = none)
+        macro_fanout: Members per MacroBrick at each level
+    """
+
+    bricks: int
+    months: int
+    mix: dict[str, float] = field(
+        default_factory=lambda: {
+            "cash": 0.1,
+            "loan": 0.15,
+            "etf": 0.25,
+            "flow": 0.35,
+            "transfer": 0.15,
+        }
+    )
+    macro_depth: int = 1
+    macro_fanout: int = 8
+
+    def counts(self) -> dict[str, int]:
+        """Brick count per kind (largest-remainder split of ``bricks``)."""
+        total = sum(self.mix.values())
+        quotas = {kind: self.bricks * w / total for kind, w in self.mix.items()}
+        counts = {kind: int(q) for kind, q in quotas.items()}
+        by_remainder = sorted(quotas, key=lambda k: counts[k] - quotas[k])
+        for kind in by_remainder[: self.bricks - sum(counts.values())]:
+            counts[kind] += 1
+        counts["cash"] = max(counts.get("cash", 0), 1)
+        if counts.get("transfer", 0):
+            # Transfers need two distinct cash accounts
+            counts["cash"] = max(counts["cash"], 2)
+        return counts
+
+
+def _nest(members: list[str], depth: int, fanout: int, prefix: str) -> list[MacroBrick]:
+    """Group members into ``depth`` levels of MacroBricks."""
+    macrobricks: list[MacroBrick] = []
+    for level in range(1, depth + 1):
+        groups = [members[i : i + fanout] for i in range(0, len(members), fanout)]
+        members = []
+        for n, group in enumerate(groups):
+            mb_id = f"{prefix}mb{level}_{n}"
+            macrobricks.append(MacroBrick(id=mb_id, name=mb_id, members=group))
+            members.append(mb_id)
+        if len(members) <= 1:
+            break
+    return macrobricks
+
+
+def generate_scenario(
+    shape: ScenarioShape, seed: int = 0, scenario_id: str = "bench"
+) -> Scenario:
+    """
+    Build a scenario with the given shape.
+
+    Incomes are sized to cover expenses, loan payments, ETF savings plans and
+    transfers, so every cash account stays funded over the horizon.
+
+    Args:
+        shape: Size and composition of the scenario
+        seed: Random seed for amounts and rates
+        scenario_id: Scenario ID (also prefixes MacroBrick IDs)
+
+    Returns:
+        Scenario ready to run from ``BENCH_START`` for ``shape.months``
+    """
+    rng = np.random.default_rng(seed)
+    counts = shape.counts()
+    cash_ids = [f"cash_{i}" for i in range(counts["cash"])]
+
+    bricks: list = [
+        ABrick(
+            id=cash_id,
+            name=f"Cash {i}",
+            kind=K.A_CASH,
+            spec={
+                "initial_balance": float(rng.uniform(20_000, 100_000)),
+                "interest_pa": float(rng.uniform(0.0, 0.03)),
+            },
+        )
+        for i, cash_id in enumerate(cash_ids)
+    ]
+    # Monthly outflow per cash account; loans and ETFs settle on the first one
+    load = dict.fromkeys(cash_ids, 0.0)
+
+    for i in range(counts.get("loan", 0)):
+        principal = float(rng.uniform(5_000, 50_000))
+        term = int(rng.integers(60, 361))
+        bricks.append(
+            LBrick(
+                id=f"loan_{i}",
+                name=f"Loan {i}",
+                kind=K.L_LOAN_ANNUITY,
+                spec={
+                    "principal": principal,
+                    "rate_pa": float(rng.uniform(0.01, 0.06)),
+                    "term_months": term,
+                },
+            )
+        )
+        load[cash_ids[0]] += 2 * principal / term
+
+    for i in range(counts.get("etf", 0)):
+        dca = float(rng.uniform(50, 500))
+        bricks.append(
+            ABrick(
+                id=f"etf_{i}",
+                name=f"ETF {i}",
+                kind=K.A_SECURITY_UNITIZED,
+                spec={
+                    "initial_amount": float(rng.uniform(1_000, 20_000)),
+                    "price0": 100.0,
+                    "drift_pa": float(rng.uniform(0.0, 0.08)),
+                    "dca": {"mode": "amount", "amount": dca},
+                },
+            )
+        )
+        load[cash_ids[0]] += dca
+
+    for i in range(counts.get("transfer", 0)):
+        source, target = rng.choice(len(cash_ids), size=2, replace=False)
+        amount = float(rng.uniform(50, 1_000))
+        bricks.append(
+            TBrick(
+                id=f"transfer_{i}",
+                name=f"Transfer {i}",
+                kind=K.T_TRANSFER_RECURRING,
+                spec={"amount": amount, "frequency": "MONTHLY"},
+                links={"from": cash_ids[source], "to": cash_ids[target]},
+            )
+        )
+        load[cash_ids[source]] += amount
+
+    flows = counts.get("flow", 0)
+    expenses = flows // 2
+    incomes = max(flows - expenses, len(cash_ids))
+    for i in range(expenses):
+        amount = float(rng.uniform(50, 2_000))
+        source = cash_ids[int(rng.integers(len(cash_ids)))]
+        bricks.append(
+            FBrick(
+                id=f"expense_{i}",
+                name=f"Expense {i}",
+                kind=K.F_EXPENSE_RECURRING,
+                spec={"amount_monthly": amount},
+                links={"route": {"to": source}},
+            )
+        )
+        load[source] += amount
+    for i in range(incomes):
+        # Incomes are assigned round-robin and cover their account's load with headroom
+        target = cash_ids[i % len(cash_ids)]
+        share = len(range(i % len(cash_ids), incomes, len(cash_ids)))
+        amount = 1.5 * load[target] / share + float(rng.uniform(100, 1_000))
+        bricks.append(
+            FBrick(
+                id=f"income_{i}",
+                name=f"Income {i}",
+                kind=K.F_INCOME_RECURRING,
+                spec={"amount_monthly": amount},
+                links={"route": {"to": target}},
+            )
+        )
+
+    non_cash = [b.id for b in bricks if b.kind != K.A_CASH]
+    macrobricks = _nest(
+        non_cash, shape.macro_depth, shape.macro_fanout, f"{scenario_id}_"
+    )
+    return Scenario(
+        id=scenario_id,
+        name=scenario_id,
+        bricks=bricks,
+        macrobricks=macrobricks,
+        settlement_default_cash_id=cash_ids[0],
+    )
+
+
+def generate_entity(shape: ScenarioShape, scenarios: int, seed: int = 0) -> Entity:
+    """
+    Build an entity holding ``scenarios`` generated scenarios of the same shape.
+
+    Args:
+        shape: Shape of every scenario
+        scenarios: Number of scenarios
+        seed: Base random seed (scenario ``i`` uses ``seed + i``)
+
+    Returns:
+        Entity holding the generated scenarios
+    """
+    entity = Entity(id="bench_entity", name="Benchmark Entity")
+    for i in range(scenarios):
+        scenario = generate_scenario(shape, seed=seed + i, scenario_id=f"s{i:04d}")
+        # Register like Entity.create_scenario does
+        entity._scenarios[scenario.id] = scenario
+        entity.scenarios.append(scenario)
+    return entity
@@ -0,0 +1,236 @@
+"""
+Measurement helpers and the machine-readable result format.
+
+A result file is a JSON object::
+
+    {
+      "format": "finbricklab.benchmarks",
+      "version": 1,
+      "environment": {...},     # package/library versions, git commit, host
+      "results": [              # one record per (workload, operation)
+        {
+          "workload": "household_40y",
+          "operation": "run",
+          "params": {...},
+          "wall_time_s": {"min": ..., "median": ..., "mean": ..., "repeat": 3},
+          "peak_memory_bytes": ...,        # tracemalloc peak (None if disabled)
+          "journal_entries": ...,          # for operations producing a journal
+          "journal_postings": ...,
+          "memory_report": {...}           # memory workloads: res["meta"]["memory"]
+        }
+      ]
+    }
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import finbricklab
+import numpy as np
+import pandas as pd
+
+RESULTS_FORMAT = "finbricklab.benchmarks"
+RESULTS_VERSION = 1
+
+
+def _git_commit() -> str | None:
+    """Commit of the working tree, if it is a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+        return result.stdout.strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+
+def environment() -> dict[str, Any]:
+    """Versions and host details stored with every result file."""
+    return {
+        "finbricklab": finbricklab.__version__,
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+    }
+
+
+def journal_size(journal: Any) -> dict[str, int]:
+    """Entry and posting counts of a journal (columnar or object-backed)."""
+    if hasattr(journal, "columns"):
+        postings = len(journal.columns()["entry"])
+    else:
+        postings = sum(len(entry.postings) for entry in journal.entries)
+    return {"journal_entries": len(journal.entries), "journal_postings": postings}
+
+
+class BenchmarkRunner:
+    """
+    Times operations and collects one record per measurement.
+
+    Every operation runs ``repeat`` times for wall time and, with ``memory``
+    enabled, once more under ``tracemalloc`` for its peak allocation (kept
+    separate because tracing slows Python code down considerably).
+
+    Attributes:
+        repeat: Timed repetitions per operation
+        memory: Whether to measure peak memory
+        records: Collected result records
+    """
+
+    def __init__(self, repeat: int = 3, memory: bool = True, verbose: bool = False):
+        if repeat < 1:
+            raise ValueError("repeat must be >= 1")
+        self.repeat = repeat
+        self.memory = memory
+        self.verbose = verbose
+        self.records: list[dict[str, Any]] = []
+
+    def measure(
+        self,
+        workload: str,
+        operation: str,
+        fn: Callable[[], Any],
+        params: dict[str, Any] | None = None,
+        journal_of: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """
+        Time ``fn`` and record the result.
+
+        Args:
+            workload: Workload name
+            operation: Operation name within the workload
+            fn: Zero-argument callable performing the operation
+            params: Workload parameters stored with the record
+            journal_of: Extracts the journal from ``fn``'s return value to
+                record its size
+
+        Returns:
+            The return value of the last timed call
+        """
+        times = []
+        value = None
+        for _ in range(self.repeat):
+            value = None
+            gc.collect()
+            start = perf_counter()
+            value = fn()
+            times.append(perf_counter() - start)
+
+        peak = None
+        if self.memory:
+            value = None
+            gc.collect()
+            tracemalloc.start()
+            try:
+                value = fn()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        fields: dict[str, Any] = {
+            "wall_time_s": {
+                "min": min(times),
+                "median": statistics.median(times),
+                "mean": statistics.fmean(times),
+                "repeat": self.repeat,
+            },
+            "peak_memory_bytes": peak,
+        }
+        if journal_of is not None:
+            fields.update(journal_size(journal_of(value)))
+        self.record(workload, operation, params, **fields)
+        return value
+
+    def record(
+        self,
+        workload: str,
+        operation: str,
+        params: dict[str, Any] | None = None,
+        **fields: Any,
+    ) -> dict[str, Any]:
+        """
+        Append a record measured by the caller.
+
+        Args:
+            workload: Workload name
+            operation: Operation name within the workload
+            params: Workload parameters stored with the record
+            **fields: Measurements (e.g. 'wall_time_s', 'peak_memory_bytes')
+
+        Returns:
+            The appended record
+        """
+        record = {
+            "workload": workload,
+            "operation": operation,
+            "params": params or {},
+            **fields,
+        }
+        self.records.append(record)
+        if self.verbose:
+            line = f"{workload:<16} {operation:<18}"
+            if "wall_time_s" in record:
+                line += f" {record['wall_time_s']['min'] * 1e3:10.1f} ms"
+            if record.get("peak_memory_bytes") is not None:
+                line += f"  peak {record['peak_memory_bytes'] / 2**20:8.1f} MiB"
+            print(line)
+        return record
+
+
+def results_payload(records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Result file content for records collected by ``BenchmarkRunner``."""
+    return {
+        "format": RESULTS_FORMAT,
+        "version": RESULTS_VERSION,
+        "environment": environment(),
+        "results": records,
+    }
+
+
+def write_results(path: str | Path, records: list[dict[str, Any]]) -> None:
+    """
+    Write records and the current environment to a result file.
+
+    Args:
+        path: Output JSON file
+        records: Records collected by ``BenchmarkRunner``
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results_payload(records), f, indent=2)
+
+
+def read_results(path: str | Path, fmt: str = RESULTS_FORMAT) -> dict[str, Any]:
+    """
+    Read a result file written by ``write_results``.
+
+    Args:
+        path: Result JSON file
+        fmt: Expected ``format`` header (micro-benchmark files use their own)
+
+    Raises:
+        ValueError: If the file is not a benchmark result file
+    """
+    with open(path, encoding="utf-8") as f:
+        payload = json.load(f)
+    if payload.get("format") != fmt:
+        raise ValueError(f"'{path}' is not a FinBrickLab benchmark result file")
+    return payload
@@ -0,0 +1,484 @@
+"""
+Micro-benchmarks for the journal and currency primitives.
+
+Every strategy leans on a handful of primitives (``Amount`` construction and
+arithmetic, ``create_amount``, ``JournalEntry`` validation, ``Journal.post``,
+metadata stamping, ID generation, ``_norm_ts`` and ``get_node_scope``). Each
+case here times one of them in isolation and reports:
+
+- ``ns_per_op``: best per-call time over ``repeat`` timed batches
+- ``alloc_blocks_per_op`` / ``alloc_bytes_per_op``: memory blocks and bytes
+  still allocated per call after a batch, with every return value kept alive
+  (``tracemalloc``); temporaries freed within the call are not counted
+
+Run and compare from the repository root::
+
+    python -m benchmarks.micro run -o micro.json
+    python -m benchmarks.micro run -c amount_add -c journal_post
+    python -m benchmarks.micro compare base.json micro.json --threshold 0.1
+
+``compare`` exits with status 1 when a case regressed by more than the
+threshold, so it can gate CI jobs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+from finbricklab.core.accounts import AccountRegistry, get_node_scope
+from finbricklab.core.currency import Amount, create_amount, get_currency
+from finbricklab.core.journal import (
+    ColumnarJournal,
+    Journal,
+    JournalEntry,
+    Posting,
+    TransactionFingerprint,
+    _norm_ts,
+    create_operation_id,
+    generate_transaction_id,
+    stamp_entry_metadata,
+    stamp_posting_metadata,
+)
+
+from .harness import environment, read_results
+
+MICRO_FORMAT = "finbricklab.benchmarks.micro"
+MICRO_VERSION = 1
+
+EUR = get_currency("EUR")
+TIMESTAMP = datetime(2026, 3, 1)
+SPEC = {
+    "amount_monthly": 2500.0,
+    "growth_pa": 0.02,
+    "schedule": list(range(24)),
+}
+LINKS = {"route": {"to": "cash_main"}}
+
+
+@dataclass(frozen=True)
+class MicroCase:
+    """
+    One micro-benchmark.
+
+    Attributes:
+        name: Case name (key in result files)
+        group: Primitive family ('currency', 'journal', 'ids', 'accounts')
+        setup: Builds a zero-argument batch that performs ``n`` operations and
+            returns what they produced; called outside the timed region
+    """
+
+    name: str
+    group: str
+    setup: Callable[[int], Callable[[], Any]]
+
+
+def _repeated(fn: Callable[[], Any]) -> Callable[[int], Callable[[], Any]]:
+    """Setup for a stateless operation: call ``fn`` ``n`` times."""
+
+    def setup(n: int) -> Callable[[], Any]:
+        calls = range(n)
+
+        def batch() -> list[Any]:
+            return [fn() for _ in calls]
+
+        return batch
+
+    return setup
+
+
+def _entry(entry_id: str, value: int = 100) -> JournalEntry:
+    """A balanced two-posting entry between two cash-like accounts."""
+    return JournalEntry(
+        id=entry_id,
+        timestamp=TIMESTAMP,
+        postings=[
+            Posting("a:cash", Amount(value, EUR), {"node_id": "a:cash"}),
+            Posting("b:boundary", Amount(-value, EUR), {"node_id": "b:boundary"}),
+        ],
+    )
+
+
+def _post(journal_cls: type[Journal]) -> Callable[[int], Callable[[], Any]]:
+    """Setup posting ``n`` distinct entries into a fresh journal."""
+
+    def setup(n: int) -> Callable[[], Any]:
+        journal = journal_cls()
+        entries = [_entry(f"e{i}", i % 97 + 1) for i in range(n)]
+
+        def batch() -> Journal:
+            for entry in entries:
+                journal.post(entry)
+            return journal
+
+        return batch
+
+    return setup
+
+
+def _stamp_entries(n: int) -> Callable[[], Any]:
+    """Setup stamping metadata on ``n`` fresh entries."""
+    entries = [_entry(f"e{i}") for i in range(n)]
+    tags = {"type": "income"}
+
+    def batch() -> list[JournalEntry]:
+        for sequence, entry in enumerate(entries, start=1):
+            stamp_entry_metadata(entry, "fs:salary", TIMESTAMP, tags, sequence)
+        return entries
+
+    return batch
+
+
+def _stamp_postings(n: int) -> Callable[[], Any]:
+    """Setup stamping metadata on ``n`` fresh postings."""
+    postings = [Posting("b:boundary", Amount(-100, EUR)) for _ in range(n)]
+
+    def batch() -> list[Posting]:
+        for posting in postings:
+            stamp_posting_metadata(
+                posting, "b:boundary", category="income.salary", type_tag="income"
+            )
+        return postings
+
+    return batch
+
+
+def _registry() -> AccountRegistry:
+    """Registry with a few brick accounts, as built by a small scenario."""
+    registry = AccountRegistry()
+    for brick_id, family in [("cash", "a"), ("house", "a"), ("mortgage", "l")]:
+        registry.register_brick_account(brick_id, family, brick_id)
+    return registry
+
+
+def _cases() -> dict[str, MicroCase]:
+    """All micro-benchmark cases by name."""
+    a = Amount(Decimal("1234.56"), EUR)
+    b = Amount(Decimal("78.90"), EUR)
+    postings = [
+        Posting("a:cash", Amount(100, EUR)),
+        Posting("b:boundary", Amount(-100, EUR)),
+    ]
+    fingerprint = TransactionFingerprint(SPEC, LINKS)
+    month = np.datetime64("2026-03", "M")
+    registry = _registry()
+    cases = [
+        MicroCase("amount_from_int", "currency", _repeated(lambda: Amount(1234, EUR))),
+        MicroCase(
+            "amount_from_float", "currency", _repeated(lambda: Amount(1234.56, EUR))
+        ),
+        MicroCase(
+            "amount_from_decimal",
+            "currency",
+            _repeated(lambda: Amount(Decimal("1234.56"), EUR)),
+        ),
+        MicroCase(
+            "amount_from_str", "currency", _repeated(lambda: Amount("1234.56", "EUR"))
+        ),
+        MicroCase("amount_add", "currency", _repeated(lambda: a + b)),
+        MicroCase("amount_sub", "currency", _repeated(lambda: a - b)),
+        MicroCase("amount_neg", "currency", _repeated(lambda: -a)),
+        MicroCase("amount_eq", "currency", _repeated(lambda: a == b)),
+        MicroCase("amount_value", "currency", _repeated(lambda: Amount(1, EUR).value)),
+        MicroCase(
+            "create_amount",
+            "currency",
+            _repeated(lambda: create_amount(1234.56, "EUR")),
+        ),
+        MicroCase(
+            "journal_entry",
+            "journal",
+            _repeated(lambda: JournalEntry("e", TIMESTAMP, postings)),
+        ),
+        MicroCase("journal_post", "journal", _post(Journal)),
+        MicroCase("columnar_journal_post", "journal", _post(ColumnarJournal)),
+        MicroCase("stamp_entry_metadata", "journal", _stamp_entries),
+        MicroCase("stamp_posting_metadata", "journal", _stamp_postings),
+        MicroCase(
+            "generate_transaction_id",
+            "ids",
+            _repeated(
+                lambda: generate_transaction_id("salary", TIMESTAMP, SPEC, LINKS)
+            ),
+        ),
+        MicroCase(
+            "generate_transaction_id_fingerprint",
+            "ids",
+            _repeated(
+                lambda: generate_transaction_id(
+                    "salary", TIMESTAMP, SPEC, LINKS, fingerprint=fingerprint
+                )
+            ),
+        ),
+        MicroCase(
+            "create_operation_id",
+            "ids",
+            _repeated(lambda: create_operation_id("fs:salary", TIMESTAMP)),
+        ),
+        MicroCase("norm_ts_datetime", "ids", _repeated(lambda: _norm_ts(TIMESTAMP))),
+        MicroCase("norm_ts_datetime64", "ids", _repeated(lambda: _norm_ts(month))),
+        MicroCase(
+            "get_node_scope",
+            "accounts",
+            _repeated(lambda: get_node_scope("a:cash", registry)),
+        ),
+        MicroCase(
+            "get_node_scope_default",
+            "accounts",
+            _repeated(lambda: get_node_scope("fs:salary", registry)),
+        ),
+    ]
+    return {case.name: case for case in cases}
+
+
+CASES = _cases()
+
+
+def _time_batch(case: MicroCase, n: int) -> float:
+    """Seconds taken by one batch of ``n`` operations."""
+    batch = case.setup(n)
+    gc.collect()
+    gc.disable()
+    try:
+        start = perf_counter()
+        batch()
+        return perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def _calibrate(case: MicroCase, min_time: float) -> int:
+    """Smallest batch size from 1, 2, 5, 10, 20, ... taking at least ``min_time``."""
+    n = 1
+    while True:
+        for factor in (1, 2, 5):
+            if _time_batch(case, n * factor) >= min_time:
+                return n * factor
+        n *= 10
+
+
+def _allocations(case: MicroCase, n: int) -> tuple[float, float]:
+    """Blocks and bytes still allocated per operation after a batch."""
+    batch = case.setup(n)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = batch()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+    # Ignore the snapshots' own bookkeeping
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = after.filter_traces(ignore).compare_to(
+        before.filter_traces(ignore), "filename"
+    )
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    return blocks / n, size / n
+
+
+def run_case(
+    case: MicroCase, repeat: int = 5, min_time: float = 0.05, alloc_ops: int = 1000
+) -> dict[str, Any]:
+    """
+    Measure one case.
+
+    Args:
+        case: Case to measure
+        repeat: Timed batches; the fastest one is reported
+        min_time: Minimum duration of one timed batch in seconds
+        alloc_ops: Operations in the ``tracemalloc`` batch
+
+    Returns:
+        Result record for the case
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be >= 1")
+    n = _calibrate(case, min_time)
+    times = [_time_batch(case, n) / n for _ in range(repeat)]
+    blocks, size = _allocations(case, alloc_ops)
+    return {
+        "name": case.name,
+        "group": case.group,
+        "ops_per_batch": n,
+        "repeat": repeat,
+        "ns_per_op": min(times) * 1e9,
+        "alloc_blocks_per_op": blocks,
+        "alloc_bytes_per_op": size,
+    }
+
+
+def run_micro(
+    names: list[str] | None = None,
+    repeat: int = 5,
+    min_time: float = 0.05,
+    alloc_ops: int = 1000,
+    verbose: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Measure the selected cases (default: all).
+
+    Returns:
+        One result record per case, in case order
+    """
+    unknown = sorted(set(names or []) - set(CASES))
+    if unknown:
+        raise ValueError(f"Unknown micro-benchmark case(s): {unknown}")
+    records = []
+    for name in names or list(CASES):
+        record = run_case(CASES[name], repeat, min_time, alloc_ops)
+        records.append(record)
+        if verbose:
+            print(
+                f"{name:<38} {record['ns_per_op']:12.1f} ns/op "
+                f"{record['alloc_blocks_per_op']:8.2f} blocks/op "
+                f"{record['alloc_bytes_per_op']:10.1f} B/op"
+            )
+    return records
+
+
+def micro_payload(records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Result file content for records returned by ``run_micro``."""
+    return {
+        "format": MICRO_FORMAT,
+        "version": MICRO_VERSION,
+        "environment": environment(),
+        "results": records,
+    }
+
+
+def compare_results(
+    base: dict[str, Any], new: dict[str, Any], threshold: float = 0.1
+) -> list[dict[str, Any]]:
+    """
+    Diff two micro-benchmark result payloads.
+
+    A case regresses when its time per operation grows by more than
+    ``threshold`` (relative), or when it keeps at least one more block or
+    ``threshold`` more bytes allocated per operation.
+
+    Args:
+        base: Baseline payload (e.g. from the previous release)
+        new: Payload to judge
+        threshold: Relative increase tolerated before flagging
+
+    Returns:
+        One row per case present in both payloads, with the relative time
+        change (``time_change``), allocation deltas and ``regressed`` flags
+    """
+    base_by_name = {record["name"]: record for record in base["results"]}
+    rows = []
+    for record in new["results"]:
+        old = base_by_name.get(record["name"])
+        if old is None:
+            continue
+        time_change = record["ns_per_op"] / old["ns_per_op"] - 1
+        blocks_delta = record["alloc_blocks_per_op"] - old["alloc_blocks_per_op"]
+        bytes_delta = record["alloc_bytes_per_op"] - old["alloc_bytes_per_op"]
+        time_regressed = time_change > threshold
+        alloc_regressed = blocks_delta >= 1 or bytes_delta > threshold * max(
+            old["alloc_bytes_per_op"], 1
+        )
+        rows.append(
+            {
+                "name": record["name"],
+                "base_ns_per_op": old["ns_per_op"],
+                "ns_per_op": record["ns_per_op"],
+                "time_change": time_change,
+                "alloc_blocks_delta": blocks_delta,
+                "alloc_bytes_delta": bytes_delta,
+                "time_regressed": time_regressed,
+                "alloc_regressed": alloc_regressed,
+                "regressed": time_regressed or alloc_regressed,
+            }
+        )
+    return rows
+
+
+def _print_comparison(rows: list[dict[str, Any]]) -> None:
+    """Print a comparison table, regressions marked with '!'."""
+    print(f"{'case':<38} {'base ns':>10} {'new ns':>10} {'change':>8}  allocs")
+    for row in rows:
+        mark = "!" if row["regressed"] else " "
+        print(
+            f"{mark}{row['name']:<37} {row['base_ns_per_op']:10.1f} "
+            f"{row['ns_per_op']:10.1f} {row['time_change']:+8.1%}  "
+            f"{row['alloc_blocks_delta']:+.2f} blocks {row['alloc_bytes_delta']:+.1f} B"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run micro-benchmarks or compare two result files."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.micro",
+        description="Micro-benchmarks for FinBrickLab journal and currency primitives",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Measure cases and write a result file")
+    run.add_argument(
+        "-c",
+        "--case",
+        action="append",
+        choices=list(CASES),
+        help="Case to run (repeatable; default: all)",
+    )
+    run.add_argument(
+        "-o", "--output", help="Write results to this JSON file (default: stdout)"
+    )
+    run.add_argument("-r", "--repeat", type=int, default=5, help="Timed batches")
+    run.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="Minimum seconds per timed batch",
+    )
+
+    compare = commands.add_parser("compare", help="Diff two result files")
+    compare.add_argument("base", help="Baseline result file")
+    compare.add_argument("new", help="Result file to judge")
+    compare.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative increase flagged as a regression (default: 0.1)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        rows = compare_results(
+            read_results(args.base, MICRO_FORMAT),
+            read_results(args.new, MICRO_FORMAT),
+            args.threshold,
+        )
+        _print_comparison(rows)
+        return 1 if any(row["regressed"] for row in rows) else 0
+
+    records = run_micro(
+        args.case, args.repeat, args.min_time, verbose=bool(args.output)
+    )
+    if args.output:
+        with open(Path(args.output), "w", encoding="utf-8") as f:
+            json.dump(micro_payload(records), f, indent=2)
+    else:
+        json.dump(micro_payload(records), sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
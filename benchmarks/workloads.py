@@ -0,0 +1,141 @@
+"""
+Standard end-to-end workloads.
+
+- ``household_40y``: a small household (cash, loans, ETFs, flows, transfers)
+  over 40 years
+- ``portfolio_1k``: a 1,000-brick portfolio with three MacroBrick levels
+- ``entity_200``: an entity of 200 small scenarios, run and compared
+- ``memory_100y``: a few hundred bricks over 1,200 months, run with
+  ``memory_report=True``
+- ``memory_wide``: 2,000 bricks over 20 years, run with ``memory_report=True``
+
+Each workload measures ``Scenario.run`` and the operations users call on its
+results; the memory workloads record ``res["meta"]["memory"]`` instead of
+repeated timings. ``quick=True`` scales every workload down for smoke runs.
+"""
+
+from __future__ import annotations
+
+import tempfile
+from collections.abc import Callable
+from dataclasses import asdict
+from pathlib import Path
+from time import perf_counter
+
+from finbricklab.core.scenario import export_ledger_csv, export_run_json
+
+from .generator import BENCH_START, ScenarioShape, generate_entity, generate_scenario
+from .harness import BenchmarkRunner, journal_size
+
+
+def _scenario_workload(
+    runner: BenchmarkRunner, name: str, shape: ScenarioShape, seed: int = 0
+) -> None:
+    """Measure run, filter, journal() and both exporters on one scenario."""
+    params = asdict(shape)
+    scenario = generate_scenario(shape, seed=seed, scenario_id=name)
+
+    def run() -> dict:
+        res = scenario.run(start=BENCH_START, months=shape.months)
+        res["totals"]  # computed on first access; part of a run's cost
+        return res
+
+    results = runner.measure(
+        name,
+        "run",
+        run,
+        params=params,
+        journal_of=lambda res: res["journal"],
+    )
+    views = results["views"]
+    half = [brick.id for brick in scenario.bricks[::2]]
+    runner.measure(
+        name, "filter", lambda: views.filter(brick_ids=half).monthly(), params=params
+    )
+    runner.measure(name, "journal", views.journal, params=params)
+    with tempfile.TemporaryDirectory() as tmp:
+        runner.measure(
+            name,
+            "export_run_json",
+            lambda: export_run_json(str(Path(tmp) / "run.json"), scenario, results),
+            params=params,
+        )
+        runner.measure(
+            name,
+            "export_ledger_csv",
+            lambda: export_ledger_csv(str(Path(tmp) / "ledger.csv"), results),
+            params=params,
+        )
+
+
+def household_40y(runner: BenchmarkRunner, quick: bool = False) -> None:
+    """A household of a dozen bricks over 40 years."""
+    shape = ScenarioShape(bricks=12, months=120 if quick else 480, macro_depth=2)
+    _scenario_workload(runner, "household_40y", shape)
+
+
+def portfolio_1k(runner: BenchmarkRunner, quick: bool = False) -> None:
+    """A wide portfolio of 1,000 bricks over 10 years."""
+    shape = ScenarioShape(
+        bricks=100 if quick else 1000, months=36 if quick else 120, macro_depth=3
+    )
+    _scenario_workload(runner, "portfolio_1k", shape)
+
+
+def entity_200(runner: BenchmarkRunner, quick: bool = False) -> None:
+    """An entity of 200 scenarios: run them all, then Entity.compare."""
+    shape = ScenarioShape(bricks=15, months=36 if quick else 120)
+    count = 10 if quick else 200
+    params = {**asdict(shape), "scenarios": count}
+    entity = generate_entity(shape, count)
+    ids = [scenario.id for scenario in entity.scenarios]
+    runner.measure(
+        "entity_200",
+        "run",
+        lambda: entity.run_many(ids, start=BENCH_START, months=shape.months),
+        params=params,
+    )
+    runner.measure("entity_200", "compare", entity.compare, params=params)
+
+
+def _memory_workload(runner: BenchmarkRunner, name: str, shape: ScenarioShape) -> None:
+    """Run once with a memory report and record where the memory goes."""
+    scenario = generate_scenario(shape, scenario_id=name)
+    start = perf_counter()
+    results = scenario.run(start=BENCH_START, months=shape.months, memory_report=True)
+    seconds = perf_counter() - start
+    report = results["meta"]["memory"]
+    runner.record(
+        name,
+        "run_memory_report",
+        asdict(shape),
+        wall_time_s={"min": seconds, "median": seconds, "mean": seconds, "repeat": 1},
+        peak_memory_bytes=report["peak_bytes"],
+        **journal_size(results["journal"]),
+        memory_report=report,
+    )
+
+
+def memory_100y(runner: BenchmarkRunner, quick: bool = False) -> None:
+    """A 100-year intergenerational run of a few hundred bricks."""
+    shape = ScenarioShape(
+        bricks=30 if quick else 300, months=120 if quick else 1200, macro_depth=2
+    )
+    _memory_workload(runner, "memory_100y", shape)
+
+
+def memory_wide(runner: BenchmarkRunner, quick: bool = False) -> None:
+    """A wide portfolio of 2,000 bricks over 20 years."""
+    shape = ScenarioShape(
+        bricks=200 if quick else 2000, months=24 if quick else 240, macro_depth=3
+    )
+    _memory_workload(runner, "memory_wide", shape)
+
+
+WORKLOADS: dict[str, Callable[[BenchmarkRunner, bool], None]] = {
+    "household_40y": household_40y,
+    "portfolio_1k": portfolio_1k,
+    "entity_200": entity_200,
+    "memory_100y": memory_100y,
+    "memory_wide": memory_wide,
+}
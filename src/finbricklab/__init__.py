@@ -94,10 +94,13 @@ from .core import (
     IValuationStrategy,
     LBrick,
     MacroBrick,
+    PathsOutput,
     PrincipalLink,
     Registry,
+    ResultCache,
     Scenario,
     ScenarioContext,
+    ScenarioPlan,
     ScheduleRegistry,
     StartLink,
     TBrick,
@@ -170,7 +173,10 @@ __all__ = [
     "TBrick",
     "Scenario",
     "ScenarioContext",
+    "ScenarioPlan",
+    "ResultCache",
     "BrickOutput",
+    "PathsOutput",
     "Event",
     # Entity system
     "Entity",
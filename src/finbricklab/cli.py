@@ -9,7 +9,7 @@ import json
 import sys
 from datetime import date
 
-from finbricklab import Scenario
+from finbricklab import ResultCache, Scenario
 
 
 def _load_json(path: str) -> dict:
@@ -228,10 +228,13 @@ def cmd_run(args) -> int:
         # Create scenario using from_dict method
         scn = Scenario.from_dict(cfg)
 
-        # Run simulation
+        # Run simulation (through the on-disk result cache if configured)
         start_date = date.fromisoformat(args.start)
         selection = args.select if args.select else None
-        res = scn.run(start=start_date, months=args.months, selection=selection)
+        cache = ResultCache(directory=args.cache_dir) if args.cache_dir else None
+        res = scn.run(
+            start=start_date, months=args.months, selection=selection, cache=cache
+        )
 
         # Print execution summary
         _print_execution_summary(res, selection)
@@ -643,6 +646,10 @@ def main() -> None:
         default="BOUNDARY_ONLY",
         help="Transfer visibility setting (default: BOUNDARY_ONLY)",
     )
+    run_parser.add_argument(
+        "--cache-dir",
+        help="Reuse results of identical earlier runs stored in this directory",
+    )
     run_parser.epilog = """
 Aggregation Semantics:
   • Per-MacroBrick view: sums all executed member bricks of that MacroBrick
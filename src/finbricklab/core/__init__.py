@@ -15,16 +15,20 @@ from .bricks import (
     ValuationRegistry,
     wire_strategies,
 )
+from .cache import ResultCache, scenario_cache_key
 from .context import ScenarioContext
 from .errors import ConfigError
 from .events import Event
 from .interfaces import IFlowStrategy, IScheduleStrategy, IValuationStrategy
 from .links import PrincipalLink, StartLink
 from .macrobrick import MacroBrick
+from .plan import ScenarioPlan
 from .registry import Registry
 from .results import (
     BrickOutput,
+    LazyResults,
     NumpyEncoder,
+    PathsOutput,
     ScenarioResults,
     aggregate_totals,
     finalize_totals,
@@ -52,12 +56,17 @@ __all__ = [
     # Events and Results
     "Event",
     "BrickOutput",
+    "PathsOutput",
     "ScenarioResults",
+    "LazyResults",
     "NumpyEncoder",
     "aggregate_totals",
     "finalize_totals",
     # Context
     "ScenarioContext",
+    "ScenarioPlan",
+    "ResultCache",
+    "scenario_cache_key",
     # Interfaces
     "IValuationStrategy",
     "IScheduleStrategy",
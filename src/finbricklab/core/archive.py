@@ -0,0 +1,528 @@
+"""
+Binary on-disk format for scenario results.
+
+``ScenarioResults.save(path)`` writes a directory that ``ScenarioResults.load``
+opens again without re-simulating:
+
+- ``manifest.json``: format version, time index, totals columns, output
+  layout and the file name of every array
+- ``arrays/*.npy``: one uncompressed NumPy array per totals column, output
+  field and journal column (loaded with ``np.load(mmap_mode="r")``)
+- ``objects.json``: plain brick and MacroBrick descriptions (id, kind, spec,
+  links, ...), output events and view defaults
+- ``journal.json``: dictionaries of the columnar journal (account IDs,
+  currency codes, timestamp kinds, metadata values), account registry and
+  balances; timestamps themselves are an int64 array in ``arrays/``
+
+The archive holds only JSON and ``.npy`` files, never pickles, so it does not
+depend on the names or layout of FinBrickLab classes. Non-JSON values (dates,
+decimals, tuples, events) are written as single-key objects tagged with their
+type; values of any other type cannot be saved.
+
+Output arrays are memory-mapped, so only the pages a view touches are read.
+The journal is rebuilt from its columns when it is first accessed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from array import array
+from datetime import date, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from .accounts import Account, AccountRegistry, AccountScope, AccountType
+from .bricks import ABrick, FBrick, LBrick, TBrick
+from .currency import Currency, RoundingPolicy, get_currency
+from .events import Event
+from .macrobrick import MacroBrick
+from .registry import Registry
+from .results import is_shared_zeros
+from .transfer_visibility import TransferVisibility
+
+if TYPE_CHECKING:
+    from .journal import ColumnarJournal
+    from .results import ScenarioResults
+
+FORMAT_NAME = "finbricklab.results"
+FORMAT_VERSION = 2
+
+# Brick attributes stored per family; strategy objects are rebuilt from kind
+_BRICK_FIELDS = (
+    "id",
+    "name",
+    "kind",
+    "currency",
+    "spec",
+    "links",
+    "start_date",
+    "end_date",
+    "duration_m",
+)
+_BRICK_CLASSES = {"a": ABrick, "l": LBrick, "f": FBrick, "t": TBrick}
+
+# Top-level files of an archive (arrays/ holds the rest)
+_ARCHIVE_FILES = ("manifest.json", "objects.json", "journal.json")
+
+_TIMESTAMP_TYPES = {"datetime": datetime, "date": date, "Timestamp": pd.Timestamp}
+
+# ColumnarJournal array columns and the NumPy dtype of their typecode
+_JOURNAL_COLUMNS = {
+    "_entry_month": np.int32,
+    "_entry_ts": np.int32,
+    "_entry_offset": np.int32,
+    "_posting_entry": np.int32,
+    "_posting_account": np.int32,
+    "_posting_minor": np.int64,
+    "_posting_currency": np.int32,
+}
+
+
+def _encode(value: Any) -> Any:
+    """Convert a value to JSON, tagging non-JSON types with their name."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (np.bool_, np.integer, np.floating)):
+        return value.item()
+    if isinstance(value, dict):
+        return {"dict": [[_encode(k), _encode(v)] for k, v in value.items()]}
+    if isinstance(value, list):
+        return {"list": [_encode(v) for v in value]}
+    if isinstance(value, Event):
+        return {"event": [_encode(v) for v in value]}
+    if isinstance(value, tuple):
+        return {"tuple": [_encode(v) for v in value]}
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    if isinstance(value, np.datetime64):
+        return {"datetime64": str(value)}
+    if isinstance(value, Decimal):
+        return {"decimal": str(value)}
+    raise ValueError(f"Cannot save value of type {type(value).__name__}: {value!r}")
+
+
+def _decode(value: Any) -> Any:
+    """Rebuild a value written by ``_encode``."""
+    if not isinstance(value, dict):
+        return value
+    ((tag, payload),) = value.items()
+    if tag == "dict":
+        return {_decode(k): _decode(v) for k, v in payload}
+    if tag == "list":
+        return [_decode(v) for v in payload]
+    if tag == "event":
+        return Event(*(_decode(v) for v in payload))
+    if tag == "tuple":
+        return tuple(_decode(v) for v in payload)
+    if tag == "datetime":
+        return datetime.fromisoformat(payload)
+    if tag == "date":
+        return date.fromisoformat(payload)
+    if tag == "datetime64":
+        return np.datetime64(payload)
+    if tag == "decimal":
+        return Decimal(payload)
+    raise ValueError(f"Unknown value tag '{tag}' in results archive")
+
+
+def _describe_registry(registry: Registry) -> dict[str, Any]:
+    """Describe bricks and MacroBricks by their plain attributes."""
+    bricks = []
+    for _, brick in registry.iter_bricks():
+        description = {"family": brick.family}
+        description.update(
+            {field: _encode(getattr(brick, field)) for field in _BRICK_FIELDS}
+        )
+        if isinstance(brick, TBrick):
+            description["transparent"] = brick.transparent
+        bricks.append(description)
+    macrobricks = [
+        {"id": mb.id, "name": mb.name, "members": mb.members, "tags": mb.tags}
+        for _, mb in registry.iter_macrobricks()
+    ]
+    return {"bricks": bricks, "macrobricks": macrobricks}
+
+
+def _build_registry(description: dict[str, Any]) -> Registry:
+    """Rebuild a Registry from ``_describe_registry`` output."""
+    bricks = {}
+    for brick in description["bricks"]:
+        fields = {key: _decode(value) for key, value in brick.items()}
+        brick_class = _BRICK_CLASSES[fields.pop("family")]
+        bricks[fields["id"]] = brick_class(**fields)
+    macrobricks = {mb["id"]: MacroBrick(**mb) for mb in description["macrobricks"]}
+    return Registry(bricks, macrobricks)
+
+
+def _timestamp_ticks(values: list[tuple[type, Any]]) -> tuple[list[str], list[int]]:
+    """Split (type, timestamp) dictionary values into kinds and int64 ticks."""
+    kinds, ticks = [], []
+    for kind, ts in values:
+        if kind is np.datetime64:
+            unit = np.datetime_data(ts.dtype)[0]
+            kinds.append(f"datetime64[{unit}]")
+            ticks.append(int(ts.astype(np.int64)))
+        elif _TIMESTAMP_TYPES.get(kind.__name__) is kind and not getattr(
+            ts, "tzinfo", None
+        ):
+            kinds.append(kind.__name__)
+            ticks.append(int(np.datetime64(ts, "us").astype(np.int64)))
+        else:
+            raise ValueError(f"Cannot save journal timestamp {ts!r}")
+    return kinds, ticks
+
+
+def _timestamp(kind: str, tick: int) -> tuple[type, Any]:
+    """Rebuild the (type, timestamp) dictionary value of one tick."""
+    if kind.startswith("datetime64["):
+        return np.datetime64, np.datetime64(tick, kind[len("datetime64[") : -1])
+    value = np.datetime64(tick, "us").astype(datetime)
+    if kind == "date":
+        value = value.date()
+    elif kind == "Timestamp":
+        value = pd.Timestamp(value)
+    return _TIMESTAMP_TYPES[kind], value
+
+
+def _fill_dictionary(dictionary: Any, values: list[Any], keys: list[Any]) -> None:
+    """Restore a journal ``_Dictionary`` from its values and lookup keys."""
+    dictionary.values = values
+    dictionary._codes = {}
+    for code, key in enumerate(keys):
+        try:
+            dictionary._codes.setdefault(key, code)
+        except TypeError:
+            continue  # Unhashable metadata values are never looked up
+
+
+class _ArrayWriter:
+    """Writes arrays as numbered .npy files and remembers their names."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._count = 0
+        self._shared: dict[int, str] = {}  # length -> file of shared zeros
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, values: Any, dtype: Any = None) -> str:
+        # Shared zero arrays of shell outputs are written once per length
+        shared = isinstance(values, np.ndarray) and is_shared_zeros(values)
+        if shared and len(values) in self._shared:
+            return self._shared[len(values)]
+        name = f"a{self._count:06d}.npy"
+        if shared:
+            self._shared[len(values)] = name
+        self._count += 1
+        np.save(
+            os.path.join(self.directory, name),
+            np.asarray(values, dtype=dtype),
+            allow_pickle=False,
+        )
+        return name
+
+
+def _journal_arrays(
+    journal: ColumnarJournal, writer: _ArrayWriter
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Write the columns of a journal; return (manifest part, journal.json)."""
+    from .journal import _thaw
+
+    columns = {
+        attr: writer.write(np.frombuffer(getattr(journal, attr), dtype=dtype))
+        for attr, dtype in _JOURNAL_COLUMNS.items()
+    }
+    meta_columns = {}
+    for attr in ("_entry_meta", "_posting_meta"):
+        meta = getattr(journal, attr)
+        meta_columns[attr] = {
+            key: writer.write(np.frombuffer(codes, dtype=np.int32))
+            for key, codes in meta.codes.items()
+        }
+    timestamp_kinds, ticks = _timestamp_ticks(journal._timestamps.values)
+    manifest = {
+        "entries": len(journal._entry_ids),
+        "entry_ids": writer.write(journal._entry_ids, dtype=str),
+        "timestamps": writer.write(ticks, dtype=np.int64),
+        "columns": columns,
+        "metadata": meta_columns,
+    }
+
+    registry = journal.account_registry
+    dictionaries = {
+        "timestamp_kinds": timestamp_kinds,
+        "accounts": journal._accounts.values,
+        "currencies": [
+            [currency.code, currency.decimals, currency.rounding.name]
+            for currency in journal._currencies.values
+        ],
+        "account_registry": (
+            [
+                [a.id, a.name, a.scope.value, a.account_type.value, a.currency]
+                for a in registry._accounts.values()
+            ]
+            if registry is not None
+            else None
+        ),
+        "balances": {
+            account_id: {code: str(value) for code, value in balances.items()}
+            for account_id, balances in journal._balances.items()
+        },
+        "metadata": {
+            attr: {
+                "rows": getattr(journal, attr)._rows,
+                "values": {
+                    key: [_encode(_thaw(value)) for value in dictionary.values]
+                    for key, dictionary in getattr(journal, attr).dictionaries.items()
+                },
+            }
+            for attr in ("_entry_meta", "_posting_meta")
+        },
+    }
+    return manifest, dictionaries
+
+
+def _load_journal(path: str, manifest: dict[str, Any]) -> ColumnarJournal:
+    """Rebuild a ColumnarJournal from its saved columns and dictionaries."""
+    from .journal import ColumnarJournal, _Dictionary, _freeze, _norm_ts
+
+    arrays = os.path.join(path, "arrays")
+    with open(os.path.join(path, "journal.json"), encoding="utf-8") as f:
+        dictionaries = json.load(f)
+
+    def _column(name: str, typecode: str) -> array:
+        column = array(typecode)
+        column.frombytes(np.load(os.path.join(arrays, name)).tobytes())
+        return column
+
+    account_registry = None
+    if dictionaries["account_registry"] is not None:
+        account_registry = AccountRegistry()
+        for account_id, name, scope, account_type, currency in dictionaries[
+            "account_registry"
+        ]:
+            account_registry.register_account(
+                Account(
+                    account_id,
+                    name,
+                    AccountScope(scope),
+                    AccountType(account_type),
+                    currency,
+                )
+            )
+
+    journal = ColumnarJournal(account_registry)
+    journal._entry_ids = np.load(os.path.join(arrays, manifest["entry_ids"])).tolist()
+    journal._id_index = set(journal._entry_ids)
+    journal._balances = {
+        account_id: {code: Decimal(value) for code, value in balances.items()}
+        for account_id, balances in dictionaries["balances"].items()
+    }
+    for attr, name in manifest["columns"].items():
+        typecode = "q" if _JOURNAL_COLUMNS[attr] is np.int64 else "i"
+        setattr(journal, attr, _column(name, typecode))
+    for attr, codes in manifest["metadata"].items():
+        meta = getattr(journal, attr)
+        saved = dictionaries["metadata"][attr]
+        meta._rows = saved["rows"]
+        meta.codes = {key: _column(name, "i") for key, name in codes.items()}
+        meta.dictionaries = {}
+        for key, values in saved["values"].items():
+            frozen = []
+            for value in values:
+                value = _decode(value)
+                try:
+                    frozen.append(_freeze(value))
+                except TypeError:
+                    frozen.append((object, value))
+            meta.dictionaries[key] = dictionary = _Dictionary()
+            _fill_dictionary(dictionary, frozen, frozen)
+
+    ticks = np.load(os.path.join(arrays, manifest["timestamps"])).tolist()
+    timestamps = [
+        _timestamp(kind, tick)
+        for kind, tick in zip(dictionaries["timestamp_kinds"], ticks, strict=True)
+    ]
+    _fill_dictionary(journal._timestamps, timestamps, timestamps)
+    journal._timestamp_months = [
+        int(_norm_ts(ts).astype(np.int64)) for _, ts in timestamps
+    ]
+    accounts = dictionaries["accounts"]
+    _fill_dictionary(journal._accounts, accounts, accounts)
+    currencies = []
+    for code, decimals, rounding in dictionaries["currencies"]:
+        currency = get_currency(code)
+        if (currency.decimals, currency.rounding.name) != (decimals, rounding):
+            currency = Currency(code, decimals, RoundingPolicy[rounding])
+        currencies.append(currency)
+    _fill_dictionary(
+        journal._currencies,
+        currencies,
+        [(c.code, c.decimals, c.rounding) for c in currencies],
+    )
+    journal._revision += 1
+    return journal
+
+
+def save_results(results: ScenarioResults, path: str) -> None:
+    """
+    Write results to a directory (see module docstring for the layout).
+
+    Args:
+        results: Results to save
+        path: Target directory (created if missing; an archive already in it
+            is removed first, other files are left alone)
+    """
+    from .journal import ColumnarJournal
+
+    os.makedirs(path, exist_ok=True)
+    # The manifest goes first so an interrupted save never looks complete
+    for name in _ARCHIVE_FILES:
+        if os.path.exists(os.path.join(path, name)):
+            os.remove(os.path.join(path, name))
+    shutil.rmtree(os.path.join(path, "arrays"), ignore_errors=True)
+    writer = _ArrayWriter(os.path.join(path, "arrays"))
+
+    totals = results._monthly_data
+    manifest: dict[str, Any] = {
+        "format": FORMAT_NAME,
+        "version": FORMAT_VERSION,
+        "index": [str(period) for period in totals.index],
+        "totals": [[column, writer.write(totals[column])] for column in totals],
+        "outputs": None,
+        "journal": None,
+    }
+
+    output_objects = None
+    if results._outputs is not None:
+        manifest["outputs"] = {}
+        output_objects = {}
+        for brick_id, output in results._outputs.items():
+            manifest["outputs"][brick_id] = {
+                key: writer.write(value)
+                for key, value in output.items()
+                if isinstance(value, np.ndarray) and value.dtype != object
+            }
+            output_objects[brick_id] = {
+                key: _encode(value)
+                for key, value in output.items()
+                if key not in manifest["outputs"][brick_id]
+            }
+
+    journal = results._journal
+    if journal is not None:
+        if not isinstance(journal, ColumnarJournal):
+            journal = ColumnarJournal.from_journal(journal)
+        manifest["journal"], dictionaries = _journal_arrays(journal, writer)
+        with open(os.path.join(path, "journal.json"), "w", encoding="utf-8") as f:
+            json.dump(dictionaries, f)
+
+    registry = results._registry
+    objects = {
+        "registry": _describe_registry(registry) if registry is not None else None,
+        "outputs": output_objects,
+        "default_selection": (
+            sorted(results._default_selection)
+            if results._default_selection is not None
+            else None
+        ),
+        "default_visibility": (
+            results._default_visibility.name
+            if results._default_visibility is not None
+            else None
+        ),
+        "include_cash": results._include_cash,
+    }
+    with open(os.path.join(path, "objects.json"), "w", encoding="utf-8") as f:
+        json.dump(objects, f)
+    with open(os.path.join(path, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+
+
+def load_results(path: str, mmap: bool = True) -> ScenarioResults:
+    """
+    Open results written by ``save_results``.
+
+    Args:
+        path: Directory written by ``save_results``
+        mmap: Memory-map output arrays (read-only) instead of reading them
+
+    Returns:
+        ScenarioResults whose journal is loaded on first access
+
+    Raises:
+        ValueError: If the directory does not hold a supported results archive
+    """
+    from .results import ScenarioResults
+
+    with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != FORMAT_NAME:
+        raise ValueError(f"'{path}' is not a FinBrickLab results archive")
+    if manifest.get("version") != FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported results archive version {manifest.get('version')} "
+            f"(expected {FORMAT_VERSION})"
+        )
+
+    arrays = os.path.join(path, "arrays")
+    mmap_mode = "r" if mmap else None
+
+    loaded: dict[str, np.ndarray] = {}
+
+    def _array(name: str) -> np.ndarray:
+        # Files shared by several outputs (zero arrays) are opened once
+        if name not in loaded:
+            loaded[name] = np.load(os.path.join(arrays, name), mmap_mode=mmap_mode)
+        return loaded[name]
+
+    with open(os.path.join(path, "objects.json"), encoding="utf-8") as f:
+        objects = json.load(f)
+
+    totals = pd.DataFrame(
+        {column: np.asarray(_array(name)) for column, name in manifest["totals"]},
+        index=pd.PeriodIndex(manifest["index"], freq="M"),
+    )
+
+    outputs = None
+    if manifest["outputs"] is not None:
+        outputs = {
+            brick_id: {
+                **{key: _array(name) for key, name in fields.items()},
+                **{
+                    key: _decode(value)
+                    for key, value in objects["outputs"][brick_id].items()
+                },
+            }
+            for brick_id, fields in manifest["outputs"].items()
+        }
+
+    results = ScenarioResults(
+        totals,
+        registry=(
+            _build_registry(objects["registry"])
+            if objects["registry"] is not None
+            else None
+        ),
+        outputs=outputs,
+        default_selection=(
+            set(objects["default_selection"])
+            if objects["default_selection"] is not None
+            else None
+        ),
+        default_visibility=(
+            TransferVisibility[objects["default_visibility"]]
+            if objects["default_visibility"] is not None
+            else None
+        ),
+        include_cash=objects["include_cash"],
+    )
+    if manifest["journal"] is not None:
+        results._journal_loader = lambda: _load_journal(path, manifest["journal"])
+    return results
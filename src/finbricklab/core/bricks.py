@@ -167,6 +167,8 @@ class ABrick(FinBrickABC):
             raise ConfigError(
                 f"Asset brick '{self.id}' ({self.kind}) has no valuation strategy configured"
             )
+        # The spec may have changed since the last pass
+        ctx.fingerprints.pop(self.id, None)
         return self.valuation.simulate(self, ctx)
 
 
@@ -226,6 +228,8 @@ class LBrick(FinBrickABC):
             raise ConfigError(
                 f"Liability brick '{self.id}' ({self.kind}) has no schedule strategy configured"
             )
+        # The spec may have changed since the last pass
+        ctx.fingerprints.pop(self.id, None)
         return self.schedule.simulate(self, ctx)
 
 
@@ -285,6 +289,8 @@ class FBrick(FinBrickABC):
             raise ConfigError(
                 f"Flow brick '{self.id}' ({self.kind}) has no flow strategy configured"
             )
+        # The spec may have changed since the last pass
+        ctx.fingerprints.pop(self.id, None)
         return self.flow.simulate(self, ctx)
 
 
@@ -347,6 +353,8 @@ class TBrick(FinBrickABC):
             raise ConfigError(
                 f"Transfer brick '{self.id}' ({self.kind}) has no transfer strategy configured"
             )
+        # The spec may have changed since the last pass
+        ctx.fingerprints.pop(self.id, None)
         return self.transfer.simulate(self, ctx)
 
 
@@ -0,0 +1,250 @@
+"""
+Content-addressed cache of scenario results.
+
+``Scenario.run(..., cache=ResultCache())`` keys each run by a stable hash of
+the scenario definition (brick kinds, specs, links and windows, MacroBricks,
+currency and output-relevant config) and the run arguments. A repeated
+request returns the stored outputs, totals and journal without simulating.
+Keys only depend on content, so a scenario rebuilt with ``Scenario.from_dict``
+(e.g. by the CLI) hits entries stored by an equal scenario.
+
+Results are kept in a bounded in-memory LRU tier and, optionally, in an
+on-disk tier (one pickle file per key) that survives the process.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from .scenario import Scenario
+
+# Bump when the cached payload or the key rendering changes
+CACHE_FORMAT_VERSION = 3
+
+# ScenarioConfig fields that never change run results (all others are keyed)
+_UNKEYED_CONFIG_FIELDS = frozenset({"warn_on_overlap", "profile_trace_path"})
+
+
+def _canonical(value: Any) -> Any:
+    """
+    Render a spec/links value as JSON-compatible data with a stable ordering.
+
+    Raises:
+        TypeError: If the value has no rendering that reflects its state
+            (e.g. an arbitrary object, whose ``repr`` may not change when it
+            is mutated)
+    """
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, dict):
+        return {
+            "__dict__": sorted(
+                ([_canonical(k), _canonical(v)] for k, v in value.items()),
+                key=lambda item: json.dumps(item[0], sort_keys=True),
+            )
+        }
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return {"__set__": sorted(json.dumps(_canonical(v)) for v in value)}
+    if isinstance(value, np.ndarray):
+        data = np.ascontiguousarray(value)
+        return {
+            "__ndarray__": [
+                str(data.dtype),
+                list(data.shape),
+                hashlib.sha256(data.tobytes()).hexdigest(),
+            ]
+        }
+    if isinstance(value, np.generic):
+        return _canonical(value.item())
+    if isinstance(value, (datetime, date, pd.Timestamp)):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"__decimal__": str(value)}
+    if isinstance(value, Enum):
+        return {"__enum__": f"{type(value).__name__}.{value.name}"}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "__dataclass__": type(value).__name__,
+            "fields": _canonical(
+                {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+            ),
+        }
+    raise TypeError(f"Cannot derive a cache key from a {type(value).__name__} value")
+
+
+def scenario_cache_key(
+    scenario: Scenario,
+    start: date,
+    months: int,
+    selection: list[str] | None = None,
+    include_cash: bool = True,
+) -> str:
+    """
+    Stable content hash of a scenario run.
+
+    Args:
+        scenario: Scenario to run
+        start: The starting date for the simulation
+        months: Number of months to simulate
+        selection: Brick and/or MacroBrick IDs to execute (None = all)
+        include_cash: Whether cash is included in aggregated results
+
+    Returns:
+        Hex SHA-256 digest, equal for equal scenario content and arguments
+
+    Raises:
+        TypeError: If a spec, links or config value cannot be keyed reliably
+    """
+    config = scenario.config
+    content = {
+        "version": CACHE_FORMAT_VERSION,
+        "currency": scenario.currency,
+        "settlement_default_cash_id": scenario.settlement_default_cash_id,
+        "validate_routing": scenario.validate_routing,
+        "config": {
+            f.name: getattr(config, f.name)
+            for f in dataclasses.fields(config)
+            if f.name not in _UNKEYED_CONFIG_FIELDS
+        },
+        "bricks": [
+            {
+                "id": brick.id,
+                "family": brick.family,
+                "kind": brick.kind,
+                "spec": brick.spec,
+                "links": brick.links,
+                "start_date": brick.start_date,
+                "end_date": brick.end_date,
+                "duration_m": brick.duration_m,
+            }
+            for brick in scenario.bricks
+        ],
+        "macrobricks": [
+            {"id": mb.id, "members": list(mb.members)} for mb in scenario.macrobricks
+        ],
+        "start": start,
+        "months": months,
+        "selection": selection,
+        "include_cash": include_cash,
+    }
+    rendered = json.dumps(_canonical(content), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(rendered.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier cache of compact scenario results.
+
+    Entries are stored pickled, so every hit returns fresh objects that the
+    caller may modify freely.
+
+    Attributes:
+        max_entries: Maximum number of entries kept in memory (LRU eviction)
+        directory: Directory of the on-disk tier (None = memory only)
+        hits: Number of lookups answered from memory or disk
+        misses: Number of lookups that required a simulation
+    """
+
+    def __init__(self, max_entries: int = 32, directory: str | None = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._memory or (
+            self._path(key) is not None and os.path.exists(self._path(key))
+        )
+
+    def _path(self, key: str) -> str | None:
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def _remember(self, key: str, payload: bytes) -> None:
+        self._memory[key] = payload
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Look up compact results and count the hit or miss.
+
+        Args:
+            key: Key from ``scenario_cache_key``
+
+        Returns:
+            Compact results (see ``Scenario._compact_results``) or None
+        """
+        payload = self._memory.get(key)
+        if payload is not None:
+            self._memory.move_to_end(key)
+        else:
+            path = self._path(key)
+            if path is not None and os.path.exists(path):
+                with open(path, "rb") as f:
+                    payload = f.read()
+                self._remember(key, payload)
+        if payload is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(payload)
+
+    def put(self, key: str, compact: dict[str, Any]) -> None:
+        """
+        Store compact results in memory and, if configured, on disk.
+
+        Args:
+            key: Key from ``scenario_cache_key``
+            compact: Compact results (see ``Scenario._compact_results``)
+        """
+        payload = pickle.dumps(compact, protocol=pickle.HIGHEST_PROTOCOL)
+        self._remember(key, payload)
+        path = self._path(key)
+        if path is not None:
+            # Write then rename so concurrent readers never see partial files
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+
+    def clear(self) -> None:
+        """Drop all entries from memory and disk and reset the counters."""
+        self._memory.clear()
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.directory, name))
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters and the number of entries held in memory."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
@@ -4,16 +4,53 @@ Context classes for FinBrickLab simulation.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 import numpy as np
 
+from .journal import TransactionFingerprint
+from .timeline import Timeline
+
 if TYPE_CHECKING:
     from .bricks import FinBrickABC
     from .journal import Journal
 
 
+@dataclass
+class RunState:
+    """
+    Values the scenario computes for bricks during one run.
+
+    Kept on the context rather than written into brick specs, so simulating
+    does not modify bricks.
+
+    Attributes:
+        cash_flows: Monthly arrays routed to each cash brick, by brick ID and
+            spec key ('external_in', 'external_out', 'post_interest_in');
+            they take precedence over the same keys in the brick's spec
+    """
+
+    cash_flows: dict[str, dict[str, np.ndarray]] = field(default_factory=dict)
+
+    def cash_flow(self, brick_id: str, key: str, length: int) -> np.ndarray:
+        """
+        Routed array of a cash brick, created as zeros on first use.
+
+        Args:
+            brick_id: Cash brick ID
+            key: Spec key of the array (e.g. 'external_out')
+            length: Number of months
+
+        Returns:
+            The stored array (modify in place to add flows)
+        """
+        flows = self.cash_flows.setdefault(brick_id, {})
+        if key not in flows:
+            flows[key] = np.zeros(length)
+        return flows[key]
+
+
 @dataclass
 class ScenarioContext:
     """
@@ -27,12 +64,23 @@ class ScenarioContext:
         t_index: Array of monthly datetime64 objects representing the simulation timeline
         currency: Base currency for the scenario (e.g., 'EUR', 'USD')
         registry: Dictionary mapping brick IDs to brick instances for cross-references
+            (during ``Scenario.run``, the run's working copies of the bricks)
         journal: Journal instance for strategies to write entries directly
+        timeline: Precomputed datetimes, dates and labels of t_index (built
+            from t_index when not given)
+        fingerprints: Per-run cache of rendered brick specs/links for
+            transaction IDs (see ``transaction_fingerprint``)
+        run_state: Values the scenario computes for bricks during the run
+            (e.g. routed cash flows)
 
     Note:
         The registry allows bricks to reference other bricks through the links mechanism,
         enabling complex interdependencies like mortgages that auto-calculate from property values.
         The journal allows strategies to create journal entries (CDPairs) directly during simulation.
+        All per-run state lives on the context: values the scenario computes go into
+        ``run_state``, and strategies may only normalize the specs of the bricks in the
+        registry during ``prepare``. ``Scenario.run`` hands them copies, so the
+        scenario's bricks stay unmodified and runs can execute concurrently.
     """
 
     t_index: np.ndarray
@@ -40,3 +88,36 @@ class ScenarioContext:
     registry: dict[str, FinBrickABC]  # id -> brick mapping
     journal: Journal | None = None  # Journal for strategies to write entries
     settlement_default_cash_id: str | None = None  # Default cash account for routing
+    timeline: Timeline | None = None
+    fingerprints: dict[str, TransactionFingerprint] = field(default_factory=dict)
+    run_state: RunState = field(default_factory=RunState)
+
+    def __post_init__(self) -> None:
+        if self.timeline is None:
+            self.timeline = Timeline.from_index(self.t_index)
+
+    def transaction_fingerprint(self, brick: FinBrickABC) -> TransactionFingerprint:
+        """
+        Rendered spec and links of a brick for ``generate_transaction_id``.
+
+        Built once per brick simulation: bricks drop their cached fingerprint
+        before simulating, since a spec may change between simulations.
+
+        Args:
+            brick: Brick being simulated
+
+        Returns:
+            Fingerprint of ``brick.spec or {}`` and ``brick.links or {}``
+        """
+        spec = brick.spec or {}
+        links = brick.links or {}
+        fingerprint = self.fingerprints.get(brick.id)
+        # Empty specs/links come in as fresh dicts on every call
+        if (
+            fingerprint is None
+            or (fingerprint.spec is not spec and (fingerprint.spec or spec))
+            or (fingerprint.links is not links and (fingerprint.links or links))
+        ):
+            fingerprint = TransactionFingerprint(spec, links)
+            self.fingerprints[brick.id] = fingerprint
+        return fingerprint
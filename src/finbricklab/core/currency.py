@@ -4,9 +4,19 @@ Currency and precision handling for FinBrickLab.
 
 from __future__ import annotations
 
+import math
 from decimal import ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal
 from enum import Enum
 
+import numpy as np
+
+# Float products within this distance of a half-unit may straddle a decimal
+# tie (e.g. 1.005 * 100 = 100.49999999999999) and are rounded via Decimal.
+_TIE_TOLERANCE = 1e-6
+# Below this magnitude (in minor units) float scaling error stays well under
+# _TIE_TOLERANCE, so np.rint agrees with Decimal rounding away from ties.
+_FLOAT_EXACT_LIMIT = 2.0**31
+
 
 class RoundingPolicy(Enum):
     """Rounding policies for currency calculations."""
@@ -23,6 +33,8 @@ class Currency:
         code: ISO currency code (e.g., 'EUR', 'USD', 'JPY')
         decimals: Number of decimal places for this currency
         rounding: Rounding policy for calculations
+        quantum: Smallest representable unit (e.g., Decimal('0.01'))
+        scale: Minor units per major unit (10 ** decimals)
     """
 
     def __init__(
@@ -34,11 +46,60 @@ class Currency:
         self.code = code.upper()
         self.decimals = decimals
         self.rounding = rounding
+        self.quantum = Decimal("1").scaleb(-decimals)  # e.g., 0.01 for 2 dp, 1 for 0 dp
+        self.scale = 10**decimals
 
     def quantize(self, amount: Decimal) -> Decimal:
         """Quantize amount to currency precision."""
-        quantum = Decimal("1").scaleb(-self.decimals)  # e.g., 0.01 for 2 dp, 1 for 0 dp
-        return amount.quantize(quantum, rounding=self.rounding.value)
+        return amount.quantize(self.quantum, rounding=self.rounding.value)
+
+    def to_minor(self, amount: Decimal) -> int:
+        """
+        Quantize amount and convert it to integer minor units.
+
+        Raises:
+            ValueError: If amount is NaN or infinite
+        """
+        if not amount.is_finite():
+            raise ValueError(f"Amount must be finite, got {amount}")
+        return int(self.quantize(amount).scaleb(self.decimals))
+
+    def float_to_minor(self, value: float) -> int:
+        """Convert a float amount to minor units, rounding like ``Decimal(str(value))``."""
+        scaled = value * self.scale
+        if (
+            abs(scaled) < _FLOAT_EXACT_LIMIT
+            and abs(scaled - math.floor(scaled) - 0.5) > _TIE_TOLERANCE
+        ):
+            return int(round(scaled))
+        return self.to_minor(Decimal(str(value)))
+
+    def to_minor_array(self, values: np.ndarray) -> np.ndarray:
+        """
+        Convert float amounts to int64 minor units in bulk.
+
+        Rounds exactly like ``Amount(float(x), currency)``, i.e.
+        ``Decimal(str(x))`` quantized with this currency's rounding policy.
+        Values near a rounding tie, very large values and non-finite values
+        take the Decimal path; everything else is rounded with ``np.rint``.
+
+        Args:
+            values: Array-like of float amounts in major units
+
+        Returns:
+            int64 array of minor units
+        """
+        values = np.asarray(values, dtype=np.float64)
+        flat = values.ravel()
+        scaled = flat * self.scale
+        tie_distance = np.abs(scaled - np.floor(scaled) - 0.5)
+        exact = (tie_distance > _TIE_TOLERANCE) & (np.abs(scaled) < _FLOAT_EXACT_LIMIT)
+
+        minor = np.zeros(len(flat), dtype=np.int64)
+        minor[exact] = np.rint(scaled[exact])
+        for i in np.flatnonzero(~exact):
+            minor[i] = self.to_minor(Decimal(str(float(flat[i]))))
+        return minor.reshape(values.shape)
 
     def __str__(self) -> str:
         return self.code
@@ -51,22 +112,90 @@ class Amount:
     """
     Monetary amount with currency and precision.
 
+    The amount is stored as an integer number of currency minor units (e.g.
+    cents); ``value`` is the equivalent quantized Decimal, built on first
+    access. Arithmetic between amounts of the same precision works on the
+    integers directly.
+
     Attributes:
         value: Decimal amount value
+        minor_units: Integer amount in currency minor units
         currency: Currency object
     """
 
+    __slots__ = ("_minor", "_value", "currency")
+
     def __init__(self, value: Decimal | float | str | int, currency: Currency | str):
         # Forward reference: get_currency is defined later in this file
         if isinstance(currency, str):
             currency = Amount._get_currency(currency)
 
-        if isinstance(value, (int, float, str)):
-            value = Decimal(str(value))
-
-        self.value = currency.quantize(value)
+        if type(value) is int:
+            self._minor = value * currency.scale
+        elif isinstance(value, float):
+            self._minor = currency.float_to_minor(value)
+        else:
+            if isinstance(value, (int, float, str)):
+                value = Decimal(str(value))
+            self._minor = currency.to_minor(value)
+        self._value: Decimal | None = None
         self.currency = currency
 
+    @classmethod
+    def from_minor_units(cls, minor: int, currency: Currency | str) -> Amount:
+        """Create an Amount from integer minor units without re-quantizing."""
+        if isinstance(currency, str):
+            currency = Amount._get_currency(currency)
+        amount = cls.__new__(cls)
+        amount._minor = int(minor)
+        amount._value = None
+        amount.currency = currency
+        return amount
+
+    @classmethod
+    def from_floats(cls, values: np.ndarray, currency: Currency | str) -> list[Amount]:
+        """
+        Create Amounts from an array of floats.
+
+        Equivalent to ``[Amount(float(x), currency) for x in values]`` but
+        rounds the whole array at once (see ``Currency.to_minor_array``).
+
+        Args:
+            values: Array-like of float amounts in major units
+            currency: Currency object or code
+
+        Returns:
+            List of Amounts in input order
+        """
+        if isinstance(currency, str):
+            currency = Amount._get_currency(currency)
+        return [
+            cls.from_minor_units(minor, currency)
+            for minor in currency.to_minor_array(values).ravel().tolist()
+        ]
+
+    @property
+    def value(self) -> Decimal:
+        """Decimal amount value, quantized to currency precision."""
+        if self._value is None:
+            self._value = Decimal(self._minor).scaleb(-self.currency.decimals)
+        return self._value
+
+    @property
+    def minor_units(self) -> int:
+        """Integer amount in currency minor units."""
+        return self._minor
+
+    def _same_scale(self, other: Amount) -> bool:
+        return self.currency.decimals == other.currency.decimals
+
+    def __getstate__(self) -> tuple[int, Currency]:
+        return self._minor, self.currency
+
+    def __setstate__(self, state: tuple[int, Currency]) -> None:
+        self._minor, self.currency = state
+        self._value = None
+
     @staticmethod
     def _get_currency(code: str) -> Currency:
         """Get currency by code (forward reference helper)."""
@@ -80,6 +209,8 @@ class Amount:
             raise ValueError(
                 f"Cannot add amounts in different currencies: {self.currency.code} + {other.currency.code}"
             )
+        if self._same_scale(other):
+            return Amount.from_minor_units(self._minor + other._minor, self.currency)
         return Amount(self.value + other.value, self.currency)
 
     def __sub__(self, other: Amount) -> Amount:
@@ -87,27 +218,35 @@ class Amount:
             raise ValueError(
                 f"Cannot subtract amounts in different currencies: {self.currency.code} - {other.currency.code}"
             )
+        if self._same_scale(other):
+            return Amount.from_minor_units(self._minor - other._minor, self.currency)
         return Amount(self.value - other.value, self.currency)
 
     def __neg__(self) -> Amount:
-        return Amount(-self.value, self.currency)
+        return Amount.from_minor_units(-self._minor, self.currency)
 
     def __pos__(self) -> Amount:
-        return Amount(+self.value, self.currency)
+        return Amount.from_minor_units(self._minor, self.currency)
 
     def __abs__(self) -> Amount:
-        return Amount(abs(self.value), self.currency)
+        return Amount.from_minor_units(abs(self._minor), self.currency)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Amount):
             return False
-        return self.value == other.value and self.currency.code == other.currency.code
+        if self.currency.code != other.currency.code:
+            return False
+        if self._same_scale(other):
+            return self._minor == other._minor
+        return self.value == other.value
 
     def __lt__(self, other: Amount) -> bool:
         if self.currency.code != other.currency.code:
             raise ValueError(
                 f"Cannot compare amounts in different currencies: {self.currency.code} < {other.currency.code}"
             )
+        if self._same_scale(other):
+            return self._minor < other._minor
         return self.value < other.value
 
     def __le__(self, other: Amount) -> bool:
@@ -9,6 +9,7 @@ different financial strategies.
 from __future__ import annotations
 
 from collections.abc import Iterable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import date
@@ -29,6 +30,25 @@ from .transfer_visibility import TransferVisibility
 from .utils import slugify_name
 
 
+def _run_scenario_task(
+    scenario: Scenario,
+    start: date,
+    months: int,
+    selection: list[str] | None,
+    include_cash: bool,
+    kwargs: dict[str, Any],
+) -> dict[str, Any]:
+    """Run a scenario in a worker process and return its compact results."""
+    results = scenario.run(
+        start=start,
+        months=months,
+        selection=selection,
+        include_cash=include_cash,
+        **kwargs,
+    )
+    return Scenario._compact_results(results)
+
+
 @dataclass
 class Entity:
     """
@@ -875,6 +895,17 @@ class Entity:
         ScenarioValidationError
             If Scenario-level validation fails (propagated).
         """
+        scen = self._require_scenario(scenario_id)
+        return scen.run(
+            start=start,
+            months=months,
+            selection=selection,
+            include_cash=include_cash,
+            **kwargs,
+        )
+
+    def _require_scenario(self, scenario_id: str) -> Scenario:
+        """Get a scenario by ID, raising ValueError listing available IDs if missing."""
         scen = self.get_scenario(scenario_id)
         if scen is None:
             available = ", ".join(self.list_scenarios()[:10])
@@ -883,14 +914,7 @@ class Entity:
                 f"Scenario '{scenario_id}' not found in Entity '{self.id}'. "
                 f"Available: [{available}{more}]"
             )
-
-        return scen.run(
-            start=start,
-            months=months,
-            selection=selection,
-            include_cash=include_cash,
-            **kwargs,
-        )
+        return scen
 
     def run_many(
         self,
@@ -900,6 +924,8 @@ class Entity:
         months: int,
         selection: list[str] | None = None,
         include_cash: bool = True,
+        workers: int | None = None,
+        executor: Executor | None = None,
         **kwargs: Any,
     ) -> dict[str, dict[str, Any]]:
         """
@@ -907,6 +933,13 @@ class Entity:
 
         Raises on first missing scenario_id; consider try/except in caller if you want partial results.
 
+        With ``workers`` > 1 or an ``executor``, scenarios run in parallel
+        (one task per scenario). Each worker returns compact results (outputs,
+        by_struct, totals, columnar journal, meta) that are reassembled into
+        the usual results dict in ``scenario_ids`` order. Errors are raised as
+        in the sequential path: the first failing scenario in order wins, and
+        a missing ID is reported after the scenarios listed before it ran.
+
         Parameters
         ----------
         scenario_ids : Iterable[str]
@@ -920,6 +953,13 @@ class Entity:
             the scenario's full selection is used.
         include_cash : bool
             Whether to include cash bricks in the simulation.
+        workers : int | None
+            Number of worker processes. None or 1 runs sequentially in this
+            process.
+        executor : Executor | None
+            Executor to submit scenario runs to (e.g. a shared
+            ProcessPoolExecutor). Takes precedence over ``workers`` and is not
+            shut down.
         **kwargs : Any
             Forwarded to Scenario.run(...).
 
@@ -935,16 +975,68 @@ class Entity:
         ScenarioValidationError
             If Scenario-level validation fails (propagated).
         """
-        out: dict[str, dict[str, Any]] = {}
+        if executor is None and (workers is None or workers <= 1):
+            out: dict[str, dict[str, Any]] = {}
+            for sid in scenario_ids:
+                out[sid] = self.run_scenario(
+                    sid,
+                    start=start,
+                    months=months,
+                    selection=selection,
+                    include_cash=include_cash,
+                    **kwargs,
+                )
+            return out
+
+        if executor is not None:
+            return self._run_many_parallel(
+                scenario_ids, executor, start, months, selection, include_cash, kwargs
+            )
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return self._run_many_parallel(
+                scenario_ids, pool, start, months, selection, include_cash, kwargs
+            )
+
+    def _run_many_parallel(
+        self,
+        scenario_ids: Iterable[str],
+        executor: Executor,
+        start: date,
+        months: int,
+        selection: list[str] | None,
+        include_cash: bool,
+        kwargs: dict[str, Any],
+    ) -> dict[str, dict[str, Any]]:
+        """Submit one run per scenario to executor and reassemble results in order."""
+        tasks: list[tuple[str, Scenario, Future]] = []
+        missing: ValueError | None = None
         for sid in scenario_ids:
-            out[sid] = self.run_scenario(
-                sid,
-                start=start,
-                months=months,
-                selection=selection,
-                include_cash=include_cash,
-                **kwargs,
+            try:
+                scen = self._require_scenario(sid)
+            except ValueError as exc:
+                missing = exc
+                break
+            # Ship the scenario definition only, not results of earlier runs
+            future = executor.submit(
+                _run_scenario_task,
+                scen._shallow_copy(),
+                start,
+                months,
+                selection,
+                include_cash,
+                kwargs,
             )
+            tasks.append((sid, scen, future))
+
+        out: dict[str, dict[str, Any]] = {}
+        try:
+            for sid, scen, future in tasks:
+                out[sid] = scen._restore_results(future.result())
+        finally:
+            for _, _, future in tasks:
+                future.cancel()
+        if missing is not None:
+            raise missing
         return out
 
     @staticmethod
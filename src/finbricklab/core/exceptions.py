@@ -17,6 +17,7 @@ class ScenarioValidationError(Exception):
 
     Attributes:
         scenario_id: The ID of the scenario that failed validation
+        message: The error message without scenario context
         report: The validation report object (if available)
         problem_ids: List of brick/MacroBrick IDs that caused issues
     """
@@ -29,10 +30,18 @@ class ScenarioValidationError(Exception):
         problem_ids: list[str] | None = None,
     ):
         self.scenario_id = scenario_id
+        self.message = message
         self.report = report
         self.problem_ids = problem_ids or []
         super().__init__(self._fmt(message))
 
+    def __reduce__(self):
+        # Re-create from the constructor arguments (e.g. when raised in a worker process)
+        return (
+            self.__class__,
+            (self.scenario_id, self.message, self.report, self.problem_ids),
+        )
+
     def _fmt(self, msg: str) -> str:
         """Format the error message with additional context."""
         suffix = ""
@@ -5,6 +5,9 @@ Double-entry journal system for FinBrickLab.
 from __future__ import annotations
 
 import hashlib
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
@@ -140,6 +143,110 @@ class JournalEntry:
         return f"JournalEntry(id='{self.id}', timestamp={self.timestamp}, postings={len(self.postings)})"
 
 
+def _norm_months(timestamps: Any) -> np.ndarray:
+    """Normalize a collection of timestamps to int64 months since 1970-01."""
+    values = np.asarray(timestamps)
+    if np.issubdtype(values.dtype, np.datetime64):
+        months = values.astype("datetime64[M]")
+    else:
+        months = np.array(
+            [_norm_ts(ts) for ts in values.ravel()], dtype="datetime64[M]"
+        )
+    return months.astype(np.int64).reshape(values.shape)
+
+
+class _BalanceIndex:
+    """
+    Cumulative per-account, per-currency balances by month.
+
+    Rows are (account_id, currency code) pairs in order of first appearance
+    by month; columns are the distinct posting months in ascending order.
+    ``cumulative[row, j]`` is the balance in minor units including every
+    entry dated in ``months[j]`` or earlier, so a point-in-time balance is a
+    binary search over ``months`` plus one lookup.
+
+    Attributes:
+        keys: (account_id, currency code) per row
+        decimals: Currency decimals per row
+        months: Ascending distinct months (int64 months since 1970-01)
+        first: Column of the first posting per row
+        cumulative: (rows × months) int64 running balances in minor units
+    """
+
+    def __init__(
+        self,
+        account_ids: list[str],
+        currency_codes: list[str],
+        decimals: np.ndarray,
+        months: np.ndarray,
+        minor: np.ndarray,
+    ):
+        # Stable month order, so rows follow a chronological scan of entries
+        order = np.argsort(months, kind="stable")
+        self.keys: list[tuple[str, str]] = []
+        rows: dict[tuple[str, str], int] = {}
+        posting_row = np.empty(len(order), dtype=np.int64)
+        for i, posting in enumerate(order.tolist()):
+            key = (account_ids[posting], currency_codes[posting])
+            row = rows.get(key)
+            if row is None:
+                row = rows[key] = len(self.keys)
+                self.keys.append(key)
+            posting_row[i] = row
+        self._rows = rows
+
+        self.months, column = np.unique(months[order], return_inverse=True)
+        n_rows, n_months = len(self.keys), len(self.months)
+
+        # Mixed precisions for one currency code are summed at the finest scale
+        self.decimals = np.zeros(n_rows, dtype=np.int64)
+        np.maximum.at(self.decimals, posting_row, decimals[order])
+        scaled = minor[order] * 10 ** (self.decimals[posting_row] - decimals[order])
+
+        self.first = np.full(n_rows, n_months, dtype=np.int64)
+        np.minimum.at(self.first, posting_row, column)
+
+        self.cumulative = np.zeros((n_rows, n_months), dtype=np.int64)
+        np.add.at(self.cumulative, (posting_row, column), scaled)
+        np.cumsum(self.cumulative, axis=1, out=self.cumulative)
+
+    def _column(self, month: int) -> int:
+        """Last column at or before month (-1 when before every posting)."""
+        return int(np.searchsorted(self.months, month, side="right")) - 1
+
+    def _value(self, row: int, column: int) -> Decimal:
+        minor = int(self.cumulative[row, column])
+        return Decimal(minor).scaleb(-int(self.decimals[row]))
+
+    def balance(self, account_id: str, currency: str, month: int) -> Decimal:
+        """Balance of one account and currency at the end of month."""
+        row = self._rows.get((account_id, currency))
+        if row is None:
+            return Decimal("0")
+        column = self._column(month)
+        if column < self.first[row]:
+            return Decimal("0")
+        return self._value(row, column)
+
+    def trial_balance(self, month: int) -> dict[str, dict[str, Decimal]]:
+        """Balances of every account posted to by the end of month."""
+        column = self._column(month)
+        balances: dict[str, dict[str, Decimal]] = {}
+        for row, (account_id, currency) in enumerate(self.keys):
+            if self.first[row] <= column:
+                balances.setdefault(account_id, {})[currency] = self._value(row, column)
+        return balances
+
+    def series(self, account_id: str, currency: str, months: np.ndarray) -> np.ndarray:
+        """Balances at the end of each month as float64 major units."""
+        row = self._rows.get((account_id, currency))
+        if row is None:
+            return np.zeros(months.shape, dtype=np.float64)
+        columns = np.searchsorted(self.months, months, side="right") - 1
+        values = np.where(columns >= 0, self.cumulative[row, np.maximum(columns, 0)], 0)
+        return values / 10.0 ** int(self.decimals[row])
+
+
 class Journal:
     """
     Double-entry journal for recording financial transactions.
@@ -156,6 +263,10 @@ class Journal:
             str, dict[str, Decimal]
         ] = {}  # account_id -> currency -> balance
         self._id_index: set[str] = set()  # Fast O(1) duplicate check for entry IDs
+        self._revision = (
+            0  # Bumped on every change; lets derived indexes detect staleness
+        )
+        self._balance_index: tuple[tuple[int, int], _BalanceIndex] | None = None
 
     def post(self, entry: JournalEntry) -> None:
         """
@@ -174,13 +285,94 @@ class Journal:
         if entry.id in self._id_index:
             raise ValueError(f"Duplicate transaction ID: {entry.id}")
 
-        # Add entry to index and list
+        # Add entry to index and storage
         self._id_index.add(entry.id)
-        self.entries.append(entry)
+        self._append_entry(entry)
+        self._revision += 1
 
         # Update balances
         self._update_balances(entry)
 
+    def post_many(self, entries: Iterable[JournalEntry]) -> None:
+        """
+        Post a batch of journal entries.
+
+        Equivalent to calling ``post`` for each entry in order, except that
+        the whole batch is validated before anything is stored: zero-sum per
+        currency (checked on integer minor units for all entries at once) and
+        duplicate IDs, against the journal and within the batch. Balances are
+        then updated once per account and currency. Like ``post``, origin_id
+        uniqueness is left to the scenario's journal validation.
+
+        Args:
+            entries: Journal entries to post, in order
+
+        Raises:
+            ValueError: For the first invalid entry, with the same message as
+                ``post``; nothing is posted in that case
+        """
+        batch = list(entries)
+        if not batch:
+            return
+
+        self._validate_batch(batch)
+
+        self._id_index.update(entry.id for entry in batch)
+        self._append_entries(batch)
+        self._revision += 1
+
+        self._update_balances_many(batch)
+
+    def _validate_batch(self, batch: list[JournalEntry]) -> None:
+        """Raise the error ``post`` would raise for the first invalid entry."""
+        # Zero-sum: two same-currency postings must cancel in minor units;
+        # anything else is re-checked entry by entry for the exact message
+        n = len(batch)
+        minor = np.zeros((n, 2), dtype=np.int64)
+        simple = np.zeros(n, dtype=bool)
+        for i, entry in enumerate(batch):
+            postings = entry.postings
+            if len(postings) == 2:
+                first, second = postings[0].amount, postings[1].amount
+                if (first.currency is second.currency) or (
+                    first.currency.code == second.currency.code
+                    and first.currency.decimals == second.currency.decimals
+                ):
+                    minor[i, 0] = first.minor_units
+                    minor[i, 1] = second.minor_units
+                    simple[i] = True
+        for i in np.flatnonzero(~simple | (minor.sum(axis=1) != 0)).tolist():
+            batch[i]._validate_zero_sum()
+
+        # Duplicate IDs, in posting order
+        ids: set[str] = set()
+        for entry in batch:
+            if entry.id in ids or self.has_id(entry.id):
+                raise ValueError(f"Duplicate transaction ID: {entry.id}")
+            ids.add(entry.id)
+
+    def _append_entry(self, entry: JournalEntry) -> None:
+        """Store a validated entry (overridden by alternative storage backends)."""
+        self.entries.append(entry)
+
+    def _append_entries(self, entries: list[JournalEntry]) -> None:
+        """Store a batch of validated entries."""
+        self.entries.extend(entries)
+
+    @contextmanager
+    def recording(self) -> Iterator[list[JournalEntry]]:
+        """
+        Collect the entries posted while the block runs.
+
+        Yields:
+            List filled with the posted entries, in order (complete once the
+            block exits)
+        """
+        posted: list[JournalEntry] = []
+        start = len(self.entries)
+        yield posted
+        posted.extend(self.entries[start:])
+
     def has_id(self, entry_id: str) -> bool:
         """
         Check if an entry with the given ID already exists (O(1) lookup).
@@ -202,6 +394,7 @@ class Journal:
         self.entries.clear()
         self._id_index.clear()
         self._balances.clear()
+        self._revision += 1
 
     def _update_balances(self, entry: JournalEntry) -> None:
         """Update account balances from journal entry."""
@@ -217,6 +410,25 @@ class Journal:
 
             self._balances[account_id][currency] += amount
 
+    def _update_balances_many(self, entries: list[JournalEntry]) -> None:
+        """Update account balances from a batch, summing minor units first."""
+        totals: dict[tuple[str, str, int], int] = {}
+        for entry in entries:
+            for posting in entry.postings:
+                amount = posting.amount
+                key = (
+                    posting.account_id,
+                    amount.currency.code,
+                    amount.currency.decimals,
+                )
+                totals[key] = totals.get(key, 0) + amount.minor_units
+
+        for (account_id, currency, decimals), minor in totals.items():
+            balances = self._balances.setdefault(account_id, {})
+            balances[currency] = balances.get(currency, Decimal("0")) + Decimal(
+                minor
+            ).scaleb(-decimals)
+
     def balance(
         self, account_id: str, currency: str, at_timestamp: Optional[datetime] = None
     ) -> Decimal:
@@ -235,24 +447,9 @@ class Journal:
             # Return current balance
             return self._balances.get(account_id, {}).get(currency, Decimal("0"))
 
-        # Calculate balance at specific timestamp
-        # TODO: Performance - cache sorted entries to avoid re-sorting on every call
-        # Sort entries by normalized timestamp to handle out-of-order posting and mixed types
-        et_normalized = _norm_ts(at_timestamp)
-        sorted_entries = sorted(self.entries, key=lambda e: _norm_ts(e.timestamp))
-        balance = Decimal("0")
-
-        for entry in sorted_entries:
-            entry_ts_norm = _norm_ts(entry.timestamp)
-            if entry_ts_norm <= et_normalized:
-                for posting in entry.postings:
-                    if (
-                        posting.account_id == account_id
-                        and posting.amount.currency.code == currency
-                    ):
-                        balance += posting.amount.value
-
-        return balance
+        return self._get_balance_index().balance(
+            account_id, currency, int(_norm_ts(at_timestamp).astype(np.int64))
+        )
 
     def trial_balance(
         self, at_timestamp: Optional[datetime] = None
@@ -269,31 +466,64 @@ class Journal:
         if at_timestamp is None:
             return self._balances.copy()
 
-        # Calculate balances at specific timestamp
-        # Normalize timestamps for consistent comparison across types
-        at_ts_norm = _norm_ts(at_timestamp)
-        balances: dict[str, dict[str, Decimal]] = {}
+        return self._get_balance_index().trial_balance(
+            int(_norm_ts(at_timestamp).astype(np.int64))
+        )
 
-        # Sort by normalized timestamp to handle out-of-order entries
-        for entry in sorted(self.entries, key=lambda e: _norm_ts(e.timestamp)):
-            entry_ts_norm = _norm_ts(entry.timestamp)
-            if entry_ts_norm <= at_ts_norm:
-                for posting in entry.postings:
-                    account_id = posting.account_id
-                    currency = posting.amount.currency.code
-                    amount = posting.amount.value
+    def balance_series(
+        self, account_id: str, currency: str, timestamps: Any
+    ) -> np.ndarray:
+        """
+        Get account balances at many timestamps in one call.
+
+        Each balance includes every entry dated in the timestamp's month or
+        earlier, as in ``balance(account_id, currency, at_timestamp)``.
+
+        Args:
+            account_id: Account identifier
+            currency: Currency code
+            timestamps: Timestamps (datetime64 array, DatetimeIndex, PeriodIndex
+                or a sequence of str/date/datetime)
 
-                    if account_id not in balances:
-                        balances[account_id] = {}
-                    if currency not in balances[account_id]:
-                        balances[account_id][currency] = Decimal("0")
+        Returns:
+            float64 array of balances in major currency units, one per timestamp
+        """
+        return self._get_balance_index().series(
+            account_id, currency, _norm_months(timestamps)
+        )
 
-                    balances[account_id][currency] += amount
-            else:
-                # Entries are sorted, safe to break
-                break
+    def _get_balance_index(self) -> _BalanceIndex:
+        """Get the month balance index, rebuilding it after the journal changed."""
+        key = (self._revision, len(self.entries))
+        if self._balance_index is None or self._balance_index[0] != key:
+            self._balance_index = (key, _BalanceIndex(*self._posting_columns()))
+        return self._balance_index[1]
 
-        return balances
+    def _posting_columns(
+        self,
+    ) -> tuple[list[str], list[str], np.ndarray, np.ndarray, np.ndarray]:
+        """Per-posting account IDs, currency codes, decimals, months and minor units."""
+        account_ids: list[str] = []
+        currency_codes: list[str] = []
+        decimals: list[int] = []
+        months: list[int] = []
+        minor: list[int] = []
+        for entry in self.entries:
+            month = int(_norm_ts(entry.timestamp).astype(np.int64))
+            for posting in entry.postings:
+                currency = posting.amount.currency
+                account_ids.append(posting.account_id)
+                currency_codes.append(currency.code)
+                decimals.append(currency.decimals)
+                months.append(month)
+                minor.append(posting.amount.minor_units)
+        return (
+            account_ids,
+            currency_codes,
+            np.array(decimals, dtype=np.int64),
+            np.array(months, dtype=np.int64),
+            np.array(minor, dtype=np.int64),
+        )
 
     def cashflow(
         self,
@@ -392,12 +622,670 @@ class Journal:
         return f"Journal(entries={len(self.entries)})"
 
 
+def _freeze(value: Any) -> tuple[Any, Any]:
+    """Convert a metadata value into a hashable, type-tagged key."""
+    if isinstance(value, dict):
+        return (dict, tuple((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return (list, tuple(_freeze(v) for v in value))
+    hash(value)  # Raises TypeError for unhashable values
+    return (type(value), value)
+
+
+def _thaw(frozen: tuple[Any, Any]) -> Any:
+    """Rebuild a fresh metadata value from its frozen key."""
+    kind, payload = frozen
+    if kind is dict:
+        return {k: _thaw(v) for k, v in payload}
+    if kind is list:
+        return [_thaw(v) for v in payload]
+    return payload
+
+
+class _Dictionary:
+    """Append-only dictionary mapping values to dense integer codes."""
+
+    __slots__ = ("_codes", "values")
+
+    def __init__(self):
+        self._codes: dict[Any, int] = {}
+        self.values: list[Any] = []
+
+    def encode(self, key: Any, value: Any = None) -> int:
+        """Return the code for key, storing value (default: key) on first sight."""
+        code = self._codes.get(key)
+        if code is None:
+            code = len(self.values)
+            self._codes[key] = code
+            self.values.append(key if value is None else value)
+        return code
+
+    def append(self, value: Any) -> int:
+        """Store a value that cannot be deduplicated and return its code."""
+        self.values.append(value)
+        return len(self.values) - 1
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class _MetadataColumns:
+    """
+    Dictionary-encoded metadata columns, one int32 code column per key.
+
+    Rows without a given key hold -1 in that key's column.
+    """
+
+    def __init__(self):
+        self.codes: dict[str, array] = {}
+        self.dictionaries: dict[str, _Dictionary] = {}
+        self._rows = 0
+
+    def append(self, metadata: dict[str, Any]) -> None:
+        for key in metadata:
+            if key not in self.codes:
+                self.codes[key] = array("i", [-1]) * self._rows
+                self.dictionaries[key] = _Dictionary()
+        for key, column in self.codes.items():
+            if key not in metadata:
+                column.append(-1)
+                continue
+            dictionary = self.dictionaries[key]
+            try:
+                column.append(dictionary.encode(_freeze(metadata[key])))
+            except TypeError:
+                column.append(dictionary.append((object, metadata[key])))
+        self._rows += 1
+
+    def row(self, index: int) -> dict[str, Any]:
+        result = {}
+        for key, column in self.codes.items():
+            code = column[index]
+            if code >= 0:
+                result[key] = _thaw(self.dictionaries[key].values[code])
+        return result
+
+    def column(self, key: str) -> tuple[np.ndarray, list[Any]]:
+        if key not in self.codes:
+            return np.full(self._rows, -1, dtype=np.int32), []
+        values = [_thaw(v) for v in self.dictionaries[key].values]
+        return np.array(self.codes[key], dtype=np.int32), values
+
+    def clear(self) -> None:
+        self.codes.clear()
+        self.dictionaries.clear()
+        self._rows = 0
+
+
+class _ColumnarEntriesView(Sequence):
+    """Read-only sequence view materializing JournalEntry objects on access."""
+
+    def __init__(self, journal: ColumnarJournal):
+        self._journal = journal
+
+    def __len__(self) -> int:
+        return len(self._journal._entry_ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._journal._materialize(i) for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("journal entry index out of range")
+        return self._journal._materialize(index)
+
+    def __iter__(self):
+        materialize = self._journal._materialize
+        for index in range(len(self)):
+            yield materialize(index)
+
+    def __repr__(self) -> str:
+        return f"<{len(self)} columnar journal entries>"
+
+
+class ColumnarJournal(Journal):
+    """
+    Journal that stores entries as parallel arrays instead of Python objects.
+
+    Each posting is kept as one row of compact columns:
+
+    - ``month``: int32 months since 1970-01 (``datetime64[M]``) of its entry
+    - ``account``: dictionary-encoded account ID code
+    - ``amount_minor``: int64 amount in currency minor units
+    - ``currency``: dictionary-encoded currency code
+
+    Entry and posting metadata are dictionary-encoded per key, so repeated
+    values (node IDs, categories, transaction types, tags) are stored once.
+
+    The ``entries`` attribute is a read-only compatibility view that yields
+    freshly built ``JournalEntry`` objects, so existing callers (results,
+    CLI diagnostics, validation) keep working unchanged. Mutating a
+    materialized entry does not change the stored journal.
+    """
+
+    def __init__(self, account_registry: Optional[Any] = None):
+        self.account_registry = account_registry
+        self._revision = 0
+        self._balance_index = None
+        self._reset()
+
+    def _reset(self) -> None:
+        """Create empty columns, dictionaries, ID index and balances."""
+        self._balances: dict[str, dict[str, Decimal]] = {}
+        self._id_index: set[str] = set()
+
+        # Entry-level columns
+        self._entry_ids: list[str] = []
+        self._entry_month = array("i")
+        self._entry_ts = array("i")
+        self._entry_offset = array("i", [0])  # postings of entry i: [off[i], off[i+1])
+        self._entry_meta = _MetadataColumns()
+
+        # Posting-level columns
+        self._posting_entry = array("i")
+        self._posting_account = array("i")
+        self._posting_minor = array("q")
+        self._posting_currency = array("i")
+        self._posting_meta = _MetadataColumns()
+
+        # Dictionaries shared by the columns above
+        self._timestamps = _Dictionary()
+        self._timestamp_months: list[int] = []
+        self._accounts = _Dictionary()
+        self._currencies = _Dictionary()
+
+    @classmethod
+    def from_journal(cls, journal: Journal) -> ColumnarJournal:
+        """
+        Copy the entries of an already validated journal into columnar storage.
+
+        Args:
+            journal: Source journal (entries are not re-validated)
+
+        Returns:
+            ColumnarJournal with the same entries, balances and registry
+        """
+        columnar = cls(journal.account_registry)
+        for entry in journal.entries:
+            columnar._id_index.add(entry.id)
+            columnar._append_entry(entry)
+            columnar._update_balances(entry)
+        columnar._revision += 1
+        return columnar
+
+    def to_journal(self) -> Journal:
+        """
+        Copy the entries into an object-backed ``Journal``.
+
+        Returns:
+            Journal with the same entries, balances and registry
+        """
+        journal = Journal(self.account_registry)
+        entries = list(self.entries)
+        journal._id_index.update(entry.id for entry in entries)
+        journal._append_entries(entries)
+        journal._update_balances_many(entries)
+        journal._revision += 1
+        return journal
+
+    @property
+    def entries(self) -> _ColumnarEntriesView:
+        """Compatibility view yielding ``JournalEntry`` objects."""
+        return _ColumnarEntriesView(self)
+
+    def _append_entry(self, entry: JournalEntry) -> None:
+        ts_code = self._timestamps.encode((type(entry.timestamp), entry.timestamp))
+        if ts_code == len(self._timestamp_months):
+            self._timestamp_months.append(
+                int(_norm_ts(entry.timestamp).astype(np.int64))
+            )
+
+        entry_index = len(self._entry_ids)
+        for posting in entry.postings:
+            currency = posting.amount.currency
+            self._posting_entry.append(entry_index)
+            self._posting_account.append(self._accounts.encode(posting.account_id))
+            self._posting_minor.append(posting.amount.minor_units)
+            self._posting_currency.append(
+                self._currencies.encode(
+                    (currency.code, currency.decimals, currency.rounding), currency
+                )
+            )
+            self._posting_meta.append(posting.metadata)
+
+        self._entry_ids.append(entry.id)
+        self._entry_ts.append(ts_code)
+        self._entry_month.append(self._timestamp_months[ts_code])
+        self._entry_offset.append(len(self._posting_entry))
+        self._entry_meta.append(entry.metadata)
+
+    def _append_entries(self, entries: list[JournalEntry]) -> None:
+        for entry in entries:
+            self._append_entry(entry)
+
+    def _materialize(self, index: int) -> JournalEntry:
+        """Build a ``JournalEntry`` for the entry stored at index."""
+        currencies = self._currencies.values
+        accounts = self._accounts.values
+        postings = []
+        for row in range(self._entry_offset[index], self._entry_offset[index + 1]):
+            currency = currencies[self._posting_currency[row]]
+            postings.append(
+                Posting(
+                    accounts[self._posting_account[row]],
+                    Amount.from_minor_units(self._posting_minor[row], currency),
+                    self._posting_meta.row(row),
+                )
+            )
+        return JournalEntry(
+            id=self._entry_ids[index],
+            timestamp=self._timestamps.values[self._entry_ts[index]][1],
+            postings=postings,
+            metadata=self._entry_meta.row(index),
+        )
+
+    def clear(self) -> None:
+        """Clear all entries, columns, dictionaries and balances."""
+        self._reset()
+        self._revision += 1
+
+    def _posting_columns(
+        self,
+    ) -> tuple[list[str], list[str], np.ndarray, np.ndarray, np.ndarray]:
+        cols = self.columns()
+        accounts = self._accounts.values
+        currencies = self._currencies.values
+        return (
+            [accounts[code] for code in cols["account"].tolist()],
+            [currencies[code].code for code in cols["currency"].tolist()],
+            np.array([c.decimals for c in currencies] or [0], dtype=np.int64)[
+                cols["currency"]
+            ],
+            cols["month"].astype(np.int64),
+            cols["amount_minor"],
+        )
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """
+        Get the posting columns as NumPy arrays (copies, safe to keep).
+
+        Returns:
+            Dictionary with one row per posting:
+            ``entry`` (int32 entry index), ``month`` (int32 months since 1970-01),
+            ``account`` (int32 code into ``account_ids``), ``amount_minor``
+            (int64 minor units) and ``currency`` (int32 code into ``currencies``).
+        """
+        entry = np.array(self._posting_entry, dtype=np.int32)
+        entry_month = np.array(self._entry_month, dtype=np.int32)
+        return {
+            "entry": entry,
+            "month": entry_month[entry],
+            "account": np.array(self._posting_account, dtype=np.int32),
+            "amount_minor": np.array(self._posting_minor, dtype=np.int64),
+            "currency": np.array(self._posting_currency, dtype=np.int32),
+        }
+
+    @property
+    def account_ids(self) -> list[str]:
+        """Account IDs indexed by the ``account`` column codes."""
+        return list(self._accounts.values)
+
+    @property
+    def currencies(self) -> list[Any]:
+        """Currency objects indexed by the ``currency`` column codes."""
+        return list(self._currencies.values)
+
+    def entry_ids(self) -> list[str]:
+        """Entry IDs in posting order (indexed by the ``entry`` column)."""
+        return list(self._entry_ids)
+
+    def timestamp_column(self) -> tuple[np.ndarray, list[Any]]:
+        """
+        Get the dictionary-encoded entry timestamps.
+
+        Returns:
+            Tuple of (int32 code per entry, distinct original timestamps)
+        """
+        codes = np.array(self._entry_ts, dtype=np.int32)
+        return codes, [ts for _, ts in self._timestamps.values]
+
+    def entry_months(self) -> np.ndarray:
+        """Month index (int32 months since 1970-01) of every entry."""
+        return np.array(self._entry_month, dtype=np.int32)
+
+    def amounts(self) -> np.ndarray:
+        """Posting amounts as float64 in major currency units."""
+        cols = self.columns()
+        scale = np.array(
+            [10.0**c.decimals for c in self._currencies.values] or [1.0],
+            dtype=np.float64,
+        )
+        return cols["amount_minor"] / scale[cols["currency"]]
+
+    def entry_metadata_column(self, key: str) -> tuple[np.ndarray, list[Any]]:
+        """
+        Get a dictionary-encoded entry metadata column.
+
+        Args:
+            key: Entry metadata key (e.g. 'transaction_type', 'parent_id')
+
+        Returns:
+            Tuple of (int32 codes per entry, -1 where absent; decoded values)
+        """
+        return self._entry_meta.column(key)
+
+    def posting_metadata_column(self, key: str) -> tuple[np.ndarray, list[Any]]:
+        """
+        Get a dictionary-encoded posting metadata column.
+
+        Args:
+            key: Posting metadata key (e.g. 'node_id', 'category', 'type')
+
+        Returns:
+            Tuple of (int32 codes per posting, -1 where absent; decoded values)
+        """
+        return self._posting_meta.column(key)
+
+    def __str__(self) -> str:
+        return f"ColumnarJournal({len(self)} entries)"
+
+    def __repr__(self) -> str:
+        return f"ColumnarJournal(entries={len(self)})"
+
+
+# Entry and posting metadata kept by SummaryJournal (what aggregation and
+# cash routing read)
+SUMMARY_ENTRY_KEYS = ("transaction_type", "parent_id", "brick_id", "brick_type")
+SUMMARY_POSTING_KEYS = ("node_id", "category")
+
+
+def _id_digest(*parts: str) -> bytes:
+    """128-bit digest standing in for an ID in SummaryJournal's indexes."""
+    return hashlib.blake2b("\x1f".join(parts).encode(), digest_size=16).digest()
+
+
+class SummaryJournal(ColumnarJournal):
+    """
+    Journal that folds entries into monthly totals instead of storing them.
+
+    Posted entries are validated as in ``Journal.post`` (zero-sum per
+    currency, unique ID), then added to the group of entries with the same
+    month, accounts, currencies, posting signs and the metadata aggregation
+    and cash routing read (``SUMMARY_ENTRY_KEYS``, the ``tags`` type and
+    ``SUMMARY_POSTING_KEYS``). Each group is stored as one columnar entry
+    whose posting amounts are running sums in minor units, so storage grows
+    with nodes × months instead of with the number of entries.
+
+    ``entries``, ``len()`` and the columnar accessors see one entry per group
+    (ID ``'summary:<n>'``, timestamp of its first entry, metadata
+    ``entry_count``), so aggregation, cash routing, balances and
+    ``ScenarioResults`` work unchanged and give the same totals up to
+    floating-point summation order; ``posted_count`` is the number of entries
+    folded in. Entry IDs and other metadata are not kept.
+
+    With ``track_ids`` (the default), IDs and (origin_id, currency) pairs are
+    remembered as 128-bit digests, one per posted entry, for ``has_id``, the
+    duplicate ID check and ``validate_origin_id_uniqueness``. Without it,
+    memory stays O(groups) but ``has_id`` is always False and duplicate IDs
+    and origin_ids go undetected.
+
+    Attributes:
+        track_ids: Whether per-entry ID and origin_id digests are kept
+    """
+
+    def __init__(self, account_registry: Optional[Any] = None, track_ids: bool = True):
+        self.track_ids = track_ids
+        super().__init__(account_registry)
+
+    def _reset(self) -> None:
+        """Create empty groups, digest indexes, columns and balances."""
+        super()._reset()
+        self._count = 0
+        self._groups: dict[tuple[int, int, int], int] = {}  # key -> entry index
+        self._group_count = array("q")
+        self._entry_keys = _Dictionary()
+        self._postings_keys = _Dictionary()
+        self._id_digests: set[bytes] = set()
+        self._origin_digests: set[bytes] = set()
+        self._origin_conflicts: list[str] = []
+        self._recorders: list[list[JournalEntry]] = []
+
+    @classmethod
+    def from_journal(cls, journal: Journal) -> SummaryJournal:
+        """
+        Fold the entries of another journal into a summary journal.
+
+        Args:
+            journal: Source journal
+
+        Returns:
+            SummaryJournal with the same totals, balances and registry
+        """
+        summary = cls(journal.account_registry)
+        summary.post_many(journal.entries)
+        return summary
+
+    def post(self, entry: JournalEntry) -> None:
+        """
+        Validate an entry and add it to its monthly group.
+
+        Args:
+            entry: Journal entry to post
+
+        Raises:
+            ValueError: If entry is not zero-sum or its ID was already posted
+        """
+        entry._validate_zero_sum()
+        if self.has_id(entry.id):
+            raise ValueError(f"Duplicate transaction ID: {entry.id}")
+        self._fold(entry)
+
+    def post_many(self, entries: Iterable[JournalEntry]) -> None:
+        """
+        Validate a batch as ``Journal.post_many`` does, then fold it in order.
+
+        Args:
+            entries: Journal entries to post, in order
+
+        Raises:
+            ValueError: For the first invalid entry; nothing is posted then
+        """
+        batch = list(entries)
+        self._validate_batch(batch)
+        for entry in batch:
+            self._fold(entry)
+
+    def _fold(self, entry: JournalEntry) -> None:
+        """Add a validated entry to its group, balances and indexes."""
+        if self.track_ids:
+            self._id_digests.add(_id_digest(entry.id))
+            self._check_origin(entry)
+        self._add_to_group(entry)
+        self._count += 1
+        self._revision += 1
+        self._update_balances(entry)
+        for recorder in self._recorders:
+            recorder.append(entry)
+
+    def _check_origin(self, entry: JournalEntry) -> None:
+        """Record a conflict if the entry repeats an (origin_id, currency)."""
+        origin_id = entry.metadata.get("origin_id")
+        if origin_id is None:
+            return
+        for currency in {p.amount.currency.code for p in entry.postings}:
+            digest = _id_digest(str(origin_id), currency)
+            if digest in self._origin_digests:
+                self._origin_conflicts.append(
+                    f"Duplicate origin_id '{origin_id}' for currency '{currency}': "
+                    f"entry {entry.id}"
+                )
+            self._origin_digests.add(digest)
+
+    def _add_to_group(self, entry: JournalEntry) -> None:
+        timestamp = entry.timestamp
+        ts_code = self._timestamps.encode((type(timestamp), timestamp))
+        if ts_code == len(self._timestamp_months):
+            self._timestamp_months.append(int(_norm_ts(timestamp).astype(np.int64)))
+        month = self._timestamp_months[ts_code]
+
+        metadata = entry.metadata
+        entry_meta = {k: metadata[k] for k in SUMMARY_ENTRY_KEYS if k in metadata}
+        if metadata.get("parent_id") is None:
+            # Resolved as CashRoutingIndex does, since operation_id is dropped
+            operation_id = metadata.get("operation_id")
+            if isinstance(operation_id, str) and operation_id.startswith("op:"):
+                parts = operation_id.split(":")
+                if len(parts) >= 3 and parts[1]:
+                    entry_meta["parent_id"] = parts[1]
+        tags = metadata.get("tags")
+        if isinstance(tags, dict) and "type" in tags:
+            entry_meta["tags"] = {"type": tags["type"]}
+
+        postings_meta = []
+        postings_key = []
+        for posting in entry.postings:
+            posting_meta = {
+                k: posting.metadata[k]
+                for k in SUMMARY_POSTING_KEYS
+                if k in posting.metadata
+            }
+            currency = posting.amount.currency
+            minor = posting.amount.minor_units
+            postings_meta.append(posting_meta)
+            postings_key.append(
+                (
+                    posting.account_id,
+                    (currency.code, currency.decimals, currency.rounding),
+                    (minor > 0) - (minor < 0),
+                    _freeze(posting_meta),
+                )
+            )
+
+        key = (
+            month,
+            self._entry_keys.encode(_freeze(entry_meta)),
+            self._postings_keys.encode(tuple(postings_key)),
+        )
+        index = self._groups.get(key)
+        if index is not None:
+            self._group_count[index] += 1
+            row = self._entry_offset[index]
+            for posting in entry.postings:
+                self._posting_minor[row] += posting.amount.minor_units
+                row += 1
+            return
+
+        self._groups[key] = len(self._entry_ids)
+        self._group_count.append(1)
+        self._append_entry(
+            JournalEntry(
+                id=f"summary:{len(self._entry_ids)}",
+                timestamp=timestamp,
+                postings=[
+                    Posting(posting.account_id, posting.amount, posting_meta)
+                    for posting, posting_meta in zip(
+                        entry.postings, postings_meta, strict=True
+                    )
+                ],
+                metadata=entry_meta,
+            )
+        )
+
+    def _materialize(self, index: int) -> JournalEntry:
+        entry = super()._materialize(index)
+        entry.metadata["entry_count"] = self._group_count[index]
+        return entry
+
+    @contextmanager
+    def recording(self) -> Iterator[list[JournalEntry]]:
+        """Collect the original entries posted while the block runs."""
+        posted: list[JournalEntry] = []
+        self._recorders.append(posted)
+        try:
+            yield posted
+        finally:
+            self._recorders.remove(posted)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Recorders belong to the process that opened them
+        return {**self.__dict__, "_recorders": []}
+
+    def has_id(self, entry_id: str) -> bool:
+        """Check if an entry with the given ID was posted (False without track_ids)."""
+        return self.track_ids and _id_digest(entry_id) in self._id_digests
+
+    @property
+    def posted_count(self) -> int:
+        """Number of entries posted (``len()`` counts the groups)."""
+        return self._count
+
+    @property
+    def origin_conflicts(self) -> list[str]:
+        """Repeated (origin_id, currency) pairs seen while posting, in order."""
+        return list(self._origin_conflicts)
+
+    def validate_invariants(self, account_registry: Optional[Any] = None) -> list[str]:
+        """
+        Validate journal invariants.
+
+        Zero-sum and unique IDs are enforced when posting; this checks for
+        orphan accounts.
+
+        Args:
+            account_registry: Account registry for orphan account checks
+
+        Returns:
+            List of validation errors (empty if all valid)
+        """
+        if not account_registry:
+            return []
+        return [
+            f"Orphan account {account_id}"
+            for account_id in self._accounts.values
+            if not account_registry.has_account(account_id)
+        ]
+
+    def __str__(self) -> str:
+        return f"SummaryJournal({self._count} entries in {len(self)} groups)"
+
+    def __repr__(self) -> str:
+        return f"SummaryJournal(entries={self._count}, groups={len(self)})"
+
+
+class TransactionFingerprint:
+    """
+    Spec and links of one brick, rendered once for ``generate_transaction_id``.
+
+    Rendering ``str(sorted(spec.items()))`` dominates ID generation when a
+    spec holds arrays, so strategies build one fingerprint per simulation
+    (``ScenarioContext.transaction_fingerprint``) and pass it to every call.
+    The rendering is only reused for the exact spec/links objects it was
+    built from; any other dict is rendered as before, so IDs never change.
+
+    Attributes:
+        spec: Spec dict the fingerprint was built from
+        links: Links dict the fingerprint was built from
+        spec_str: Rendered spec
+        links_str: Rendered links ('None' when empty)
+    """
+
+    __slots__ = ("spec", "links", "spec_str", "links_str")
+
+    def __init__(self, spec: dict[str, Any], links: dict[str, Any]):
+        self.spec = spec
+        self.links = links
+        self.spec_str = str(sorted(spec.items()))
+        self.links_str = str(sorted(links.items())) if links else "None"
+
+
 def generate_transaction_id(
     brick_id: str,
     timestamp: datetime,
     spec: dict[str, Any],
     links: dict[str, Any],
     sequence: int = 0,
+    fingerprint: TransactionFingerprint | None = None,
 ) -> str:
     """
     Generate deterministic transaction ID.
@@ -408,6 +1296,8 @@ def generate_transaction_id(
         spec: Brick specification
         links: Brick links
         sequence: Sequence number for tie-breaking
+        fingerprint: Pre-rendered spec/links of the brick; used for whichever
+            of spec and links is the object it was built from
 
     Returns:
         Deterministic transaction ID
@@ -422,11 +1312,16 @@ def generate_transaction_id(
             timestamp.isoformat() if hasattr(timestamp, "isoformat") else str(timestamp)
         )
 
-    # Handle None links
-    links_str = str(sorted(links.items())) if links else "None"
-    content = (
-        f"{brick_id}:{timestamp_str}:{str(sorted(spec.items()))}:{links_str}:{sequence}"
-    )
+    if fingerprint is not None and spec is fingerprint.spec:
+        spec_str = fingerprint.spec_str
+    else:
+        spec_str = str(sorted(spec.items()))
+    if fingerprint is not None and links is fingerprint.links:
+        links_str = fingerprint.links_str
+    else:
+        # Handle None links
+        links_str = str(sorted(links.items())) if links else "None"
+    content = f"{brick_id}:{timestamp_str}:{spec_str}:{links_str}:{sequence}"
     return hashlib.sha256(content.encode()).hexdigest()[:16]
 
 
@@ -0,0 +1,284 @@
+"""
+Opt-in memory reporting for scenario runs.
+
+Enabled with ``Scenario.run(..., memory_report=True)``: the run is traced with
+``tracemalloc`` and ``res["meta"]["memory"]`` reports
+
+- peak and retained bytes per phase and per brick (traced counters),
+- the source lines holding most of the retained memory (snapshot),
+- retained bytes per subsystem (brick output arrays, events, journal,
+  journal metadata, MacroBrick aggregates, result frames), measured by sizing
+  the returned objects, and the byte cost of one journal entry.
+
+Subsystem sizes come from the objects themselves, traced bytes from the
+allocator, so the 'unattributed' remainder can be negative (e.g. objects
+built from interpreter free lists are not new traced allocations).
+
+Tracing slows the run down considerably; use it for capacity planning, not
+for timing.
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from enum import Enum
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from .profiling import NULL_PROFILER, NullProfiler, RunProfiler
+
+if TYPE_CHECKING:
+    from .bricks import FinBrickABC
+    from .journal import Journal
+
+# Objects shared process-wide; never attributed to a run
+_UNSIZED = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType, Enum)
+
+# Number of source lines listed in 'top_allocations'
+TOP_ALLOCATIONS = 10
+
+
+def deep_sizeof(obj: Any, seen: set[int] | None = None) -> int:
+    """
+    Bytes held by an object and everything it references.
+
+    NumPy arrays count their buffers, pandas objects their deep
+    ``memory_usage``. Objects whose id is in ``seen`` are skipped and every
+    visited id is added, so one ``seen`` set shared across calls counts shared
+    objects once. Classes, modules, functions and enum members are ignored.
+
+    Args:
+        obj: Object to size
+        seen: Ids of objects already counted (updated in place)
+
+    Returns:
+        Size in bytes
+    """
+    if seen is None:
+        seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if id(o) in seen or o is None or isinstance(o, _UNSIZED):
+            continue
+        seen.add(id(o))
+        if isinstance(o, (pd.DataFrame, pd.Series, pd.Index)):
+            usage = o.memory_usage(deep=True)
+            total += int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+            continue
+        total += sys.getsizeof(o)
+        if isinstance(o, np.ndarray):
+            # Views report their header only; their buffer belongs to the base
+            if o.base is not None:
+                stack.append(o.base)
+            if o.dtype == object:
+                stack.extend(o.ravel().tolist())
+        elif isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+        elif not isinstance(o, (str, bytes, int, float, complex)):
+            if hasattr(o, "__dict__"):
+                stack.append(o.__dict__)
+            for cls in type(o).__mro__:
+                for slot in getattr(cls, "__slots__", ()):
+                    if hasattr(o, slot):
+                        stack.append(getattr(o, slot))
+    return total
+
+
+def _journal_metadata(journal: Journal) -> list[Any]:
+    """Metadata containers of a journal (per-entry dicts or encoded columns)."""
+    if hasattr(journal, "_entry_meta"):
+        return [journal._entry_meta, journal._posting_meta]
+    containers: list[Any] = []
+    for entry in journal.entries:
+        containers.append(entry.metadata)
+        containers.extend(posting.metadata for posting in entry.postings)
+    return containers
+
+
+class MemoryProfiler:
+    """
+    Traces the memory of one scenario run.
+
+    Used in place of the run's profiler: spans are forwarded to the timing
+    profiler and additionally record traced memory. Nested spans are
+    supported; the peak of an inner span also counts for the spans around it.
+
+    Attributes:
+        timer: Timing profiler spans are forwarded to
+        spans: Recorded spans in start order
+    """
+
+    def __init__(self, timer: RunProfiler | NullProfiler = NULL_PROFILER):
+        self.timer = timer
+        self.spans: list[dict[str, Any]] = []
+        self._open: list[dict[str, Any]] = []
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+        self._before = None if self._started else tracemalloc.take_snapshot()
+        self._peak = 0
+        self._origin = self._fold()
+        self._peak = self._origin
+
+    @property
+    def journal(self) -> Journal | None:
+        """Journal tracked by the timing profiler."""
+        return self.timer.journal
+
+    @journal.setter
+    def journal(self, journal: Journal | None) -> None:
+        self.timer.journal = journal
+
+    def _fold(self) -> int:
+        """Fold the traced peak into all open spans, restart it and return current bytes."""
+        current, peak = tracemalloc.get_traced_memory()
+        for span in self._open:
+            span["peak"] = max(span["peak"], peak)
+        self._peak = max(self._peak, peak)
+        tracemalloc.reset_peak()
+        return current
+
+    @contextmanager
+    def _traced(self, record: dict[str, Any]) -> Iterator[None]:
+        # Recorded at entry so spans stay in start order
+        self.spans.append(record)
+        current = self._fold()
+        state = {"start": current, "peak": current}
+        self._open.append(state)
+        try:
+            yield
+        finally:
+            current = self._fold()
+            self._open.pop()
+            record["peak_bytes"] = state["peak"] - state["start"]
+            record["retained_bytes"] = current - state["start"]
+
+    @contextmanager
+    def span(self, name: str, category: str = "phase", **args: Any) -> Iterator[None]:
+        """
+        Trace a block of code (and time it with the timing profiler).
+
+        Args:
+            name: Span name (phase name or brick ID)
+            category: 'phase' or 'brick'
+            **args: Extra fields passed to the timing profiler
+        """
+        with self.timer.span(name, category, **args):
+            with self._traced({"name": name, "category": category}):
+                yield
+
+    @contextmanager
+    def brick(self, brick: FinBrickABC, phase: str) -> Iterator[None]:
+        """
+        Trace the simulation of one brick.
+
+        Args:
+            brick: Brick being simulated
+            phase: Phase the brick runs in (e.g. 'first_pass', 'cash_pass')
+        """
+        with self.timer.brick(brick, phase):
+            with self._traced({"name": brick.id, "category": "brick", "phase": phase}):
+                yield
+
+    def stop(self) -> None:
+        """Stop tracing if this profiler started it."""
+        if self._started and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def _top_allocations(self) -> list[dict[str, Any]]:
+        """Source lines holding the most memory allocated during the run."""
+        after = tracemalloc.take_snapshot()
+        if self._before is not None:
+            stats = after.compare_to(self._before, "lineno")
+            sizes = [(stat, stat.size_diff, stat.count_diff) for stat in stats]
+        else:
+            sizes = [
+                (stat, stat.size, stat.count) for stat in after.statistics("lineno")
+            ]
+        # Drop the profiler's own bookkeeping (filtered per line: much faster
+        # than Snapshot.filter_traces on large traces)
+        ignore = {tracemalloc.__file__, __file__}
+        sizes = sorted(
+            (s for s in sizes if s[1] > 0 and s[0].traceback[0].filename not in ignore),
+            key=lambda s: -s[1],
+        )
+        return [
+            {
+                "site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "bytes": size,
+                "blocks": blocks,
+            }
+            for stat, size, blocks in sizes[:TOP_ALLOCATIONS]
+        ]
+
+    def report(
+        self, results: dict[str, Any], exclude: tuple[Any, ...] = ()
+    ) -> dict[str, Any]:
+        """
+        Build the memory report of a finished run and stop tracing.
+
+        Args:
+            results: Results dict of the run
+            exclude: Objects that existed before the run (e.g. the scenario's
+                own bricks and registry); they are not attributed
+
+        Returns:
+            Dict with 'peak_bytes', 'retained_bytes', 'phases', 'bricks',
+            'top_allocations', 'subsystems', 'journal_entries' and
+            'bytes_per_journal_entry'
+        """
+        try:
+            retained = self._fold() - self._origin
+            peak = self._peak - self._origin
+            top = self._top_allocations()
+        finally:
+            self.stop()
+
+        seen: set[int] = set()
+        for obj in exclude:
+            deep_sizeof(obj, seen)
+
+        outputs = results["outputs"]
+        journal = results["journal"]
+        events = [output.get("events") for output in outputs.values()]
+        subsystems = {
+            "events": deep_sizeof(events, seen),
+            "brick_outputs": deep_sizeof(outputs, seen),
+            "journal_metadata": deep_sizeof(_journal_metadata(journal), seen),
+            "journal": deep_sizeof(journal, seen),
+            "struct_aggregates": deep_sizeof(results["by_struct"], seen),
+            "results": deep_sizeof([results["totals"], results["views"]], seen),
+        }
+        subsystems["unattributed"] = retained - sum(subsystems.values())
+
+        entries = len(journal)
+        journal_bytes = subsystems["journal"] + subsystems["journal_metadata"]
+        return {
+            "peak_bytes": peak,
+            "retained_bytes": retained,
+            "phases": [
+                {k: v for k, v in s.items() if k != "category"}
+                for s in self.spans
+                if s["category"] == "phase"
+            ],
+            "bricks": [
+                {k: v for k, v in s.items() if k != "category"}
+                for s in self.spans
+                if s["category"] == "brick"
+            ],
+            "top_allocations": top,
+            "subsystems": subsystems,
+            "journal_entries": entries,
+            "bytes_per_journal_entry": journal_bytes / entries if entries else None,
+        }
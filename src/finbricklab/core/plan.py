@@ -0,0 +1,86 @@
+"""
+Compiled scenario plans.
+
+``Scenario.compile`` does the setup work of a run that only depends on the
+scenario definition, not on ``start``/``months``: resolving the selection,
+ordering bricks by their dependencies, wiring strategies, resolving
+mortgage links and building the account registry template. The resulting
+plan is reused by ``Scenario.run(plan=...)``; runs recompile automatically
+when the bricks or MacroBricks changed since the plan was built. Compiling
+and running leave the bricks unmodified (runs work on copies), so one plan
+can serve concurrent runs.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .accounts import Account
+    from .scenario import Scenario
+
+
+def scenario_signature(scenario: Scenario) -> tuple[Any, ...]:
+    """
+    Snapshot of everything a compiled plan depends on.
+
+    Covers brick identity, IDs, kinds, links and activation dates, MacroBrick
+    membership and the default settlement account. Spec values are not
+    part of the signature: they only matter once bricks are prepared.
+
+    Args:
+        scenario: Scenario to describe
+
+    Returns:
+        Hashable-by-equality tuple; equal tuples mean a plan is still valid
+    """
+    bricks = tuple(
+        (
+            id(brick),
+            brick.id,
+            brick.kind,
+            repr(brick.links),
+            brick.start_date,
+            brick.end_date,
+            brick.duration_m,
+        )
+        for brick in scenario.bricks
+    )
+    macrobricks = tuple(
+        (id(mb), mb.id, tuple(mb.members)) for mb in scenario.macrobricks
+    )
+    return (bricks, macrobricks, scenario.settlement_default_cash_id)
+
+
+@dataclass(frozen=True)
+class ScenarioPlan:
+    """
+    Immutable setup of a scenario run, independent of start and months.
+
+    Attributes:
+        signature: ``scenario_signature`` of the scenario after compiling
+        selection: Selection the plan was compiled for (None = all bricks)
+        brick_ids: IDs of the bricks to execute
+        overlaps: Bricks shared by several selected MacroBricks
+        execution_order: Brick IDs in dependency order
+        cash_ids: Cash brick IDs in the execution set, in scenario order
+        accounts: Accounts registered in every run's account registry
+        struct_members: Flattened member brick IDs per MacroBrick
+        start_dates: Start dates derived from StartLinks, by brick ID
+    """
+
+    signature: tuple[Any, ...]
+    selection: tuple[str, ...] | None
+    brick_ids: frozenset[str]
+    overlaps: dict[str, dict[str, Any]]
+    execution_order: tuple[str, ...]
+    cash_ids: tuple[str, ...]
+    accounts: tuple[Account, ...]
+    struct_members: dict[str, frozenset[str]]
+    start_dates: dict[str, date]
+
+    def is_valid_for(self, scenario: Scenario) -> bool:
+        """Whether the scenario is unchanged since the plan was compiled."""
+        return self.signature == scenario_signature(scenario)
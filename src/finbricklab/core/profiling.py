@@ -0,0 +1,168 @@
+"""
+Opt-in timing instrumentation for scenario runs.
+
+Enabled with ``ScenarioConfig(profile=True)``: ``Scenario.run`` then records
+wall time and journal-entry counts per phase and per brick and stores them
+in ``res["meta"]["timings"]``. Timings can be exported as a Chrome trace
+(``chrome://tracing`` / Perfetto) with ``write_chrome_trace``.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .bricks import FinBrickABC
+    from .journal import Journal
+
+# Attribute holding the strategy object on each brick family
+_STRATEGY_ATTRIBUTES = ("valuation", "schedule", "flow", "transfer")
+
+
+class RunProfiler:
+    """
+    Collects timed spans of one scenario run.
+
+    Each span records its start (seconds since the profiler was created),
+    duration and the number of journal entries posted while it was open.
+
+    Attributes:
+        journal: Journal whose entry count is tracked (set once it exists)
+        spans: Recorded spans in completion order
+    """
+
+    def __init__(self):
+        self._origin = perf_counter()
+        self.journal: Journal | None = None
+        self.spans: list[dict[str, Any]] = []
+
+    def _entry_count(self) -> int:
+        return len(self.journal) if self.journal is not None else 0
+
+    @contextmanager
+    def span(self, name: str, category: str = "phase", **args: Any) -> Iterator[None]:
+        """
+        Time a block of code.
+
+        Args:
+            name: Span name (phase name or brick ID)
+            category: 'phase' or 'brick'
+            **args: Extra fields stored with the span (e.g. kind, strategy)
+        """
+        entries_before = self._entry_count()
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.spans.append(
+                {
+                    "name": name,
+                    "category": category,
+                    "start": start - self._origin,
+                    "seconds": perf_counter() - start,
+                    "entries": self._entry_count() - entries_before,
+                    **args,
+                }
+            )
+
+    def brick(self, brick: FinBrickABC, phase: str) -> Any:
+        """
+        Time the simulation of one brick.
+
+        Args:
+            brick: Brick being simulated
+            phase: Phase the brick runs in (e.g. 'first_pass', 'cash_pass')
+        """
+        strategy = next(
+            (
+                getattr(brick, attr)
+                for attr in _STRATEGY_ATTRIBUTES
+                if getattr(brick, attr, None) is not None
+            ),
+            None,
+        )
+        return self.span(
+            brick.id,
+            category="brick",
+            kind=brick.kind,
+            strategy=type(strategy).__name__ if strategy is not None else None,
+            phase=phase,
+        )
+
+    def timings(self) -> dict[str, Any]:
+        """
+        Summarize the recorded spans.
+
+        Returns:
+            Dict with 'total_seconds', 'phases' and 'bricks' (lists of spans
+            ordered by start time)
+        """
+        spans = sorted(self.spans, key=lambda s: s["start"])
+        return {
+            "total_seconds": perf_counter() - self._origin,
+            "phases": [s for s in spans if s["category"] == "phase"],
+            "bricks": [s for s in spans if s["category"] == "brick"],
+        }
+
+
+class NullProfiler:
+    """Profiler stand-in used when profiling is off; records nothing."""
+
+    journal = None
+
+    def span(self, name: str, category: str = "phase", **args: Any) -> Any:
+        return nullcontext()
+
+    def brick(self, brick: FinBrickABC, phase: str) -> Any:
+        return nullcontext()
+
+
+NULL_PROFILER = NullProfiler()
+
+
+def chrome_trace(timings: dict[str, Any]) -> dict[str, Any]:
+    """
+    Convert run timings to the Chrome trace event format.
+
+    Args:
+        timings: ``res["meta"]["timings"]`` of a profiled run
+
+    Returns:
+        Dict with a 'traceEvents' list of complete ('X') events
+    """
+    events = []
+    for span in sorted(timings["phases"] + timings["bricks"], key=lambda s: s["start"]):
+        args = {
+            key: value
+            for key, value in span.items()
+            if key not in ("name", "category", "start", "seconds")
+        }
+        events.append(
+            {
+                "name": span["name"],
+                "cat": span["category"],
+                "ph": "X",
+                "ts": span["start"] * 1e6,
+                "dur": span["seconds"] * 1e6,
+                "pid": 1,
+                "tid": 1,
+                "args": args,
+            }
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write_chrome_trace(timings: dict[str, Any], path: str) -> None:
+    """
+    Write run timings as a Chrome trace JSON file.
+
+    Args:
+        timings: ``res["meta"]["timings"]`` of a profiled run
+        path: Output file path
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(chrome_trace(timings), f)
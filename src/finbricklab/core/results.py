@@ -4,7 +4,9 @@ Results and output structures for FinBrickLab.
 
 from __future__ import annotations
 
-from typing import NotRequired, TypedDict
+from collections.abc import Callable, ItemsView, Iterator, Mapping, ValuesView
+from functools import lru_cache
+from typing import Any, NotRequired, TypedDict
 
 import numpy as np
 import pandas as pd
@@ -14,10 +16,10 @@ from .accounts import (
     AccountScope,
     AccountType,
     get_node_scope,
-    get_node_type,
 )
+from .aggregation import aggregate_cash_flows, posting_table
 from .events import Event
-from .journal import Journal, JournalEntry
+from .journal import Journal
 from .registry import Registry
 from .transfer_visibility import TransferVisibility
 
@@ -54,6 +56,249 @@ class BrickOutput(TypedDict):
     events: list[Event]  # Time-stamped events describing key occurrences
 
 
+@lru_cache(maxsize=64)
+def shared_zeros(length: int) -> np.ndarray:
+    """
+    Shared read-only array of ``length`` float zeros.
+
+    Shell outputs (flow and transfer bricks, the liabilities of assets, the
+    assets of liabilities, ...) use it instead of allocating ``np.zeros(T)``
+    per brick, so thousands of shell bricks cost one buffer per horizon.
+    Writing to it raises ``ValueError``; copy it (``arr.copy()`` or
+    ``arr + other``) to get a writable array.
+
+    Args:
+        length: Number of months
+
+    Returns:
+        The same read-only array for every call with the same length
+    """
+    zeros = np.zeros(length)
+    zeros.flags.writeable = False
+    return zeros
+
+
+def is_shared_zeros(array: np.ndarray) -> bool:
+    """Whether ``array`` is the buffer returned by ``shared_zeros``."""
+    return array.ndim == 1 and array is shared_zeros(len(array))
+
+
+class _SharedZerosRef:
+    """Picklable stand-in for ``shared_zeros(length)``; unpickles to the shared array."""
+
+    __slots__ = ("length",)
+
+    def __init__(self, length: int):
+        self.length = length
+
+    def __reduce__(self):
+        return (shared_zeros, (self.length,))
+
+
+def _pack_shared_zeros(outputs: dict[str, BrickOutput]) -> dict[str, dict]:
+    """Replace shared zero arrays with references so pickles stay small and shared."""
+    return {
+        brick_id: {
+            key: (
+                _SharedZerosRef(len(value))
+                if isinstance(value, np.ndarray) and is_shared_zeros(value)
+                else value
+            )
+            for key, value in output.items()
+        }
+        for brick_id, output in outputs.items()
+    }
+
+
+def _unpack_shared_zeros(outputs: dict[str, dict]) -> dict[str, BrickOutput]:
+    """Resolve references left by ``_pack_shared_zeros`` (when never pickled)."""
+    return {
+        brick_id: {
+            key: (
+                shared_zeros(value.length)
+                if isinstance(value, _SharedZerosRef)
+                else value
+            )
+            for key, value in output.items()
+        }
+        for brick_id, output in outputs.items()
+    }
+
+
+# Placeholder stored under keys whose value is not computed yet
+_PENDING = object()
+
+
+class LazyResults(dict):
+    """
+    Dict whose values can be computed on first access.
+
+    Deferred keys keep their position and are listed, counted and tested with
+    ``in`` like stored ones; reading one (``[]``, ``get``, ``items()``,
+    ``values()``, ``dict(res)``) calls its factory once and stores the value.
+    Assigning or deleting a deferred key discards its factory. Pickling and
+    comparing compute all values.
+
+    Used for run results, so sweeps that only read ``res["totals"]`` never
+    build views or MacroBrick aggregates.
+
+    Example:
+        >>> res = LazyResults({"a": 1}, pending={"b": lambda: 2})
+        >>> res.pending
+        frozenset({'b'})
+        >>> res["b"], res.pending
+        (2, frozenset())
+    """
+
+    def __init__(
+        self,
+        values: Mapping[str, Any] | None = None,
+        pending: Mapping[str, Callable[[], Any]] | None = None,
+    ):
+        super().__init__(values or {})
+        self._factories: dict[str, Callable[[], Any]] = {}
+        for key, factory in (pending or {}).items():
+            if key not in self:
+                self.defer(key, factory)
+
+    @property
+    def pending(self) -> frozenset[str]:
+        """Keys whose values have not been computed yet."""
+        return frozenset(self._factories)
+
+    def defer(self, key: str, factory: Callable[[], Any]) -> None:
+        """
+        Set ``key`` to be computed by ``factory`` on first access.
+
+        Args:
+            key: Key to set (replaces a stored value)
+            factory: Callable without arguments returning the value
+        """
+        super().__setitem__(key, _PENDING)
+        self._factories[key] = factory
+
+    def resolve(self) -> LazyResults:
+        """Compute all pending values and return self."""
+        for key in list(self._factories):
+            self[key]
+        return self
+
+    def __getitem__(self, key: str) -> Any:
+        value = super().__getitem__(key)
+        if value is _PENDING:
+            value = self._factories[key]()
+            # Keep a value assigned while the factory ran
+            if self._factories.pop(key, None) is not None:
+                super().__setitem__(key, value)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        # Overridden so dict(res) and {**res} read values through __getitem__
+        return super().__iter__()
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._factories.pop(key, None)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._factories.pop(key, None)
+        super().__delitem__(key)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyResults):
+            other.resolve()
+        return super(LazyResults, self.resolve()).__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __or__(self, other: Mapping[str, Any]) -> LazyResults:
+        merged = self.copy()
+        merged.update(other)
+        return merged
+
+    def __ior__(self, other: Mapping[str, Any]) -> LazyResults:
+        self.update(other)
+        return self
+
+    def __repr__(self) -> str:
+        items = ", ".join(
+            f"{k!r}: {'<pending>' if v is _PENDING else repr(v)}"
+            for k, v in super().items()
+        )
+        return f"{type(self).__name__}({{{items}}})"
+
+    def __reduce__(self):
+        return (type(self), (dict(self.resolve()),))
+
+    def values(self) -> ValuesView[Any]:
+        return ValuesView(self)
+
+    def items(self) -> ItemsView[str, Any]:
+        return ItemsView(self)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key not in self:
+            return super().pop(key, *default)
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self) -> tuple[str, Any]:
+        key = next(reversed(self))
+        return key, self.pop(key)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        self._factories.clear()
+        super().clear()
+
+    def copy(self) -> LazyResults:
+        """Shallow copy sharing the pending factories (each copy calls its own)."""
+        clone = LazyResults()
+        dict.update(clone, super().items())
+        clone._factories = dict(self._factories)
+        return clone
+
+
+class PathsOutput(TypedDict):
+    """
+    Output of a Monte Carlo simulation of one brick over many price paths.
+
+    Produced without a journal: cash effects are returned as arrays instead
+    of being posted, so thousands of paths can be simulated in one call.
+
+    Attributes:
+        price: Price per unit, shape (paths, months)
+        units: Units held at month end, shape (paths, months)
+        value: Asset value (units x price, 0 after liquidation), shape (paths, months)
+        cash_flow: Net cash effect on the settlement account per month
+            (dividends and sells positive, buys negative), shape (paths, months)
+        net_worth: value plus cumulative cash_flow, shape (paths, months)
+        bands: Percentile -> net worth across paths per month, shape (months,)
+    """
+
+    price: np.ndarray
+    units: np.ndarray
+    value: np.ndarray
+    cash_flow: np.ndarray
+    net_worth: np.ndarray
+    bands: dict[float, np.ndarray]
+
+
 class ScenarioResults:
     """
     Helper class for convenient access to different time aggregations of scenario results.
@@ -86,11 +331,72 @@ class ScenarioResults:
         self._monthly_data = totals  # PeriodIndex 'M'
         self._registry = registry
         self._outputs = outputs
+        self._journal_loader = None  # Set by load() to read the journal on demand
         self._journal = journal
         self._default_selection = default_selection
         self._default_visibility = default_visibility
         self._include_cash = include_cash
 
+    @property
+    def _journal(self):
+        if self._journal_loader is not None:
+            self._journal_value = self._journal_loader()
+            self._journal_loader = None
+        return self._journal_value
+
+    @_journal.setter
+    def _journal(self, journal) -> None:
+        self._journal_value = journal
+        self._journal_loader = None
+
+    def save(self, path: str) -> None:
+        """
+        Save the results to a directory in a binary columnar format.
+
+        Totals columns, output arrays and journal columns are stored as
+        ``.npy`` files; bricks, events and the journal's dictionary-encoded
+        metadata as JSON. ``ScenarioResults.load`` opens the directory again
+        without re-simulating.
+
+        Args:
+            path: Target directory (created if missing)
+
+        Raises:
+            ValueError: If a spec, event or metadata value has no JSON form
+
+        Example:
+            >>> results = scenario.run(start=date(2026, 1, 1), months=120)
+            >>> results["views"].save("runs/baseline")
+            >>> views = ScenarioResults.load("runs/baseline")
+            >>> views.yearly()
+        """
+        from .archive import save_results
+
+        save_results(self, path)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> ScenarioResults:
+        """
+        Open results saved with ``save``.
+
+        Output arrays are memory-mapped (read-only) and the journal is read
+        when it is first used, so opening an archive for one view only reads
+        the files that view needs.
+
+        Args:
+            path: Directory written by ``save``
+            mmap: Memory-map output arrays; False reads them into memory
+
+        Returns:
+            ScenarioResults with the saved totals, outputs, registry and journal
+
+        Raises:
+            ValueError: If the directory does not hold a results archive
+        """
+        from .archive import load_results
+
+        return load_results(path, mmap=mmap)
+
     def to_freq(self, freq: str = "Q") -> pd.DataFrame:
         """
         Aggregate to specified frequency.
@@ -170,6 +476,7 @@ class ScenarioResults:
                 selection=selection,
                 transfer_visibility=transfer_visibility,
                 outputs=self._outputs,
+                use_flow_matrix=True,
             )
 
             # Apply transfer visibility if needed (already handled in aggregation)
@@ -285,9 +592,13 @@ class ScenarioResults:
                     # Hide internal transfers - zero out the cash flows
                     filtered_output = output.copy()
                     if "cash_in" in output:
-                        filtered_output["cash_in"] = np.zeros_like(output["cash_in"])
+                        filtered_output["cash_in"] = shared_zeros(
+                            len(output["cash_in"])
+                        )
                     if "cash_out" in output:
-                        filtered_output["cash_out"] = np.zeros_like(output["cash_out"])
+                        filtered_output["cash_out"] = shared_zeros(
+                            len(output["cash_out"])
+                        )
                     filtered_outputs[brick_id] = filtered_output
                 elif visibility == TransferVisibility.ONLY:
                     # Show only transfers
@@ -1300,6 +1611,7 @@ def _aggregate_journal_monthly(
     selection: set[str] | None = None,
     transfer_visibility: TransferVisibility = TransferVisibility.BOUNDARY_ONLY,
     outputs: dict[str, BrickOutput] | None = None,
+    use_flow_matrix: bool = False,
 ) -> pd.DataFrame:
     """
     Aggregate journal entries monthly with internal cancellation logic.
@@ -1322,20 +1634,16 @@ def _aggregate_journal_monthly(
         selection: Set of A/L node IDs to include (None = all)
         transfer_visibility: Transfer visibility setting
         outputs: Optional brick outputs for balance aggregation
+        use_flow_matrix: Answer non-empty selections from the journal's cached
+            node×month flow matrix (equal up to float summation order)
 
     Returns:
         DataFrame with monthly totals (cash_in, cash_out, assets, liabilities, interest, equity)
     """
-    from datetime import datetime
-
-    import numpy as np
-
     # Initialize arrays
     length = len(time_index)
     cash_in = np.zeros(length)
     cash_out = np.zeros(length)
-    interest_in_from_journal = np.zeros(length)
-    interest_out_from_journal = np.zeros(length)
     assets = np.zeros(length)
     liabilities = np.zeros(length)
     interest = np.zeros(length)
@@ -1421,203 +1729,39 @@ def _aggregate_journal_monthly(
         else set()
     )
 
-    # Group entries by month
-    entries_by_month: dict[str, list[JournalEntry]] = {}
-    for entry in journal.entries:
-        # Normalize timestamp to month
-        if isinstance(entry.timestamp, datetime):
-            month_str = entry.timestamp.strftime("%Y-%m")
-        else:
-            # Handle numpy datetime64
-            month_str = str(entry.timestamp)[:7]  # YYYY-MM
-
-        if month_str not in entries_by_month:
-            entries_by_month[month_str] = []
-        entries_by_month[month_str].append(entry)
-
-    # Process each month
-    for month_idx, period in enumerate(time_index):
-        month_str = period.strftime("%Y-%m")
-
-        # Get entries for this month
-        month_entries = entries_by_month.get(month_str, [])
-
-        # Process each entry
-        for entry in month_entries:
-            if entry.metadata.get("transaction_type") == "opening":
-                continue
-            # Check if entry touches boundary
-            # Use get_node_scope() to detect boundary accounts (including FX_CLEAR_NODE_ID)
-            touches_boundary = False
-            for posting in entry.postings:
-                boundary_node_id = posting.metadata.get("node_id")
-                if boundary_node_id is None or not isinstance(boundary_node_id, str):
-                    continue  # Skip postings without node_id (legacy entries)
-                try:
-                    scope = get_node_scope(boundary_node_id, account_registry)
-                    if scope == AccountScope.BOUNDARY:
-                        touches_boundary = True
-                        break
-                except ValueError:
-                    # Fallback to direct comparison for known boundary nodes
-                    if boundary_node_id == BOUNDARY_NODE_ID:
-                        touches_boundary = True
-                        break
-
-            # Check if this is a transfer entry
-            # Include fx_transfer so it participates in transfer-visibility logic
-            is_transfer_entry = entry.metadata.get("transaction_type") in {
-                "transfer",
-                "tbrick",
-                "maturity_transfer",
-                "fx_transfer",
-            }
-
-            entry_hits_selected_cash = False
-            if selected_cash_nodes:
-                for posting in entry.postings:
-                    posting_node_id = posting.metadata.get("node_id")
-                    if posting_node_id in selected_cash_nodes:
-                        entry_hits_selected_cash = True
-                        break
-
-            # Check if both postings are INTERNAL (global check, regardless of selection)
-            both_internal_global = not touches_boundary
-            if both_internal_global:
-                # Verify all postings are INTERNAL (not boundary)
-                for posting in entry.postings:
-                    posting_node_id = posting.metadata.get("node_id")
-                    if posting_node_id is None or not isinstance(posting_node_id, str):
-                        both_internal_global = False
-                        break
-                    try:
-                        scope = get_node_scope(posting_node_id, account_registry)
-                        if scope != AccountScope.INTERNAL:
-                            both_internal_global = False
-                            break
-                    except ValueError:
-                        # Fallback: if can't determine scope, assume not internal
-                        both_internal_global = False
-                        break
-
-            # Check if both postings are INTERNAL and in selection (for cancellation)
-            both_internal_in_selection = False
-            if both_internal_global and selection_set:
-                both_in_selection = True
-                for posting in entry.postings:
-                    posting_node_id = posting.metadata.get("node_id")
-                    if posting_node_id is None or not isinstance(posting_node_id, str):
-                        both_in_selection = (
-                            False  # Legacy entries can't be internal transfers
-                        )
-                        break
-                    if posting_node_id not in selection_set:
-                        both_in_selection = False
-                        break
-                if both_in_selection:
-                    both_internal_in_selection = True
-
-            # Apply TransferVisibility filtering
-            if transfer_visibility != TransferVisibility.ALL:
-                if transfer_visibility == TransferVisibility.OFF:
-                    # Hide internal transfers (global check, works without selection)
-                    if is_transfer_entry and both_internal_global:
-                        continue  # Skip internal transfers
-                    if not touches_boundary:
-                        continue  # Skip all internal entries
-                    # Also skip if both internal and in selection (cancellation)
-                    if both_internal_in_selection:
-                        continue  # Skip internal transfers in selection
-                elif transfer_visibility == TransferVisibility.ONLY:
-                    # Show only transfer entries
-                    if not is_transfer_entry:
-                        continue  # Skip non-transfer entries
-                elif transfer_visibility == TransferVisibility.BOUNDARY_ONLY:
-                    # Show only boundary-crossing transfers (not internal transfers)
-                    if not touches_boundary and not entry_hits_selected_cash:
-                        continue  # Skip non-boundary entries
-
-            # Apply cancellation: if both INTERNAL and in selection, cancel
-            if both_internal_in_selection:
-                # Skip this entry for cashflow (internal transfer cancels)
-                continue
-
-            cash_postings: list = []
-            if selection_set:
-                if selected_cash_nodes:
-                    for posting in entry.postings:
-                        posting_node_id = posting.metadata.get("node_id")
-                        if (
-                            posting_node_id is not None
-                            and isinstance(posting_node_id, str)
-                            and posting_node_id in selected_cash_nodes
-                        ):
-                            cash_postings.append(posting)
-                else:
-                    cash_postings = []
-            else:
-                # No selection_set: pick the first ASSET posting (status quo)
-                for posting in entry.postings:
-                    posting_node_id = posting.metadata.get("node_id")
-                    if posting_node_id is None or not isinstance(posting_node_id, str):
-                        continue  # Skip postings without node_id (legacy entries)
-                    try:
-                        node_type = get_node_type(posting_node_id, account_registry)
-                        if node_type == AccountType.ASSET:
-                            cash_postings = [posting]
-                            break
-                    except ValueError:
-                        continue  # Skip if node_id is None or invalid
-
-            # Include ASSET posting (already selection-aware if selection_set was provided)
-            interest_recorded_from_cash = False
-            for asset_posting in cash_postings:
-                is_interest_entry = (
-                    entry.metadata.get("tags", {}).get("type") == "interest"
-                )
-                asset_node_id = asset_posting.metadata.get("node_id")
-                if asset_node_id is None or not isinstance(asset_node_id, str):
-                    continue
-                if selection_set and asset_node_id not in selected_cash_nodes:
-                    continue
-                amount = float(asset_posting.amount.value)
-                if asset_posting.is_debit():
-                    cash_in[month_idx] += abs(amount)
-                    if is_interest_entry:
-                        interest_in_from_journal[month_idx] += abs(amount)
-                        interest_recorded_from_cash = True
-                else:  # credit
-                    cash_out[month_idx] += abs(amount)
-                    if is_interest_entry:
-                        interest_out_from_journal[month_idx] += abs(amount)
-                        interest_recorded_from_cash = True
-
-            # Track boundary interest postings even if no cash posting is recorded
-            if (
-                entry.metadata.get("tags", {}).get("type") == "interest"
-                and not interest_recorded_from_cash
-            ):
-                for posting in entry.postings:
-                    posting_node_id = posting.metadata.get("node_id")
-                    if posting_node_id == BOUNDARY_NODE_ID:
-                        amount = float(posting.amount.value)
-                        if posting.is_debit():
-                            interest_out_from_journal[month_idx] += abs(amount)
-                        elif posting.is_credit():
-                            interest_in_from_journal[month_idx] += abs(amount)
-                        break
-
-        # Aggregate balances from outputs if provided
-        if outputs:
-            for brick_id, output in outputs.items():
-                # Check if this brick is in selection
-                output_brick = registry.get_brick(brick_id) if registry else None
-                if output_brick and hasattr(output_brick, "family"):
-                    output_node_id = f"{output_brick.family}:{brick_id}"
-                    if not selection_set or output_node_id in selection_set:
-                        assets[month_idx] += output["assets"][month_idx]
-                        liabilities[month_idx] += output["liabilities"][month_idx]
-                        interest[month_idx] += output["interest"][month_idx]
+    # Cash flows and journal interest from the cached posting table
+    table = posting_table(journal)
+    if use_flow_matrix and selection_set:
+        # Journal interest only feeds the no-selection adjustment below
+        cash_in, cash_out = table.flow_matrix(
+            time_index, transfer_visibility
+        ).cash_flows(selection_set, selected_cash_nodes)
+        interest_in_from_journal = interest_out_from_journal = np.zeros(length)
+    else:
+        (
+            cash_in,
+            cash_out,
+            interest_in_from_journal,
+            interest_out_from_journal,
+        ) = aggregate_cash_flows(
+            table,
+            time_index,
+            selection_set,
+            selected_cash_nodes,
+            transfer_visibility,
+        )
+
+    # Aggregate balances from outputs if provided
+    if outputs:
+        for brick_id, output in outputs.items():
+            # Check if this brick is in selection
+            output_brick = registry.get_brick(brick_id) if registry else None
+            if output_brick and hasattr(output_brick, "family"):
+                output_node_id = f"{output_brick.family}:{brick_id}"
+                if not selection_set or output_node_id in selection_set:
+                    assets += output["assets"][:length]
+                    liabilities += output["liabilities"][:length]
+                    interest += output["interest"][:length]
 
     # Calculate derived fields
     desired_interest_in = np.clip(interest, a_min=0.0, a_max=None)
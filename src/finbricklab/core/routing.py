@@ -0,0 +1,201 @@
+"""
+Routing index for cash-account external flows.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from .journal import SummaryJournal
+
+_BRICK_TYPE_PREFIX = {
+    "flow": "fs",
+    "transfer": "ts",
+    "liability": "l",
+    "asset": "a",
+}
+
+
+class _NodeRows:
+    """Postings on a single cash node, in journal order."""
+
+    __slots__ = ("months", "amounts", "rows", "parents", "candidates", "interest")
+
+    def __init__(self):
+        self.months: list[int] = []
+        self.amounts: list[float] = []
+        self.rows: list[int] = []
+        self.parents: list[int] = []
+        self.candidates: list[int] = []
+        self.interest: list[bool] = []
+
+
+class CashRoutingIndex:
+    """
+    Index of cash-node postings keyed by posting node_id and month.
+
+    Built in a single pass over the journal, replacing the per-cash-account
+    scan of every journal entry in the cash pass of ``Scenario.run``. Parent
+    IDs are resolved once per entry (from ``parent_id``, the ``operation_id``
+    prefix, or ``brick_type``/``brick_id``) and dictionary-encoded, so each
+    cash account's ``external_in``/``external_out`` becomes a masked
+    ``np.add.at`` over its own postings.
+
+    The index picks up entries posted after it was built (e.g. interest
+    posted while simulating an earlier cash account) on the next query. For a
+    ``SummaryJournal``, whose monthly groups keep growing after they were
+    indexed, posting rows are indexed and amounts read at query time.
+
+    Attributes:
+        journal: Journal being indexed
+        month_lookup: Mapping of 'YYYY-MM' strings to month indices
+        node_ids: Cash node IDs to index (e.g. {'a:cash'})
+    """
+
+    def __init__(
+        self,
+        journal: Any,
+        month_lookup: dict[str, int],
+        node_ids: set[str],
+    ):
+        self.journal = journal
+        self.month_lookup = month_lookup
+        self.node_ids = set(node_ids)
+        self._rows: dict[str, _NodeRows] = {}
+        self._key_codes: dict[str, int] = {}
+        self._keys: list[str] = []
+        self._indexed = 0
+        self._summary = isinstance(journal, SummaryJournal)
+
+    def _encode(self, key: str | None) -> int:
+        """Dictionary-encode a parent key (-1 for None)."""
+        if key is None:
+            return -1
+        code = self._key_codes.get(key)
+        if code is None:
+            code = len(self._keys)
+            self._key_codes[key] = code
+            self._keys.append(key)
+        return code
+
+    def _codes_matching(self, predicate) -> np.ndarray:
+        """Codes of all parent keys satisfying predicate."""
+        return np.array(
+            [code for code, key in enumerate(self._keys) if predicate(key)],
+            dtype=np.int64,
+        )
+
+    def refresh(self) -> None:
+        """Index entries posted since the last refresh."""
+        entries = self.journal.entries
+        total = len(entries)
+        for i in range(self._indexed, total):
+            self._index_entry(entries[i], i)
+        self._indexed = total
+
+    def _index_entry(self, entry: Any, index: int) -> None:
+        postings = [
+            (j, p)
+            for j, p in enumerate(entry.postings)
+            if p.metadata.get("node_id") in self.node_ids
+        ]
+        if not postings:
+            return
+
+        metadata = entry.metadata
+        if metadata.get("transaction_type") == "opening":
+            return
+
+        if isinstance(entry.timestamp, datetime):
+            month_str = entry.timestamp.strftime("%Y-%m")
+        else:
+            month_str = str(entry.timestamp)[:7]
+        month_idx = self.month_lookup.get(month_str)
+        if month_idx is None:
+            return
+
+        parent_id = metadata.get("parent_id")
+        if parent_id is None:
+            operation_id = metadata.get("operation_id")
+            if isinstance(operation_id, str) and operation_id.startswith("op:"):
+                parts = operation_id.split(":")
+                if len(parts) >= 3 and parts[1]:
+                    parent_id = parts[1]
+
+        candidate = None
+        prefix = _BRICK_TYPE_PREFIX.get(metadata.get("brick_type") or "")
+        brick_id = metadata.get("brick_id")
+        if prefix and brick_id:
+            candidate = f"{prefix}:{brick_id}"
+            if parent_id is None:
+                parent_id = candidate
+
+        parent_code = self._encode(parent_id if isinstance(parent_id, str) else None)
+        candidate_code = self._encode(candidate)
+        is_interest = metadata.get("tags", {}).get("type") == "interest"
+
+        for j, posting in postings:
+            rows = self._rows.get(posting.metadata["node_id"])
+            if rows is None:
+                rows = self._rows[posting.metadata["node_id"]] = _NodeRows()
+            rows.months.append(month_idx)
+            if self._summary:
+                rows.rows.append(self.journal._entry_offset[index] + j)
+            else:
+                rows.amounts.append(float(posting.amount.value))
+            rows.parents.append(parent_code)
+            rows.candidates.append(candidate_code)
+            rows.interest.append(is_interest)
+
+    def add_external_flows(
+        self,
+        cash_id: str,
+        excluded_parents: set[str],
+        external_in: np.ndarray,
+        external_out: np.ndarray,
+    ) -> None:
+        """
+        Add a cash account's journal inflows/outflows to its external flows.
+
+        Postings whose parent is in ``excluded_parents`` (already counted from
+        brick output arrays), and the account's own interest postings, are
+        skipped. Debits are added to ``external_in`` and credits to
+        ``external_out``, in journal order.
+
+        Args:
+            cash_id: Cash brick ID
+            excluded_parents: Parent node IDs whose flows are excluded
+            external_in: Monthly inflows, updated in place
+            external_out: Monthly outflows, updated in place
+        """
+        self.refresh()
+
+        cash_node_id = f"a:{cash_id}"
+        rows = self._rows.get(cash_node_id)
+        if rows is None:
+            return
+
+        months = np.asarray(rows.months, dtype=np.int64)
+        if self._summary:
+            amounts = self.journal.amounts()[np.asarray(rows.rows, dtype=np.int64)]
+        else:
+            amounts = np.asarray(rows.amounts, dtype=np.float64)
+        parents = np.asarray(rows.parents, dtype=np.int64)
+        candidates = np.asarray(rows.candidates, dtype=np.int64)
+        interest = np.asarray(rows.interest, dtype=bool)
+
+        excluded = self._codes_matching(lambda key: key in excluded_parents)
+        own = self._codes_matching(lambda key: key.startswith(cash_node_id))
+        keep = ~(
+            np.isin(candidates, excluded)
+            | np.isin(parents, excluded)
+            | (interest & np.isin(parents, own))
+        )
+
+        debit = keep & (amounts > 0)
+        credit = keep & ~(amounts > 0)
+        np.add.at(external_in, months[debit], np.abs(amounts[debit]))
+        np.add.at(external_out, months[credit], np.abs(amounts[credit]))
@@ -4,25 +4,47 @@ Scenario engine for orchestrating financial simulations.
 
 from __future__ import annotations
 
+import copy
 import csv
+import heapq
 import json
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date
+from functools import partial
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
 from .bricks import ABrick, FBrick, FinBrickABC, LBrick, TBrick, wire_strategies
+from .cache import ResultCache, scenario_cache_key
 from .context import ScenarioContext
 from .errors import ConfigError
 from .events import Event
 from .kinds import K
 from .links import PrincipalLink, StartLink
 from .macrobrick import MacroBrick
+from .memory import MemoryProfiler
+from .plan import ScenarioPlan, scenario_signature
+from .profiling import NULL_PROFILER, NullProfiler, RunProfiler, write_chrome_trace
 from .registry import Registry
-from .results import BrickOutput, ScenarioResults, aggregate_totals, finalize_totals
+from .results import (
+    BrickOutput,
+    LazyResults,
+    ScenarioResults,
+    _pack_shared_zeros,
+    _unpack_shared_zeros,
+    aggregate_totals,
+    finalize_totals,
+    is_shared_zeros,
+    shared_zeros,
+)
+from .routing import CashRoutingIndex
 from .specs import LMortgageSpec
+from .sweep import UpstreamCache, run_sweep
+from .timeline import Timeline
 from .transfer_visibility import TransferVisibility
 from .utils import (
     _apply_window_equity_neutral,
@@ -40,6 +62,16 @@ class ScenarioConfig:
     warn_on_overlap: bool = True
     include_struct_results: bool = True
     structs_filter: set[str] | None = None
+    # Journal storage backend: "objects" (JournalEntry list), "columnar" or
+    # "summary" (monthly totals only, see SummaryJournal)
+    journal_storage: str = "objects"
+    # Summary storage: keep per-entry ID/origin_id digests for has_id and the
+    # duplicate checks (False keeps memory O(groups) but skips those checks)
+    summary_track_ids: bool = True
+    # Record per-phase / per-brick timings in res["meta"]["timings"]
+    profile: bool = False
+    # Write profiled timings as a Chrome trace JSON file to this path
+    profile_trace_path: str | None = None
 
 
 @dataclass
@@ -108,6 +140,25 @@ class Scenario:
         macrobricks_dict = {mb.id: mb for mb in self.macrobricks}
         return Registry(bricks_dict, macrobricks_dict)
 
+    def _shallow_copy(self, bricks: list[FinBrickABC] | None = None) -> Scenario:
+        """
+        Copy the scenario definition without results of earlier runs.
+
+        Args:
+            bricks: Replacement brick list (registry is rebuilt); None keeps
+                the same brick objects
+
+        Returns:
+            New Scenario sharing config, macrobricks and (unless replaced) bricks
+        """
+        clone = copy.copy(self)
+        clone._last_totals = None
+        clone._last_results = None
+        if bricks is not None:
+            clone.bricks = bricks
+            clone._registry = clone._build_registry()
+        return clone
+
     @classmethod
     def from_dict(cls, data: dict) -> Scenario:
         """
@@ -224,21 +275,218 @@ class Scenario:
 
         return DisjointReport(is_disjoint=len(conflicts) == 0, conflicts=conflicts)
 
+    def compile(self, selection: list[str] | None = None) -> ScenarioPlan:
+        """
+        Compile the setup of a run into a reusable, immutable plan.
+
+        Resolves the selection, orders bricks by their dependencies, wires
+        strategies, resolves mortgage links (deriving linked start dates),
+        validates settlement buckets and builds the account registry
+        template. None of this depends on ``start`` or ``months``, so one
+        plan serves any number of runs. Only strategies are attached to the
+        bricks; everything else is kept in the plan.
+
+        Args:
+            selection: Brick and/or MacroBrick IDs to execute (None = all)
+
+        Returns:
+            ScenarioPlan to pass to ``run(plan=...)``
+
+        Raises:
+            ConfigError: If selection contains unknown IDs, a strategy is
+                missing or links are inconsistent
+
+        Example:
+            >>> plan = scenario.compile()
+            >>> for months in (12, 60, 120):
+            ...     results = scenario.run(date(2026, 1, 1), months, plan=plan)
+        """
+        brick_ids, overlaps = self._resolve_execution_set(selection)
+        edges = self._build_dependency_graph(brick_ids)
+        execution_order = self._topological_order(brick_ids, edges)
+
+        # Wire strategies to bricks based on their kind discriminators
+        wire_strategies(self.bricks)
+
+        # Resolve mortgage links and validate settlement buckets
+        start_dates = self._resolve_mortgage_links()
+
+        cash_ids = tuple(
+            b.id
+            for b in self.bricks
+            if isinstance(b, ABrick) and b.kind == K.A_CASH and b.id in brick_ids
+        )
+        return ScenarioPlan(
+            signature=scenario_signature(self),
+            selection=tuple(selection) if selection is not None else None,
+            brick_ids=frozenset(brick_ids),
+            overlaps=overlaps,
+            execution_order=tuple(execution_order),
+            cash_ids=cash_ids,
+            accounts=self._account_template(brick_ids, cash_ids),
+            start_dates=start_dates,
+            struct_members={
+                struct_id: self._registry.get_struct_flat_members(struct_id)
+                for struct_id, _macrobrick in self._registry.iter_macrobricks()
+            },
+        )
+
+    def _working_copies(
+        self, start_dates: dict[str, date] | None = None
+    ) -> list[FinBrickABC]:
+        """
+        Run-scoped copies of the bricks.
+
+        Values the scenario computes during a run (routed cash flows) live in
+        ``ctx.run_state``; the only writes to bricks are strategies
+        normalizing specs and deriving activation windows in ``prepare``.
+        They do so on these copies, so the scenario's bricks are never
+        modified and concurrent runs can share them.
+
+        Copies are cheap: each gets its own top-level spec dict, nested dicts
+        and lists (which ``prepare`` may normalize, e.g. FX and sell settings)
+        are deep-copied, and everything else (scalars, arrays, links, strategy
+        instances) is shared, as no strategy writes to them.
+
+        Args:
+            start_dates: Start dates derived from StartLinks, by brick ID
+
+        Returns:
+            Copies of the bricks (in scenario order) with their own spec
+        """
+        bricks = []
+        for brick in self.bricks:
+            working = copy.copy(brick)
+            spec = brick.spec
+            # Convert LMortgageSpec to dict for strategy compatibility
+            if (
+                isinstance(brick, LBrick)
+                and brick.kind == K.L_LOAN_ANNUITY
+                and isinstance(spec, LMortgageSpec)
+            ):
+                spec = spec.__dict__
+            if spec is not None:
+                working.spec = {
+                    key: (
+                        copy.deepcopy(value)
+                        if isinstance(value, (dict, list))
+                        else value
+                    )
+                    for key, value in spec.items()
+                }
+            if start_dates and brick.id in start_dates:
+                working.start_date = start_dates[brick.id]
+            bricks.append(working)
+        return bricks
+
+    def _account_template(
+        self, brick_ids: set[str], cash_ids: tuple[str, ...]
+    ) -> tuple[Any, ...]:
+        """Accounts every run registers, in registration order."""
+        from .accounts import Account, AccountScope, AccountType, get_node_id
+
+        accounts = [
+            Account(
+                cash_id,
+                f"Cash Account {cash_id}",
+                AccountScope.INTERNAL,
+                AccountType.ASSET,
+            )
+            for cash_id in cash_ids
+        ]
+
+        # Register boundary accounts for external flows
+        boundary_accounts = [
+            "Income:Salary",
+            "Income:Dividends",
+            "Income:Interest",
+            "Expenses:Groceries",
+            "Expenses:BankFees",
+            "Expenses:Interest",
+            "P&L:Unrealized",
+            "P&L:FX",
+        ]
+
+        for account_id in boundary_accounts:
+            account_type = (
+                AccountType.INCOME
+                if account_id.startswith("Income:")
+                else AccountType.EXPENSE
+                if account_id.startswith("Expenses:")
+                else AccountType.PNL
+                if account_id.startswith("P&L:")
+                else AccountType.EQUITY
+            )
+            accounts.append(
+                Account(account_id, account_id, AccountScope.BOUNDARY, account_type)
+            )
+
+        # Register cash accounts with node IDs (consistent with V2 model)
+        for cash_id in cash_ids:
+            cash_node_id = get_node_id(cash_id, "a")
+            accounts.append(
+                Account(
+                    cash_node_id,  # Use node ID format
+                    f"Cash Account {cash_id}",
+                    AccountScope.INTERNAL,
+                    AccountType.ASSET,
+                )
+            )
+
+        # Register liability accounts with node IDs (for loan bricks)
+        liability_ids = [
+            b.id for b in self.bricks if isinstance(b, LBrick) and b.id in brick_ids
+        ]
+        for liability_id in liability_ids:
+            liability_node_id = get_node_id(liability_id, "l")
+            accounts.append(
+                Account(
+                    liability_node_id,  # Use node ID format
+                    f"Liability {liability_id}",
+                    AccountScope.INTERNAL,
+                    AccountType.LIABILITY,
+                )
+            )
+
+        # Register asset accounts with node IDs (for non-cash asset bricks like ETF, property)
+        asset_ids = [
+            b.id
+            for b in self.bricks
+            if isinstance(b, ABrick)
+            and b.id in brick_ids
+            and b.kind != K.A_CASH  # Exclude cash (already registered)
+        ]
+        for asset_id in asset_ids:
+            asset_node_id = get_node_id(asset_id, "a")
+            accounts.append(
+                Account(
+                    asset_node_id,  # Use node ID format
+                    f"Asset {asset_id}",
+                    AccountScope.INTERNAL,
+                    AccountType.ASSET,
+                )
+            )
+
+        return tuple(accounts)
+
     def run(
         self,
         start: date,
         months: int,
         selection: list[str] | None = None,
         include_cash: bool = True,
+        plan: ScenarioPlan | None = None,
+        cache: ResultCache | None = None,
+        memory_report: bool = False,
     ) -> dict:
         """
         Run the complete financial scenario simulation.
 
         This method orchestrates the entire simulation process:
-        1. Resolves the execution set from selection (bricks and/or MacroBricks)
+        1. Compiles the scenario (see ``compile``) unless a valid plan is given
         2. Creates the time index for the simulation period
-        3. Wires strategies to bricks based on their kind discriminators
-        4. Prepares all bricks for simulation
+        3. Prepares all bricks for simulation
+        4. Registers the plan's accounts
         5. Simulates all non-cash bricks and routes their cash flows
         6. Simulates the cash account with all routed flows
         7. Aggregates results into summary statistics
@@ -249,16 +497,30 @@ class Scenario:
             selection: Optional list of brick IDs and/or MacroBrick IDs to execute.
                       If None, executes all bricks in the scenario.
             include_cash: Whether to include cash account in aggregated results
+            plan: Plan from ``compile`` to skip the setup work; recompiled
+                automatically if the bricks changed since. Defaults to the
+                plan's selection when selection is None.
+            cache: Result cache to consult first; runs with equal scenario
+                content and arguments return the stored results instead of
+                simulating. Scenarios whose specs or links hold values that
+                cannot be keyed reliably (arbitrary objects) bypass the cache.
+            memory_report: Trace the run with ``tracemalloc`` and report peak and
+                retained bytes per phase, brick and subsystem in
+                ``res["meta"]["memory"]`` (see ``finbricklab.core.memory``).
+                The cache is bypassed so the simulation is actually measured.
 
         Returns:
             Dictionary containing:
                 - 'outputs': Dict mapping brick IDs to their individual BrickOutput results
                 - 'by_struct': Dict mapping MacroBrick IDs to their aggregated BrickOutput results
                 - 'totals': DataFrame with aggregated monthly totals (cash flows, assets, debt, equity)
+            'totals', 'views' and each 'by_struct' entry are computed on first
+            access (see ``LazyResults``).
 
         Raises:
             AssertionError: If there are no cash account bricks (kind='{K.A_CASH}') in selection
-            ConfigError: If selection contains unknown IDs or invalid MacroBrick references
+            ConfigError: If selection contains unknown IDs or invalid MacroBrick references,
+                or differs from the selection the plan was compiled for
 
         Note:
             The simulation supports multiple cash accounts. Cash flows from other bricks
@@ -266,45 +528,275 @@ class Scenario:
             if no routing is specified. If MacroBricks share bricks, execution is
             deduplicated at the scenario level.
         """
-        # Resolve execution set from selection
-        brick_ids, overlaps = self._resolve_execution_set(selection)
+        if cache is None or memory_report:
+            return self._run(
+                start,
+                months,
+                selection,
+                include_cash,
+                plan=plan,
+                memory_report=memory_report,
+            )
 
-        # Build dependency graph and compute deterministic execution order
-        edges = self._build_dependency_graph(brick_ids)
-        execution_order = self._topological_order(brick_ids, edges)
+        if selection is None and plan is not None and plan.selection is not None:
+            selection = list(plan.selection)
+        try:
+            key = scenario_cache_key(self, start, months, selection, include_cash)
+        except TypeError:
+            # Specs holding values without a stable rendering are never cached
+            return self._run(start, months, selection, include_cash, plan=plan)
+        compact = cache.get(key)
+        if compact is not None:
+            return self._restore_results(compact)
+
+        results = self._run(start, months, selection, include_cash, plan=plan)
+        cache.put(key, self._compact_results(results))
+        return results
+
+    def _run(
+        self,
+        start: date,
+        months: int,
+        selection: list[str] | None = None,
+        include_cash: bool = True,
+        brick_cache: UpstreamCache | None = None,
+        plan: ScenarioPlan | None = None,
+        memory_report: bool = False,
+    ) -> dict:
+        """Run the simulation, optionally reusing brick results from a sweep cache."""
+        timer = RunProfiler() if self.config.profile else NULL_PROFILER
+        if not memory_report:
+            return self._run_profiled(
+                start, months, selection, include_cash, brick_cache, plan, timer
+            )
+
+        memory = MemoryProfiler(timer)
+        try:
+            results = self._run_profiled(
+                start, months, selection, include_cash, brick_cache, plan, memory
+            )
+            results["meta"]["memory"] = memory.report(
+                results, exclude=(self.bricks, self.macrobricks, self._registry)
+            )
+        finally:
+            memory.stop()
+        return results
+
+    def _run_profiled(
+        self,
+        start: date,
+        months: int,
+        selection: list[str] | None,
+        include_cash: bool,
+        brick_cache: UpstreamCache | None,
+        plan: ScenarioPlan | None,
+        profiler: RunProfiler | NullProfiler | MemoryProfiler,
+    ) -> dict:
+        """Run the simulation, recording spans with the given profiler."""
+        # Resolve selection, execution order, strategies and links (or reuse a plan)
+        with profiler.span("compile"):
+            if plan is not None:
+                if selection is None:
+                    selection = list(plan.selection) if plan.selection else None
+                elif tuple(selection) != plan.selection:
+                    raise ConfigError(
+                        f"Selection {selection} does not match the plan's "
+                        f"selection {plan.selection}"
+                    )
+            if plan is None or not plan.is_valid_for(self):
+                plan = self.compile(selection)
 
         # Initialize simulation context
-        t_index, ctx = self._initialize_simulation(start, months)
+        with profiler.span("initialize"):
+            t_index, ctx = self._initialize_simulation(
+                start, months, self._working_copies(plan.start_dates)
+            )
+        profiler.journal = ctx.journal
 
         # Prepare bricks for simulation
-        self._prepare_simulation(ctx)
+        with profiler.span("prepare"):
+            self._prepare_simulation(ctx)
 
         # Simulate selected bricks and route cash flows (in deterministic order)
-        outputs, journal = self._simulate_bricks(ctx, t_index, execution_order)
+        with profiler.span("simulate_bricks"):
+            outputs, journal = self._simulate_bricks(
+                ctx, t_index, plan, brick_cache, profiler
+            )
+
+        # Totals and MacroBrick aggregates are computed on first access
+        totals = partial(
+            self._aggregate_results,
+            outputs,
+            ctx.timeline.period_index,
+            include_cash,
+            journal=journal,
+        )
+        by_struct = self._build_struct_aggregates(outputs, plan)
+        meta: dict[str, Any] = {
+            "execution_order": list(plan.execution_order),
+            "overlaps": plan.overlaps,
+        }
+        results = self._store_results(
+            outputs, by_struct, totals, journal, meta, list(ctx.registry.values())
+        )
+
+        # Profiled runs compute them up front so the report covers them
+        if profiler is not NULL_PROFILER:
+            with profiler.span("aggregation"):
+                results["totals"]
+            with profiler.span("struct_aggregates"):
+                by_struct.resolve()
+
+        timer = profiler.timer if isinstance(profiler, MemoryProfiler) else profiler
+        if isinstance(timer, RunProfiler):
+            meta["timings"] = timer.timings()
+            if self.config.profile_trace_path:
+                write_chrome_trace(meta["timings"], self.config.profile_trace_path)
+
+        return results
+
+    def sweep(
+        self,
+        params: dict[str, Sequence[Any]],
+        start: date,
+        months: int,
+        *,
+        design: str = "grid",
+        samples: int | None = None,
+        seed: int | None = None,
+        selection: list[str] | None = None,
+        include_cash: bool = True,
+        workers: int | None = None,
+        executor: Executor | None = None,
+    ) -> pd.DataFrame:
+        """
+        Run the scenario for many parameter variants and collect their totals.
+
+        Each parameter path names a brick field to override, e.g.
+        ``{"mortgage.spec.rate_pa": [0.03, 0.035, 0.04]}``. Variants run on
+        shallow brick copies (this scenario is left untouched), and non-cash
+        bricks that no override can reach, directly or through links, are
+        simulated once and reused across variants.
 
-        # Aggregate results into summary statistics (journal-first for V2)
-        totals = self._aggregate_results(
-            outputs, t_index, include_cash, journal=journal
+        Args:
+            params: Mapping of '<brick_id>.spec.<field>' (or
+                '<brick_id>.start_date' / 'end_date' / 'duration_m') to values
+            start: The starting date for the simulation
+            months: Number of months to simulate
+            design: 'grid' for every combination of values, or 'random' for
+                ``samples`` independently drawn combinations
+            samples: Number of variants for the random design
+            seed: Random seed for the random design
+            selection: Optional list of brick IDs and/or MacroBrick IDs to execute
+            include_cash: Whether to include cash account in aggregated results
+            workers: Number of worker processes (variants are split into this
+                many chunks); None or 1 runs sequentially in this process
+            executor: Executor to submit chunks to instead of creating a pool
+
+        Returns:
+            Long-format DataFrame with columns 'variant', one column per
+            parameter path, 'month', 'metric' and 'value'
+
+        Raises:
+            ConfigError: If a parameter path, brick ID or design is invalid
+        """
+        return run_sweep(
+            self,
+            params,
+            start,
+            months,
+            design=design,
+            samples=samples,
+            seed=seed,
+            selection=selection,
+            include_cash=include_cash,
+            workers=workers,
+            executor=executor,
         )
 
-        # Build MacroBrick aggregates
-        by_struct = self._build_struct_aggregates(outputs, brick_ids)
-
-        # Store for convenience methods
-        self._last_totals = totals
-        self._last_results = {
-            "outputs": outputs,
-            "by_struct": by_struct,
-            "totals": totals,
-            "views": ScenarioResults(
-                totals, registry=self._registry, outputs=outputs, journal=journal
+    def _store_results(
+        self,
+        outputs: dict[str, BrickOutput],
+        by_struct: dict[str, BrickOutput],
+        totals: pd.DataFrame | Callable[[], pd.DataFrame],
+        journal: Any,
+        meta: dict[str, Any],
+        bricks: list[FinBrickABC] | None = None,
+    ) -> LazyResults:
+        """
+        Assemble the results dict of a run and keep it for convenience methods.
+
+        'totals' (when given as a factory) and 'views' are computed on first
+        access, so callers that only read the journal or some outputs skip them.
+        """
+        registry = self._registry
+        results = LazyResults({"outputs": outputs, "by_struct": by_struct})
+        if callable(totals):
+            results.defer("totals", totals)
+        else:
+            results["totals"] = totals
+        results.defer(
+            "views",
+            lambda: ScenarioResults(
+                results["totals"], registry=registry, outputs=outputs, journal=journal
             ),
+        )
+        results.update(
+            journal=journal,
+            _scenario_bricks=bricks if bricks is not None else self.bricks,
+            meta=meta,
+        )
+
+        self._last_totals = None
+        self._last_results = results
+        return results
+
+    @staticmethod
+    def _compact_results(results: dict) -> dict[str, Any]:
+        """
+        Reduce a results dict to its picklable core for transfer between processes.
+
+        Views and brick references are dropped (they are rebuilt by
+        ``_restore_results``), the journal is converted to columnar storage and
+        shared zero arrays are replaced by references that unpickle to them.
+
+        Args:
+            results: Results dict returned by ``run``
+
+        Returns:
+            Dict with 'outputs', 'by_struct', 'totals', 'journal' and 'meta'
+        """
+        from .journal import ColumnarJournal
+
+        journal = results["journal"]
+        if not isinstance(journal, ColumnarJournal):
+            journal = ColumnarJournal.from_journal(journal)
+        return {
+            "outputs": _pack_shared_zeros(results["outputs"]),
+            "by_struct": _pack_shared_zeros(results["by_struct"]),
+            "totals": results["totals"],
             "journal": journal,
-            "_scenario_bricks": self.bricks,
-            "meta": {"execution_order": execution_order, "overlaps": overlaps},
+            "meta": results["meta"],
         }
 
-        return self._last_results
+    def _restore_results(self, compact: dict[str, Any]) -> dict:
+        """
+        Rebuild the full results dict of this scenario from ``_compact_results``.
+
+        The journal is converted back to an object ``Journal`` when the
+        scenario runs with the default storage, so restored results carry the
+        same journal type as a direct run.
+        """
+        journal = compact["journal"]
+        if self.config.journal_storage == "objects":
+            journal = journal.to_journal()
+        return self._store_results(
+            _unpack_shared_zeros(compact["outputs"]),
+            _unpack_shared_zeros(compact["by_struct"]),
+            compact["totals"],
+            journal,
+            compact["meta"],
+        )
 
     def _resolve_execution_set(
         self, selection: list[str] | None
@@ -455,24 +947,26 @@ class Scenario:
         return order
 
     def _build_struct_aggregates(
-        self, outputs: dict[str, BrickOutput], brick_ids: set[str]
-    ) -> dict[str, BrickOutput]:
+        self, outputs: dict[str, BrickOutput], plan: ScenarioPlan
+    ) -> LazyResults:
         """
         Build MacroBrick aggregates from individual brick outputs.
 
+        Each aggregate is summed on first access, so only the MacroBricks a
+        caller reads are computed.
+
         Args:
             outputs: Dictionary of brick outputs from simulation
-            brick_ids: Set of brick IDs that were executed
+            plan: Plan of the run (executed bricks and MacroBrick members)
 
         Returns:
-            Dictionary mapping MacroBrick IDs to their aggregated BrickOutput
+            Lazy dictionary mapping MacroBrick IDs to their aggregated BrickOutput
         """
         if not self.config.include_struct_results:
-            return {}
-
-        by_struct: dict[str, BrickOutput] = {}
+            return LazyResults()
 
-        for struct_id, _macrobrick in self._registry.iter_macrobricks():
+        pending = {}
+        for struct_id, member_bricks in plan.struct_members.items():
             # Apply structs filter if configured
             if (
                 self.config.structs_filter is not None
@@ -480,86 +974,107 @@ class Scenario:
             ):
                 continue
 
-            # Get the member bricks for this MacroBrick (using cached expansion)
-            member_bricks = self._registry.get_struct_flat_members(struct_id)
-
             # Only include bricks that were actually executed
-            executed_members = member_bricks & brick_ids
+            executed_members = member_bricks & plan.brick_ids
 
             if not executed_members:
                 # Skip MacroBricks with no executed members
                 continue
 
-            # Create empty aggregate
-            agg = self._create_empty_output(
-                len(outputs[list(outputs.keys())[0]]["cash_in"])
+            pending[struct_id] = partial(
+                self._aggregate_struct, outputs, executed_members
             )
 
-            # Sum outputs from all executed member bricks
-            for brick_id in executed_members:
-                if brick_id in outputs:
-                    brick_output = outputs[brick_id]
-                    for key in agg.keys():
-                        # Map old column names to new ones for compatibility
-                        brick_key = key
-                        if key == "asset_value":
-                            brick_key = "assets"
-                        elif key == "debt_balance":
-                            brick_key = "liabilities"
+        return LazyResults(pending=pending)
 
-                        if brick_key in brick_output:
-                            agg[key] += brick_output[brick_key]
+    def _aggregate_struct(
+        self, outputs: dict[str, BrickOutput], members: set[str]
+    ) -> BrickOutput:
+        """Sum the outputs of one MacroBrick's executed member bricks."""
+        # Create empty aggregate
+        agg = self._create_empty_output(
+            len(outputs[list(outputs.keys())[0]]["cash_in"])
+        )
 
-            by_struct[struct_id] = agg
+        # Sum outputs from all executed member bricks
+        for brick_id in members:
+            if brick_id in outputs:
+                brick_output = outputs[brick_id]
+                for key in agg.keys():
+                    # Map old column names to new ones for compatibility
+                    brick_key = key
+                    if key == "asset_value":
+                        brick_key = "assets"
+                    elif key == "debt_balance":
+                        brick_key = "liabilities"
+
+                    if brick_key not in brick_output:
+                        continue
+                    value = brick_output[brick_key]
+                    if key == "events":
+                        agg[key] += value
+                    elif is_shared_zeros(value):
+                        continue
+                    elif is_shared_zeros(agg[key]):
+                        # First non-zero member: materialize the aggregate
+                        agg[key] = value.astype(float)
+                    else:
+                        agg[key] += value
 
-        return by_struct
+        return agg
 
     def _initialize_simulation(
-        self, start: date, months: int
+        self, start: date, months: int, bricks: list[FinBrickABC]
     ) -> tuple[np.ndarray, ScenarioContext]:
-        """Initialize the simulation context and resolve mortgage links."""
+        """Initialize the journal and the simulation context of the working bricks."""
         from .accounts import AccountRegistry
-        from .journal import Journal
+        from .journal import ColumnarJournal, Journal, SummaryJournal
 
         t_index = month_range(start, months)
 
         # Create account registry and journal for V2 postings model
         account_registry = AccountRegistry()
-        journal = Journal(account_registry)
+        if self.config.journal_storage == "columnar":
+            journal = ColumnarJournal(account_registry)
+        elif self.config.journal_storage == "summary":
+            journal = SummaryJournal(
+                account_registry, track_ids=self.config.summary_track_ids
+            )
+        elif self.config.journal_storage == "objects":
+            journal = Journal(account_registry)
+        else:
+            raise ConfigError(
+                f"Unknown journal_storage '{self.config.journal_storage}' "
+                "(expected 'objects', 'columnar' or 'summary')"
+            )
 
         ctx = ScenarioContext(
             t_index=t_index,
             currency=self.currency,
-            registry={b.id: b for b in self.bricks},
+            registry={b.id: b for b in bricks},
             journal=journal,
             settlement_default_cash_id=self.settlement_default_cash_id,
+            timeline=Timeline.from_index(t_index),
         )
 
-        # Resolve mortgage links and validate settlement buckets
-        self._resolve_mortgage_links()
-
         return t_index, ctx
 
     def _prepare_simulation(self, ctx: ScenarioContext) -> None:
-        """Wire strategies and prepare all bricks for simulation."""
-        # Wire strategies to bricks based on their kind discriminators
-        wire_strategies(self.bricks)
-
+        """Prepare all bricks for simulation (strategies are wired by compile)."""
         # Prepare all bricks for simulation (validate parameters, setup state)
-        for b in self.bricks:
+        for b in ctx.registry.values():
             b.prepare(ctx)
 
     def _simulate_bricks(
-        self, ctx: ScenarioContext, t_index: np.ndarray, execution_order: list[str]
+        self,
+        ctx: ScenarioContext,
+        t_index: np.ndarray,
+        plan: ScenarioPlan,
+        brick_cache: UpstreamCache | None = None,
+        profiler: RunProfiler | NullProfiler | MemoryProfiler = NULL_PROFILER,
     ):
         """Simulate all bricks using Journal-based system."""
-        from .accounts import (
-            BOUNDARY_NODE_ID,
-            Account,
-            AccountScope,
-            AccountType,
-            get_node_id,
-        )
+        from .accounts import BOUNDARY_NODE_ID, get_node_id
 
         outputs: dict[str, BrickOutput] = {}
 
@@ -573,37 +1088,23 @@ class Scenario:
         brick_iteration_counters = {}
         # compiler = BrickCompiler(account_registry)  # No longer needed with new journal system
 
-        period_index = pd.PeriodIndex(t_index, freq="M")
-        month_lookup = {
-            period.strftime("%Y-%m"): idx for idx, period in enumerate(period_index)
-        }
+        execution_order = plan.execution_order
+        cash_ids = plan.cash_ids
 
-        # Register all cash accounts as internal assets
-        cash_ids = [
-            b.id
-            for b in self.bricks
-            if isinstance(b, ABrick) and b.kind == K.A_CASH and b.id in execution_order
-        ]
+        # Register the plan's accounts (cash, boundary, liability and asset nodes)
+        for account in plan.accounts:
+            account_registry.register_account(account)
 
         # Track processed cash IDs to prevent duplicate opening entries
         processed_openings: set[str] = set()
 
         for cash_id in cash_ids:
-            account_registry.register_account(
-                Account(
-                    cash_id,
-                    f"Cash Account {cash_id}",
-                    AccountScope.INTERNAL,
-                    AccountType.ASSET,
-                )
-            )
-
             # Initialize cash account with opening balance
             # Guard: skip if already processed
             if cash_id in processed_openings:
                 continue
 
-            cash_brick = next(b for b in self.bricks if b.id == cash_id)
+            cash_brick = ctx.registry[cash_id]
             mask = active_mask(
                 t_index,
                 cash_brick.start_date,
@@ -693,296 +1194,202 @@ class Scenario:
                 f"At least one cash account (kind='{K.A_CASH}') is required in the selection"
             )
 
-        # Register boundary accounts for external flows
-        boundary_accounts = [
-            "Income:Salary",
-            "Income:Dividends",
-            "Income:Interest",
-            "Expenses:Groceries",
-            "Expenses:BankFees",
-            "Expenses:Interest",
-            "P&L:Unrealized",
-            "P&L:FX",
-        ]
-
-        for account_id in boundary_accounts:
-            account_type = (
-                AccountType.INCOME
-                if account_id.startswith("Income:")
-                else AccountType.EXPENSE
-                if account_id.startswith("Expenses:")
-                else AccountType.PNL
-                if account_id.startswith("P&L:")
-                else AccountType.EQUITY
-            )
-            account_registry.register_account(
-                Account(account_id, account_id, AccountScope.BOUNDARY, account_type)
-            )
-
-        # Register cash accounts with node IDs (consistent with V2 model)
-        for cash_id in cash_ids:
-            cash_node_id = get_node_id(cash_id, "a")
-            account_registry.register_account(
-                Account(
-                    cash_node_id,  # Use node ID format
-                    f"Cash Account {cash_id}",
-                    AccountScope.INTERNAL,
-                    AccountType.ASSET,
-                )
-            )
-
-        # Register liability accounts with node IDs (for loan bricks)
-        liability_ids = [
-            b.id
-            for b in self.bricks
-            if isinstance(b, LBrick) and b.id in execution_order
-        ]
-        for liability_id in liability_ids:
-            liability_node_id = get_node_id(liability_id, "l")
-            account_registry.register_account(
-                Account(
-                    liability_node_id,  # Use node ID format
-                    f"Liability {liability_id}",
-                    AccountScope.INTERNAL,
-                    AccountType.LIABILITY,
-                )
-            )
-
-        # Register asset accounts with node IDs (for non-cash asset bricks like ETF, property)
-        asset_ids = [
-            b.id
-            for b in self.bricks
-            if isinstance(b, ABrick)
-            and b.id in execution_order
-            and b.kind != K.A_CASH  # Exclude cash (already registered)
-        ]
-        for asset_id in asset_ids:
-            asset_node_id = get_node_id(asset_id, "a")
-            account_registry.register_account(
-                Account(
-                    asset_node_id,  # Use node ID format
-                    f"Asset {asset_id}",
-                    AccountScope.INTERNAL,
-                    AccountType.ASSET,
-                )
-            )
-
         # Simulate all bricks and compile to journal entries
 
         # First pass: process all non-cash bricks and compile to journal
-        for b in [ctx.registry[bid] for bid in execution_order]:
-            if isinstance(b, ABrick) and b.kind == K.A_CASH:
-                continue  # Skip cash accounts for now
-
-            brick_output = self._simulate_single_brick(b, ctx, t_index)
-            outputs[b.id] = brick_output
+        with profiler.span("first_pass"):
+            for b in [ctx.registry[bid] for bid in execution_order]:
+                if isinstance(b, ABrick) and b.kind == K.A_CASH:
+                    continue  # Skip cash accounts for now
+
+                with profiler.brick(b, "first_pass"):
+                    if brick_cache is not None:
+                        brick_output = brick_cache.simulate(
+                            b,
+                            journal,
+                            lambda b=b: self._simulate_single_brick(b, ctx, t_index),
+                        )
+                    else:
+                        brick_output = self._simulate_single_brick(b, ctx, t_index)
+                outputs[b.id] = brick_output
 
             # Journal entries are now created in _capture_monthly_transactions
             # No need to compile here as we use the new journal system
 
         # NEW: Capture monthly transactions for each month of simulation
-        self._capture_monthly_transactions(
-            journal, outputs, ctx, execution_order, brick_iteration_counters
-        )
+        with profiler.span("capture_monthly_transactions"):
+            self._capture_monthly_transactions(
+                journal, outputs, ctx, execution_order, brick_iteration_counters
+            )
 
         # Second pass: process cash accounts with all journal entries available
-        for b in [ctx.registry[bid] for bid in execution_order]:
-            if not (isinstance(b, ABrick) and b.kind == K.A_CASH):
-                continue
-
-            # Cash bricks: use journal balances for valuation
-            # Don't set initial_balance from journal - let external flows handle it
-
-            # Calculate external flows from FBrick outputs for this cash account
-            external_in = np.zeros(len(ctx.t_index))
-            external_out = np.zeros(len(ctx.t_index))
-            array_parent_ids: set[str] = set()
-
-            # Sum up all brick flows that route to this cash account
-            for brick_id, brick_output in outputs.items():
-                if brick_id == b.id:
-                    continue  # Skip self
-
-                # Check if this brick routes to our cash account
-                brick = ctx.registry[brick_id]
+        with profiler.span("cash_pass"):
+            routing_index = CashRoutingIndex(
+                journal,
+                ctx.timeline.month_index,
+                {get_node_id(cid, "a") for cid in cash_ids},
+            )
+            for b in [ctx.registry[bid] for bid in execution_order]:
+                if not (isinstance(b, ABrick) and b.kind == K.A_CASH):
+                    continue
 
-                # Handle different brick types that generate cash flows
-                if isinstance(brick, FBrick):
-                    # Check for explicit routing
-                    if (
-                        brick.links
-                        and "route" in brick.links
-                        and "to" in brick.links["route"]
-                    ):
-                        if brick.links["route"]["to"] == b.id:
-                            # This brick routes to our cash account
+                # Cash bricks: use journal balances for valuation
+                # Don't set initial_balance from journal - let external flows handle it
+
+                # Calculate external flows from FBrick outputs for this cash account
+                external_in = np.zeros(len(ctx.t_index))
+                external_out = np.zeros(len(ctx.t_index))
+                array_parent_ids: set[str] = set()
+
+                # Sum up all brick flows that route to this cash account
+                for brick_id, brick_output in outputs.items():
+                    if brick_id == b.id:
+                        continue  # Skip self
+
+                    # Check if this brick routes to our cash account
+                    brick = ctx.registry[brick_id]
+
+                    # Handle different brick types that generate cash flows
+                    if isinstance(brick, FBrick):
+                        # Check for explicit routing
+                        if (
+                            brick.links
+                            and "route" in brick.links
+                            and "to" in brick.links["route"]
+                        ):
+                            if brick.links["route"]["to"] == b.id:
+                                # This brick routes to our cash account
+                                if np.any(brick_output["cash_in"]) or np.any(
+                                    brick_output["cash_out"]
+                                ):
+                                    external_in += brick_output["cash_in"]
+                                    external_out += brick_output["cash_out"]
+                                    array_parent_ids.add(f"fs:{brick_id}")
+                        elif not (brick.links and "route" in brick.links):
+                            # No explicit routing - use default routing (all flows go to first cash account)
+                            # This maintains backward compatibility with the old system
                             if np.any(brick_output["cash_in"]) or np.any(
                                 brick_output["cash_out"]
                             ):
                                 external_in += brick_output["cash_in"]
                                 external_out += brick_output["cash_out"]
                                 array_parent_ids.add(f"fs:{brick_id}")
-                    elif not (brick.links and "route" in brick.links):
-                        # No explicit routing - use default routing (all flows go to first cash account)
-                        # This maintains backward compatibility with the old system
-                        if np.any(brick_output["cash_in"]) or np.any(
-                            brick_output["cash_out"]
+                    elif isinstance(brick, TBrick):
+                        # Transfer bricks: route based on from/to links
+                        if (
+                            brick.links
+                            and "from" in brick.links
+                            and "to" in brick.links
                         ):
-                            external_in += brick_output["cash_in"]
-                            external_out += brick_output["cash_out"]
-                            array_parent_ids.add(f"fs:{brick_id}")
-                elif isinstance(brick, TBrick):
-                    # Transfer bricks: route based on from/to links
-                    if brick.links and "from" in brick.links and "to" in brick.links:
-                        if brick.links["from"] == b.id:
-                            # Money going out from this account
-                            if np.any(brick_output["cash_out"]):
-                                external_out += brick_output["cash_out"]
-                                array_parent_ids.add(f"ts:{brick_id}")
-                        elif brick.links["to"] == b.id:
-                            # Money coming in to this account
-                            if np.any(brick_output["cash_in"]):
-                                external_in += brick_output["cash_in"]
-                                array_parent_ids.add(f"ts:{brick_id}")
-                elif isinstance(brick, ABrick) and brick.kind == K.A_PROPERTY:
-                    # Property bricks generate cash flows (purchase costs, etc.)
-                    # Check for explicit routing first
-                    if (
-                        brick.links
-                        and "route" in brick.links
-                        and "to" in brick.links["route"]
-                    ):
-                        if brick.links["route"]["to"] == b.id:
-                            # This brick routes to our cash account
+                            if brick.links["from"] == b.id:
+                                # Money going out from this account
+                                if np.any(brick_output["cash_out"]):
+                                    external_out += brick_output["cash_out"]
+                                    array_parent_ids.add(f"ts:{brick_id}")
+                            elif brick.links["to"] == b.id:
+                                # Money coming in to this account
+                                if np.any(brick_output["cash_in"]):
+                                    external_in += brick_output["cash_in"]
+                                    array_parent_ids.add(f"ts:{brick_id}")
+                    elif isinstance(brick, ABrick) and brick.kind == K.A_PROPERTY:
+                        # Property bricks generate cash flows (purchase costs, etc.)
+                        # Check for explicit routing first
+                        if (
+                            brick.links
+                            and "route" in brick.links
+                            and "to" in brick.links["route"]
+                        ):
+                            if brick.links["route"]["to"] == b.id:
+                                # This brick routes to our cash account
+                                if np.any(brick_output["cash_in"]) or np.any(
+                                    brick_output["cash_out"]
+                                ):
+                                    external_in += brick_output["cash_in"]
+                                    external_out += brick_output["cash_out"]
+                                    array_parent_ids.add(f"a:{brick_id}")
+                        elif b.id == self.settlement_default_cash_id:
+                            # Fall back to settlement account if no explicit routing
                             if np.any(brick_output["cash_in"]) or np.any(
                                 brick_output["cash_out"]
                             ):
                                 external_in += brick_output["cash_in"]
                                 external_out += brick_output["cash_out"]
                                 array_parent_ids.add(f"a:{brick_id}")
-                    elif b.id == self.settlement_default_cash_id:
-                        # Fall back to settlement account if no explicit routing
-                        if np.any(brick_output["cash_in"]) or np.any(
-                            brick_output["cash_out"]
+                    elif isinstance(brick, LBrick):
+                        # Liability bricks generate cash flows (payments, etc.)
+                        # Check for explicit routing first
+                        if (
+                            brick.links
+                            and "route" in brick.links
+                            and "to" in brick.links["route"]
                         ):
-                            external_in += brick_output["cash_in"]
-                            external_out += brick_output["cash_out"]
-                            array_parent_ids.add(f"a:{brick_id}")
-                elif isinstance(brick, LBrick):
-                    # Liability bricks generate cash flows (payments, etc.)
-                    # Check for explicit routing first
-                    if (
-                        brick.links
-                        and "route" in brick.links
-                        and "to" in brick.links["route"]
-                    ):
-                        if brick.links["route"]["to"] == b.id:
-                            # This brick routes to our cash account
+                            if brick.links["route"]["to"] == b.id:
+                                # This brick routes to our cash account
+                                if np.any(brick_output["cash_in"]) or np.any(
+                                    brick_output["cash_out"]
+                                ):
+                                    external_in += brick_output["cash_in"]
+                                    external_out += brick_output["cash_out"]
+                                    array_parent_ids.add(f"l:{brick_id}")
+                        elif b.id == self.settlement_default_cash_id:
+                            # Fall back to settlement account if no explicit routing
                             if np.any(brick_output["cash_in"]) or np.any(
                                 brick_output["cash_out"]
                             ):
                                 external_in += brick_output["cash_in"]
                                 external_out += brick_output["cash_out"]
                                 array_parent_ids.add(f"l:{brick_id}")
-                    elif b.id == self.settlement_default_cash_id:
-                        # Fall back to settlement account if no explicit routing
-                        if np.any(brick_output["cash_in"]) or np.any(
-                            brick_output["cash_out"]
+                    elif isinstance(brick, ABrick) and brick.kind == K.A_CASH:
+                        # Cash accounts with maturity transfers
+                        # Check for explicit routing first
+                        if (
+                            brick.links
+                            and "route" in brick.links
+                            and "to" in brick.links["route"]
                         ):
-                            external_in += brick_output["cash_in"]
-                            external_out += brick_output["cash_out"]
-                            array_parent_ids.add(f"l:{brick_id}")
-                elif isinstance(brick, ABrick) and brick.kind == K.A_CASH:
-                    # Cash accounts with maturity transfers
-                    # Check for explicit routing first
-                    if (
-                        brick.links
-                        and "route" in brick.links
-                        and "to" in brick.links["route"]
-                    ):
-                        if brick.links["route"]["to"] == b.id:
-                            # This cash account routes to our cash account (maturity transfer)
-                            if np.any(brick_output["cash_in"]) or np.any(
-                                brick_output["cash_out"]
-                            ):
-                                external_in += brick_output["cash_in"]
-                                external_out += brick_output["cash_out"]
-                                array_parent_ids.add(f"a:{brick_id}")
-
-            cash_node_id = get_node_id(b.id, "a")
-            for entry in journal.entries:
-                parent_id = entry.metadata.get("parent_id")
-                if parent_id is None:
-                    operation_id = entry.metadata.get("operation_id")
-                    if isinstance(operation_id, str) and operation_id.startswith("op:"):
-                        parts = operation_id.split(":")
-                        if len(parts) >= 3:
-                            inferred_parent = parts[1]
-                            if inferred_parent:
-                                parent_id = inferred_parent
-                bt = entry.metadata.get("brick_type")
-                bid = entry.metadata.get("brick_id")
-                prefix = {
-                    "flow": "fs",
-                    "transfer": "ts",
-                    "liability": "l",
-                    "asset": "a",
-                }.get(bt or "")
-                if prefix and bid:
-                    candidate = f"{prefix}:{bid}"
-                    if candidate in array_parent_ids:
-                        continue
-                    if parent_id is None:
-                        parent_id = candidate
-                if parent_id in array_parent_ids:
-                    continue
-                if entry.metadata.get("transaction_type") == "opening":
-                    continue
-                tag_type = entry.metadata.get("tags", {}).get("type")
-                if tag_type == "interest":
-                    if isinstance(parent_id, str) and parent_id.startswith(f"a:{b.id}"):
-                        continue
-
-                if isinstance(entry.timestamp, datetime):
-                    month_str = entry.timestamp.strftime("%Y-%m")
-                else:
-                    month_str = str(entry.timestamp)[:7]
-                month_idx = month_lookup.get(month_str)
-                if month_idx is None:
-                    continue
-
-                for posting in entry.postings:
-                    posting_node_id = posting.metadata.get("node_id")
-                    if posting_node_id != cash_node_id:
-                        continue
-                    amount = float(posting.amount.value)
-                    if posting.is_debit():
-                        external_in[month_idx] += abs(amount)
-                    else:
-                        external_out[month_idx] += abs(amount)
+                            if brick.links["route"]["to"] == b.id:
+                                # This cash account routes to our cash account (maturity transfer)
+                                if np.any(brick_output["cash_in"]) or np.any(
+                                    brick_output["cash_out"]
+                                ):
+                                    external_in += brick_output["cash_in"]
+                                    external_out += brick_output["cash_out"]
+                                    array_parent_ids.add(f"a:{brick_id}")
+
+                # Add journal postings on this cash node not already counted above
+                routing_index.add_external_flows(
+                    b.id, array_parent_ids, external_in, external_out
+                )
 
-            # Set external flows for backward compatibility
-            b.spec["external_in"] = external_in
-            b.spec["external_out"] = external_out
+                flows = ctx.run_state.cash_flows.setdefault(b.id, {})
+                flows["external_in"] = external_in
+                flows["external_out"] = external_out
 
-            outputs[b.id] = b.simulate(ctx)
+                with profiler.brick(b, "cash_pass"):
+                    outputs[b.id] = b.simulate(ctx)
 
         # Handle maturity transfers for cash accounts with end_date and route links
-        self._handle_maturity_transfers(outputs, ctx, journal, brick_iteration_counters)
+        with profiler.span("maturity_transfers"):
+            self._handle_maturity_transfers(
+                outputs, ctx, journal, brick_iteration_counters
+            )
 
         # Validate journal invariants (V2)
-        if self.validate_routing:
-            errors = journal.validate_invariants(account_registry)
-            if errors:
-                raise AssertionError(f"Journal validation failed: {errors}")
-
-            # V2: Validate origin_id uniqueness
-            from .validation import validate_origin_id_uniqueness
-
-            try:
-                validate_origin_id_uniqueness(journal)
-            except ValueError as e:
-                raise AssertionError(f"Journal origin_id validation failed: {e}") from e
+        with profiler.span("validate_journal"):
+            if self.validate_routing:
+                errors = journal.validate_invariants(account_registry)
+                if errors:
+                    raise AssertionError(f"Journal validation failed: {errors}")
+
+                # V2: Validate origin_id uniqueness
+                from .validation import validate_origin_id_uniqueness
+
+                try:
+                    validate_origin_id_uniqueness(journal)
+                except ValueError as e:
+                    raise AssertionError(
+                        f"Journal origin_id validation failed: {e}"
+                    ) from e
 
         return outputs, journal
 
@@ -999,7 +1406,7 @@ class Scenario:
         from .events import Event
         from .journal import JournalEntry, Posting
 
-        for brick in self.bricks:
+        for brick in ctx.registry.values():
             if (
                 isinstance(brick, ABrick)
                 and brick.kind == K.A_CASH
@@ -1020,15 +1427,10 @@ class Scenario:
                 if end_month_idx is not None and end_month_idx < len(ctx.t_index):
                     # Get final balance at maturity (before active mask is applied)
                     # We need to calculate the balance before the active mask zeros it out
-                    # Temporarily remove the end_date to get the true balance
-                    original_end_date = brick.end_date
-                    brick.end_date = None
-
-                    # Re-simulate to get the balance without active mask
-                    temp_output = brick.simulate(ctx)
-
-                    # Restore the original end_date
-                    brick.end_date = original_end_date
+                    # Re-simulate a copy without end_date to get the true balance
+                    unbounded = copy.copy(brick)
+                    unbounded.end_date = None
+                    temp_output = unbounded.simulate(ctx)
 
                     # Calculate the transfer amount: balance before interest + contribution
                     # This ensures we transfer the principal + contribution, and let interest be earned on the remaining balance
@@ -1043,8 +1445,8 @@ class Scenario:
                         else raw_prev
                     )
 
-                    monthly_contribution = brick.spec.get(
-                        "external_in", np.zeros(len(ctx.t_index))
+                    monthly_contribution = ctx.run_state.cash_flow(
+                        brick.id, "external_in", len(ctx.t_index)
                     )[end_month_idx]
                     contrib_dec = (
                         Decimal(str(monthly_contribution))
@@ -1068,25 +1470,17 @@ class Scenario:
                         # This ensures source earns interest for the month, destination doesn't double-earn
 
                         # Source: transfer out at end of month (earns interest first)
-                        if "external_out" not in brick.spec:
-                            brick.spec["external_out"] = np.zeros(len(ctx.t_index))
-                        brick.spec["external_out"][end_month_idx] += transfer_amount
+                        ctx.run_state.cash_flow(
+                            brick.id, "external_out", len(ctx.t_index)
+                        )[end_month_idx] += transfer_amount
 
                         # Destination: receive post-interest (no interest on transfer this month)
-                        dest_brick = None
-                        for b in self.bricks:
-                            if b.id == dest_brick_id:
-                                dest_brick = b
-                                break
+                        dest_brick = ctx.registry.get(dest_brick_id)
 
                         if dest_brick:
-                            if "post_interest_in" not in dest_brick.spec:
-                                dest_brick.spec["post_interest_in"] = np.zeros(
-                                    len(ctx.t_index)
-                                )
-                            dest_brick.spec["post_interest_in"][
-                                end_month_idx
-                            ] += transfer_amount
+                            ctx.run_state.cash_flow(
+                                dest_brick_id, "post_interest_in", len(ctx.t_index)
+                            )[end_month_idx] += transfer_amount
 
                         # Create maturity transfer event
                         transfer_event = Event(
@@ -1804,19 +2198,20 @@ class Scenario:
 
     def _create_empty_output(self, length: int) -> BrickOutput:
         """Create an empty BrickOutput for bricks that don't participate in simulation."""
+        zeros = shared_zeros(length)
         return BrickOutput(
-            cash_in=np.zeros(length),
-            cash_out=np.zeros(length),
-            assets=np.zeros(length),
-            liabilities=np.zeros(length),
-            interest=np.zeros(length),
+            cash_in=zeros,
+            cash_out=zeros,
+            assets=zeros,
+            liabilities=zeros,
+            interest=zeros,
             events=[],
         )
 
     def _aggregate_results(
         self,
         outputs: dict[str, BrickOutput],
-        t_index: np.ndarray,
+        t_index: np.ndarray | pd.PeriodIndex,
         include_cash: bool,
         journal=None,
     ) -> pd.DataFrame:
@@ -1910,6 +2305,16 @@ class Scenario:
         # Finalize totals with proper identities and assertions
         return finalize_totals(totals)
 
+    def _last_run_totals(self) -> pd.DataFrame:
+        """Totals of the last run (computed now if it was never read)."""
+        if self._last_totals is not None:
+            return self._last_totals
+        if self._last_results is None:
+            raise RuntimeError(
+                "No scenario has been run yet. Call scenario.run() first."
+            )
+        return self._last_results["totals"]
+
     def aggregate_totals(self, freq: str = "Q", **kwargs: Any) -> pd.DataFrame:
         """
         Convenience method to aggregate the last run's totals to different frequencies.
@@ -1929,11 +2334,7 @@ class Scenario:
             >>> quarterly = scenario.aggregate_totals("Q")
             >>> yearly = scenario.aggregate_totals("Y")
         """
-        if self._last_totals is None:
-            raise RuntimeError(
-                "No scenario has been run yet. Call scenario.run() first."
-            )
-        return aggregate_totals(self._last_totals, freq=freq, **kwargs)
+        return aggregate_totals(self._last_run_totals(), freq=freq, **kwargs)
 
     def validate(self, mode: str = "raise", tol: float = 1e-6) -> None:
         """
@@ -1961,7 +2362,12 @@ class Scenario:
             )
 
         # Use the stored results from the last run
-        validate_run(self._last_results, self.bricks, mode=mode, tol=tol)
+        validate_run(
+            self._last_results,
+            self._last_results["_scenario_bricks"],
+            mode=mode,
+            tol=tol,
+        )
 
     def to_canonical_frame(
         self, transfer_visibility: TransferVisibility | None = None
@@ -1984,13 +2390,8 @@ class Scenario:
         Raises:
             RuntimeError: If no scenario has been run yet
         """
-        if self._last_totals is None:
-            raise RuntimeError(
-                "No scenario has been run yet. Call scenario.run() first."
-            )
-
         # Start with the totals DataFrame
-        df = self._last_totals.copy()
+        df = self._last_run_totals().copy()
 
         # Ensure we have month-end dates
         if not isinstance(df.index, pd.PeriodIndex):
@@ -2065,27 +2466,23 @@ class Scenario:
 
         return canonical_df
 
-    def _resolve_mortgage_links(self) -> None:
+    def _resolve_mortgage_links(self) -> dict[str, date]:
         """
         Resolve mortgage links and validate settlement buckets.
 
         This method processes all mortgage bricks to:
         1. Resolve start dates from StartLink references
-        2. Resolve principal amounts from PrincipalLink references
-        3. Validate settlement buckets for remaining_of links
-        4. Validate brick configurations
-        """
-        # Create brick registry for lookups
-        brick_registry = {b.id: b for b in self.bricks}
+        2. Validate settlement buckets for remaining_of links
+        3. Validate brick configurations
 
-        # Process each mortgage brick
-        for brick in self.bricks:
-            if not isinstance(brick, LBrick) or brick.kind != K.L_LOAN_ANNUITY:
-                continue
+        Links are resolved on working copies, so the bricks are not modified.
 
-            # Convert LMortgageSpec to dict for strategy compatibility
-            if isinstance(brick.spec, LMortgageSpec):
-                brick.spec = brick.spec.__dict__.copy()
+        Returns:
+            Start dates derived from StartLinks, by brick ID
+        """
+        # Create brick registry for lookups
+        bricks = self._working_copies()
+        brick_registry = {b.id: b for b in bricks}
 
         # Resolve start dates
         self._resolve_start_dates(brick_registry)
@@ -2096,9 +2493,15 @@ class Scenario:
         # Validate settlement buckets
         self._validate_settlement_buckets(brick_registry)
 
+        return {
+            working.id: working.start_date
+            for brick, working in zip(self.bricks, bricks, strict=True)
+            if working.start_date != brick.start_date
+        }
+
     def _resolve_start_dates(self, brick_registry: dict[str, FinBrickABC]) -> None:
         """Resolve start dates from StartLink references."""
-        for brick in self.bricks:
+        for brick in brick_registry.values():
             if not hasattr(brick, "links") or not brick.links:
                 continue
 
@@ -2165,7 +2568,7 @@ class Scenario:
 
     def _resolve_principals(self, brick_registry: dict[str, FinBrickABC]) -> None:
         """Resolve principal amounts from PrincipalLink references."""
-        for brick in self.bricks:
+        for brick in brick_registry.values():
             if not isinstance(brick, LBrick) or brick.kind != K.L_LOAN_ANNUITY:
                 continue
 
@@ -2223,7 +2626,7 @@ class Scenario:
         # Group contributors by remaining_of target
         settlement_buckets = {}
 
-        for brick in self.bricks:
+        for brick in brick_registry.values():
             if not isinstance(brick, LBrick) or brick.kind != K.L_LOAN_ANNUITY:
                 continue
 
@@ -2269,19 +2672,6 @@ class Scenario:
                     f"Settlement bucket {target_id}: multiple fill_remaining=True"
                 )
 
-            # Store settlement info for later validation during simulation
-            for brick, principal_link in contributors:
-                if not hasattr(brick, "_settlement_info"):
-                    brick._settlement_info = []
-                brick._settlement_info.append(
-                    {
-                        "target_id": target_id,
-                        "share": principal_link.share,
-                        "nominal": principal_link.nominal,
-                        "fill_remaining": principal_link.fill_remaining,
-                    }
-                )
-
     def _find_start_index(self, start_date: date, t_index: np.ndarray) -> int | None:
         """
         Find the index in t_index that corresponds to the start_date.
@@ -2313,17 +2703,18 @@ class Scenario:
             start_idx: The index where the brick starts
 
         Returns:
-            A new context with time index starting from start_idx
+            A new context with time index starting from start_idx, sharing
+            the run's journal and fingerprints and a slice of its timeline
         """
-        # Create a new time index starting from the brick's start time
-        new_t_index = ctx.t_index[start_idx:]
-
         return ScenarioContext(
-            t_index=new_t_index,
+            t_index=ctx.t_index[start_idx:],
             currency=ctx.currency,
             registry=ctx.registry,
             journal=ctx.journal,
             settlement_default_cash_id=ctx.settlement_default_cash_id,
+            timeline=ctx.timeline.tail(start_idx),
+            fingerprints=ctx.fingerprints,
+            run_state=ctx.run_state,
         )
 
     def _shift_output(
@@ -2339,31 +2730,24 @@ class Scenario:
 
         Returns:
             A new BrickOutput with arrays padded with zeros at the beginning
+            (shared zero arrays stay shared)
         """
-        # Create arrays of the full simulation length
-        full_cash_in = np.zeros(total_length)
-        full_cash_out = np.zeros(total_length)
-        full_assets = np.zeros(total_length)
-        full_liabilities = np.zeros(total_length)
-        full_interest = np.zeros(total_length)
-
         # Place the brick's output at the correct time positions
         brick_length = len(output["cash_in"])
         end_idx = min(start_idx + brick_length, total_length)
         actual_length = end_idx - start_idx
 
-        full_cash_in[start_idx:end_idx] = output["cash_in"][:actual_length]
-        full_cash_out[start_idx:end_idx] = output["cash_out"][:actual_length]
-        full_assets[start_idx:end_idx] = output["assets"][:actual_length]
-        full_liabilities[start_idx:end_idx] = output["liabilities"][:actual_length]
-        full_interest[start_idx:end_idx] = output["interest"][:actual_length]
+        shifted = {}
+        for key in ("cash_in", "cash_out", "assets", "liabilities", "interest"):
+            if is_shared_zeros(output[key]):
+                shifted[key] = shared_zeros(total_length)
+                continue
+            full = np.zeros(total_length)
+            full[start_idx:end_idx] = output[key][:actual_length]
+            shifted[key] = full
 
         return BrickOutput(
-            cash_in=full_cash_in,
-            cash_out=full_cash_out,
-            assets=full_assets,
-            liabilities=full_liabilities,
-            interest=full_interest,
+            **shifted,
             events=output["events"],  # Events don't need shifting
         )
 
@@ -2621,6 +3005,88 @@ def validate_run(
             print(f"WARNING: {full}")
 
 
+# Series exported per brick by export_run_json (when present in the output)
+_EXPORT_SERIES_KEYS = (
+    "cash_in",
+    "cash_out",
+    "assets",
+    "liabilities",
+    "asset_value",
+    "debt_balance",
+)
+
+
+def _rounded_list(values: Any, precision: int) -> list:
+    """Values as a list, with numeric entries rounded to precision (if >= 0)."""
+    if isinstance(values, np.ndarray | pd.Series):
+        arr = np.asarray(values)
+        if precision >= 0 and arr.dtype.kind in "iuf":
+            arr = np.round(arr, precision)
+        return arr.tolist()
+    values = list(values) if isinstance(values, list | tuple) else [values]
+    if precision >= 0:
+        values = [
+            round(v, precision) if isinstance(v, int | float) else v for v in values
+        ]
+    return values
+
+
+def _json_block(value: Any, level: int, cls: type[json.JSONEncoder]) -> str:
+    """Render value as ``json.dump(indent=2)`` does when nested level deep."""
+    text = json.dumps(value, indent=2, ensure_ascii=False, cls=cls)
+    return text.replace("\n", "\n" + "  " * level)
+
+
+def _write_json_members(
+    f: Any,
+    items: Iterator[tuple[str, Any]],
+    level: int,
+    cls: type[json.JSONEncoder],
+) -> None:
+    """Stream an object member by member, formatted like ``json.dump(indent=2)``."""
+    indent = "  " * level
+    first = True
+    for key, value in items:
+        f.write("{\n" if first else ",\n")
+        f.write(f"{indent}  {json.dumps(key, ensure_ascii=False)}: ")
+        f.write(_json_block(value, level + 1, cls))
+        first = False
+    f.write("{}" if first else f"\n{indent}}}")
+
+
+def _write_json_items(
+    f: Any, items: Iterator[Any], level: int, cls: type[json.JSONEncoder]
+) -> None:
+    """Stream an array item by item, formatted like ``json.dump(indent=2)``."""
+    indent = "  " * level
+    first = True
+    for item in items:
+        f.write("[\n" if first else ",\n")
+        f.write(f"{indent}  {_json_block(item, level + 1, cls)}")
+        first = False
+    f.write("[]" if first else f"\n{indent}]")
+
+
+def _sorted_events(brick_id: str, output: BrickOutput) -> list[tuple[str, str, Event]]:
+    """(month, brick ID, event) of one brick in time order (stable)."""
+    return sorted(
+        (
+            (str(event.t.astype("datetime64[M]")), brick_id, event)
+            for event in output.get("events", [])
+        ),
+        key=lambda item: item[0],
+    )
+
+
+def _nonzero_flows(
+    output: BrickOutput, flow_type: str, order: int
+) -> Iterator[tuple[int, int, str, float]]:
+    """(month index, order, flow type, amount) of the non-zero flows of a series."""
+    arr = np.asarray(output[flow_type])
+    for i in np.flatnonzero(np.abs(arr) > 1e-9):
+        yield int(i), order, flow_type, float(arr[i])
+
+
 def export_run_json(
     path: str,
     scenario: Scenario,
@@ -2638,6 +3104,9 @@ def export_run_json(
     - Aggregated totals
     - Validation results and invariants
 
+    The file is written incrementally, one brick (or event) at a time, so
+    memory use does not grow with the number of bricks and months.
+
     Args:
         path: Output file path for the JSON file
         scenario: The scenario that was run
@@ -2648,67 +3117,6 @@ def export_run_json(
     # Convert time index to string format
     t_index = res["totals"].index.strftime("%Y-%m").tolist()
 
-    # Extract series data for all bricks
-    series = {}
-    for brick_id, output in res["outputs"].items():
-        series[brick_id] = {}
-        for key in [
-            "cash_in",
-            "cash_out",
-            "assets",
-            "liabilities",
-            "asset_value",
-            "debt_balance",
-        ]:
-            if key in output:
-                # Convert to list and round to specified precision
-                if hasattr(output[key], "tolist"):
-                    values = output[key].tolist()
-                elif isinstance(output[key], list | tuple):
-                    values = list(output[key])
-                else:
-                    values = [output[key]]
-
-                if precision >= 0:
-                    values = [
-                        round(v, precision) if isinstance(v, int | float) else v
-                        for v in values
-                    ]
-                series[brick_id][key] = values
-
-    # Extract and format events
-    events = []
-    for brick_id, output in res["outputs"].items():
-        for event in output.get("events", []):
-            event_data = {
-                "t": str(event.t.astype("datetime64[M]")),
-                "brick_id": brick_id,
-                "kind": event.kind,
-                "message": event.message,
-                "meta": event.meta or {},
-            }
-            # Add amount if available in meta
-            if event.meta and "amount" in event.meta:
-                event_data["amount"] = round(event.meta["amount"], precision)
-            events.append(event_data)
-
-    # Sort events by time
-    events.sort(key=lambda x: x["t"])
-
-    # Extract totals with precision
-    totals = {}
-    for col in res["totals"].columns:
-        if hasattr(res["totals"][col], "tolist"):
-            values = res["totals"][col].tolist()
-        else:
-            values = list(res["totals"][col])
-
-        if precision >= 0:
-            values = [
-                round(v, precision) if isinstance(v, int | float) else v for v in values
-            ]
-        totals[col] = values
-
     # Run validation and capture results
     validation_results = {}
     try:
@@ -2748,39 +3156,56 @@ def export_run_json(
             "messages": [f"Validation error: {str(e)}"],
         }
 
-    # Build the comprehensive JSON structure
-    payload = {
-        "metadata": {
-            "scenario": {"id": scenario.id, "name": scenario.name},
-            "simulation_period": {
-                "start": t_index[0],
-                "end": t_index[-1],
-                "months": len(t_index),
-            },
-            "bricks": [
-                {
-                    "id": brick.id,
-                    "name": brick.name,
-                    "family": brick.family,
-                    "kind": brick.kind,
-                    "start_date": str(brick.start_date) if brick.start_date else None,
-                }
-                for brick in scenario.bricks
-            ],
-        },
-        "t_index": t_index,
-        "series": series,
-        "events": events,
-        "totals": totals,
-        "invariants": validation_results,
-    }
+    def series():
+        # Series data per brick, rounded with vectorized NumPy
+        for brick_id, output in res["outputs"].items():
+            yield brick_id, {
+                key: _rounded_list(output[key], precision)
+                for key in _EXPORT_SERIES_KEYS
+                if key in output
+            }
 
-    # Optionally include brick specifications
-    if include_specs:
-        payload["brick_specs"] = {
-            brick.id: {"spec": brick.spec, "links": brick.links}
+    def events():
+        # Per-brick time-ordered events merged into one time-ordered stream
+        streams = [
+            _sorted_events(brick_id, output)
+            for brick_id, output in res["outputs"].items()
+        ]
+        for t, brick_id, event in heapq.merge(*streams, key=lambda item: item[0]):
+            event_data = {
+                "t": t,
+                "brick_id": brick_id,
+                "kind": event.kind,
+                "message": event.message,
+                "meta": event.meta or {},
+            }
+            # Add amount if available in meta
+            if event.meta and "amount" in event.meta:
+                event_data["amount"] = round(event.meta["amount"], precision)
+            yield event_data
+
+    def totals():
+        for col in res["totals"].columns:
+            yield col, _rounded_list(res["totals"][col], precision)
+
+    metadata = {
+        "scenario": {"id": scenario.id, "name": scenario.name},
+        "simulation_period": {
+            "start": t_index[0],
+            "end": t_index[-1],
+            "months": len(t_index),
+        },
+        "bricks": [
+            {
+                "id": brick.id,
+                "name": brick.name,
+                "family": brick.family,
+                "kind": brick.kind,
+                "start_date": str(brick.start_date) if brick.start_date else None,
+            }
             for brick in scenario.bricks
-        }
+        ],
+    }
 
     # Custom JSON encoder to handle numpy types
     class NumpyEncoder(json.JSONEncoder):
@@ -2795,9 +3220,65 @@ def export_run_json(
                 return obj.tolist()
             return super().default(obj)
 
-    # Write to file
+    # Write the top-level object member by member
     with open(path, "w") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=False, cls=NumpyEncoder)
+        f.write("{\n")
+        f.write(f'  "metadata": {_json_block(metadata, 1, NumpyEncoder)},\n')
+        f.write(f'  "t_index": {_json_block(t_index, 1, NumpyEncoder)},\n')
+        f.write('  "series": ')
+        _write_json_members(f, series(), 1, NumpyEncoder)
+        f.write(',\n  "events": ')
+        _write_json_items(f, events(), 1, NumpyEncoder)
+        f.write(',\n  "totals": ')
+        _write_json_members(f, totals(), 1, NumpyEncoder)
+        f.write(
+            f',\n  "invariants": {_json_block(validation_results, 1, NumpyEncoder)}'
+        )
+        # Optionally include brick specifications
+        if include_specs:
+            f.write(',\n  "brick_specs": ')
+            _write_json_members(
+                f,
+                (
+                    (brick.id, {"spec": brick.spec, "links": brick.links})
+                    for brick in scenario.bricks
+                ),
+                1,
+                NumpyEncoder,
+            )
+        f.write("\n}")
+
+
+def _ledger_rows(
+    brick_id: str, output: BrickOutput, labels: list[str]
+) -> Iterator[tuple[str, str, str, float, str]]:
+    """Ledger rows of one brick in time order: cash in, cash out, then events."""
+    # Only non-zero flows; cash in before cash out of the same month
+    cash_rows = (
+        (labels[i], brick_id, flow_type, amount, "")
+        for i, _order, flow_type, amount in heapq.merge(
+            _nonzero_flows(output, "cash_in", 0),
+            _nonzero_flows(output, "cash_out", 1),
+        )
+    )
+
+    def event_rows():
+        for t, _brick_id, event in _sorted_events(brick_id, output):
+            amount = 0.0
+            if event.meta and "amount" in event.meta:
+                amount = float(event.meta["amount"])
+            elif event.meta and "price" in event.meta:
+                amount = float(event.meta["price"])
+            yield (
+                t,
+                brick_id,
+                "event",
+                amount,
+                f"{event.kind}: {event.message}",
+            )
+
+    # Cash flows come before events of the same month
+    return heapq.merge(cash_rows, event_rows(), key=lambda row: row[0])
 
 
 def export_ledger_csv(path: str, res: dict) -> None:
@@ -2805,58 +3286,26 @@ def export_ledger_csv(path: str, res: dict) -> None:
     Export simulation results to a flat ledger CSV format.
 
     This creates a simple CSV with one row per cash flow or event,
-    making it easy to eyeball the financial transactions.
+    making it easy to eyeball the financial transactions. Rows are ordered
+    by month, then brick ID; they are produced per brick already in order and
+    merged while writing, so memory use stays flat for long horizons.
 
     Args:
         path: Output file path for the CSV file
         res: Results dictionary from Scenario.run()
     """
-    t_index = res["totals"].index
-    rows = []
-
-    # Extract cash flows
-    for brick_id, output in res["outputs"].items():
-        for flow_type in ["cash_in", "cash_out"]:
-            arr = output[flow_type]
-            for i, val in enumerate(arr):
-                if abs(val) > 1e-9:  # Only include non-zero flows
-                    rows.append(
-                        {
-                            "t": t_index[i].strftime("%Y-%m"),
-                            "brick_id": brick_id,
-                            "flow": flow_type,
-                            "amount": float(val),
-                            "note": "",
-                        }
-                    )
-
-    # Extract events
-    for brick_id, output in res["outputs"].items():
-        for event in output.get("events", []):
-            amount = 0.0
-            if event.meta and "amount" in event.meta:
-                amount = float(event.meta["amount"])
-            elif event.meta and "price" in event.meta:
-                amount = float(event.meta["price"])
-
-            rows.append(
-                {
-                    "t": str(event.t.astype("datetime64[M]")),
-                    "brick_id": brick_id,
-                    "flow": "event",
-                    "amount": amount,
-                    "note": f"{event.kind}: {event.message}",
-                }
-            )
-
-    # Sort by time, then by brick_id
-    rows.sort(key=lambda x: (x["t"], x["brick_id"]))
-
-    # Write CSV
-    if rows:
+    labels = res["totals"].index.strftime("%Y-%m").tolist()
+    streams = [
+        _ledger_rows(brick_id, output, labels)
+        for brick_id, output in res["outputs"].items()
+    ]
+    rows = heapq.merge(*streams, key=lambda row: (row[0], row[1]))
+
+    # Write CSV (no file without rows)
+    first = next(rows, None)
+    if first is not None:
         with open(path, "w", newline="") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=["t", "brick_id", "flow", "amount", "note"]
-            )
-            writer.writeheader()
+            writer = csv.writer(f)
+            writer.writerow(["t", "brick_id", "flow", "amount", "note"])
+            writer.writerow(first)
             writer.writerows(rows)
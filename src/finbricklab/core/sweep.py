@@ -0,0 +1,366 @@
+"""
+Parameter sweeps over a scenario.
+
+A sweep runs one scenario many times with spec fields overridden per
+variant (e.g. ``{"mortgage.spec.rate_pa": [0.03, 0.04]}``) and collects the
+``totals`` of every variant into a long-format DataFrame.
+
+Variants are cheap copies of the scenario: only overridden bricks are
+shallow-copied, with their spec updated copy-on-write (runs never modify
+bricks), without deep-copying the scenario. Non-cash bricks that no
+override can reach are simulated once per sweep (per worker) and their
+outputs and journal entries are replayed into later variants.
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import itertools
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import date
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from .bricks import ABrick
+from .errors import ConfigError
+from .kinds import K
+
+if TYPE_CHECKING:
+    from .results import BrickOutput
+    from .scenario import Scenario
+
+# Brick attributes that can be swept besides spec fields
+_BRICK_ATTRIBUTES = frozenset({"start_date", "end_date", "duration_m"})
+
+
+def parse_param_path(path: str) -> tuple[str, tuple[str, ...]]:
+    """
+    Split a sweep parameter path into brick ID and attribute path.
+
+    Args:
+        path: '<brick_id>.spec.<field>[.<field>...]' or
+            '<brick_id>.<start_date|end_date|duration_m>'
+
+    Returns:
+        Tuple of (brick_id, attribute path), e.g. ('mortgage', ('spec', 'rate_pa'))
+
+    Raises:
+        ConfigError: If the path does not name a spec field or brick attribute
+    """
+    brick_id, _, rest = path.partition(".")
+    keys = tuple(rest.split(".")) if rest else ()
+    valid = (len(keys) >= 2 and keys[0] == "spec" and all(keys)) or (
+        len(keys) == 1 and keys[0] in _BRICK_ATTRIBUTES
+    )
+    if not brick_id or not valid:
+        raise ConfigError(
+            f"Invalid sweep parameter '{path}' "
+            "(expected '<brick_id>.spec.<field>' or '<brick_id>.<start_date|end_date|duration_m>')"
+        )
+    return brick_id, keys
+
+
+def sweep_design(
+    params: dict[str, Sequence[Any]],
+    design: str = "grid",
+    samples: int | None = None,
+    seed: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Expand sweep parameters into a list of variants.
+
+    Args:
+        params: Mapping of parameter path to candidate values
+        design: 'grid' (full Cartesian product, in parameter order) or
+            'random' (``samples`` variants, each value drawn independently)
+        samples: Number of variants for the random design
+        seed: Random seed for the random design
+
+    Returns:
+        List of {parameter path: value} overrides, one per variant
+
+    Raises:
+        ConfigError: If the design is unknown, a parameter has no values, or
+            samples is missing for the random design
+    """
+    for path, values in params.items():
+        if len(values) == 0:
+            raise ConfigError(f"Sweep parameter '{path}' has no values")
+
+    names = list(params)
+    if design == "grid":
+        return [
+            dict(zip(names, combo, strict=True))
+            for combo in itertools.product(*(params[name] for name in names))
+        ]
+    if design == "random":
+        if samples is None or samples < 1:
+            raise ConfigError("Random sweep design requires samples >= 1")
+        rng = np.random.default_rng(seed)
+        picks = {name: rng.integers(len(params[name]), size=samples) for name in names}
+        return [
+            {name: params[name][int(picks[name][i])] for name in names}
+            for i in range(samples)
+        ]
+    raise ConfigError(f"Unknown sweep design '{design}' (expected 'grid' or 'random')")
+
+
+def _with_path(obj: Any, keys: tuple[str, ...], value: Any) -> Any:
+    """Copy-on-write set of a nested dict key / attribute path."""
+    if not keys:
+        return value
+    key, rest = keys[0], keys[1:]
+    if isinstance(obj, dict):
+        updated = dict(obj)
+        updated[key] = _with_path(obj.get(key), rest, value)
+        return updated
+    if obj is None or not hasattr(obj, key):
+        raise ConfigError(f"Cannot set sweep field '{key}' on {type(obj).__name__}")
+    updated = copy.copy(obj)
+    setattr(updated, key, _with_path(getattr(obj, key), rest, value))
+    return updated
+
+
+def _referenced_ids(value: Any, brick_ids: set[str]) -> set[str]:
+    """Brick IDs mentioned anywhere in a links/spec structure."""
+    if isinstance(value, str):
+        return {value} & brick_ids
+    if isinstance(value, dict):
+        value = list(value.values())
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        value = list(vars(value).values())
+    if isinstance(value, (list, tuple, set)):
+        found: set[str] = set()
+        for item in value:
+            found |= _referenced_ids(item, brick_ids)
+        return found
+    return set()
+
+
+def affected_bricks(scenario: Scenario, varied: set[str]) -> set[str]:
+    """
+    Bricks whose simulation can change when the varied bricks change.
+
+    A brick is affected if it is varied or references (through links or spec
+    values) an affected non-cash brick. Cash bricks are only referenced by ID
+    during the first simulation pass, so references to them do not spread.
+
+    Args:
+        scenario: Scenario being swept
+        varied: IDs of bricks with overridden fields
+
+    Returns:
+        Set of affected brick IDs (including varied)
+    """
+    brick_ids = {b.id for b in scenario.bricks}
+    cash_ids = {
+        b.id for b in scenario.bricks if isinstance(b, ABrick) and b.kind == K.A_CASH
+    }
+    refs = {
+        b.id: _referenced_ids([b.links, b.spec], brick_ids) - {b.id}
+        for b in scenario.bricks
+    }
+    affected = set(varied)
+    changed = True
+    while changed:
+        changed = False
+        for brick_id, targets in refs.items():
+            if brick_id not in affected and targets & (affected - cash_ids):
+                affected.add(brick_id)
+                changed = True
+    return affected
+
+
+class UpstreamCache:
+    """
+    Outputs and journal entries of bricks shared by every sweep variant.
+
+    The first variant simulates each reusable brick and records its output,
+    the journal entries it posted and the accounts it registered; later
+    variants replay those instead of simulating again.
+
+    Attributes:
+        brick_ids: IDs of bricks that may be reused
+        hits: Number of brick simulations skipped
+    """
+
+    def __init__(self, brick_ids: set[str]):
+        self.brick_ids = set(brick_ids)
+        self.hits = 0
+        self._records: dict[str, tuple[BrickOutput, list[Any], list[Any]]] = {}
+
+    def simulate(self, brick: Any, journal: Any, simulate: Any) -> BrickOutput:
+        """
+        Simulate a brick through the cache.
+
+        Args:
+            brick: Brick being simulated
+            journal: Journal of the current run
+            simulate: Zero-argument callable running the actual simulation
+
+        Returns:
+            The brick's output (a fresh dict with its own events list)
+        """
+        if brick.id not in self.brick_ids:
+            return simulate()
+
+        registry = journal.account_registry
+        record = self._records.get(brick.id)
+        if record is not None:
+            output, entries, accounts = record
+            for account in accounts:
+                if not registry.has_account(account.id):
+                    registry.register_account(account)
+            for entry in entries:
+                journal.post(entry)
+            self.hits += 1
+            return {**output, "events": list(output["events"])}
+
+        known = set(registry._accounts) if registry is not None else set()
+        with journal.recording() as entries:
+            output = simulate()
+        accounts = (
+            [a for a_id, a in registry._accounts.items() if a_id not in known]
+            if registry is not None
+            else []
+        )
+        self._records[brick.id] = (
+            {**output, "events": list(output["events"])},
+            entries,
+            accounts,
+        )
+        return output
+
+
+def _variant(scenario: Scenario, overrides: dict[str, Any]) -> Scenario:
+    """Copy of scenario with overrides applied to per-variant brick copies."""
+    by_brick: dict[str, list[tuple[tuple[str, ...], Any]]] = {}
+    for path, value in overrides.items():
+        brick_id, keys = parse_param_path(path)
+        by_brick.setdefault(brick_id, []).append((keys, value))
+
+    bricks = []
+    for brick in scenario.bricks:
+        if brick.id in by_brick:
+            brick = copy.copy(brick)
+        for keys, value in by_brick.get(brick.id, []):
+            if keys[0] == "spec":
+                brick.spec = _with_path(brick.spec, keys[1:], value)
+            else:
+                setattr(brick, keys[0], value)
+        bricks.append(brick)
+    return scenario._shallow_copy(bricks=bricks)
+
+
+def _run_variants(
+    scenario: Scenario,
+    variants: list[dict[str, Any]],
+    start: date,
+    months: int,
+    selection: list[str] | None,
+    include_cash: bool,
+) -> list[pd.DataFrame]:
+    """Run variants in order, sharing an upstream cache; return their totals."""
+    varied = {parse_param_path(path)[0] for v in variants for path in v}
+    affected = affected_bricks(scenario, varied)
+    cache = UpstreamCache(
+        {
+            b.id
+            for b in scenario.bricks
+            if b.id not in affected
+            and not (isinstance(b, ABrick) and b.kind == K.A_CASH)
+        }
+    )
+    totals = []
+    for overrides in variants:
+        results = _variant(scenario, overrides)._run(
+            start=start,
+            months=months,
+            selection=selection,
+            include_cash=include_cash,
+            brick_cache=cache,
+        )
+        totals.append(results["totals"])
+    return totals
+
+
+def _chunks(items: list[Any], n: int) -> list[list[Any]]:
+    """Split items into at most n contiguous, near-equal chunks."""
+    n = max(1, min(n, len(items)))
+    size, extra = divmod(len(items), n)
+    out, i = [], 0
+    for k in range(n):
+        j = i + size + (1 if k < extra else 0)
+        out.append(items[i:j])
+        i = j
+    return out
+
+
+def run_sweep(
+    scenario: Scenario,
+    params: dict[str, Sequence[Any]],
+    start: date,
+    months: int,
+    *,
+    design: str = "grid",
+    samples: int | None = None,
+    seed: int | None = None,
+    selection: list[str] | None = None,
+    include_cash: bool = True,
+    workers: int | None = None,
+    executor: Executor | None = None,
+) -> pd.DataFrame:
+    """
+    Run a parameter sweep and return the totals of every variant in long format.
+
+    See ``Scenario.sweep`` for the parameters.
+
+    Returns:
+        DataFrame with columns 'variant', one column per parameter path,
+        'month', 'metric' and 'value' (one row per variant, month and
+        totals column)
+    """
+    brick_ids = {b.id for b in scenario.bricks}
+    for path in params:
+        brick_id, _ = parse_param_path(path)
+        if brick_id not in brick_ids:
+            raise ConfigError(
+                f"Sweep parameter '{path}' references unknown brick '{brick_id}'"
+            )
+
+    variants = sweep_design(params, design=design, samples=samples, seed=seed)
+    base = scenario._shallow_copy()
+
+    if executor is None and (workers is None or workers <= 1):
+        totals = _run_variants(base, variants, start, months, selection, include_cash)
+    else:
+        chunks = _chunks(variants, workers or len(variants))
+
+        def _submit(pool: Executor) -> list[pd.DataFrame]:
+            futures = [
+                pool.submit(
+                    _run_variants, base, chunk, start, months, selection, include_cash
+                )
+                for chunk in chunks
+            ]
+            return [frame for future in futures for frame in future.result()]
+
+        if executor is not None:
+            totals = _submit(executor)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                totals = _submit(pool)
+
+    frames = []
+    for i, (overrides, frame) in enumerate(zip(variants, totals, strict=True)):
+        long = frame.rename_axis("month").reset_index()
+        long = long.melt(id_vars="month", var_name="metric", value_name="value")
+        for path in reversed(list(params)):
+            long.insert(0, path, [overrides[path]] * len(long))
+        long.insert(0, "variant", i)
+        frames.append(long)
+    return pd.concat(frames, ignore_index=True)
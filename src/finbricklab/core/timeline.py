@@ -0,0 +1,108 @@
+"""
+Precomputed monthly timeline shared by all strategies of a scenario run.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True, eq=False)
+class Timeline:
+    """
+    Immutable views of a simulation time index.
+
+    Built once per run (``Scenario._initialize_simulation``) and exposed as
+    ``ScenarioContext.timeline`` so strategies index into ready-made Python
+    objects instead of converting ``ctx.t_index[t]`` in their monthly loops.
+
+    Attributes:
+        months: Read-only datetime64[M] array
+        datetimes: Python datetimes of the time index (entry timestamps)
+        dates: Python dates of the time index
+        labels: 'YYYY-MM' strings
+        period_index: Monthly PeriodIndex (index of results DataFrames)
+        month_index: Mapping of 'YYYY-MM' label to month index (do not modify)
+    """
+
+    months: np.ndarray
+    datetimes: tuple[datetime, ...]
+    dates: tuple[date, ...]
+    labels: tuple[str, ...]
+    period_index: pd.PeriodIndex
+    month_index: Mapping[str, int]
+
+    @classmethod
+    def from_index(cls, t_index: np.ndarray | pd.PeriodIndex) -> Timeline:
+        """
+        Build the timeline of a time index.
+
+        Args:
+            t_index: datetime64 array (e.g. from ``month_range``) or PeriodIndex
+
+        Returns:
+            Timeline with one element per entry of t_index
+        """
+        if isinstance(t_index, pd.PeriodIndex):
+            t_index = t_index.to_timestamp().to_numpy()
+        values = np.asarray(t_index)
+
+        months = values.astype("datetime64[M]")
+        months.flags.writeable = False
+        labels = tuple(np.datetime_as_string(months, unit="M").tolist())
+        return cls(
+            months=months,
+            datetimes=tuple(values.astype("datetime64[us]").tolist()),
+            dates=tuple(values.astype("datetime64[D]").tolist()),
+            labels=labels,
+            period_index=pd.PeriodIndex(months, freq="M"),
+            month_index={label: idx for idx, label in enumerate(labels)},
+        )
+
+    def tail(self, start: int) -> Timeline:
+        """
+        Timeline of the months from index start on, sliced from this one.
+
+        Args:
+            start: First month index of the new timeline
+
+        Returns:
+            Timeline whose month 0 is month start of this one
+        """
+        labels = self.labels[start:]
+        return Timeline(
+            months=self.months[start:],
+            datetimes=self.datetimes[start:],
+            dates=self.dates[start:],
+            labels=labels,
+            period_index=self.period_index[start:],
+            month_index={label: idx for idx, label in enumerate(labels)},
+        )
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def index_of(self, value: Any) -> int | None:
+        """
+        Month index of a timestamp, date or 'YYYY-MM' string.
+
+        Args:
+            value: datetime, date, np.datetime64, pd.Period or string
+                starting with 'YYYY-MM'
+
+        Returns:
+            Index into the timeline, or None if the month is outside it
+        """
+        if isinstance(value, (date, pd.Period)):
+            key = value.strftime("%Y-%m")
+        elif isinstance(value, np.datetime64):
+            key = str(value.astype("datetime64[M]"))
+        else:
+            key = str(value)[:7]
+        return self.month_index.get(key)
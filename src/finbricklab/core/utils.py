@@ -186,9 +186,12 @@ def _apply_window_equity_neutral(out, mask):
     """
     import numpy as np
 
-    # Mask flows to zero outside the window
-    out["cash_in"] = np.where(mask, out["cash_in"], 0.0)
-    out["cash_out"] = np.where(mask, out["cash_out"], 0.0)
+    from .results import is_shared_zeros
+
+    # Mask flows to zero outside the window (shared zero arrays need no mask)
+    for key in ("cash_in", "cash_out"):
+        if not is_shared_zeros(out[key]):
+            out[key] = np.where(mask, out[key], 0.0)
 
     # Do NOT touch stocks here; terminal actions set them explicitly at t_stop
 
@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from .accounts import BOUNDARY_NODE_ID, AccountRegistry, AccountScope, get_node_scope
-from .journal import JournalEntry, Posting
+from .journal import JournalEntry, Posting, SummaryJournal
 
 
 @dataclass
@@ -284,12 +284,20 @@ def validate_origin_id_uniqueness(journal) -> None:
     """
     Validate that origin_id is unique per currency in the journal.
 
+    A ``SummaryJournal`` keeps no origin_ids; the repeats it recorded while
+    posting are reported instead.
+
     Args:
         journal: Journal to validate
 
     Raises:
         ValueError: If duplicate origin_id found
     """
+    if isinstance(journal, SummaryJournal):
+        if journal.origin_conflicts:
+            raise ValueError(journal.origin_conflicts[0])
+        return
+
     seen: dict[tuple[str, str], str] = {}  # (origin_id, currency) -> entry_id
 
     for entry in journal.entries:
@@ -6,9 +6,6 @@ from __future__ import annotations
 
 from datetime import datetime
 
-import numpy as np
-import pandas as pd
-
 from finbricklab.core.accounts import BOUNDARY_NODE_ID, get_node_id
 from finbricklab.core.bricks import FBrick
 from finbricklab.core.context import ScenarioContext
@@ -24,7 +21,7 @@ from finbricklab.core.journal import (
     stamp_entry_metadata,
     stamp_posting_metadata,
 )
-from finbricklab.core.results import BrickOutput
+from finbricklab.core.results import BrickOutput, shared_zeros
 
 
 class FlowExpenseOneTime(IFlowStrategy):
@@ -111,7 +108,7 @@ class FlowExpenseOneTime(IFlowStrategy):
         T = len(ctx.t_index)
 
         # V2: Shell behavior - no cash arrays emitted
-        cash_out = np.zeros(T)
+        cash_out = shared_zeros(T)
 
         # Get journal from context (V2)
         if ctx.journal is None:
@@ -119,6 +116,7 @@ class FlowExpenseOneTime(IFlowStrategy):
                 "Journal must be provided in ScenarioContext for V2 postings model"
             )
         journal = ctx.journal
+        fingerprint = ctx.transaction_fingerprint(brick)
 
         # Find cash account node ID (use routing or settlement_default_cash_id)
         cash_node_id = None
@@ -143,29 +141,11 @@ class FlowExpenseOneTime(IFlowStrategy):
         # Find the month when this event occurs
         # Convert the event date to a string format that matches the time index
         event_month_str = event_date.strftime("%Y-%m")
-        event_month_idx = None
-
-        for month_idx in range(T):
-            # Convert the time index to string format for comparison
-            current_month_str = str(ctx.t_index[month_idx])
-
-            # Check if this is the month of the event
-            if current_month_str == event_month_str:
-                event_month_idx = month_idx
-                break
+        event_month_idx = ctx.timeline.month_index.get(event_month_str)
 
         # V2: Create journal entry for one-time expense (BOUNDARY↔INTERNAL: DR expense, CR cash)
         if event_month_idx is not None and net_amount > 0:
-            expense_timestamp = ctx.t_index[event_month_idx]
-            # Convert numpy datetime64 to Python datetime
-            if isinstance(expense_timestamp, np.datetime64):
-                expense_timestamp = pd.Timestamp(expense_timestamp).to_pydatetime()
-            elif hasattr(expense_timestamp, "astype"):
-                expense_timestamp = pd.Timestamp(
-                    expense_timestamp.astype("datetime64[D]")
-                ).to_pydatetime()
-            else:
-                expense_timestamp = datetime.fromisoformat(str(expense_timestamp))
+            expense_timestamp = ctx.timeline.datetimes[event_month_idx]
 
             operation_id = create_operation_id(f"fs:{brick.id}", expense_timestamp)
             entry_id = create_entry_id(operation_id, 1)
@@ -175,6 +155,7 @@ class FlowExpenseOneTime(IFlowStrategy):
                 brick.spec or {},
                 brick.links or {},
                 sequence=0,
+                fingerprint=fingerprint,
             )
 
             # DR expense (boundary), CR cash (internal)
@@ -224,10 +205,10 @@ class FlowExpenseOneTime(IFlowStrategy):
 
         # V2: Shell behavior - return zero arrays (no balances)
         return BrickOutput(
-            cash_in=np.zeros(T),  # Zero - deprecated
+            cash_in=shared_zeros(T),  # Zero - deprecated
             cash_out=cash_out,  # Zero - deprecated
-            assets=np.zeros(T),
-            liabilities=np.zeros(T),
-            interest=np.zeros(T),  # Flow bricks don't generate interest
+            assets=shared_zeros(T),
+            liabilities=shared_zeros(T),
+            interest=shared_zeros(T),  # Flow bricks don't generate interest
             events=[],
         )
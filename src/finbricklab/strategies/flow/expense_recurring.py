@@ -4,8 +4,6 @@ Fixed monthly expense flow strategy.
 
 from __future__ import annotations
 
-import numpy as np
-
 from finbricklab.core.accounts import BOUNDARY_NODE_ID, get_node_id
 from finbricklab.core.bricks import FBrick
 from finbricklab.core.context import ScenarioContext
@@ -21,7 +19,7 @@ from finbricklab.core.journal import (
     stamp_entry_metadata,
     stamp_posting_metadata,
 )
-from finbricklab.core.results import BrickOutput
+from finbricklab.core.results import BrickOutput, shared_zeros
 
 
 class FlowExpenseRecurring(IFlowStrategy):
@@ -77,7 +75,7 @@ class FlowExpenseRecurring(IFlowStrategy):
         """
         T = len(ctx.t_index)
         # V2: Shell behavior - no cash arrays emitted
-        cash_out = np.zeros(T)
+        cash_out = shared_zeros(T)
 
         # Get journal from context (V2)
         if ctx.journal is None:
@@ -85,6 +83,7 @@ class FlowExpenseRecurring(IFlowStrategy):
                 "Journal must be provided in ScenarioContext for V2 postings model"
             )
         journal = ctx.journal
+        fingerprint = ctx.transaction_fingerprint(brick)
 
         # Find cash account node ID (use routing or settlement_default_cash_id)
         cash_node_id = None
@@ -116,21 +115,7 @@ class FlowExpenseRecurring(IFlowStrategy):
         for t in range(T):
             # V2: Create journal entry for expense (BOUNDARY↔INTERNAL: DR expense, CR cash)
             if amount > 0:
-                expense_timestamp = ctx.t_index[t]
-                if isinstance(expense_timestamp, np.datetime64):
-                    import pandas as pd
-
-                    expense_timestamp = pd.Timestamp(expense_timestamp).to_pydatetime()
-                elif hasattr(expense_timestamp, "astype"):
-                    import pandas as pd
-
-                    expense_timestamp = pd.Timestamp(
-                        expense_timestamp.astype("datetime64[D]")
-                    ).to_pydatetime()
-                else:
-                    from datetime import datetime
-
-                    expense_timestamp = datetime.fromisoformat(str(expense_timestamp))
+                expense_timestamp = ctx.timeline.datetimes[t]
 
                 operation_id = create_operation_id(f"fs:{brick.id}", expense_timestamp)
                 entry_id = create_entry_id(operation_id, 1)
@@ -140,6 +125,7 @@ class FlowExpenseRecurring(IFlowStrategy):
                     brick.spec or {},
                     brick.links or {},
                     sequence=t,
+                    fingerprint=fingerprint,
                 )
 
                 # DR expense (boundary), CR cash (internal)
@@ -189,10 +175,10 @@ class FlowExpenseRecurring(IFlowStrategy):
 
         # V2: Shell behavior - return zero arrays (no balances)
         return BrickOutput(
-            cash_in=np.zeros(T),  # Zero - deprecated
+            cash_in=shared_zeros(T),  # Zero - deprecated
             cash_out=cash_out,  # Zero - deprecated
-            assets=np.zeros(T),
-            liabilities=np.zeros(T),
-            interest=np.zeros(T),  # Flow bricks don't generate interest
+            assets=shared_zeros(T),
+            liabilities=shared_zeros(T),
+            interest=shared_zeros(T),  # Flow bricks don't generate interest
             events=events,
         )
@@ -4,10 +4,6 @@ Fixed monthly income flow strategy with escalation.
 
 from __future__ import annotations
 
-from datetime import date
-
-import numpy as np
-
 from finbricklab.core.accounts import BOUNDARY_NODE_ID, get_node_id
 from finbricklab.core.bricks import FBrick
 from finbricklab.core.context import ScenarioContext
@@ -23,7 +19,7 @@ from finbricklab.core.journal import (
     stamp_entry_metadata,
     stamp_posting_metadata,
 )
-from finbricklab.core.results import BrickOutput
+from finbricklab.core.results import BrickOutput, shared_zeros
 
 
 class FlowIncomeRecurring(IFlowStrategy):
@@ -101,7 +97,7 @@ class FlowIncomeRecurring(IFlowStrategy):
         """
         T = len(ctx.t_index)
         # V2: Shell behavior - no cash arrays emitted
-        cash_in = np.zeros(T)
+        cash_in = shared_zeros(T)
 
         # Get journal from context (V2)
         if ctx.journal is None:
@@ -109,6 +105,9 @@ class FlowIncomeRecurring(IFlowStrategy):
                 "Journal must be provided in ScenarioContext for V2 postings model"
             )
         journal = ctx.journal
+        fingerprint = ctx.transaction_fingerprint(brick)
+        # Entries are collected and posted as one batch at the end
+        entries: list[JournalEntry] = []
 
         # Find cash account node ID (use routing or settlement_default_cash_id)
         cash_node_id = None
@@ -140,9 +139,7 @@ class FlowIncomeRecurring(IFlowStrategy):
         )  # For step_every_m
 
         # Determine start date for anniversary calculations
-        start_date = brick.start_date or ctx.t_index[0].astype("datetime64[D]").astype(
-            date
-        )
+        start_date = brick.start_date or ctx.timeline.dates[0]
 
         events = []
 
@@ -151,7 +148,7 @@ class FlowIncomeRecurring(IFlowStrategy):
             None  # Track previous month's computed amount for escalation detection
         )
         for t in range(T):
-            current_date = ctx.t_index[t].astype("datetime64[D]").astype(date)
+            current_date = ctx.timeline.dates[t]
 
             if step_every_m is not None:
                 # Non-annual escalation
@@ -179,21 +176,7 @@ class FlowIncomeRecurring(IFlowStrategy):
 
             # V2: Create journal entry for income (BOUNDARY↔INTERNAL: CR income, DR cash)
             if amount > 0:
-                income_timestamp = ctx.t_index[t]
-                if isinstance(income_timestamp, np.datetime64):
-                    import pandas as pd
-
-                    income_timestamp = pd.Timestamp(income_timestamp).to_pydatetime()
-                elif hasattr(income_timestamp, "astype"):
-                    import pandas as pd
-
-                    income_timestamp = pd.Timestamp(
-                        income_timestamp.astype("datetime64[D]")
-                    ).to_pydatetime()
-                else:
-                    from datetime import datetime
-
-                    income_timestamp = datetime.fromisoformat(str(income_timestamp))
+                income_timestamp = ctx.timeline.datetimes[t]
 
                 operation_id = create_operation_id(f"fs:{brick.id}", income_timestamp)
                 entry_id = create_entry_id(operation_id, 1)
@@ -203,6 +186,7 @@ class FlowIncomeRecurring(IFlowStrategy):
                     brick.spec or {},
                     brick.links or {},
                     sequence=t,
+                    fingerprint=fingerprint,
                 )
 
                 # CR income (boundary), DR cash (internal)
@@ -248,7 +232,7 @@ class FlowIncomeRecurring(IFlowStrategy):
                     type_tag="income",
                 )
 
-                journal.post(income_entry)
+                entries.append(income_entry)
 
             # Add escalation event for the first month of each new amount
             # V2: cash_in is a shell array (zeros); compare against previously computed amount
@@ -264,12 +248,14 @@ class FlowIncomeRecurring(IFlowStrategy):
                     )
             prev_amount = amount
 
+        journal.post_many(entries)
+
         # V2: Shell behavior - return zero arrays (no balances)
         return BrickOutput(
             cash_in=cash_in,  # Zero - deprecated
-            cash_out=np.zeros(T),  # Zero - deprecated
-            assets=np.zeros(T),
-            liabilities=np.zeros(T),
-            interest=np.zeros(T),  # Flow bricks don't generate interest
+            cash_out=shared_zeros(T),  # Zero - deprecated
+            assets=shared_zeros(T),
+            liabilities=shared_zeros(T),
+            interest=shared_zeros(T),  # Flow bricks don't generate interest
             events=events,
         )
@@ -4,7 +4,6 @@ Fixed-term credit schedule strategy with linear amortization.
 
 from __future__ import annotations
 
-from datetime import date
 from decimal import ROUND_HALF_UP, Decimal
 
 import numpy as np
@@ -23,7 +22,7 @@ from finbricklab.core.journal import (
     stamp_entry_metadata,
     stamp_posting_metadata,
 )
-from finbricklab.core.results import BrickOutput
+from finbricklab.core.results import BrickOutput, shared_zeros
 
 from ._loan_utils import resolve_loan_cash_nodes
 
@@ -69,7 +68,7 @@ class ScheduleCreditFixed(IScheduleStrategy):
         if brick.start_date:
             start_date = brick.start_date
         else:
-            start_date = ctx.t_index[0].astype("datetime64[D]").astype(date)
+            start_date = ctx.timeline.dates[0]
 
         # Get months from context if not provided
         if months is None:
@@ -90,6 +89,7 @@ class ScheduleCreditFixed(IScheduleStrategy):
                 "Journal must be provided in ScenarioContext for V2 postings model"
             )
         journal = ctx.journal
+        fingerprint = ctx.transaction_fingerprint(brick)
 
         liability_node_id = get_node_id(brick.id, "l")
         cash_draw_node_id, cash_pay_node_id = resolve_loan_cash_nodes(brick, ctx)
@@ -99,8 +99,8 @@ class ScheduleCreditFixed(IScheduleStrategy):
 
         # Find the start month index
         start_month_idx = None
-        for i, t in enumerate(ctx.t_index):
-            if t.astype("datetime64[D]").astype(date) >= start_date:
+        for i, month_date in enumerate(ctx.timeline.dates):
+            if month_date >= start_date:
                 start_month_idx = i
                 break
 
@@ -108,21 +108,7 @@ class ScheduleCreditFixed(IScheduleStrategy):
             # Record loan disbursement at start month (if we found one)
             if start_month_idx is not None and month_idx == start_month_idx:
                 current_balance = principal
-                draw_timestamp = ctx.t_index[month_idx]
-                if isinstance(draw_timestamp, np.datetime64):
-                    import pandas as pd
-
-                    draw_timestamp = pd.Timestamp(draw_timestamp).to_pydatetime()
-                elif hasattr(draw_timestamp, "astype"):
-                    import pandas as pd
-
-                    draw_timestamp = pd.Timestamp(
-                        draw_timestamp.astype("datetime64[D]")
-                    ).to_pydatetime()
-                else:
-                    from datetime import datetime
-
-                    draw_timestamp = datetime.fromisoformat(str(draw_timestamp))
+                draw_timestamp = ctx.timeline.datetimes[month_idx]
 
                 operation_id = create_operation_id(f"l:{brick.id}", draw_timestamp)
                 entry_id = create_entry_id(operation_id, 1)
@@ -132,6 +118,7 @@ class ScheduleCreditFixed(IScheduleStrategy):
                     brick.spec or {},
                     brick.links or {},
                     sequence=0,
+                    fingerprint=fingerprint,
                 )
                 draw_entry = JournalEntry(
                     id=entry_id,
@@ -177,7 +164,7 @@ class ScheduleCreditFixed(IScheduleStrategy):
                 continue
 
             # Get the date for this month - convert from numpy datetime64 to Python date
-            month_date = ctx.t_index[month_idx].astype("datetime64[D]").astype(date)
+            month_date = ctx.timeline.dates[month_idx]
 
             # Calculate month delta from start for billing logic
             ms = (month_date.year * 12 + month_date.month) - (
@@ -215,21 +202,7 @@ class ScheduleCreditFixed(IScheduleStrategy):
                 # Track interest paid
                 interest_paid[month_idx] = float(interest)
 
-                payment_timestamp = ctx.t_index[month_idx]
-                if isinstance(payment_timestamp, np.datetime64):
-                    import pandas as pd
-
-                    payment_timestamp = pd.Timestamp(payment_timestamp).to_pydatetime()
-                elif hasattr(payment_timestamp, "astype"):
-                    import pandas as pd
-
-                    payment_timestamp = pd.Timestamp(
-                        payment_timestamp.astype("datetime64[D]")
-                    ).to_pydatetime()
-                else:
-                    from datetime import datetime
-
-                    payment_timestamp = datetime.fromisoformat(str(payment_timestamp))
+                payment_timestamp = ctx.timeline.datetimes[month_idx]
 
                 operation_id = create_operation_id(f"l:{brick.id}", payment_timestamp)
 
@@ -242,6 +215,7 @@ class ScheduleCreditFixed(IScheduleStrategy):
                         brick.spec or {},
                         brick.links or {},
                         sequence=month_idx * 100 + sequence,
+                        fingerprint=fingerprint,
                     )
                     principal_entry = JournalEntry(
                         id=entry_id,
@@ -294,6 +268,7 @@ class ScheduleCreditFixed(IScheduleStrategy):
                         brick.spec or {},
                         brick.links or {},
                         sequence=month_idx * 100 + sequence,
+                        fingerprint=fingerprint,
                     )
                     interest_entry = JournalEntry(
                         id=entry_id,
@@ -339,9 +314,9 @@ class ScheduleCreditFixed(IScheduleStrategy):
             debt_balance[month_idx] = float(current_balance)
 
         return BrickOutput(
-            cash_in=np.zeros(months, dtype=float),
-            cash_out=np.zeros(months, dtype=float),
-            assets=np.zeros(months, dtype=float),
+            cash_in=shared_zeros(months),
+            cash_out=shared_zeros(months),
+            assets=shared_zeros(months),
             liabilities=debt_balance,
             interest=-interest_paid,  # Negative for interest expense
             events=[],
@@ -4,7 +4,7 @@ Credit line schedule strategy for revolving credit.
 
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date
 from decimal import ROUND_HALF_UP, Decimal
 from typing import Any
 
@@ -25,7 +25,7 @@ from finbricklab.core.journal import (
     stamp_entry_metadata,
     stamp_posting_metadata,
 )
-from finbricklab.core.results import BrickOutput
+from finbricklab.core.results import BrickOutput, shared_zeros
 
 from ._loan_utils import resolve_loan_cash_nodes
 
@@ -130,7 +130,7 @@ class ScheduleCreditLine(IScheduleStrategy):
         if brick.start_date:
             start_date = brick.start_date
         else:
-            start_date = ctx.t_index[0].astype("datetime64[D]").astype(date)
+            start_date = ctx.timeline.dates[0]
 
         # Optional parameters
         fees = brick.spec.get("fees", {})
@@ -149,6 +149,7 @@ class ScheduleCreditLine(IScheduleStrategy):
                 "Journal must be provided in ScenarioContext for V2 postings model"
             )
         journal = ctx.journal
+        fingerprint = ctx.transaction_fingerprint(brick)
 
         liability_node_id = get_node_id(brick.id, "l")
         cash_draw_node_id, cash_pay_node_id = resolve_loan_cash_nodes(brick, ctx)
@@ -181,7 +182,7 @@ class ScheduleCreditLine(IScheduleStrategy):
 
         for month_idx in range(months):
             # Get the date for this month - convert from numpy datetime64 to Python date
-            month_date = ctx.t_index[month_idx].astype("datetime64[D]").astype(date)
+            month_date = ctx.timeline.dates[month_idx]
 
             # Month delta from start_date (month granularity)
             ms = (month_date.year * 12 + month_date.month) - (
@@ -191,19 +192,7 @@ class ScheduleCreditLine(IScheduleStrategy):
             # Record initial draw at start month (ms == 0)
             if ms == 0 and initial_draw > 0:
                 current_balance = initial_draw
-                draw_timestamp = ctx.t_index[month_idx]
-                if isinstance(draw_timestamp, np.datetime64):
-                    import pandas as pd
-
-                    draw_timestamp = pd.Timestamp(draw_timestamp).to_pydatetime()
-                elif hasattr(draw_timestamp, "astype"):
-                    import pandas as pd
-
-                    draw_timestamp = pd.Timestamp(
-                        draw_timestamp.astype("datetime64[D]")
-                    ).to_pydatetime()
-                else:
-                    draw_timestamp = datetime.fromisoformat(str(draw_timestamp))
+                draw_timestamp = ctx.timeline.datetimes[month_idx]
 
                 operation_id = create_operation_id(f"l:{brick.id}", draw_timestamp)
                 entry_id = create_entry_id(operation_id, 1)
@@ -213,6 +202,7 @@ class ScheduleCreditLine(IScheduleStrategy):
                     brick.spec or {},
                     brick.links or {},
                     sequence=0,
+                    fingerprint=fingerprint,
                 )
                 draw_entry = JournalEntry(
                     id=entry_id,
@@ -254,19 +244,7 @@ class ScheduleCreditLine(IScheduleStrategy):
 
             # Bill monthly starting month after start (ms >= 1)
             if ms >= 1:
-                payment_timestamp = ctx.t_index[month_idx]
-                if isinstance(payment_timestamp, np.datetime64):
-                    import pandas as pd
-
-                    payment_timestamp = pd.Timestamp(payment_timestamp).to_pydatetime()
-                elif hasattr(payment_timestamp, "astype"):
-                    import pandas as pd
-
-                    payment_timestamp = pd.Timestamp(
-                        payment_timestamp.astype("datetime64[D]")
-                    ).to_pydatetime()
-                else:
-                    payment_timestamp = datetime.fromisoformat(str(payment_timestamp))
+                payment_timestamp = ctx.timeline.datetimes[month_idx]
 
                 operation_id = create_operation_id(f"l:{brick.id}", payment_timestamp)
                 sequence = 1
@@ -303,6 +281,7 @@ class ScheduleCreditLine(IScheduleStrategy):
                         brick.spec or {},
                         brick.links or {},
                         sequence=month_idx * 100 + sequence,
+                        fingerprint=fingerprint,
                     )
                     stamp_entry_metadata(
                         interest_entry,
@@ -357,6 +336,7 @@ class ScheduleCreditLine(IScheduleStrategy):
                         brick.spec or {},
                         brick.links or {},
                         sequence=month_idx * 100 + sequence,
+                        fingerprint=fingerprint,
                     )
                     stamp_entry_metadata(
                         fee_entry,
@@ -419,6 +399,7 @@ class ScheduleCreditLine(IScheduleStrategy):
                             brick.spec or {},
                             brick.links or {},
                             sequence=month_idx * 100 + sequence,
+                            fingerprint=fingerprint,
                         )
                         stamp_entry_metadata(
                             payment_entry,
@@ -446,9 +427,9 @@ class ScheduleCreditLine(IScheduleStrategy):
             debt_balance[month_idx] = float(current_balance)
 
         return BrickOutput(
-            cash_in=np.zeros(months, dtype=float),
-            cash_out=np.zeros(months, dtype=float),
-            assets=np.zeros(months, dtype=float),
+            cash_in=shared_zeros(months),
+            cash_out=shared_zeros(months),
+            assets=shared_zeros(months),
             liabilities=debt_balance,
             interest=-interest_paid,  # Negative for interest expense
             events=[],
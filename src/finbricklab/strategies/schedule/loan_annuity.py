@@ -6,7 +6,6 @@ from __future__ import annotations
 
 import warnings
 from dataclasses import asdict, is_dataclass
-from datetime import date
 
 import numpy as np
 
@@ -26,7 +25,7 @@ from finbricklab.core.journal import (
     stamp_posting_metadata,
 )
 from finbricklab.core.links import PrincipalLink
-from finbricklab.core.results import BrickOutput
+from finbricklab.core.results import BrickOutput, shared_zeros
 from finbricklab.core.specs import term_from_amort
 from finbricklab.core.utils import active_mask, resolve_prepayments_to_month_idx
 
@@ -331,8 +330,8 @@ class ScheduleLoanAnnuity(IScheduleStrategy):
         """
         T = len(ctx.t_index)
         # V2: Don't emit cash arrays - use journal entries instead
-        cash_in = np.zeros(T)
-        cash_out = np.zeros(T)
+        cash_in = shared_zeros(T)
+        cash_out = shared_zeros(T)
         debt = np.zeros(T)
         interest_paid = np.zeros(T)
 
@@ -342,6 +341,9 @@ class ScheduleLoanAnnuity(IScheduleStrategy):
                 "Journal must be provided in ScenarioContext for V2 postings model"
             )
         journal = ctx.journal
+        fingerprint = ctx.transaction_fingerprint(brick)
+        # Entries are collected and posted as one batch at the end
+        entries: list[JournalEntry] = []
 
         # Get node IDs
         liability_node_id = get_node_id(brick.id, "l")
@@ -359,9 +361,7 @@ class ScheduleLoanAnnuity(IScheduleStrategy):
         _get_spec_value(brick.spec, "balloon_policy", "payoff")
 
         # Resolve prepayments to month indices
-        mortgage_start = brick.start_date or ctx.t_index[0].astype(
-            "datetime64[D]"
-        ).astype(date)
+        mortgage_start = brick.start_date or ctx.timeline.dates[0]
         prepay_map = resolve_prepayments_to_month_idx(
             ctx.t_index, prepayments, mortgage_start
         )
@@ -374,22 +374,7 @@ class ScheduleLoanAnnuity(IScheduleStrategy):
 
         # Create drawdown entry (if principal > 0)
         if principal > 0:
-            drawdown_timestamp = ctx.t_index[0]
-            # Convert timestamp to datetime
-            if isinstance(drawdown_timestamp, np.datetime64):
-                import pandas as pd
-
-                drawdown_timestamp = pd.Timestamp(drawdown_timestamp).to_pydatetime()
-            elif hasattr(drawdown_timestamp, "astype"):
-                import pandas as pd
-
-                drawdown_timestamp = pd.Timestamp(
-                    drawdown_timestamp.astype("datetime64[D]")
-                ).to_pydatetime()
-            else:
-                from datetime import datetime
-
-                drawdown_timestamp = datetime.fromisoformat(str(drawdown_timestamp))
+            drawdown_timestamp = ctx.timeline.datetimes[0]
 
             operation_id = create_operation_id(f"l:{brick.id}", drawdown_timestamp)
             entry_id = create_entry_id(operation_id, 1)
@@ -399,6 +384,7 @@ class ScheduleLoanAnnuity(IScheduleStrategy):
                 brick.spec or {},
                 brick.links or {},
                 sequence=0,
+                fingerprint=fingerprint,
             )
 
             # DR liability (increase debt), CR cash (cash inflow)
@@ -445,7 +431,7 @@ class ScheduleLoanAnnuity(IScheduleStrategy):
                 type_tag="drawdown",
             )
 
-            journal.post(drawdown_entry)
+            entries.append(drawdown_entry)
 
         # Calculate monthly payment using annuity formula
         r_m = rate_pa / 12.0
@@ -496,22 +482,7 @@ class ScheduleLoanAnnuity(IScheduleStrategy):
                     debt[t] = bal_after_sched
 
                 # V2: Create journal entries for payment
-                payment_timestamp = ctx.t_index[t]
-                # Convert timestamp to datetime
-                if isinstance(payment_timestamp, np.datetime64):
-                    import pandas as pd
-
-                    payment_timestamp = pd.Timestamp(payment_timestamp).to_pydatetime()
-                elif hasattr(payment_timestamp, "astype"):
-                    import pandas as pd
-
-                    payment_timestamp = pd.Timestamp(
-                        payment_timestamp.astype("datetime64[D]")
-                    ).to_pydatetime()
-                else:
-                    from datetime import datetime
-
-                    payment_timestamp = datetime.fromisoformat(str(payment_timestamp))
+                payment_timestamp = ctx.timeline.datetimes[t]
 
                 sequence = 1
 
@@ -529,6 +500,7 @@ class ScheduleLoanAnnuity(IScheduleStrategy):
                         brick.spec or {},
                         brick.links or {},
                         sequence=t * 100 + sequence,  # Unique per entry in same month
+                        fingerprint=fingerprint,
                     )
 
                     principal_entry = JournalEntry(
@@ -572,7 +544,7 @@ class ScheduleLoanAnnuity(IScheduleStrategy):
                         type_tag="principal",
                     )
 
-                    journal.post(principal_entry)
+                    entries.append(principal_entry)
                     sequence += 1
 
                 # Interest payment (BOUNDARY↔INTERNAL: DR expense, CR cash)
@@ -588,6 +560,7 @@ class ScheduleLoanAnnuity(IScheduleStrategy):
                         brick.spec or {},
                         brick.links or {},
                         sequence=t * 100 + sequence,  # Unique per entry in same month
+                        fingerprint=fingerprint,
                     )
 
                     interest_entry = JournalEntry(
@@ -632,7 +605,7 @@ class ScheduleLoanAnnuity(IScheduleStrategy):
                         type_tag="interest",
                     )
 
-                    journal.post(interest_entry)
+                    entries.append(interest_entry)
 
                 # Fee payment (if any) - BOUNDARY↔INTERNAL: DR expense, CR cash
                 if prepay_amt > 0 and prepay_fee > 0:
@@ -648,6 +621,7 @@ class ScheduleLoanAnnuity(IScheduleStrategy):
                         brick.links or {},
                         sequence=t * 100
                         + (sequence + 1),  # Unique per entry in same month
+                        fingerprint=fingerprint,
                     )
 
                     fee_entry = JournalEntry(
@@ -692,7 +666,7 @@ class ScheduleLoanAnnuity(IScheduleStrategy):
                         type_tag="fee",
                     )
 
-                    journal.post(fee_entry)
+                    entries.append(fee_entry)
             else:
                 debt[t] = 0.0
 
@@ -719,22 +693,7 @@ class ScheduleLoanAnnuity(IScheduleStrategy):
 
             if policy == "payoff":
                 # V2: Create journal entry for balloon payment (INTERNAL↔INTERNAL: DR liability, CR cash)
-                balloon_timestamp = ctx.t_index[t_stop]
-                # Convert timestamp to datetime
-                if isinstance(balloon_timestamp, np.datetime64):
-                    import pandas as pd
-
-                    balloon_timestamp = pd.Timestamp(balloon_timestamp).to_pydatetime()
-                elif hasattr(balloon_timestamp, "astype"):
-                    import pandas as pd
-
-                    balloon_timestamp = pd.Timestamp(
-                        balloon_timestamp.astype("datetime64[D]")
-                    ).to_pydatetime()
-                else:
-                    from datetime import datetime
-
-                    balloon_timestamp = datetime.fromisoformat(str(balloon_timestamp))
+                balloon_timestamp = ctx.timeline.datetimes[t_stop]
 
                 operation_id = create_operation_id(f"l:{brick.id}", balloon_timestamp)
                 # Use distinct sequence for balloon payment (90) to avoid conflicts with regular payments
@@ -748,6 +707,7 @@ class ScheduleLoanAnnuity(IScheduleStrategy):
                     brick.links or {},
                     sequence=t_stop * 100
                     + balloon_sequence,  # Unique per balloon entry
+                    fingerprint=fingerprint,
                 )
 
                 balloon_entry = JournalEntry(
@@ -793,7 +753,7 @@ class ScheduleLoanAnnuity(IScheduleStrategy):
 
                 # Guard: Skip posting if entry with same ID already exists (e.g., re-simulation)
                 if not journal.has_id(balloon_entry.id):
-                    journal.post(balloon_entry)
+                    entries.append(balloon_entry)
 
                 debt[t_stop] = 0.0
                 # Set all future debt to 0 (mortgage is paid off)
@@ -851,10 +811,12 @@ class ScheduleLoanAnnuity(IScheduleStrategy):
                     )
                 )
 
+        journal.post_many(entries)
+
         return BrickOutput(
             cash_in=cash_in,
             cash_out=cash_out,
-            assets=np.zeros(T),
+            assets=shared_zeros(T),
             liabilities=debt,
             interest=-interest_paid,  # Negative for interest expense
             events=events,
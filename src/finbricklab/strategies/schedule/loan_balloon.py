@@ -4,11 +4,10 @@ Balloon loan schedule strategy for balloon payment loans.
 
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date
 from decimal import ROUND_HALF_UP, Decimal
 
 import numpy as np
-import pandas as pd
 
 from finbricklab.core.accounts import BOUNDARY_NODE_ID, get_node_id
 from finbricklab.core.bricks import LBrick
@@ -25,7 +24,7 @@ from finbricklab.core.journal import (
     stamp_entry_metadata,
     stamp_posting_metadata,
 )
-from finbricklab.core.results import BrickOutput
+from finbricklab.core.results import BrickOutput, shared_zeros
 
 from ._loan_utils import resolve_loan_cash_nodes
 
@@ -89,7 +88,7 @@ class ScheduleLoanBalloon(IScheduleStrategy):
         if brick.start_date:
             start_date = brick.start_date
         else:
-            start_date = ctx.t_index[0].astype("datetime64[D]").astype(date)
+            start_date = ctx.timeline.dates[0]
 
         # Get months from context if not provided
         if months is None:
@@ -98,8 +97,8 @@ class ScheduleLoanBalloon(IScheduleStrategy):
         T = len(ctx.t_index)
 
         # V2: Don't emit cash arrays - use journal entries instead
-        cash_in = np.zeros(T, dtype=float)
-        cash_out = np.zeros(T, dtype=float)
+        cash_in = shared_zeros(T)
+        cash_out = shared_zeros(T)
         debt_balance = np.zeros(T, dtype=float)
         interest_paid = np.zeros(T, dtype=float)
 
@@ -109,6 +108,7 @@ class ScheduleLoanBalloon(IScheduleStrategy):
                 "Journal must be provided in ScenarioContext for V2 postings model"
             )
         journal = ctx.journal
+        fingerprint = ctx.transaction_fingerprint(brick)
 
         # Get node IDs
         liability_node_id = get_node_id(brick.id, "l")
@@ -125,8 +125,8 @@ class ScheduleLoanBalloon(IScheduleStrategy):
 
         # Find start month index
         start_month_idx = None
-        for i, t in enumerate(ctx.t_index):
-            if t.astype("datetime64[D]").astype(date) >= start_date:
+        for i, month_date in enumerate(ctx.timeline.dates):
+            if month_date >= start_date:
                 start_month_idx = i
                 break
 
@@ -135,7 +135,7 @@ class ScheduleLoanBalloon(IScheduleStrategy):
             return BrickOutput(
                 cash_in=cash_in,
                 cash_out=cash_out,
-                assets=np.zeros(T, dtype=float),
+                assets=shared_zeros(T),
                 liabilities=debt_balance,
                 interest=interest_paid,
                 events=events,
@@ -148,16 +148,7 @@ class ScheduleLoanBalloon(IScheduleStrategy):
             debt_balance[start_month_idx] = float(principal)
 
             # Create disbursement entry
-            drawdown_timestamp = ctx.t_index[start_month_idx]
-            # Convert numpy datetime64 to Python datetime
-            if isinstance(drawdown_timestamp, np.datetime64):
-                drawdown_timestamp = pd.Timestamp(drawdown_timestamp).to_pydatetime()
-            elif hasattr(drawdown_timestamp, "astype"):
-                drawdown_timestamp = pd.Timestamp(
-                    drawdown_timestamp.astype("datetime64[D]")
-                ).to_pydatetime()
-            else:
-                drawdown_timestamp = datetime.fromisoformat(str(drawdown_timestamp))
+            drawdown_timestamp = ctx.timeline.datetimes[start_month_idx]
 
             operation_id = create_operation_id(f"l:{brick.id}", drawdown_timestamp)
             entry_id = create_entry_id(operation_id, 1)
@@ -167,6 +158,7 @@ class ScheduleLoanBalloon(IScheduleStrategy):
                 brick.spec or {},
                 brick.links or {},
                 sequence=0,
+                fingerprint=fingerprint,
             )
 
             # DR cash (increase cash), CR liability (increase debt)
@@ -239,7 +231,7 @@ class ScheduleLoanBalloon(IScheduleStrategy):
 
         for month_idx in range(T):
             # Get the date for this month
-            month_date = ctx.t_index[month_idx].astype("datetime64[D]").astype(date)
+            month_date = ctx.timeline.dates[month_idx]
 
             # Check if this is a payment month
             is_payment_month = self._is_payment_month(month_date, start_date)
@@ -253,16 +245,7 @@ class ScheduleLoanBalloon(IScheduleStrategy):
                 months_since_start = month_idx - start_month_idx
                 is_balloon_month = months_since_start == balloon_after_months
 
-                # Convert timestamp to datetime
-                payment_timestamp = ctx.t_index[month_idx]
-                if isinstance(payment_timestamp, np.datetime64):
-                    payment_timestamp = pd.Timestamp(payment_timestamp).to_pydatetime()
-                elif hasattr(payment_timestamp, "astype"):
-                    payment_timestamp = pd.Timestamp(
-                        payment_timestamp.astype("datetime64[D]")
-                    ).to_pydatetime()
-                else:
-                    payment_timestamp = datetime.fromisoformat(str(payment_timestamp))
+                payment_timestamp = ctx.timeline.datetimes[month_idx]
 
                 if is_balloon_month:
                     # Balloon payment: both principal and interest entries
@@ -291,6 +274,7 @@ class ScheduleLoanBalloon(IScheduleStrategy):
                             brick.links or {},
                             sequence=month_idx * 100
                             + sequence,  # Unique per entry in same month
+                            fingerprint=fingerprint,
                         )
 
                         principal_entry = JournalEntry(
@@ -353,6 +337,7 @@ class ScheduleLoanBalloon(IScheduleStrategy):
                             brick.links or {},
                             sequence=month_idx * 100
                             + sequence,  # Unique per entry in same month
+                            fingerprint=fingerprint,
                         )
 
                         interest_entry = JournalEntry(
@@ -444,6 +429,7 @@ class ScheduleLoanBalloon(IScheduleStrategy):
                             brick.links or {},
                             sequence=month_idx * 100
                             + sequence,  # Unique per entry in same month
+                            fingerprint=fingerprint,
                         )
 
                         principal_entry = JournalEntry(
@@ -506,6 +492,7 @@ class ScheduleLoanBalloon(IScheduleStrategy):
                             brick.links or {},
                             sequence=month_idx * 100
                             + sequence,  # Unique per entry in same month
+                            fingerprint=fingerprint,
                         )
 
                         interest_entry = JournalEntry(
@@ -594,6 +581,7 @@ class ScheduleLoanBalloon(IScheduleStrategy):
                             brick.links or {},
                             sequence=month_idx * 100
                             + 1,  # Unique per entry in same month
+                            fingerprint=fingerprint,
                         )
 
                         interest_entry = JournalEntry(
@@ -663,7 +651,7 @@ class ScheduleLoanBalloon(IScheduleStrategy):
         return BrickOutput(
             cash_in=cash_in,  # Zero - deprecated
             cash_out=cash_out,  # Zero - deprecated
-            assets=np.zeros(T, dtype=float),
+            assets=shared_zeros(T),
             liabilities=debt_balance,
             interest=-interest_paid,  # Negative for interest expense
             events=events,
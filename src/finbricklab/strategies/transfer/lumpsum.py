@@ -4,11 +4,9 @@ Lump sum transfer strategy.
 
 from __future__ import annotations
 
-from datetime import datetime
 from decimal import Decimal
 
 import numpy as np
-import pandas as pd
 
 from finbricklab.core.accounts import (
     FX_CLEAR_NODE_ID,
@@ -32,7 +30,7 @@ from finbricklab.core.journal import (
     stamp_entry_metadata,
     stamp_posting_metadata,
 )
-from finbricklab.core.results import BrickOutput
+from finbricklab.core.results import BrickOutput, shared_zeros
 
 from ._validation import validate_fee_account, validate_fx_spec
 
@@ -139,8 +137,8 @@ class TransferLumpSum(ITransferStrategy):
         T = len(ctx.t_index)
 
         # V2: Don't emit cash arrays - use journal entries instead
-        cash_in = np.zeros(T, dtype=float)
-        cash_out = np.zeros(T, dtype=float)
+        cash_in = shared_zeros(T)
+        cash_out = shared_zeros(T)
 
         # Get journal from context (V2)
         if ctx.journal is None:
@@ -148,6 +146,7 @@ class TransferLumpSum(ITransferStrategy):
                 "Journal must be provided in ScenarioContext for V2 postings model"
             )
         journal = ctx.journal
+        fingerprint = ctx.transaction_fingerprint(brick)
 
         # Get node IDs from links (both must be INTERNAL assets)
         from_account_id = brick.links["from"]
@@ -189,24 +188,14 @@ class TransferLumpSum(ITransferStrategy):
             return BrickOutput(
                 cash_in=cash_in,
                 cash_out=cash_out,
-                assets=np.zeros(T),
-                liabilities=np.zeros(T),
-                interest=np.zeros(T),
+                assets=shared_zeros(T),
+                liabilities=shared_zeros(T),
+                interest=shared_zeros(T),
                 events=[],
             )
 
         # Use the canonical timeline timestamp for all postings (transfer, fees, FX)
-        transfer_timestamp = ctx.t_index[month_idx]
-
-        # Convert timestamp to datetime
-        if isinstance(transfer_timestamp, np.datetime64):
-            transfer_timestamp = pd.Timestamp(transfer_timestamp).to_pydatetime()
-        elif hasattr(transfer_timestamp, "astype"):
-            transfer_timestamp = pd.Timestamp(
-                transfer_timestamp.astype("datetime64[D]")
-            ).to_pydatetime()
-        else:
-            transfer_timestamp = datetime.fromisoformat(str(transfer_timestamp))
+        transfer_timestamp = ctx.timeline.datetimes[month_idx]
 
         events = []
 
@@ -225,6 +214,7 @@ class TransferLumpSum(ITransferStrategy):
                 brick.spec or {},
                 brick.links or {},
                 sequence=0,
+                fingerprint=fingerprint,
             )
 
             transfer_entry = JournalEntry(
@@ -312,6 +302,7 @@ class TransferLumpSum(ITransferStrategy):
                 {"fee": float(fee_amount)},
                 brick.links or {},
                 sequence=0,
+                fingerprint=fingerprint,
             )
 
             fee_entry = JournalEntry(
@@ -430,6 +421,7 @@ class TransferLumpSum(ITransferStrategy):
                 {**(brick.spec or {}), "fx_leg": "source"},
                 brick.links or {},
                 sequence=1,
+                fingerprint=fingerprint,
             )
 
             fx_entry_1 = JournalEntry(
@@ -485,6 +477,7 @@ class TransferLumpSum(ITransferStrategy):
                 {**(brick.spec or {}), "fx_leg": "dest"},
                 brick.links or {},
                 sequence=2,
+                fingerprint=fingerprint,
             )
 
             fx_entry_2 = JournalEntry(
@@ -540,6 +533,7 @@ class TransferLumpSum(ITransferStrategy):
                     {**(brick.spec or {}), "fx_leg": "pnl"},
                     brick.links or {},
                     sequence=3,
+                    fingerprint=fingerprint,
                 )
 
                 # P&L: DR/CR between b:fx_clear and P&L:FX
@@ -625,8 +619,8 @@ class TransferLumpSum(ITransferStrategy):
         return BrickOutput(
             cash_in=cash_in,
             cash_out=cash_out,
-            assets=np.zeros(T),
-            liabilities=np.zeros(T),
-            interest=np.zeros(T),  # Transfer bricks don't generate interest
+            assets=shared_zeros(T),
+            liabilities=shared_zeros(T),
+            interest=shared_zeros(T),  # Transfer bricks don't generate interest
             events=events,
         )
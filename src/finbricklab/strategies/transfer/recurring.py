@@ -30,7 +30,7 @@ from finbricklab.core.journal import (
     stamp_entry_metadata,
     stamp_posting_metadata,
 )
-from finbricklab.core.results import BrickOutput
+from finbricklab.core.results import BrickOutput, shared_zeros
 
 from ._validation import validate_fee_account, validate_fx_spec
 
@@ -158,8 +158,8 @@ class TransferRecurring(ITransferStrategy):
         T = len(ctx.t_index)
 
         # V2: Don't emit cash arrays - use journal entries instead
-        cash_in = np.zeros(T, dtype=float)
-        cash_out = np.zeros(T, dtype=float)
+        cash_in = shared_zeros(T)
+        cash_out = shared_zeros(T)
 
         # Get journal from context (V2)
         if ctx.journal is None:
@@ -167,6 +167,9 @@ class TransferRecurring(ITransferStrategy):
                 "Journal must be provided in ScenarioContext for V2 postings model"
             )
         journal = ctx.journal
+        fingerprint = ctx.transaction_fingerprint(brick)
+        # Entries are collected and posted as one batch at the end
+        entries: list[JournalEntry] = []
 
         # Get node IDs from links (both must be INTERNAL assets)
         from_account_id = brick.links["from"]
@@ -222,23 +225,7 @@ class TransferRecurring(ITransferStrategy):
         while current_month_idx < T and ctx.t_index[current_month_idx] <= end_m:
             # Use the canonical timeline month for this transfer
             month_idx = current_month_idx
-            transfer_timestamp = ctx.t_index[month_idx]
-
-            # Convert timestamp to datetime
-            if isinstance(transfer_timestamp, np.datetime64):
-                import pandas as pd
-
-                transfer_timestamp = pd.Timestamp(transfer_timestamp).to_pydatetime()
-            elif hasattr(transfer_timestamp, "astype"):
-                import pandas as pd
-
-                transfer_timestamp = pd.Timestamp(
-                    transfer_timestamp.astype("datetime64[D]")
-                ).to_pydatetime()
-            else:
-                from datetime import datetime
-
-                transfer_timestamp = datetime.fromisoformat(str(transfer_timestamp))
+            transfer_timestamp = ctx.timeline.datetimes[month_idx]
 
             # Check if FX is specified
             has_fx = "fx" in brick.spec
@@ -255,6 +242,7 @@ class TransferRecurring(ITransferStrategy):
                     brick.spec or {},
                     brick.links or {},
                     sequence=sequence,
+                    fingerprint=fingerprint,
                 )
 
                 transfer_entry = JournalEntry(
@@ -299,7 +287,7 @@ class TransferRecurring(ITransferStrategy):
                     type_tag="transfer",
                 )
 
-                journal.post(transfer_entry)
+                entries.append(transfer_entry)
 
             # Create transfer event
             event = Event(
@@ -336,6 +324,7 @@ class TransferRecurring(ITransferStrategy):
                     {"fee": float(fee_amount)},
                     brick.links or {},
                     sequence=sequence,
+                    fingerprint=fingerprint,
                 )
 
                 fee_entry = JournalEntry(
@@ -379,7 +368,7 @@ class TransferRecurring(ITransferStrategy):
                     type_tag="fee",
                 )
 
-                journal.post(fee_entry)
+                entries.append(fee_entry)
 
                 # Create fee event
                 fee_event = Event(
@@ -472,6 +461,7 @@ class TransferRecurring(ITransferStrategy):
                     {**(brick.spec or {}), "fx_leg": "source"},
                     brick.links or {},
                     sequence=sequence * 100 + 1,
+                    fingerprint=fingerprint,
                 )
 
                 fx_entry_1 = JournalEntry(
@@ -518,7 +508,7 @@ class TransferRecurring(ITransferStrategy):
 
                 # Guard: Skip posting if entry with same ID already exists
                 if not journal.has_id(fx_entry_1.id):
-                    journal.post(fx_entry_1)
+                    entries.append(fx_entry_1)
 
                 # Entry 2: Destination leg (destination currency)
                 # DR a:<to> (destination currency), CR b:fx_clear (destination currency)
@@ -529,6 +519,7 @@ class TransferRecurring(ITransferStrategy):
                     {**(brick.spec or {}), "fx_leg": "dest"},
                     brick.links or {},
                     sequence=sequence * 100 + 2,
+                    fingerprint=fingerprint,
                 )
 
                 fx_entry_2 = JournalEntry(
@@ -573,7 +564,7 @@ class TransferRecurring(ITransferStrategy):
 
                 # Guard: Skip posting if entry with same ID already exists
                 if not journal.has_id(fx_entry_2.id):
-                    journal.post(fx_entry_2)
+                    entries.append(fx_entry_2)
 
                 # Entry 3: P&L entry (if non-zero)
                 if abs(pnl_amount) > Decimal("1e-6"):  # Only create if significant
@@ -584,6 +575,7 @@ class TransferRecurring(ITransferStrategy):
                         {**(brick.spec or {}), "fx_leg": "pnl"},
                         brick.links or {},
                         sequence=sequence * 100 + 3,
+                        fingerprint=fingerprint,
                     )
 
                     # P&L: DR/CR between b:fx_clear and P&L:FX with correct debit/credit alignment
@@ -646,7 +638,7 @@ class TransferRecurring(ITransferStrategy):
 
                     # Guard: Skip posting if entry with same ID already exists
                     if not journal.has_id(fx_entry_3.id):
-                        journal.post(fx_entry_3)
+                        entries.append(fx_entry_3)
 
                 # Create FX event
                 fx_event = Event(
@@ -668,11 +660,13 @@ class TransferRecurring(ITransferStrategy):
             current_month_idx += interval_months
             sequence += 1
 
+        journal.post_many(entries)
+
         return BrickOutput(
             cash_in=cash_in,
             cash_out=cash_out,
-            assets=np.zeros(T),
-            liabilities=np.zeros(T),
-            interest=np.zeros(T),  # Transfer bricks don't generate interest
+            assets=shared_zeros(T),
+            liabilities=shared_zeros(T),
+            interest=shared_zeros(T),  # Transfer bricks don't generate interest
             events=events,
         )
@@ -4,11 +4,10 @@ Scheduled transfer strategy.
 
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal
 
 import numpy as np
-import pandas as pd
 
 from finbricklab.core.accounts import (
     FX_CLEAR_NODE_ID,
@@ -32,7 +31,7 @@ from finbricklab.core.journal import (
     stamp_entry_metadata,
     stamp_posting_metadata,
 )
-from finbricklab.core.results import BrickOutput
+from finbricklab.core.results import BrickOutput, shared_zeros
 
 from ._validation import validate_fee_account, validate_fx_spec
 
@@ -173,8 +172,8 @@ class TransferScheduled(ITransferStrategy):
         T = len(ctx.t_index)
 
         # V2: Don't emit cash arrays - use journal entries instead
-        cash_in = np.zeros(T, dtype=float)
-        cash_out = np.zeros(T, dtype=float)
+        cash_in = shared_zeros(T)
+        cash_out = shared_zeros(T)
 
         # Get journal from context (V2)
         if ctx.journal is None:
@@ -182,6 +181,7 @@ class TransferScheduled(ITransferStrategy):
                 "Journal must be provided in ScenarioContext for V2 postings model"
             )
         journal = ctx.journal
+        fingerprint = ctx.transaction_fingerprint(brick)
 
         # Get node IDs from links (both must be INTERNAL assets)
         from_account_id = brick.links["from"]
@@ -223,17 +223,7 @@ class TransferScheduled(ITransferStrategy):
                 continue
 
             # Use the canonical timeline timestamp for all postings (transfer, fees, FX)
-            transfer_timestamp = ctx.t_index[month_idx]
-
-            # Convert timestamp to datetime
-            if isinstance(transfer_timestamp, np.datetime64):
-                transfer_timestamp = pd.Timestamp(transfer_timestamp).to_pydatetime()
-            elif hasattr(transfer_timestamp, "astype"):
-                transfer_timestamp = pd.Timestamp(
-                    transfer_timestamp.astype("datetime64[D]")
-                ).to_pydatetime()
-            else:
-                transfer_timestamp = datetime.fromisoformat(str(transfer_timestamp))
+            transfer_timestamp = ctx.timeline.datetimes[month_idx]
 
             # Check if FX is specified
             has_fx = "fx" in brick.spec
@@ -255,6 +245,7 @@ class TransferScheduled(ITransferStrategy):
                     {"schedule_entry": entry},
                     brick.links or {},
                     sequence=transfer_sequence,
+                    fingerprint=fingerprint,
                 )
 
                 transfer_entry = JournalEntry(
@@ -335,6 +326,7 @@ class TransferScheduled(ITransferStrategy):
                     {"fee": float(fee_amount), "schedule_entry": entry},
                     brick.links or {},
                     sequence=fee_sequence,
+                    fingerprint=fingerprint,
                 )
 
                 fee_entry = JournalEntry(
@@ -474,6 +466,7 @@ class TransferScheduled(ITransferStrategy):
                     {**(brick.spec or {}), "fx_leg": "source", "schedule_entry": entry},
                     brick.links or {},
                     sequence=fx_source_sequence,
+                    fingerprint=fingerprint,
                 )
 
                 fx_entry_1 = JournalEntry(
@@ -531,6 +524,7 @@ class TransferScheduled(ITransferStrategy):
                     {**(brick.spec or {}), "fx_leg": "dest", "schedule_entry": entry},
                     brick.links or {},
                     sequence=fx_dest_sequence,
+                    fingerprint=fingerprint,
                 )
 
                 fx_entry_2 = JournalEntry(
@@ -590,6 +584,7 @@ class TransferScheduled(ITransferStrategy):
                         },
                         brick.links or {},
                         sequence=fx_pnl_sequence,
+                        fingerprint=fingerprint,
                     )
 
                     # P&L: ensure correct debit/credit orientation between clearing and P&L account
@@ -675,8 +670,8 @@ class TransferScheduled(ITransferStrategy):
         return BrickOutput(
             cash_in=cash_in,
             cash_out=cash_out,
-            assets=np.zeros(T),
-            liabilities=np.zeros(T),
-            interest=np.zeros(T),  # Transfer bricks don't generate interest
+            assets=shared_zeros(T),
+            liabilities=shared_zeros(T),
+            interest=shared_zeros(T),  # Transfer bricks don't generate interest
             events=events,
         )
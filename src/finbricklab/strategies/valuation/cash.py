@@ -8,12 +8,11 @@ import logging
 import warnings
 
 import numpy as np
-import pandas as pd
 
 from finbricklab.core.accounts import BOUNDARY_NODE_ID, get_node_id
 from finbricklab.core.bricks import ABrick
 from finbricklab.core.context import ScenarioContext
-from finbricklab.core.currency import create_amount
+from finbricklab.core.currency import Amount
 from finbricklab.core.errors import ConfigError
 from finbricklab.core.interfaces import IValuationStrategy
 from finbricklab.core.journal import (
@@ -25,7 +24,55 @@ from finbricklab.core.journal import (
     stamp_entry_metadata,
     stamp_posting_metadata,
 )
-from finbricklab.core.results import BrickOutput
+from finbricklab.core.results import BrickOutput, shared_zeros
+
+
+def _balance_recurrence(
+    opening: float,
+    inflows: np.ndarray,
+    outflows: np.ndarray,
+    post_flows: np.ndarray,
+    r_m: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Run the monthly cash balance recurrence over one active segment.
+
+    Interest accrues on the previous balance plus this month's flows, then
+    post-interest flows are added::
+
+        pre[t] = bal[t-1] + (inflows[t] - outflows[t])
+        interest[t] = pre[t] * r_m
+        bal[t] = pre[t] * (1 + r_m) + post_flows[t]
+
+    The scan runs over plain Python floats in the same operation order as the
+    per-month update it replaces, so balances and interest (and the origin
+    IDs hashed from them) are bit-for-bit stable.
+
+    Args:
+        opening: Balance before the first month of the segment
+        inflows: Monthly inflows that earn interest in their month
+        outflows: Monthly outflows
+        post_flows: Monthly net flows applied after interest
+        r_m: Monthly interest rate
+
+    Returns:
+        Tuple of (balance, interest) arrays for the segment
+    """
+    growth = 1 + r_m
+    flows = (inflows - outflows).tolist()
+    post = post_flows.tolist()
+    bal = [0.0] * len(flows)
+    interest = [0.0] * len(flows)
+
+    # First month adds inflows then outflows to the opening balance
+    b = opening + float(inflows[0]) - float(outflows[0])
+    for t in range(len(flows)):
+        if t:
+            b += flows[t]
+        interest[t] = b * r_m
+        b = b * growth + post[t]
+        bal[t] = b
+    return np.array(bal), np.array(interest)
 
 
 class ValuationCash(IValuationStrategy):
@@ -63,9 +110,9 @@ class ValuationCash(IValuationStrategy):
         ```
 
     **Note:**
-        Supports scenarios with one or multiple cash accounts. The Scenario engine must
-        populate `spec.external_in` and `spec.external_out` per cash brick; they are not
-        derived here.
+        Supports scenarios with one or multiple cash accounts. The Scenario engine
+        routes `external_in` and `external_out` per cash brick into `ctx.run_state`
+        (taking precedence over the spec keys); they are not derived here.
     """
 
     def prepare(self, brick: ABrick, ctx: ScenarioContext) -> None:
@@ -147,8 +194,8 @@ class ValuationCash(IValuationStrategy):
         T = len(ctx.t_index)
 
         # V2: Don't emit cash arrays - use journal entries instead
-        cash_in = np.zeros(T)
-        cash_out = np.zeros(T)
+        cash_in = shared_zeros(T)
+        cash_out = shared_zeros(T)
 
         # Get journal from context (V2)
         if ctx.journal is None:
@@ -156,23 +203,28 @@ class ValuationCash(IValuationStrategy):
                 "Journal must be provided in ScenarioContext for V2 postings model"
             )
         journal = ctx.journal
+        fingerprint = ctx.transaction_fingerprint(brick)
 
         # Get node ID for cash account
         cash_node_id = get_node_id(brick.id, "a")
 
         bal = np.zeros(T)
         r_m = brick.spec["interest_pa"] / 12.0  # Monthly interest rate
-        # Don't copy the arrays - use them directly to allow runtime modifications
-        external_in = brick.spec["external_in"]
-        external_out = brick.spec["external_out"]
+        # Flows routed by the scenario for this run take precedence over the spec
+        routed = ctx.run_state.cash_flows.get(brick.id, {})
+        external_in = routed.get("external_in", brick.spec["external_in"])
+        external_out = routed.get("external_out", brick.spec["external_out"])
 
         # Support for post-interest adjustments (for maturity transfers)
         # Coerce and validate arrays
         post_interest_in = np.asarray(
-            brick.spec.get("post_interest_in", np.zeros(T)), dtype=float
+            routed.get(
+                "post_interest_in", brick.spec.get("post_interest_in", shared_zeros(T))
+            ),
+            dtype=float,
         )
         post_interest_out = np.asarray(
-            brick.spec.get("post_interest_out", np.zeros(T)), dtype=float
+            brick.spec.get("post_interest_out", shared_zeros(T)), dtype=float
         )
 
         # Validate length matches timeline
@@ -199,154 +251,129 @@ class ValuationCash(IValuationStrategy):
                 cash_in=cash_in,
                 cash_out=cash_out,
                 assets=bal,
-                liabilities=np.zeros(T),
+                liabilities=shared_zeros(T),
                 interest=interest_earned,
                 events=[],
             )
 
-        first_active_idx = int(active_indices[0])
-
-        def _normalize_timestamp(ts):
-            if isinstance(ts, pd.Timestamp):
-                return ts.to_pydatetime()
-            if isinstance(ts, pd.Period):
-                return ts.to_timestamp().to_pydatetime()
-            if isinstance(ts, np.datetime64):
-                return pd.Timestamp(ts).to_pydatetime()
-            if hasattr(ts, "astype"):
-                try:
-                    return pd.Timestamp(ts.astype("datetime64[D]")).to_pydatetime()
-                except Exception:
-                    pass
-            return pd.Timestamp(ts).to_pydatetime()
-
-        def _post_interest_entry(month_idx: int) -> None:
-            interest_value = interest_earned[month_idx]
-            if interest_value == 0:
-                return
-
-            interest_timestamp = _normalize_timestamp(ctx.t_index[month_idx])
-            parent_id = f"a:{brick.id}"
-            operation_id = create_operation_id(parent_id, interest_timestamp)
-            entry_id = create_entry_id(operation_id, 1)
-            origin_id = generate_transaction_id(
-                brick.id,
-                interest_timestamp,
-                {"interest": interest_value},
-                brick.links or {},
-                sequence=month_idx,
+        # Balances and interest per contiguous active segment; later segments
+        # restart from 0 (months outside the window stay at 0)
+        breaks = np.flatnonzero(np.diff(active_indices) > 1) + 1
+        opening = brick.spec["initial_balance"]
+        for segment in np.split(active_indices, breaks):
+            lo, hi = int(segment[0]), int(segment[-1]) + 1
+            bal[lo:hi], interest_earned[lo:hi] = _balance_recurrence(
+                opening,
+                external_in[lo:hi],
+                external_out[lo:hi],
+                post_interest_in[lo:hi] - post_interest_out[lo:hi],
+                r_m,
             )
+            opening = 0.0
+
+        # Interest entries for all months with non-zero interest, built in one pass
+        months = np.flatnonzero(interest_earned)
+        if months.size:
+            datetimes = ctx.timeline.datetimes
+            timestamps = [datetimes[t] for t in months.tolist()]
+            values = interest_earned[months]
+            debits = Amount.from_floats(values, ctx.currency)
+            credits = Amount.from_floats(-values, ctx.currency)
+            parent_id = f"a:{brick.id}"
+            links = brick.links or {}
+            interest_entries: list[JournalEntry] = []
+
+            for i, t in enumerate(months.tolist()):
+                interest_value = values[i]
+                interest_timestamp = timestamps[i]
+                operation_id = create_operation_id(parent_id, interest_timestamp)
+                entry_id = create_entry_id(operation_id, 1)
+                if journal.has_id(entry_id):
+                    continue
+                origin_id = generate_transaction_id(
+                    brick.id,
+                    interest_timestamp,
+                    {"interest": interest_value},
+                    links,
+                    sequence=t,
+                    fingerprint=fingerprint,
+                )
 
-            interest_entry = JournalEntry(
-                id=entry_id,
-                timestamp=interest_timestamp,
-                postings=[
-                    Posting(
-                        account_id=cash_node_id,
-                        amount=create_amount(interest_value, ctx.currency),
-                        metadata={},
-                    ),
-                    Posting(
-                        account_id=BOUNDARY_NODE_ID,
-                        amount=create_amount(-interest_value, ctx.currency),
-                        metadata={},
-                    ),
-                ],
-                metadata={},
-            )
+                interest_entry = JournalEntry(
+                    id=entry_id,
+                    timestamp=interest_timestamp,
+                    postings=[
+                        Posting(
+                            account_id=cash_node_id,
+                            amount=debits[i],
+                            metadata={},
+                        ),
+                        Posting(
+                            account_id=BOUNDARY_NODE_ID,
+                            amount=credits[i],
+                            metadata={},
+                        ),
+                    ],
+                    metadata={},
+                )
 
-            stamp_entry_metadata(
-                interest_entry,
-                parent_id=parent_id,
-                timestamp=interest_timestamp,
-                tags={"type": "interest"},
-                sequence=1,
-                origin_id=origin_id,
-            )
+                stamp_entry_metadata(
+                    interest_entry,
+                    parent_id=parent_id,
+                    timestamp=interest_timestamp,
+                    tags={"type": "interest"},
+                    sequence=1,
+                    origin_id=origin_id,
+                )
 
-            if interest_value > 0:
-                interest_entry.metadata["transaction_type"] = "income"
-                boundary_category = "income.interest"
-            else:
-                interest_entry.metadata["transaction_type"] = "expense"
-                boundary_category = "expense.interest"
-
-            stamp_posting_metadata(
-                interest_entry.postings[0],
-                node_id=cash_node_id,
-                type_tag="interest",
-            )
-            stamp_posting_metadata(
-                interest_entry.postings[1],
-                node_id=BOUNDARY_NODE_ID,
-                category=boundary_category,
-                type_tag="interest",
-            )
+                if interest_value > 0:
+                    interest_entry.metadata["transaction_type"] = "income"
+                    boundary_category = "income.interest"
+                else:
+                    interest_entry.metadata["transaction_type"] = "expense"
+                    boundary_category = "expense.interest"
+
+                stamp_posting_metadata(
+                    interest_entry.postings[0],
+                    node_id=cash_node_id,
+                    type_tag="interest",
+                )
+                stamp_posting_metadata(
+                    interest_entry.postings[1],
+                    node_id=BOUNDARY_NODE_ID,
+                    category=boundary_category,
+                    type_tag="interest",
+                )
 
-            if not journal.has_id(interest_entry.id):
-                journal.post(interest_entry)
+                interest_entries.append(interest_entry)
 
-        def _check_overdraft(month_idx: int, balance: float) -> None:
-            if overdraft_limit is None or balance >= -overdraft_limit:
-                return
+            journal.post_many(interest_entries)
 
-            if overdraft_policy == "raise":
+        # Enforce overdraft limit if configured
+        if overdraft_limit is not None:
+            breached = np.flatnonzero(mask & (bal < -overdraft_limit))
+            if breached.size and overdraft_policy == "raise":
+                t = int(breached[0])
                 raise ConfigError(
-                    f"{brick.id}: overdraft_limit exceeded at month {month_idx}: "
-                    f"balance {balance:.2f} < -{overdraft_limit:.2f}"
+                    f"{brick.id}: overdraft_limit exceeded at month {t}: "
+                    f"balance {bal[t]:.2f} < -{overdraft_limit:.2f}"
                 )
             if overdraft_policy == "warn":
                 log = logging.getLogger(__name__)
-                log.warning(
-                    "%s: overdraft_limit exceeded at month %d: balance %.2f < -%.2f",
-                    brick.id,
-                    month_idx,
-                    balance,
-                    overdraft_limit,
-                )
-
-        # Seed the first active month
-        bal[first_active_idx] = (
-            brick.spec["initial_balance"]
-            + external_in[first_active_idx]
-            - external_out[first_active_idx]
-        )
-        interest_earned[first_active_idx] = bal[first_active_idx] * r_m
-        _post_interest_entry(first_active_idx)
-        bal[first_active_idx] *= 1 + r_m
-        bal[first_active_idx] += (
-            post_interest_in[first_active_idx] - post_interest_out[first_active_idx]
-        )
-        _check_overdraft(first_active_idx, bal[first_active_idx])
-
-        # Calculate balance for remaining months (after first active)
-        for t in range(first_active_idx + 1, T):
-            # Apply active mask before interest calculations
-            if mask[t]:
-                # Start with previous month's balance
-                bal[t] = bal[t - 1]
-                # Add/subtract this month's cash flows
-                bal[t] += external_in[t] - external_out[t]
-                # Calculate interest on the full balance (including this month's flows)
-                interest_earned[t] = bal[t] * r_m
-                _post_interest_entry(t)
-
-                # Apply interest to balance
-                bal[t] *= 1 + r_m
-                # Apply post-interest adjustments (no interest on these)
-                bal[t] += post_interest_in[t] - post_interest_out[t]
-
-                # Enforce overdraft limit if configured
-                _check_overdraft(t, bal[t])
-            else:
-                bal[t] = 0.0
-                interest_earned[t] = 0.0
+                for t in breached.tolist():
+                    log.warning(
+                        "%s: overdraft_limit exceeded at month %d: balance %.2f < -%.2f",
+                        brick.id,
+                        t,
+                        bal[t],
+                        overdraft_limit,
+                    )
 
         return BrickOutput(
             cash_in=cash_in,  # V2: Zero arrays (shell behavior)
             cash_out=cash_out,  # V2: Zero arrays (shell behavior)
             assets=bal,
-            liabilities=np.zeros(T),
+            liabilities=shared_zeros(T),
             interest=interest_earned,  # Interest earned on cash balance (kept for KPIs)
             events=[],
         )
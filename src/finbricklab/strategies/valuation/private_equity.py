@@ -4,7 +4,6 @@ Private equity valuation strategy with deterministic marking.
 
 from __future__ import annotations
 
-from datetime import date
 from decimal import Decimal
 
 import numpy as np
@@ -13,7 +12,7 @@ from finbricklab.core.bricks import ABrick
 from finbricklab.core.context import ScenarioContext
 from finbricklab.core.errors import ConfigError
 from finbricklab.core.interfaces import IValuationStrategy
-from finbricklab.core.results import BrickOutput
+from finbricklab.core.results import BrickOutput, shared_zeros
 
 
 class ValuationPrivateEquity(IValuationStrategy):
@@ -111,7 +110,7 @@ class ValuationPrivateEquity(IValuationStrategy):
 
         for month_idx in range(months):
             # Get the date for this month - convert from numpy datetime64 to Python date
-            month_date = ctx.t_index[month_idx].astype("datetime64[D]").astype(date)
+            month_date = ctx.timeline.dates[month_idx]
 
             # Calculate value for this month
             if nav_series and month_idx < len(nav_series):
@@ -142,12 +141,10 @@ class ValuationPrivateEquity(IValuationStrategy):
             asset_value[month_idx] = float(value)
 
         return BrickOutput(
-            cash_in=np.zeros(months, dtype=float),
-            cash_out=np.zeros(months, dtype=float),
+            cash_in=shared_zeros(months),
+            cash_out=shared_zeros(months),
             assets=asset_value,
-            liabilities=np.zeros(months, dtype=float),
-            interest=np.zeros(
-                months, dtype=float
-            ),  # Private equity doesn't generate regular interest
+            liabilities=shared_zeros(months),
+            interest=shared_zeros(months),  # Private equity doesn't generate interest
             events=[],
         )
@@ -10,7 +10,7 @@ from finbricklab.core.bricks import ABrick
 from finbricklab.core.context import ScenarioContext
 from finbricklab.core.events import Event
 from finbricklab.core.interfaces import IValuationStrategy
-from finbricklab.core.results import BrickOutput
+from finbricklab.core.results import BrickOutput, shared_zeros
 from finbricklab.core.utils import active_mask
 
 
@@ -156,7 +156,7 @@ class ValuationProperty(IValuationStrategy):
             cash_in=cash_in,
             cash_out=cash_out,
             assets=value,
-            liabilities=np.zeros(T),
-            interest=np.zeros(T),  # Property doesn't generate interest/dividends
+            liabilities=shared_zeros(T),
+            interest=shared_zeros(T),  # Property doesn't generate interest/dividends
             events=events,
         )
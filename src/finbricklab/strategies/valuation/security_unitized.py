@@ -4,10 +4,7 @@ ETF investment valuation strategy.
 
 from __future__ import annotations
 
-from datetime import datetime
-
 import numpy as np
-import pandas as pd
 
 from finbricklab.core.accounts import BOUNDARY_NODE_ID, get_node_id
 from finbricklab.core.bricks import ABrick
@@ -24,7 +21,7 @@ from finbricklab.core.journal import (
     stamp_entry_metadata,
     stamp_posting_metadata,
 )
-from finbricklab.core.results import BrickOutput
+from finbricklab.core.results import BrickOutput, PathsOutput, shared_zeros
 from finbricklab.core.utils import active_mask
 
 
@@ -219,8 +216,8 @@ class ValuationSecurityUnitized(IValuationStrategy):
         s = brick.spec
 
         # V2: Don't emit cash arrays - use journal entries instead
-        cash_in = np.zeros(T)
-        cash_out = np.zeros(T)
+        cash_in = shared_zeros(T)
+        cash_out = shared_zeros(T)
         units = np.zeros(T)
         price = np.zeros(T)
         dividends_earned = np.zeros(T)  # Track dividends/yield earned
@@ -232,6 +229,9 @@ class ValuationSecurityUnitized(IValuationStrategy):
                 "Journal must be provided in ScenarioContext for V2 postings model"
             )
         journal = ctx.journal
+        fingerprint = ctx.transaction_fingerprint(brick)
+        # Entries are collected and posted as one batch at the end
+        entries: list[JournalEntry] = []
 
         # Get node IDs
         etf_node_id = get_node_id(brick.id, "a")
@@ -283,15 +283,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                 units[0] += add_u
 
                 # Create journal entry for buy
-                buy_timestamp = ctx.t_index[0]
-                if isinstance(buy_timestamp, np.datetime64):
-                    buy_timestamp = pd.Timestamp(buy_timestamp).to_pydatetime()
-                elif hasattr(buy_timestamp, "astype"):
-                    buy_timestamp = pd.Timestamp(
-                        buy_timestamp.astype("datetime64[D]")
-                    ).to_pydatetime()
-                else:
-                    buy_timestamp = datetime.fromisoformat(str(buy_timestamp))
+                buy_timestamp = ctx.timeline.datetimes[0]
 
                 operation_id = create_operation_id(f"a:{brick.id}", buy_timestamp)
                 sequence = next_sequence(operation_id)
@@ -302,6 +294,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                     {"buy_at_start": amt},
                     brick.links or {},
                     sequence=0,
+                    fingerprint=fingerprint,
                 )
 
                 # DR a:etf (increase asset), CR a:cash (decrease cash)
@@ -345,7 +338,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                     type_tag="buy",
                 )
 
-                journal.post(buy_entry)
+                entries.append(buy_entry)
 
                 if s.get("events_level") in ("major", "all"):
                     events.append(
@@ -362,15 +355,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                 units[0] += u
 
                 # Create journal entry for buy
-                buy_timestamp = ctx.t_index[0]
-                if isinstance(buy_timestamp, np.datetime64):
-                    buy_timestamp = pd.Timestamp(buy_timestamp).to_pydatetime()
-                elif hasattr(buy_timestamp, "astype"):
-                    buy_timestamp = pd.Timestamp(
-                        buy_timestamp.astype("datetime64[D]")
-                    ).to_pydatetime()
-                else:
-                    buy_timestamp = datetime.fromisoformat(str(buy_timestamp))
+                buy_timestamp = ctx.timeline.datetimes[0]
 
                 operation_id = create_operation_id(f"a:{brick.id}", buy_timestamp)
                 sequence = next_sequence(operation_id)
@@ -381,6 +366,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                     {"buy_at_start": u},
                     brick.links or {},
                     sequence=0,
+                    fingerprint=fingerprint,
                 )
 
                 # DR a:etf (increase asset), CR a:cash (decrease cash)
@@ -424,7 +410,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                     type_tag="buy",
                 )
 
-                journal.post(buy_entry)
+                entries.append(buy_entry)
 
                 if s.get("events_level") in ("major", "all"):
                     events.append(
@@ -469,19 +455,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                         )
                 elif dv > 0:
                     # Cash dividend: V2: Create journal entry (BOUNDARY↔INTERNAL: CR income.dividend, DR cash)
-                    dividend_timestamp = ctx.t_index[t]
-                    if isinstance(dividend_timestamp, np.datetime64):
-                        dividend_timestamp = pd.Timestamp(
-                            dividend_timestamp
-                        ).to_pydatetime()
-                    elif hasattr(dividend_timestamp, "astype"):
-                        dividend_timestamp = pd.Timestamp(
-                            dividend_timestamp.astype("datetime64[D]")
-                        ).to_pydatetime()
-                    else:
-                        dividend_timestamp = datetime.fromisoformat(
-                            str(dividend_timestamp)
-                        )
+                    dividend_timestamp = ctx.timeline.datetimes[t]
 
                     operation_id = create_operation_id(
                         f"a:{brick.id}", dividend_timestamp
@@ -494,6 +468,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                         {"dividend": dv},
                         brick.links or {},
                         sequence=t,
+                        fingerprint=fingerprint,
                     )
 
                     # CR income.dividend (boundary), DR cash (internal)
@@ -538,7 +513,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                         type_tag="dividend",
                     )
 
-                    journal.post(dividend_entry)
+                    entries.append(dividend_entry)
 
                     if ev_lvl in ("major", "all"):
                         events.append(
@@ -557,15 +532,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                 months = dca.get("months", None)
                 m_rel = t - start_off
                 if m_rel >= 0 and (months is None or m_rel < int(months)):
-                    dca_timestamp = ctx.t_index[t]
-                    if isinstance(dca_timestamp, np.datetime64):
-                        dca_timestamp = pd.Timestamp(dca_timestamp).to_pydatetime()
-                    elif hasattr(dca_timestamp, "astype"):
-                        dca_timestamp = pd.Timestamp(
-                            dca_timestamp.astype("datetime64[D]")
-                        ).to_pydatetime()
-                    else:
-                        dca_timestamp = datetime.fromisoformat(str(dca_timestamp))
+                    dca_timestamp = ctx.timeline.datetimes[t]
 
                     if dca["mode"] == "amount":
                         step_blocks = max(0, m_rel // 12)
@@ -588,6 +555,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                                 {"dca": amt, "month": m_rel},
                                 brick.links or {},
                                 sequence=t,
+                                fingerprint=fingerprint,
                             )
 
                             # DR a:etf (increase asset), CR a:cash (decrease cash)
@@ -633,7 +601,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
 
                             # Guard: Skip posting if entry with same ID already exists (e.g., re-simulation)
                             if not journal.has_id(dca_entry.id):
-                                journal.post(dca_entry)
+                                entries.append(dca_entry)
 
                             if ev_lvl == "all":
                                 events.append(
@@ -666,6 +634,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                                 {"dca": u, "month": m_rel},
                                 brick.links or {},
                                 sequence=t,
+                                fingerprint=fingerprint,
                             )
 
                             # DR a:etf (increase asset), CR a:cash (decrease cash)
@@ -711,7 +680,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
 
                             # Guard: Skip posting if entry with same ID already exists (e.g., re-simulation)
                             if not journal.has_id(dca_entry.id):
-                                journal.post(dca_entry)
+                                entries.append(dca_entry)
 
                             if ev_lvl == "all":
                                 events.append(
@@ -745,17 +714,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                         units[t] -= sell_units
 
                         # Create journal entry for sell
-                        sell_timestamp = ctx.t_index[t]
-                        if isinstance(sell_timestamp, np.datetime64):
-                            sell_timestamp = pd.Timestamp(
-                                sell_timestamp
-                            ).to_pydatetime()
-                        elif hasattr(sell_timestamp, "astype"):
-                            sell_timestamp = pd.Timestamp(
-                                sell_timestamp.astype("datetime64[D]")
-                            ).to_pydatetime()
-                        else:
-                            sell_timestamp = datetime.fromisoformat(str(sell_timestamp))
+                        sell_timestamp = ctx.timeline.datetimes[t]
 
                         operation_id = create_operation_id(
                             f"a:{brick.id}", sell_timestamp
@@ -768,6 +727,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                             {"sell": sell_units},
                             brick.links or {},
                             sequence=t,
+                            fingerprint=fingerprint,
                         )
 
                         # DR a:cash (increase cash), CR a:etf (decrease asset)
@@ -813,7 +773,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
 
                         # Guard: Skip posting if entry with same ID already exists (e.g., re-simulation)
                         if not journal.has_id(sell_entry.id):
-                            journal.post(sell_entry)
+                            entries.append(sell_entry)
 
                         if ev_lvl in ("major", "all"):
                             events.append(
@@ -837,15 +797,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                 months = sdca.get("months", None)
                 m_rel = t - start_off
                 if m_rel >= 0 and (months is None or m_rel < int(months)):
-                    sdca_timestamp = ctx.t_index[t]
-                    if isinstance(sdca_timestamp, np.datetime64):
-                        sdca_timestamp = pd.Timestamp(sdca_timestamp).to_pydatetime()
-                    elif hasattr(sdca_timestamp, "astype"):
-                        sdca_timestamp = pd.Timestamp(
-                            sdca_timestamp.astype("datetime64[D]")
-                        ).to_pydatetime()
-                    else:
-                        sdca_timestamp = datetime.fromisoformat(str(sdca_timestamp))
+                    sdca_timestamp = ctx.timeline.datetimes[t]
 
                     if sdca["mode"] == "amount":
                         amt = float(sdca["amount"])
@@ -869,6 +821,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                             {"sdca": sell_units, "month": m_rel},
                             brick.links or {},
                             sequence=t,
+                            fingerprint=fingerprint,
                         )
 
                         # DR a:cash (increase cash), CR a:etf (decrease asset)
@@ -912,7 +865,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                             type_tag="sell",
                         )
 
-                        journal.post(sdca_entry)
+                        entries.append(sdca_entry)
 
                         if ev_lvl == "all":
                             events.append(
@@ -954,19 +907,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
 
             if gross > 0:
                 # Create journal entries for liquidation
-                liquidate_timestamp = ctx.t_index[t_stop]
-                if isinstance(liquidate_timestamp, np.datetime64):
-                    liquidate_timestamp = pd.Timestamp(
-                        liquidate_timestamp
-                    ).to_pydatetime()
-                elif hasattr(liquidate_timestamp, "astype"):
-                    liquidate_timestamp = pd.Timestamp(
-                        liquidate_timestamp.astype("datetime64[D]")
-                    ).to_pydatetime()
-                else:
-                    liquidate_timestamp = datetime.fromisoformat(
-                        str(liquidate_timestamp)
-                    )
+                liquidate_timestamp = ctx.timeline.datetimes[t_stop]
 
                 operation_id = create_operation_id(f"a:{brick.id}", liquidate_timestamp)
 
@@ -980,6 +921,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                     {"liquidate": gross},
                     brick.links or {},
                     sequence=t_stop,
+                    fingerprint=fingerprint,
                 )
 
                 # DR a:cash (gross received), CR a:etf (full asset value)
@@ -1023,7 +965,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                     type_tag="sell",
                 )
 
-                journal.post(liquidate_entry)
+                entries.append(liquidate_entry)
 
                 # Fee entry (if any): DR expense.fee (BOUNDARY), CR a:cash (INTERNAL)
                 if fees > 0:
@@ -1035,6 +977,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                         {"fee": fees},
                         brick.links or {},
                         sequence=t_stop,
+                        fingerprint=fingerprint,
                     )
 
                     fee_entry = JournalEntry(
@@ -1078,7 +1021,7 @@ class ValuationSecurityUnitized(IValuationStrategy):
                         type_tag="fee",
                     )
 
-                    journal.post(fee_entry)
+                    entries.append(fee_entry)
 
             asset_value[t_stop] = 0.0  # explicit zero on the sale month
             # Set all future values to 0 (ETF is liquidated)
@@ -1092,12 +1035,174 @@ class ValuationSecurityUnitized(IValuationStrategy):
                 )
             )
 
+        journal.post_many(entries)
+
         # V2: Shell behavior - return zero arrays (no balances)
         return BrickOutput(
             cash_in=cash_in,  # Zero - deprecated
             cash_out=cash_out,  # Zero - deprecated
             assets=asset_value,
-            liabilities=np.zeros(T),
+            liabilities=shared_zeros(T),
             interest=dividends_earned,  # Positive for dividend income
             events=events,
         )
+
+    def simulate_paths(
+        self,
+        brick: ABrick,
+        ctx: ScenarioContext,
+        paths: int,
+        seed: int | None = None,
+        percentiles: tuple[float, ...] = (5.0, 25.0, 50.0, 75.0, 95.0),
+    ) -> PathsOutput:
+        """
+        Simulate many price paths at once (Monte Carlo mode).
+
+        Runs the same monthly processing as ``simulate`` (dividends, DCA,
+        one-shot sells, SDCA, rounding, liquidation) on (paths, months)
+        arrays instead of one path, and returns cash effects as arrays
+        instead of posting journal entries. ``prepare`` must have been called.
+
+        With ``seed`` equal to ``spec.seed`` (the default), path 0 reproduces
+        the single path drawn by ``simulate``.
+
+        Args:
+            brick: The ETF investment brick
+            ctx: The simulation context (only t_index is used; no journal needed)
+            paths: Number of price paths to simulate
+            seed: Random seed (default: spec.seed)
+            percentiles: Percentiles of net worth to report in ``bands``
+
+        Returns:
+            PathsOutput with per-path arrays and net worth percentile bands
+
+        Raises:
+            ValueError: If paths < 1
+        """
+        if paths < 1:
+            raise ValueError("ValuationSecurityUnitized: paths must be >= 1")
+
+        T = len(ctx.t_index)
+        s = brick.spec
+        K = int(paths)
+
+        # Price paths: one row per path, same draw order as simulate()
+        mu = float(s["drift_pa"])
+        sigma = float(s["volatility_pa"])
+        rng = np.random.default_rng(int(s["seed"] if seed is None else seed))
+        log_ret = np.full((K, T), mu / 12.0)
+        log_ret[:, 0] = 0.0
+        if sigma > 0 and T > 1:
+            log_ret[:, 1:] += (sigma / np.sqrt(12.0)) * rng.standard_normal((K, T - 1))
+        price = float(s["price0"]) * np.exp(np.cumsum(log_ret, axis=1))
+        price[:, 0] = float(s["price0"])
+
+        units = np.zeros((K, T))
+        cash_flow = np.zeros((K, T))
+
+        # Initial holdings and one-shot buy at start (price0 is path-independent)
+        held = np.full(K, float(s["initial_units"]))
+        buy0 = s.get("buy_at_start")
+        if buy0:
+            if "amount" in buy0 and buy0["amount"] > 0:
+                held += float(buy0["amount"]) / price[:, 0]
+                cash_flow[:, 0] -= float(buy0["amount"])
+            elif "units" in buy0 and buy0["units"] > 0:
+                held += float(buy0["units"])
+                cash_flow[:, 0] -= float(buy0["units"]) * price[:, 0]
+
+        divm = float(s["div_yield_pa"]) / 12.0
+        reinv = bool(s["reinvest_dividends"])
+        round_to = s.get("round_units_to")
+        dca = s.get("dca")
+        sdca = s.get("sdca")
+        sells_by_month: dict[int, list[dict]] = {}
+        for sell_spec in s.get("sell", []):
+            hits = np.nonzero(ctx.t_index == np.datetime64(sell_spec["t"], "M"))[0]
+            for t in hits:
+                sells_by_month.setdefault(int(t), []).append(sell_spec)
+
+        for t in range(T):
+            p = price[:, t]
+
+            # Dividends BEFORE DCA (based on units at start of month)
+            if divm > 0:
+                dv = held * p * divm
+                if reinv:
+                    held = held + np.where(dv > 0, dv / p, 0.0)
+                else:
+                    cash_flow[:, t] += np.maximum(dv, 0.0)
+
+            # DCA AFTER dividends
+            if dca is not None:
+                start_off = int(dca.get("start_offset_m", 0))
+                months = dca.get("months", None)
+                m_rel = t - start_off
+                if m_rel >= 0 and (months is None or m_rel < int(months)):
+                    if dca["mode"] == "amount":
+                        amt = float(dca["amount"]) * (
+                            (1 + float(dca.get("annual_step_pct", 0.0)))
+                            ** max(0, m_rel // 12)
+                        )
+                        if amt > 0:
+                            held = held + amt / p
+                            cash_flow[:, t] -= amt
+                    else:
+                        u = float(dca["units"])
+                        if u > 0:
+                            held = held + u
+                            cash_flow[:, t] -= u * p
+
+            # One-shot sells
+            for sell_spec in sells_by_month.get(t, []):
+                if "amount" in sell_spec:
+                    sell_units = np.minimum(held, sell_spec["amount"] / p)
+                elif "_percentage" in sell_spec:
+                    sell_units = held * sell_spec["_percentage"]
+                else:
+                    sell_units = np.minimum(held, sell_spec["units"])
+                sell_units = np.maximum(sell_units, 0.0)
+                held = held - sell_units
+                cash_flow[:, t] += sell_units * p
+
+            # SDCA (Systematic DCA-out)
+            if sdca is not None:
+                start_off = int(sdca.get("start_offset_m", 0))
+                months = sdca.get("months", None)
+                m_rel = t - start_off
+                if m_rel >= 0 and (months is None or m_rel < int(months)):
+                    if sdca["mode"] == "amount":
+                        sell_units = np.minimum(held, float(sdca["amount"]) / p)
+                    else:
+                        sell_units = np.minimum(held, float(sdca["units"]))
+                    sell_units = np.maximum(sell_units, 0.0)
+                    held = held - sell_units
+                    cash_flow[:, t] += sell_units * p
+
+            if round_to is not None:
+                held = np.round(held, int(round_to))
+            units[:, t] = held
+
+        value = units * price
+
+        # Auto-dispose on window end (same rule as simulate)
+        mask = active_mask(
+            ctx.t_index, brick.start_date, brick.end_date, brick.duration_m
+        )
+        if bool(s.get("liquidate_on_window_end", False)) and mask.any():
+            t_stop = int(np.where(mask)[0].max())
+            gross = np.maximum(value[:, t_stop], 0.0)
+            fees_pct = float(s.get("sell_fees_pct", 0.0))
+            cash_flow[:, t_stop] += gross - gross * fees_pct
+            value[:, t_stop:] = 0.0
+
+        net_worth = value + np.cumsum(cash_flow, axis=1)
+        levels = np.percentile(net_worth, list(percentiles), axis=0)
+        return PathsOutput(
+            price=price,
+            units=units,
+            value=value,
+            cash_flow=cash_flow,
+            net_worth=net_worth,
+            bands={float(q): levels[i] for i, q in enumerate(percentiles)},
+        )
@@ -0,0 +1,55 @@
+"""
+Shared fixtures for core tests.
+"""
+
+import pytest
+from finbricklab import ABrick, FBrick, MacroBrick, Scenario
+from finbricklab.core.kinds import K
+from finbricklab.core.scenario import ScenarioConfig
+
+
+@pytest.fixture
+def small_scenario():
+    """
+    Factory for a small cash + salary + savings scenario.
+
+    Cash and savings are grouped in a "liquid" MacroBrick. The factory takes
+    an optional ScenarioConfig, a savings start date, and extra bricks and
+    MacroBricks to append.
+    """
+
+    def build(config=None, savings_start=None, bricks=(), macrobricks=()):
+        return Scenario(
+            id="small",
+            name="Small",
+            bricks=[
+                ABrick(
+                    id="cash",
+                    name="Cash",
+                    kind=K.A_CASH,
+                    spec={"initial_balance": 1000.0, "interest_pa": 0.02},
+                ),
+                FBrick(
+                    id="salary",
+                    name="Salary",
+                    kind=K.F_INCOME_RECURRING,
+                    spec={"amount_monthly": 3000.0},
+                ),
+                ABrick(
+                    id="savings",
+                    name="Savings",
+                    kind=K.A_CASH,
+                    spec={"initial_balance": 500.0},
+                    start_date=savings_start,
+                ),
+                *bricks,
+            ],
+            macrobricks=[
+                MacroBrick(id="liquid", name="Liquid", members=["cash", "savings"]),
+                *macrobricks,
+            ],
+            settlement_default_cash_id="cash",
+            config=config or ScenarioConfig(),
+        )
+
+    return build
@@ -0,0 +1,91 @@
+"""
+Tests for the cash routing index used by the scenario cash pass.
+"""
+
+from datetime import datetime
+
+import numpy as np
+from finbricklab.core.currency import create_amount
+from finbricklab.core.journal import Journal, JournalEntry, Posting
+from finbricklab.core.routing import CashRoutingIndex
+
+MONTHS = {"2026-01": 0, "2026-02": 1, "2026-03": 2}
+
+
+def _entry(entry_id, month, amount, node="a:cash", other="b:boundary", **metadata):
+    return JournalEntry(
+        id=entry_id,
+        timestamp=datetime(2026, month, 1),
+        postings=[
+            Posting(node, create_amount(amount, "EUR"), {"node_id": node}),
+            Posting(other, create_amount(-amount, "EUR"), {"node_id": other}),
+        ],
+        metadata=metadata,
+    )
+
+
+def _flows(index, cash_id="cash", excluded=frozenset()):
+    external_in = np.zeros(3)
+    external_out = np.zeros(3)
+    index.add_external_flows(cash_id, set(excluded), external_in, external_out)
+    return external_in, external_out
+
+
+class TestCashRoutingIndex:
+    """Test single-pass routing of journal postings to cash accounts."""
+
+    def test_debits_and_credits_by_month(self):
+        """Debits become inflows and credits outflows in their month."""
+        journal = Journal()
+        journal.post(_entry("e1", 1, 100, parent_id="fs:salary"))
+        journal.post(_entry("e2", 2, -40, parent_id="fs:rent"))
+        journal.post(_entry("e3", 2, 10, parent_id="fs:salary"))
+        index = CashRoutingIndex(journal, MONTHS, {"a:cash"})
+
+        external_in, external_out = _flows(index)
+
+        np.testing.assert_array_equal(external_in, [100, 10, 0])
+        np.testing.assert_array_equal(external_out, [0, 40, 0])
+
+    def test_exclusions(self):
+        """Array-routed parents, openings, own interest and other months are skipped."""
+        journal = Journal()
+        journal.post(_entry("e1", 1, 100, parent_id="fs:salary"))
+        journal.post(_entry("e2", 1, 5, brick_type="flow", brick_id="bonus"))
+        journal.post(
+            _entry("e3", 1, 7, operation_id="op:fs:gift:2026-01", parent_id=None)
+        )
+        journal.post(_entry("e4", 1, 1000, transaction_type="opening"))
+        journal.post(_entry("e5", 2, 3, parent_id="a:cash", tags={"type": "interest"}))
+        journal.post(_entry("e6", 2, 2, parent_id="a:other", tags={"type": "interest"}))
+        journal.post(_entry("e7", 2, 9, node="a:other", other="a:cash"))
+        journal.post(
+            JournalEntry(
+                id="e8",
+                timestamp=datetime(2027, 1, 1),
+                postings=[
+                    Posting("a:cash", create_amount(50, "EUR"), {"node_id": "a:cash"}),
+                    Posting("b:boundary", create_amount(-50, "EUR"), {}),
+                ],
+            )
+        )
+        index = CashRoutingIndex(journal, MONTHS, {"a:cash"})
+
+        external_in, external_out = _flows(index, excluded={"fs:salary", "fs:bonus"})
+
+        # e3: parent inferred from operation_id ("fs"), not excluded
+        np.testing.assert_array_equal(external_in, [7, 2, 0])
+        # e7: credit on a:cash from an internal transfer to a:other
+        np.testing.assert_array_equal(external_out, [0, 9, 0])
+
+    def test_picks_up_entries_posted_after_build(self):
+        """Entries posted after the index was built are routed on the next query."""
+        journal = Journal()
+        journal.post(_entry("e1", 1, 100, parent_id="fs:salary"))
+        index = CashRoutingIndex(journal, MONTHS, {"a:cash", "a:savings"})
+        np.testing.assert_array_equal(_flows(index, "savings")[0], [0, 0, 0])
+
+        journal.post(_entry("e2", 3, 25, node="a:savings", parent_id="ts:saver"))
+
+        np.testing.assert_array_equal(_flows(index, "savings")[0], [0, 0, 25])
+        np.testing.assert_array_equal(_flows(index, "cash")[0], [100, 0, 0])
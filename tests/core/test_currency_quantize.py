@@ -2,8 +2,11 @@
 Tests for currency quantization and rounding.
 """
 
+import pickle
 from decimal import Decimal
 
+import numpy as np
+import pytest
 from finbricklab.core.currency import (
     Amount,
     Currency,
@@ -103,3 +106,68 @@ class TestCurrencyQuantization:
         amount = create_amount("100.50", "EUR")
         assert "100.50" in repr(amount)
         assert "EUR" in repr(amount)
+
+
+class TestMinorUnits:
+    """Test the integer minor-unit representation of Amount."""
+
+    def test_minor_units_and_value_agree(self):
+        """Amounts store minor units and expose the same quantized Decimal."""
+        amount = Amount(1.005, "EUR")
+        assert amount.minor_units == 100
+        assert amount.value == Decimal("1.00")
+        assert str(amount.value) == "1.00"
+
+        assert Amount(5, "EUR").minor_units == 500
+        assert Amount(5, "JPY").value == Decimal("5")
+        assert Amount.from_minor_units(-1234, "EUR").value == Decimal("-12.34")
+
+    def test_arithmetic_matches_decimal(self):
+        """Integer arithmetic gives the same values as Decimal arithmetic."""
+        a = Amount("10.25", "EUR")
+        b = Amount("0.37", "EUR")
+        assert (a + b).value == a.value + b.value
+        assert (a - b).value == a.value - b.value
+        assert (-a).value == -a.value
+        assert abs(-a) == a
+        assert b < a
+
+    def test_pickle_roundtrip(self):
+        """Amounts survive pickling."""
+        amount = Amount("42.42", "USD")
+        restored = pickle.loads(pickle.dumps(amount))
+        assert restored == amount
+        assert restored.value == Decimal("42.42")
+
+    @pytest.mark.parametrize("rounding", list(RoundingPolicy))
+    @pytest.mark.parametrize("decimals", [0, 2, 3])
+    def test_to_minor_array_matches_decimal_rounding(self, decimals, rounding):
+        """Float rounding equals Decimal(str(x)).quantize for ties and large values."""
+        currency = Currency("XTS", decimals=decimals, rounding=rounding)
+        rng = np.random.default_rng(7)
+        values = np.concatenate(
+            [
+                [1.005, 2.675, 0.125, -0.125, 0.5, 1.5, 2.5, -2.5, 1e15 + 0.5, 0.0],
+                rng.integers(-(10**6), 10**6, 500) / 200,
+                rng.normal(0, 1e4, 500),
+            ]
+        )
+
+        expected = [currency.to_minor(Decimal(str(v))) for v in values.tolist()]
+
+        np.testing.assert_array_equal(currency.to_minor_array(values), expected)
+        assert [currency.float_to_minor(v) for v in values.tolist()] == expected
+
+    def test_from_floats(self):
+        """Bulk construction equals per-value construction."""
+        values = np.array([100.0, -33.335, 0.015, 1234.5678])
+        amounts = Amount.from_floats(values, "EUR")
+        assert amounts == [Amount(float(v), "EUR") for v in values]
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), "NaN", "-Infinity"])
+    def test_non_finite_amounts_rejected(self, value):
+        """NaN and infinite values have no minor-unit form and raise ValueError."""
+        with pytest.raises(ValueError, match="Amount must be finite"):
+            Amount(value, "EUR")
+        with pytest.raises(ValueError, match="Amount must be finite"):
+            Amount.from_floats(np.array([1.0, float(value)]), "EUR")
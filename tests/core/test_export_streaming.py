@@ -0,0 +1,119 @@
+"""
+Tests for the streaming JSON and ledger CSV exports.
+"""
+
+import csv
+import json
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from finbricklab.core.bricks import ABrick, FBrick
+from finbricklab.core.events import Event
+from finbricklab.core.kinds import K
+from finbricklab.core.scenario import Scenario, export_ledger_csv, export_run_json
+
+
+def _results():
+    index = pd.period_range("2026-01", periods=3, freq="M")
+    outputs = {
+        "b": {
+            "cash_in": np.array([0.0, 5.0, 0.0]),
+            "cash_out": np.array([1.0, 0.0, 2.0]),
+            "events": [
+                Event(np.datetime64("2026-03", "M"), "sell", "late", {"price": 9.0}),
+                Event(np.datetime64("2026-01", "M"), "buy", "early", None),
+            ],
+        },
+        "a": {
+            "cash_in": np.array([3.0, 0.0, 4.0]),
+            "cash_out": np.array([3.0, 0.0, 0.0]),
+            "events": [],
+        },
+    }
+    return {
+        "totals": pd.DataFrame({"x": [1.0, 2.0, 3.0]}, index=index),
+        "outputs": outputs,
+    }
+
+
+class TestExportLedgerCsv:
+    """Test export_ledger_csv."""
+
+    def test_rows_ordered_by_month_then_brick(self, tmp_path):
+        """Cash in, cash out and events are merged in (month, brick) order."""
+        path = tmp_path / "ledger.csv"
+        export_ledger_csv(str(path), _results())
+
+        with open(path, newline="") as f:
+            rows = [(r["t"], r["brick_id"], r["flow"]) for r in csv.DictReader(f)]
+        assert rows == [
+            ("2026-01", "a", "cash_in"),
+            ("2026-01", "a", "cash_out"),
+            ("2026-01", "b", "cash_out"),
+            ("2026-01", "b", "event"),
+            ("2026-02", "b", "cash_in"),
+            ("2026-03", "a", "cash_in"),
+            ("2026-03", "b", "cash_out"),
+            ("2026-03", "b", "event"),
+        ]
+
+    def test_no_file_without_rows(self, tmp_path):
+        """Nothing is written when there are no flows or events."""
+        results = _results()
+        for output in results["outputs"].values():
+            output["cash_in"][:] = 0.0
+            output["cash_out"][:] = 0.0
+            output["events"] = []
+        export_ledger_csv(str(tmp_path / "ledger.csv"), results)
+        assert not (tmp_path / "ledger.csv").exists()
+
+
+class TestExportRunJson:
+    """Test export_run_json."""
+
+    def test_matches_in_memory_payload(self, tmp_path):
+        """The streamed file parses to the expected structure and values."""
+        scenario = Scenario(
+            id="export",
+            name="Export",
+            bricks=[
+                ABrick(
+                    id="cash",
+                    name="Cash",
+                    kind=K.A_CASH,
+                    spec={"initial_balance": 1000.0, "interest_pa": 0.02},
+                ),
+                FBrick(
+                    id="salary",
+                    name="Salary",
+                    kind=K.F_INCOME_RECURRING,
+                    spec={"amount_monthly": 3000.0},
+                ),
+            ],
+        )
+        results = scenario.run(start=date(2026, 1, 1), months=6)
+        path = tmp_path / "run.json"
+        export_run_json(str(path), scenario, results, include_specs=True)
+
+        payload = json.loads(path.read_text())
+        assert list(payload) == [
+            "metadata",
+            "t_index",
+            "series",
+            "events",
+            "totals",
+            "invariants",
+            "brick_specs",
+        ]
+        assert payload["metadata"]["simulation_period"]["months"] == 6
+        assert set(payload["series"]) == {"cash", "salary"}
+        assert payload["series"]["cash"]["assets"] == [
+            round(v, 2) for v in results["outputs"]["cash"]["assets"]
+        ]
+        assert payload["totals"]["cash_in"] == [
+            round(v, 2) for v in results["totals"]["cash_in"]
+        ]
+        times = [event["t"] for event in payload["events"]]
+        assert times == sorted(times)
+        assert payload["brick_specs"]["salary"]["spec"] == {"amount_monthly": 3000.0}
@@ -0,0 +1,164 @@
+"""
+Tests for vectorized journal aggregation (posting table + bincount).
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from finbricklab.core.accounts import (
+    BOUNDARY_NODE_ID,
+    Account,
+    AccountRegistry,
+    AccountScope,
+    AccountType,
+)
+from finbricklab.core.aggregation import aggregate_cash_flows, posting_table
+from finbricklab.core.currency import create_amount
+from finbricklab.core.journal import ColumnarJournal, Journal, JournalEntry, Posting
+from finbricklab.core.transfer_visibility import TransferVisibility
+
+TIME_INDEX = pd.period_range("2026-01", periods=2, freq="M")
+
+
+def _entry(entry_id, month, debit, credit, amount, transaction_type, tag=None):
+    return JournalEntry(
+        id=entry_id,
+        timestamp=datetime(2026, month, 1),
+        postings=[
+            Posting(debit, create_amount(amount, "EUR"), {"node_id": debit}),
+            Posting(credit, create_amount(-amount, "EUR"), {"node_id": credit}),
+        ],
+        metadata={"transaction_type": transaction_type, "tags": {"type": tag}},
+    )
+
+
+def _journal(journal_cls=Journal):
+    registry = AccountRegistry()
+    for node_id in ("a:cash", "a:savings"):
+        registry.register_account(
+            Account(node_id, node_id, AccountScope.INTERNAL, AccountType.ASSET)
+        )
+    journal = journal_cls(registry)
+    for entry in [
+        _entry("open", 1, "a:cash", BOUNDARY_NODE_ID, 1000, "opening"),
+        _entry("salary", 1, "a:cash", BOUNDARY_NODE_ID, 500, "income"),
+        _entry("rent", 1, BOUNDARY_NODE_ID, "a:cash", 200, "expense"),
+        _entry("save", 2, "a:savings", "a:cash", 100, "transfer"),
+        _entry("int", 2, "a:savings", BOUNDARY_NODE_ID, 3, "interest", "interest"),
+        _entry("late", 3, "a:cash", BOUNDARY_NODE_ID, 999, "income"),
+    ]:
+        journal.post(entry)
+    return journal
+
+
+def _flows(journal, visibility, selection=frozenset(), cash=frozenset()):
+    return aggregate_cash_flows(
+        posting_table(journal), TIME_INDEX, set(selection), set(cash), visibility
+    )
+
+
+class TestJournalAggregation:
+    """Test the vectorized cash-flow aggregation rules."""
+
+    def test_boundary_only_without_selection(self):
+        """Boundary entries count via their first ASSET posting; openings skipped."""
+        cash_in, cash_out, int_in, int_out = _flows(
+            _journal(), TransferVisibility.BOUNDARY_ONLY
+        )
+        np.testing.assert_array_equal(cash_in, [500, 3])
+        np.testing.assert_array_equal(cash_out, [200, 0])
+        np.testing.assert_array_equal(int_in, [0, 3])
+        np.testing.assert_array_equal(int_out, [0, 0])
+
+    @pytest.mark.parametrize(
+        "visibility, expected_in, expected_out",
+        [
+            (TransferVisibility.ALL, [500, 103], [200, 0]),
+            (TransferVisibility.ONLY, [0, 100], [0, 0]),
+            (TransferVisibility.OFF, [500, 3], [200, 0]),
+        ],
+    )
+    def test_visibility_modes(self, visibility, expected_in, expected_out):
+        """Transfer visibility decides which entries contribute."""
+        cash_in, cash_out, _, _ = _flows(_journal(), visibility)
+        np.testing.assert_array_equal(cash_in, expected_in)
+        np.testing.assert_array_equal(cash_out, expected_out)
+
+    def test_internal_transfer_cancels_within_selection(self):
+        """A transfer between two selected cash nodes cancels out."""
+        nodes = {"a:cash", "a:savings"}
+        cash_in, cash_out, _, _ = _flows(
+            _journal(), TransferVisibility.ALL, selection=nodes, cash=nodes
+        )
+        np.testing.assert_array_equal(cash_in, [500, 3])
+        np.testing.assert_array_equal(cash_out, [200, 0])
+
+    def test_selected_cash_node_sees_transfer_out(self):
+        """Selecting one cash node shows its side of an internal transfer."""
+        cash_in, cash_out, int_in, _ = _flows(
+            _journal(),
+            TransferVisibility.BOUNDARY_ONLY,
+            selection={"a:cash"},
+            cash={"a:cash"},
+        )
+        np.testing.assert_array_equal(cash_in, [500, 0])
+        np.testing.assert_array_equal(cash_out, [200, 100])
+        # Interest on another node falls back to the boundary posting
+        np.testing.assert_array_equal(int_in, [0, 3])
+
+    def test_columnar_journal_matches_object_journal(self):
+        """Both storage backends aggregate identically."""
+        for visibility in TransferVisibility:
+            expected = _flows(_journal(), visibility, {"a:cash"}, {"a:cash"})
+            actual = _flows(
+                _journal(ColumnarJournal), visibility, {"a:cash"}, {"a:cash"}
+            )
+            for exp, act in zip(expected, actual, strict=True):
+                np.testing.assert_array_equal(exp, act)
+
+    def test_posting_table_is_cached_until_journal_changes(self):
+        """The posting table is reused and rebuilt after new posts."""
+        journal = _journal()
+        table = posting_table(journal)
+        assert posting_table(journal) is table
+
+        journal.post(_entry("bonus", 2, "a:cash", BOUNDARY_NODE_ID, 50, "income"))
+
+        rebuilt = posting_table(journal)
+        assert rebuilt is not table
+        assert rebuilt.n_entries == table.n_entries + 1
+
+
+class TestSelectionFlowMatrix:
+    """Test the precomputed node×month matrix used for selections."""
+
+    @pytest.mark.parametrize("visibility", list(TransferVisibility))
+    @pytest.mark.parametrize(
+        "selection, cash",
+        [
+            ({"a:cash"}, {"a:cash"}),
+            ({"a:savings"}, {"a:savings"}),
+            ({"a:cash", "a:savings"}, {"a:cash", "a:savings"}),
+            ({"a:cash", "l:loan"}, {"a:cash"}),
+        ],
+    )
+    def test_matches_direct_aggregation(self, visibility, selection, cash):
+        """Row sums equal the direct aggregation for every selection and mode."""
+        journal = _journal()
+        expected_in, expected_out, _, _ = _flows(journal, visibility, selection, cash)
+
+        matrix = posting_table(journal).flow_matrix(TIME_INDEX, visibility)
+        cash_in, cash_out = matrix.cash_flows(selection, cash)
+
+        np.testing.assert_allclose(cash_in, expected_in)
+        np.testing.assert_allclose(cash_out, expected_out)
+
+    def test_matrix_is_cached_per_visibility(self):
+        """Each visibility mode builds its matrix once per posting table."""
+        table = posting_table(_journal())
+        matrix = table.flow_matrix(TIME_INDEX, TransferVisibility.ALL)
+
+        assert table.flow_matrix(TIME_INDEX, TransferVisibility.ALL) is matrix
+        assert table.flow_matrix(TIME_INDEX, TransferVisibility.OFF) is not matrix
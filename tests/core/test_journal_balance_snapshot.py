@@ -2,9 +2,11 @@
 Tests for journal balance snapshot and out-of-order posting handling.
 """
 
+from datetime import datetime
 from decimal import Decimal
 
 import numpy as np
+import pandas as pd
 import pytest
 from finbricklab.core.currency import create_amount
 from finbricklab.core.journal import Journal, JournalEntry, Posting
@@ -233,3 +235,63 @@ class TestJournalBalanceSnapshot:
 
         accounts = entry.get_accounts()
         assert accounts == {"asset:cash", "equity:opening"}
+
+
+def _cash_entry(entry_id, timestamp, amount):
+    return JournalEntry(
+        id=entry_id,
+        timestamp=timestamp,
+        postings=[
+            Posting("asset:cash", create_amount(amount, "EUR"), {}),
+            Posting("income:salary", create_amount(-amount, "EUR"), {}),
+        ],
+    )
+
+
+class TestJournalBalanceIndex:
+    """Test the cached month balance index behind point-in-time balances."""
+
+    def test_index_refreshes_after_post(self):
+        """Balances reflect entries posted after a previous lookup."""
+        journal = Journal()
+        journal.post(_cash_entry("txn1", datetime(2024, 1, 10), 100))
+        at = np.datetime64("2024-02", "M")
+        assert journal.balance("asset:cash", "EUR", at) == Decimal("100")
+
+        journal.post(_cash_entry("txn2", np.datetime64("2024-02", "M"), 25.5))
+
+        assert journal.balance("asset:cash", "EUR", at) == Decimal("125.50")
+        assert journal.trial_balance(at) == {
+            "asset:cash": {"EUR": Decimal("125.50")},
+            "income:salary": {"EUR": Decimal("-125.50")},
+        }
+
+    def test_before_first_posting_and_unknown_account(self):
+        """Accounts without postings up to the timestamp are zero or absent."""
+        journal = Journal()
+        journal.post(_cash_entry("txn1", datetime(2024, 3, 1), 10))
+        before = datetime(2024, 2, 1)
+
+        assert journal.balance("asset:cash", "EUR", before) == Decimal("0")
+        assert journal.balance("asset:other", "EUR", before) == Decimal("0")
+        assert journal.trial_balance(before) == {}
+
+    def test_balance_series_matches_point_lookups(self):
+        """A balance time series equals one balance() call per month."""
+        journal = Journal()
+        journal.post(_cash_entry("txn3", pd.Timestamp(2024, 3, 5), -30))
+        journal.post(_cash_entry("txn1", datetime(2024, 1, 15), 100))
+        journal.post(_cash_entry("txn2", np.datetime64("2024-02", "M"), 50))
+        months = pd.period_range("2023-12", periods=5, freq="M")
+
+        series = journal.balance_series("asset:cash", "EUR", months)
+
+        np.testing.assert_array_equal(series, [0, 100, 150, 120, 120])
+        expected = [
+            float(journal.balance("asset:cash", "EUR", m.to_timestamp()))
+            for m in months
+        ]
+        np.testing.assert_array_equal(series, expected)
+        np.testing.assert_array_equal(
+            journal.balance_series("asset:other", "EUR", months), np.zeros(5)
+        )
@@ -0,0 +1,210 @@
+"""
+Tests for the columnar journal storage backend.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+from finbricklab.core.bricks import ABrick, FBrick, LBrick
+from finbricklab.core.currency import create_amount
+from finbricklab.core.errors import ConfigError
+from finbricklab.core.journal import ColumnarJournal, Journal, JournalEntry, Posting
+from finbricklab.core.kinds import K
+from finbricklab.core.scenario import Scenario, ScenarioConfig
+
+
+def _entry(entry_id, timestamp, amount, currency="EUR", tags=None):
+    return JournalEntry(
+        id=entry_id,
+        timestamp=timestamp,
+        postings=[
+            Posting(
+                "a:cash",
+                create_amount(amount, currency),
+                {"node_id": "a:cash", "type": "income"},
+            ),
+            Posting(
+                "b:boundary",
+                create_amount(-amount, currency),
+                {"node_id": "b:boundary", "category": "income.salary"},
+            ),
+        ],
+        metadata={
+            "transaction_type": "income",
+            "sequence": 1,
+            "tags": tags or {"type": "income"},
+        },
+    )
+
+
+def _build_scenario(journal_storage):
+    cash = ABrick(
+        id="cash",
+        name="Cash",
+        kind=K.A_CASH,
+        spec={"initial_balance": 100000.0, "interest_pa": 0.02},
+    )
+    income = FBrick(
+        id="salary",
+        name="Salary",
+        kind=K.F_INCOME_RECURRING,
+        spec={"amount_monthly": 5000.0},
+    )
+    expense = FBrick(
+        id="rent",
+        name="Rent",
+        kind=K.F_EXPENSE_RECURRING,
+        spec={"amount_monthly": 1800.0},
+    )
+    house = ABrick(
+        id="house",
+        name="House",
+        kind=K.A_PROPERTY,
+        spec={"initial_value": 300000.0, "fees_pct": 0.05, "appreciation_pa": 0.03},
+    )
+    mortgage = LBrick(
+        id="mortgage",
+        name="Mortgage",
+        kind=K.L_LOAN_ANNUITY,
+        links={"principal": {"from_house": "house"}},
+        spec={"rate_pa": 0.035, "term_months": 300},
+    )
+    return Scenario(
+        id=f"columnar_{journal_storage}",
+        name="Columnar",
+        bricks=[cash, income, expense, house, mortgage],
+        settlement_default_cash_id="cash",
+        config=ScenarioConfig(journal_storage=journal_storage),
+    )
+
+
+class TestColumnarJournal:
+    """Test columnar storage and the JournalEntry compatibility view."""
+
+    def test_entries_round_trip(self):
+        """Materialized entries equal the posted ones."""
+        journal = ColumnarJournal()
+        posted = [
+            _entry("e1", datetime(2026, 1, 1), 100.5),
+            _entry("e2", np.datetime64("2026-02", "M"), 2000, "JPY"),
+            _entry("e3", pd.Timestamp("2026-03-01"), 0.07, tags={"fx_leg": "pnl"}),
+        ]
+        for entry in posted:
+            journal.post(entry)
+
+        assert len(journal) == 3
+        for original, restored in zip(posted, journal.entries, strict=True):
+            assert restored.id == original.id
+            assert restored.timestamp == original.timestamp
+            assert type(restored.timestamp) is type(original.timestamp)
+            assert restored.metadata == original.metadata
+            for p_orig, p_rest in zip(
+                original.postings, restored.postings, strict=True
+            ):
+                assert p_rest.account_id == p_orig.account_id
+                assert p_rest.amount == p_orig.amount
+                assert p_rest.metadata == p_orig.metadata
+
+        assert journal.entries[-1].id == "e3"
+        assert [e.id for e in journal.entries[:2]] == ["e1", "e2"]
+
+    def test_materialized_entries_are_independent(self):
+        """Mutating a materialized entry does not change stored data."""
+        journal = ColumnarJournal()
+        journal.post(_entry("e1", datetime(2026, 1, 1), 10))
+
+        journal.entries[0].metadata["tags"]["type"] = "changed"
+
+        assert journal.entries[0].metadata["tags"] == {"type": "income"}
+
+    def test_columns_are_compact_and_dictionary_encoded(self):
+        """Postings are stored as int codes, int64 minor units and int32 months."""
+        journal = ColumnarJournal()
+        journal.post(_entry("e1", datetime(2026, 1, 1), 100.5))
+        journal.post(_entry("e2", datetime(2026, 2, 1), 99.99))
+
+        cols = journal.columns()
+        assert cols["month"].dtype == np.int32
+        assert cols["account"].dtype == np.int32
+        assert cols["amount_minor"].dtype == np.int64
+        assert cols["amount_minor"].tolist() == [10050, -10050, 9999, -9999]
+        assert cols["entry"].tolist() == [0, 0, 1, 1]
+        months = cols["month"].astype("datetime64[M]")
+        assert [str(m) for m in months] == ["2026-01", "2026-01", "2026-02", "2026-02"]
+        assert journal.account_ids == ["a:cash", "b:boundary"]
+        np.testing.assert_allclose(journal.amounts(), [100.5, -100.5, 99.99, -99.99])
+
+        codes, values = journal.posting_metadata_column("category")
+        assert codes.tolist() == [-1, 0, -1, 0]
+        assert values == ["income.salary"]
+
+        codes, values = journal.entry_metadata_column("transaction_type")
+        assert codes.tolist() == [0, 0]
+        assert values == ["income"]
+
+    def test_validation_matches_object_journal(self):
+        """Duplicate IDs are rejected with the same message; clear resets state."""
+        journal = ColumnarJournal()
+        journal.post(_entry("e1", datetime(2026, 1, 1), 10))
+
+        with pytest.raises(ValueError, match="Duplicate transaction ID: e1"):
+            journal.post(_entry("e1", datetime(2026, 2, 1), 20))
+        assert len(journal) == 1
+
+        assert journal.balance("a:cash", "EUR") == Decimal("10.00")
+        assert journal.has_id("e1")
+
+        journal.clear()
+        assert len(journal) == 0
+        assert not journal.has_id("e1")
+        assert journal.columns()["amount_minor"].size == 0
+
+    def test_balances_match_object_journal(self):
+        """Point-in-time balances match the object-backed journal."""
+        columnar = ColumnarJournal()
+        objects = Journal()
+        for i, amount in enumerate([100, 250.25, -75.5]):
+            entry = _entry(f"e{i}", datetime(2026, i + 1, 1), amount)
+            columnar.post(entry)
+            objects.post(entry)
+
+        at = np.datetime64("2026-02", "M")
+        assert columnar.balance("a:cash", "EUR", at) == objects.balance(
+            "a:cash", "EUR", at
+        )
+        assert columnar.trial_balance() == objects.trial_balance()
+        assert columnar.trial_balance(at) == objects.trial_balance(at)
+
+
+class TestColumnarScenario:
+    """Test scenario runs with columnar journal storage."""
+
+    def test_scenario_results_match_object_storage(self):
+        """A columnar run produces the same totals and journal as the default."""
+        res_objects = _build_scenario("objects").run(start=date(2026, 1, 1), months=24)
+        res_columnar = _build_scenario("columnar").run(
+            start=date(2026, 1, 1), months=24
+        )
+
+        assert isinstance(res_columnar["journal"], ColumnarJournal)
+        pd.testing.assert_frame_equal(res_objects["totals"], res_columnar["totals"])
+
+        objects_entries = res_objects["journal"].entries
+        columnar_entries = list(res_columnar["journal"].entries)
+        assert [e.id for e in objects_entries] == [e.id for e in columnar_entries]
+        assert [e.metadata for e in objects_entries] == [
+            e.metadata for e in columnar_entries
+        ]
+
+        pd.testing.assert_frame_equal(
+            res_objects["views"].journal(), res_columnar["views"].journal()
+        )
+
+    def test_unknown_journal_storage_raises(self):
+        """An unknown storage mode is a configuration error."""
+        scenario = _build_scenario("parquet")
+        with pytest.raises(ConfigError, match="Unknown journal_storage"):
+            scenario.run(start=date(2026, 1, 1), months=3)
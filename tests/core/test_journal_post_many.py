@@ -0,0 +1,170 @@
+"""
+Tests for batch posting (Journal.post_many).
+"""
+
+from datetime import datetime
+
+import pytest
+from finbricklab.core.accounts import (
+    BOUNDARY_NODE_ID,
+    Account,
+    AccountRegistry,
+    AccountScope,
+    AccountType,
+)
+from finbricklab.core.currency import create_amount
+from finbricklab.core.journal import (
+    ColumnarJournal,
+    Journal,
+    JournalEntry,
+    Posting,
+    SummaryJournal,
+)
+from finbricklab.core.validation import validate_origin_id_uniqueness
+
+
+def _entry(entry_id, month, debit, credit, amount, origin_id=None, currency="EUR"):
+    metadata = {"transaction_type": "transfer"}
+    if origin_id is not None:
+        metadata["origin_id"] = origin_id
+    return JournalEntry(
+        id=entry_id,
+        timestamp=datetime(2026, month, 1),
+        postings=[
+            Posting(debit, create_amount(amount, currency), {"node_id": debit}),
+            Posting(credit, create_amount(-amount, currency), {"node_id": credit}),
+        ],
+        metadata=metadata,
+    )
+
+
+def _entries():
+    return [
+        _entry("open", 1, "a:cash", BOUNDARY_NODE_ID, 1000.10, "o1"),
+        _entry("salary", 1, "a:cash", BOUNDARY_NODE_ID, 500.25, "o2"),
+        _entry("save", 2, "a:savings", "a:cash", 100.05, "o3"),
+        _entry("usd", 2, "a:cash", BOUNDARY_NODE_ID, 7.5, "o4", currency="USD"),
+        _entry("int", 3, "a:savings", BOUNDARY_NODE_ID, 0.01),
+    ]
+
+
+def _journal(journal_cls=Journal):
+    registry = AccountRegistry()
+    for node_id in ("a:cash", "a:savings"):
+        registry.register_account(
+            Account(node_id, node_id, AccountScope.INTERNAL, AccountType.ASSET)
+        )
+    return journal_cls(registry)
+
+
+class TestJournalPostMany:
+    """Test batch posting against sequential posting."""
+
+    @pytest.mark.parametrize("journal_cls", [Journal, ColumnarJournal])
+    def test_matches_sequential_post(self, journal_cls):
+        """A batch stores the same entries and balances as one post per entry."""
+        sequential = _journal(journal_cls)
+        for entry in _entries():
+            sequential.post(entry)
+
+        batched = _journal(journal_cls)
+        batched.post_many(_entries())
+
+        assert [e.id for e in batched.entries] == [e.id for e in sequential.entries]
+        for account_id, currency in [
+            ("a:cash", "EUR"),
+            ("a:cash", "USD"),
+            ("a:savings", "EUR"),
+            (BOUNDARY_NODE_ID, "EUR"),
+        ]:
+            assert batched.balance(account_id, currency) == sequential.balance(
+                account_id, currency
+            )
+        assert batched.has_id("int")
+
+    def test_empty_batch_is_a_no_op(self):
+        """Posting an empty batch leaves the journal unchanged."""
+        journal = _journal()
+        revision = journal._revision
+
+        journal.post_many([])
+
+        assert journal.entries == []
+        assert journal._revision == revision
+
+    def test_non_zero_sum_entry_rejects_batch(self):
+        """An unbalanced entry fails the whole batch with post's message."""
+        entries = _entries()
+        entries[2].postings[1] = Posting(
+            "a:cash", create_amount(-100.0, "EUR"), {"node_id": "a:cash"}
+        )
+        journal = _journal()
+
+        with pytest.raises(ValueError, match="not zero-sum"):
+            journal.post_many(entries)
+
+        assert journal.entries == []
+        assert journal.balance("a:cash", "EUR") == 0
+
+    def test_duplicate_id_within_batch(self):
+        """A repeated ID inside the batch is rejected before anything is posted."""
+        entries = _entries()
+        entries.append(_entry("save", 4, "a:savings", "a:cash", 1.0))
+        journal = _journal()
+
+        with pytest.raises(ValueError, match="Duplicate transaction ID: save"):
+            journal.post_many(entries)
+
+        assert journal.entries == []
+        assert not journal.has_id("open")
+
+    def test_duplicate_id_against_journal(self):
+        """An ID already in the journal is rejected."""
+        journal = _journal()
+        journal.post(_entry("salary", 1, "a:cash", BOUNDARY_NODE_ID, 1.0))
+
+        with pytest.raises(ValueError, match="Duplicate transaction ID: salary"):
+            journal.post_many(_entries())
+
+        assert len(journal.entries) == 1
+
+    def test_duplicate_origin_id_left_to_scenario_validation(self):
+        """Like post, post_many does not check origin_id uniqueness."""
+        entries = [
+            _entry("a", 1, "a:cash", BOUNDARY_NODE_ID, 1.0, "same"),
+            _entry("b", 1, "a:cash", BOUNDARY_NODE_ID, 1.0, "same"),
+        ]
+        batched = _journal()
+        batched.post_many(entries)
+        sequential = _journal()
+        for entry in entries:
+            sequential.post(entry)
+
+        assert len(batched.entries) == len(sequential.entries) == 2
+        with pytest.raises(ValueError, match="entry b conflicts with a"):
+            validate_origin_id_uniqueness(batched)
+
+    def test_summary_journal_batch_is_atomic(self):
+        """A failing batch leaves a summary journal unchanged."""
+        entries = _entries()
+        entries.append(_entry("save", 4, "a:savings", "a:cash", 1.0))
+        journal = _journal(SummaryJournal)
+
+        with pytest.raises(ValueError, match="Duplicate transaction ID: save"):
+            journal.post_many(entries)
+
+        assert len(journal.entries) == 0
+        assert not journal.has_id("open")
+        assert journal.balance("a:cash", "EUR") == 0
+
+    def test_same_origin_id_in_other_currency_is_allowed(self):
+        """The origin_id check is per currency."""
+        journal = _journal()
+        journal.post_many(
+            [
+                _entry("eur", 1, "a:cash", BOUNDARY_NODE_ID, 1.0, "fx"),
+                _entry("usd", 1, "a:cash", BOUNDARY_NODE_ID, 1.0, "fx", "USD"),
+            ]
+        )
+
+        assert len(journal.entries) == 2
@@ -0,0 +1,231 @@
+"""
+Tests for the summary journal storage backend.
+"""
+
+import pickle
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+from finbricklab.core.bricks import ABrick, FBrick, LBrick
+from finbricklab.core.currency import create_amount
+from finbricklab.core.journal import Journal, JournalEntry, Posting, SummaryJournal
+from finbricklab.core.kinds import K
+from finbricklab.core.scenario import ScenarioConfig
+from finbricklab.core.validation import validate_origin_id_uniqueness
+
+
+def _entry(entry_id, timestamp, amount, parent="fs:salary", origin_id=None):
+    metadata = {
+        "transaction_type": "income",
+        "parent_id": parent,
+        "sequence": 1,
+        "tags": {"type": "income", "source": entry_id},
+    }
+    if origin_id is not None:
+        metadata["origin_id"] = origin_id
+    return JournalEntry(
+        id=entry_id,
+        timestamp=timestamp,
+        postings=[
+            Posting(
+                "a:cash",
+                create_amount(amount, "EUR"),
+                {"node_id": "a:cash", "type": "income"},
+            ),
+            Posting(
+                "b:boundary",
+                create_amount(-amount, "EUR"),
+                {"node_id": "b:boundary", "category": "income.salary"},
+            ),
+        ],
+        metadata=metadata,
+    )
+
+
+@pytest.fixture
+def storage_scenario(small_scenario):
+    """Small scenario plus rent and a mortgaged house, for a given storage."""
+
+    def build(journal_storage):
+        return small_scenario(
+            ScenarioConfig(journal_storage=journal_storage),
+            bricks=[
+                FBrick(
+                    id="rent",
+                    name="Rent",
+                    kind=K.F_EXPENSE_RECURRING,
+                    spec={"amount_monthly": 1800.0},
+                ),
+                ABrick(
+                    id="house",
+                    name="House",
+                    kind=K.A_PROPERTY,
+                    spec={
+                        "initial_value": 300000.0,
+                        "fees_pct": 0.05,
+                        "appreciation_pa": 0.03,
+                    },
+                ),
+                LBrick(
+                    id="mortgage",
+                    name="Mortgage",
+                    kind=K.L_LOAN_ANNUITY,
+                    links={"principal": {"from_house": "house"}},
+                    spec={"rate_pa": 0.035, "term_months": 300},
+                ),
+            ],
+        )
+
+    return build
+
+
+class TestSummaryJournal:
+    """Test folding entries into monthly groups."""
+
+    def test_entries_fold_per_month(self):
+        """Entries of one month and parent share a group with summed amounts."""
+        journal = SummaryJournal()
+        for day in range(1, 11):
+            journal.post(_entry(f"jan{day}", datetime(2026, 1, day), 10.25))
+        journal.post(_entry("feb1", datetime(2026, 2, 1), 5))
+        journal.post(_entry("rent1", datetime(2026, 1, 1), -3, parent="fs:rent"))
+
+        assert journal.posted_count == 12
+        assert len(journal) == len(journal.entries) == 3
+        jan = journal.entries[0]
+        assert jan.id == "summary:0"
+        assert jan.timestamp == datetime(2026, 1, 1)
+        assert jan.metadata == {
+            "transaction_type": "income",
+            "parent_id": "fs:salary",
+            "tags": {"type": "income"},
+            "entry_count": 10,
+        }
+        assert jan.postings[0].amount == create_amount(102.5, "EUR")
+        assert jan.postings[0].metadata == {"node_id": "a:cash"}
+        assert jan.postings[1].metadata == {
+            "node_id": "b:boundary",
+            "category": "income.salary",
+        }
+        assert journal.columns()["amount_minor"].tolist() == [
+            10250,
+            -10250,
+            500,
+            -500,
+            -300,
+            300,
+        ]
+
+    def test_balances_match_object_journal(self):
+        """Balances and trial balances equal those of the full journal."""
+        summary = SummaryJournal()
+        objects = Journal()
+        for i, amount in enumerate([100, 250.25, -75.5, 12, 8.75]):
+            entry = _entry(f"e{i}", datetime(2026, 1 + i // 2, 1 + i), amount)
+            summary.post(entry)
+            objects.post(entry)
+
+        at = np.datetime64("2026-02", "M")
+        assert summary.balance("a:cash", "EUR") == Decimal("295.50")
+        assert summary.balance("a:cash", "EUR", at) == objects.balance(
+            "a:cash", "EUR", at
+        )
+        assert summary.trial_balance() == objects.trial_balance()
+
+    def test_validation_on_post(self):
+        """Zero-sum and unique IDs are still enforced; IDs are kept as digests."""
+        journal = SummaryJournal()
+        journal.post(_entry("e1", datetime(2026, 1, 1), 10))
+
+        with pytest.raises(ValueError, match="Duplicate transaction ID: e1"):
+            journal.post(_entry("e1", datetime(2026, 2, 1), 20))
+        unbalanced = _entry("e2", datetime(2026, 1, 1), 10)
+        unbalanced.postings[1] = Posting(
+            "b:boundary", create_amount(-9, "EUR"), {"node_id": "b:boundary"}
+        )
+        with pytest.raises(ValueError, match="not zero-sum"):
+            journal.post(unbalanced)
+
+        assert len(journal) == 1
+        assert journal.has_id("e1") and not journal.has_id("e2")
+        journal.clear()
+        assert len(journal) == 0 and not journal.has_id("e1")
+
+    def test_duplicate_origin_id_detected_on_post(self):
+        """Repeats seen while posting fail the origin_id validation."""
+        journal = SummaryJournal()
+        journal.post(_entry("e1", datetime(2026, 1, 1), 10, origin_id="o1"))
+        journal.post(_entry("e2", datetime(2026, 1, 2), 10, origin_id="o2"))
+        validate_origin_id_uniqueness(journal)
+
+        journal.post(_entry("e3", datetime(2026, 1, 3), 10, origin_id="o1"))
+        assert journal.origin_conflicts == [
+            "Duplicate origin_id 'o1' for currency 'EUR': entry e3"
+        ]
+        with pytest.raises(ValueError, match="Duplicate origin_id 'o1'.*e3"):
+            validate_origin_id_uniqueness(journal)
+        assert journal.validate_invariants() == []
+
+    def test_without_id_tracking(self):
+        """track_ids=False keeps no per-entry digests and skips the ID checks."""
+        journal = SummaryJournal(track_ids=False)
+        for day in range(1, 4):
+            journal.post(_entry("same", datetime(2026, 1, day), 10, origin_id="o"))
+
+        assert journal.posted_count == 3 and len(journal) == 1
+        assert not journal.has_id("same")
+        assert not journal._id_digests and not journal._origin_digests
+        validate_origin_id_uniqueness(journal)
+        assert journal.balance("a:cash", "EUR") == Decimal("30.00")
+
+    def test_recording_and_pickle(self):
+        """Recording yields the original entries; pickles keep the groups."""
+        journal = SummaryJournal()
+        journal.post(_entry("e1", datetime(2026, 1, 1), 10))
+        with journal.recording() as posted:
+            journal.post(_entry("e2", datetime(2026, 1, 2), 20))
+        assert [entry.id for entry in posted] == ["e2"]
+
+        restored = pickle.loads(pickle.dumps(journal))
+        assert restored.posted_count == 2 and restored.has_id("e2")
+        assert restored.entries[0].metadata["entry_count"] == 2
+
+
+class TestSummaryScenario:
+    """Test scenario runs with summary journal storage."""
+
+    def test_results_match_object_storage(self, storage_scenario):
+        """A summary run produces the same outputs, totals and balances."""
+        res_objects = storage_scenario("objects").run(start=date(2026, 1, 1), months=24)
+        res_summary = storage_scenario("summary").run(start=date(2026, 1, 1), months=24)
+
+        journal = res_summary["journal"]
+        assert isinstance(journal, SummaryJournal)
+        assert journal.posted_count == len(res_objects["journal"])
+        pd.testing.assert_frame_equal(res_objects["totals"], res_summary["totals"])
+        for brick_id, output in res_objects["outputs"].items():
+            for key in ("assets", "liabilities", "interest"):
+                np.testing.assert_allclose(
+                    res_summary["outputs"][brick_id][key], output[key]
+                )
+        assert journal.trial_balance() == res_objects["journal"].trial_balance()
+
+    def test_untracked_ids_same_totals(self, storage_scenario):
+        """summary_track_ids=False changes memory, not results."""
+        scenario = storage_scenario("summary")
+        scenario.config.summary_track_ids = False
+        untracked = scenario.run(start=date(2026, 1, 1), months=12)
+        tracked = storage_scenario("summary").run(start=date(2026, 1, 1), months=12)
+
+        assert not untracked["journal"].track_ids
+        pd.testing.assert_frame_equal(untracked["totals"], tracked["totals"])
+
+    def test_sweep_with_summary_storage(self, storage_scenario):
+        """Sweeps reuse upstream bricks from a summary journal."""
+        params = {"rent.spec.amount_monthly": [1500.0, 2000.0]}
+        objects = storage_scenario("objects").sweep(params, date(2026, 1, 1), 6)
+        summary = storage_scenario("summary").sweep(params, date(2026, 1, 1), 6)
+        pd.testing.assert_frame_equal(objects, summary)
@@ -0,0 +1,117 @@
+"""
+Tests for lazily computed run results.
+"""
+
+import pickle
+from datetime import date
+
+import pandas as pd
+import pytest
+from finbricklab import MacroBrick
+from finbricklab.core.results import LazyResults, ScenarioResults
+from finbricklab.core.scenario import ScenarioConfig
+
+RESULT_KEYS = [
+    "outputs",
+    "by_struct",
+    "totals",
+    "views",
+    "journal",
+    "_scenario_bricks",
+    "meta",
+]
+
+
+@pytest.fixture
+def lazy_scenario(small_scenario):
+    """Small scenario factory with an extra "income" MacroBrick."""
+    return lambda config=None: small_scenario(
+        config,
+        macrobricks=[MacroBrick(id="income", name="Income", members=["salary"])],
+    )
+
+
+class TestLazyResults:
+    """Test the LazyResults dict."""
+
+    def test_factory_called_once_on_first_access(self):
+        """Pending values are computed once and then stored."""
+        calls = []
+        res = LazyResults({"a": 1}, pending={"b": lambda: calls.append(1) or 2})
+
+        assert list(res) == ["a", "b"] and len(res) == 2 and "b" in res
+        assert res.pending == {"b"} and not calls
+        assert res["b"] == 2 and res.get("b") == 2
+        assert res.pending == frozenset() and calls == [1]
+
+    def test_dict_protocol_resolves_values(self):
+        """Copies, views and pickles never expose unresolved placeholders."""
+        for convert in (
+            dict,
+            lambda r: {**r},
+            lambda r: dict(r.items()),
+            lambda r: pickle.loads(pickle.dumps(r)),
+        ):
+            res = LazyResults({"a": 1}, pending={"b": lambda: 2})
+            assert convert(res) == {"a": 1, "b": 2}
+        res = LazyResults({"a": 1}, pending={"b": lambda: 2})
+        assert list(res.values()) == [1, 2]
+        assert res == {"a": 1, "b": 2}
+
+    def test_assignment_discards_factory(self):
+        """Setting or deleting a pending key drops its factory."""
+        res = LazyResults(pending={"a": pytest.fail, "b": pytest.fail})
+        res["a"] = 1
+        del res["b"]
+        assert dict(res) == {"a": 1}
+        assert res.pending == frozenset()
+
+
+class TestLazyScenarioRun:
+    """Test that Scenario.run defers totals, views and struct aggregates."""
+
+    def test_keys_unchanged_and_computed_on_access(self, lazy_scenario):
+        """The result dict keeps its keys; totals and views wait for access."""
+        results = lazy_scenario().run(start=date(2026, 1, 1), months=12)
+
+        assert list(results) == RESULT_KEYS
+        assert {"totals", "views"} <= results.pending
+        assert results["by_struct"].pending == {"liquid", "income"}
+
+        totals = results["totals"]
+        assert isinstance(totals, pd.DataFrame)
+        assert results["totals"] is totals
+        assert isinstance(results["views"], ScenarioResults)
+        assert results["views"]._monthly_data is totals
+
+    def test_struct_aggregates_per_macrobrick(self, lazy_scenario):
+        """Only the MacroBricks read are summed."""
+        results = lazy_scenario().run(start=date(2026, 1, 1), months=12)
+        by_struct = results["by_struct"]
+
+        liquid = by_struct["liquid"]
+        assert by_struct.pending == {"income"}
+        outputs = results["outputs"]
+        assert liquid["assets"] == pytest.approx(
+            outputs["cash"]["assets"] + outputs["savings"]["assets"]
+        )
+
+    def test_lazy_totals_match_profiled_run(self, lazy_scenario):
+        """Profiled runs compute everything up front, with the same totals."""
+        lazy = lazy_scenario().run(start=date(2026, 1, 1), months=12)
+        profiled = lazy_scenario(ScenarioConfig(profile=True)).run(
+            start=date(2026, 1, 1), months=12
+        )
+
+        assert profiled.pending == {"views"}
+        assert profiled["by_struct"].pending == frozenset()
+        pd.testing.assert_frame_equal(lazy["totals"], profiled["totals"])
+
+    def test_convenience_methods_use_last_run(self, lazy_scenario):
+        """aggregate_totals computes the totals of a run never read."""
+        scenario = lazy_scenario()
+        results = scenario.run(start=date(2026, 1, 1), months=12)
+
+        yearly = scenario.aggregate_totals("Y")
+        assert "totals" not in results.pending
+        assert len(yearly) == 1
@@ -0,0 +1,165 @@
+"""
+Tests for the content-addressed scenario result cache.
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+from finbricklab.core.cache import ResultCache, scenario_cache_key
+from finbricklab.core.journal import Journal, SummaryJournal
+from finbricklab.core.scenario import Scenario
+
+SCENARIO_DICT = {
+    "id": "cached",
+    "name": "Cached",
+    "bricks": [
+        {
+            "id": "cash",
+            "name": "Cash",
+            "kind": "a.cash",
+            "spec": {"initial_balance": 1000.0, "interest_pa": 0.02},
+        },
+        {
+            "id": "salary",
+            "name": "Salary",
+            "kind": "f.income.recurring",
+            "spec": {"amount_monthly": 3000.0},
+        },
+    ],
+    "structs": [{"id": "income", "name": "Income", "members": ["salary"]}],
+}
+
+
+class _Note:
+    """Mutable object whose default repr does not show its state."""
+
+    def __init__(self):
+        self.text = "initial"
+
+
+def _scenario():
+    return Scenario.from_dict(SCENARIO_DICT)
+
+
+class TestScenarioCacheKey:
+    """Test the stable content hash of scenario runs."""
+
+    def test_equal_content_equal_key(self):
+        """Independently built equal scenarios share a key."""
+        key = scenario_cache_key(_scenario(), date(2026, 1, 1), 12)
+        assert key == scenario_cache_key(_scenario(), date(2026, 1, 1), 12)
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda s, args: s.bricks[1].spec.update(amount_monthly=3100.0),
+            lambda s, args: s.bricks[1].links.update(route={"to": "cash"}),
+            lambda s, args: setattr(s, "currency", "USD"),
+            lambda s, args: setattr(s.config, "journal_storage", "columnar"),
+            lambda s, args: setattr(s.config, "include_struct_results", False),
+            lambda s, args: args.update(start=date(2026, 2, 1)),
+            lambda s, args: args.update(months=24),
+            lambda s, args: args.update(selection=["cash"]),
+            lambda s, args: args.update(include_cash=False),
+        ],
+    )
+    def test_changes_change_key(self, change):
+        """Specs, links, currency, config and run arguments are part of the key."""
+        args = {"start": date(2026, 1, 1), "months": 12}
+        scenario = _scenario()
+        scenario.bricks[1].links = {}
+        base = scenario_cache_key(scenario, **args)
+        change(scenario, args)
+        assert scenario_cache_key(scenario, **args) != base
+
+    def test_opaque_values_are_not_keyed(self):
+        """Objects whose rendering may hide their state raise instead of keying."""
+        scenario = _scenario()
+        scenario.bricks[1].spec = {**scenario.bricks[1].spec, "note": _Note()}
+        with pytest.raises(TypeError, match="Cannot derive a cache key from a _Note"):
+            scenario_cache_key(scenario, date(2026, 1, 1), 12)
+
+
+class TestResultCache:
+    """Test Scenario.run with a ResultCache."""
+
+    def test_repeated_run_hits(self):
+        """A repeated run returns the stored results without simulating."""
+        cache = ResultCache()
+        first = _scenario().run(start=date(2026, 1, 1), months=12, cache=cache)
+        second = _scenario().run(start=date(2026, 1, 1), months=12, cache=cache)
+
+        assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+        pd.testing.assert_frame_equal(second["totals"], first["totals"])
+        assert set(second["outputs"]) == set(first["outputs"])
+        assert set(second["by_struct"]) == {"income"}
+        assert type(second["journal"]) is type(first["journal"]) is Journal
+        assert [e.id for e in second["journal"].entries] == [
+            e.id for e in first["journal"].entries
+        ]
+
+    def test_journal_storage_change_misses(self):
+        """Runs with another journal backend are simulated, not served."""
+        cache = ResultCache()
+        _scenario().run(start=date(2026, 1, 1), months=6, cache=cache)
+        scenario = _scenario()
+        scenario.config.journal_storage = "summary"
+        results = scenario.run(start=date(2026, 1, 1), months=6, cache=cache)
+
+        assert cache.stats() == {"hits": 0, "misses": 2, "entries": 2}
+        assert isinstance(results["journal"], SummaryJournal)
+
+    def test_opaque_spec_values_bypass_cache(self):
+        """Scenarios that cannot be keyed are simulated every time."""
+        cache = ResultCache()
+        scenario = _scenario()
+        note = _Note()
+        scenario.bricks[1].spec = {**scenario.bricks[1].spec, "note": note}
+        scenario.run(start=date(2026, 1, 1), months=6, cache=cache)
+        note.text = "changed"
+        results = scenario.run(start=date(2026, 1, 1), months=6, cache=cache)
+
+        assert cache.stats() == {"hits": 0, "misses": 0, "entries": 0}
+        assert len(results["totals"]) == 6
+
+    def test_hits_return_independent_copies(self):
+        """Modifying returned results does not affect later hits."""
+        cache = ResultCache()
+        scenario = _scenario()
+        scenario.run(start=date(2026, 1, 1), months=6, cache=cache)
+        hit = scenario.run(start=date(2026, 1, 1), months=6, cache=cache)
+        hit["outputs"]["cash"]["assets"][:] = -1.0
+
+        again = scenario.run(start=date(2026, 1, 1), months=6, cache=cache)
+        assert (again["outputs"]["cash"]["assets"] > 0).all()
+
+    def test_lru_eviction(self):
+        """The memory tier keeps the most recently used entries."""
+        cache = ResultCache(max_entries=2)
+        scenario = _scenario()
+        for months in (3, 4, 3, 5):
+            scenario.run(start=date(2026, 1, 1), months=months, cache=cache)
+
+        assert len(cache) == 2
+        assert scenario_cache_key(scenario, date(2026, 1, 1), 3) in cache
+        assert scenario_cache_key(scenario, date(2026, 1, 1), 4) not in cache
+
+    def test_disk_tier_shared_between_caches(self, tmp_path):
+        """Results stored on disk are found by a new cache instance."""
+        _scenario().run(
+            start=date(2026, 1, 1), months=6, cache=ResultCache(directory=tmp_path)
+        )
+
+        cache = ResultCache(directory=tmp_path)
+        results = _scenario().run(start=date(2026, 1, 1), months=6, cache=cache)
+        assert (cache.hits, cache.misses) == (1, 0)
+        assert len(results["totals"]) == 6
+
+        cache.clear()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_invalid_size(self):
+        """The memory tier needs room for at least one entry."""
+        with pytest.raises(ValueError, match="max_entries"):
+            ResultCache(max_entries=0)
@@ -0,0 +1,213 @@
+"""
+Tests for saving and loading ScenarioResults in the binary archive format.
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+from finbricklab.core.bricks import ABrick, FBrick, LBrick
+from finbricklab.core.currency import create_amount
+from finbricklab.core.journal import ColumnarJournal, Journal, JournalEntry, Posting
+from finbricklab.core.kinds import K
+from finbricklab.core.registry import Registry
+from finbricklab.core.results import ScenarioResults
+from finbricklab.core.scenario import Scenario
+
+
+def _results():
+    scenario = Scenario(
+        id="archived",
+        name="Archived",
+        bricks=[
+            ABrick(
+                id="cash",
+                name="Cash",
+                kind=K.A_CASH,
+                spec={"initial_balance": 100000.0, "interest_pa": 0.02},
+            ),
+            FBrick(
+                id="salary",
+                name="Salary",
+                kind=K.F_INCOME_RECURRING,
+                spec={"amount_monthly": 5000.0},
+            ),
+            ABrick(
+                id="house",
+                name="House",
+                kind=K.A_PROPERTY,
+                spec={
+                    "initial_value": 300000.0,
+                    "fees_pct": 0.05,
+                    "appreciation_pa": 0.03,
+                },
+            ),
+            LBrick(
+                id="mortgage",
+                name="Mortgage",
+                kind=K.L_LOAN_ANNUITY,
+                links={"principal": {"from_house": "house"}},
+                spec={"rate_pa": 0.035, "term_months": 300},
+            ),
+        ],
+        settlement_default_cash_id="cash",
+    )
+    return scenario.run(start=date(2026, 1, 1), months=36)
+
+
+def _entries(journal):
+    return [
+        (
+            e.id,
+            e.timestamp,
+            [(p.account_id, p.amount, p.metadata) for p in e.postings],
+            e.metadata,
+        )
+        for e in journal.entries
+    ]
+
+
+class TestResultsArchive:
+    """Test ScenarioResults.save / ScenarioResults.load."""
+
+    def test_round_trip(self, tmp_path):
+        """Loaded results reproduce totals, views, outputs and journal."""
+        results = _results()
+        views = results["views"]
+        views.save(tmp_path / "run")
+
+        loaded = ScenarioResults.load(tmp_path / "run")
+
+        pd.testing.assert_frame_equal(loaded.monthly(), views.monthly())
+        pd.testing.assert_frame_equal(loaded.yearly(), views.yearly())
+        pd.testing.assert_frame_equal(
+            loaded.filter(brick_ids=["house", "mortgage"]).monthly(),
+            views.filter(brick_ids=["house", "mortgage"]).monthly(),
+        )
+        for brick_id, output in results["outputs"].items():
+            np.testing.assert_array_equal(
+                loaded._outputs[brick_id]["assets"], output["assets"]
+            )
+            assert len(loaded._outputs[brick_id]["events"]) == len(output["events"])
+        assert _entries(loaded._journal) == _entries(results["journal"])
+        pd.testing.assert_frame_equal(loaded.journal(), views.journal())
+
+    def test_lazy_loading(self, tmp_path):
+        """Outputs are memory-mapped and the journal is read on first use."""
+        _results()["views"].save(tmp_path / "run")
+
+        loaded = ScenarioResults.load(tmp_path / "run")
+        assert isinstance(loaded._outputs["cash"]["assets"], np.memmap)
+        assert loaded._journal_loader is not None
+
+        assert isinstance(loaded._journal, ColumnarJournal)
+        assert loaded._journal_loader is None
+
+        eager = ScenarioResults.load(tmp_path / "run", mmap=False)
+        assert not isinstance(eager._outputs["cash"]["assets"], np.memmap)
+
+    def test_layout(self, tmp_path):
+        """The archive is a manifest plus plain .npy arrays."""
+        _results()["views"].save(tmp_path / "run")
+
+        manifest = json.loads((tmp_path / "run" / "manifest.json").read_text())
+        assert manifest["format"] == "finbricklab.results"
+        assert len(manifest["index"]) == 36
+        entry_ids = np.load(
+            tmp_path / "run" / "arrays" / manifest["journal"]["entry_ids"]
+        )
+        assert len(entry_ids) == manifest["journal"]["entries"]
+        suffixes = {p.suffix for p in (tmp_path / "run").rglob("*") if p.is_file()}
+        assert suffixes == {".json", ".npy"}
+
+    def test_registry_and_defaults_rebuilt(self, tmp_path):
+        """Bricks come back from their plain descriptions, without strategies."""
+        results = _results()
+        views = results["views"].filter(brick_ids=["house", "mortgage"])
+        views.save(tmp_path / "run")
+
+        loaded = ScenarioResults.load(tmp_path / "run")
+        mortgage = loaded._registry.get_brick("mortgage")
+        assert isinstance(mortgage, LBrick) and mortgage.schedule is None
+        assert mortgage.links == {"principal": {"from_house": "house"}}
+        assert mortgage.spec == results["views"]._registry.get_brick("mortgage").spec
+        assert loaded._default_selection == views._default_selection
+        pd.testing.assert_frame_equal(loaded.monthly(), views.monthly())
+
+    def test_typed_values_round_trip(self, tmp_path):
+        """Dates, decimals, tuples and NumPy scalars keep their values."""
+        journal = Journal()
+        metadata = {
+            "when": date(2026, 3, 1),
+            "rate": Decimal("0.035"),
+            "pair": ("a", 1),
+            "count": np.int64(3),
+            "tags": {"type": "income", "ids": [1, 2]},
+        }
+        for i, timestamp in enumerate(
+            [datetime(2026, 1, 15), date(2026, 2, 1), np.datetime64("2026-03")]
+        ):
+            journal.post(
+                JournalEntry(
+                    id=f"e{i}",
+                    timestamp=timestamp,
+                    postings=[
+                        Posting("a:cash", create_amount(10, "JPY"), metadata),
+                        Posting("b:boundary", create_amount(-10, "JPY")),
+                    ],
+                    metadata={"transaction_type": "income"},
+                )
+            )
+        totals = _results()["totals"]
+        ScenarioResults(totals, journal=journal).save(tmp_path / "run")
+
+        loaded = ScenarioResults.load(tmp_path / "run")._journal
+        assert _entries(loaded) == _entries(journal)
+        assert [type(e.timestamp) for e in loaded.entries] == [
+            datetime,
+            date,
+            np.datetime64,
+        ]
+        assert loaded.trial_balance() == journal.trial_balance()
+
+    def test_rejects_unsupported_values(self, tmp_path):
+        """Values without a JSON form are refused instead of pickled."""
+        brick = ABrick(id="odd", name="Odd", kind=K.A_CASH, spec={"x": object()})
+        registry = Registry({"odd": brick}, {})
+        totals = _results()["totals"]
+        with pytest.raises(ValueError, match="Cannot save value of type object"):
+            ScenarioResults(totals, registry=registry).save(tmp_path / "run")
+
+    def test_totals_only(self, tmp_path):
+        """Results without outputs or journal round-trip too."""
+        totals = _results()["totals"]
+        ScenarioResults(totals).save(tmp_path / "run")
+
+        loaded = ScenarioResults.load(tmp_path / "run")
+        pd.testing.assert_frame_equal(loaded.monthly(), totals)
+        assert loaded._journal is None
+
+    def test_save_replaces_previous_archive(self, tmp_path):
+        """Saving over an archive leaves no files of the previous save behind."""
+        results = _results()
+        results["views"].save(tmp_path / "run")
+        (tmp_path / "run" / "notes.txt").write_text("kept")
+
+        totals = results["totals"]
+        ScenarioResults(totals).save(tmp_path / "run")
+
+        arrays = list((tmp_path / "run" / "arrays").iterdir())
+        assert len(arrays) == len(totals.columns)
+        assert not (tmp_path / "run" / "journal.json").exists()
+        assert (tmp_path / "run" / "notes.txt").read_text() == "kept"
+        loaded = ScenarioResults.load(tmp_path / "run")
+        assert loaded._journal is None and loaded._outputs is None
+
+    def test_rejects_other_directories(self, tmp_path):
+        """Loading a directory without a results manifest fails clearly."""
+        (tmp_path / "manifest.json").write_text('{"format": "other"}')
+        with pytest.raises(ValueError, match="not a FinBrickLab results archive"):
+            ScenarioResults.load(tmp_path)
@@ -0,0 +1,98 @@
+"""
+Tests for the opt-in memory report of scenario runs.
+"""
+
+import tracemalloc
+from datetime import date
+
+import numpy as np
+from finbricklab.core.memory import deep_sizeof
+from finbricklab.core.scenario import ScenarioConfig
+
+
+class TestScenarioMemoryReport:
+    """Test res["meta"]["memory"] recorded with memory_report=True."""
+
+    def test_report_only_when_enabled(self, small_scenario):
+        """Default runs carry no memory report."""
+        results = small_scenario().run(start=date(2026, 1, 1), months=6)
+        assert "memory" not in results["meta"]
+
+    def test_phases_bricks_and_subsystems(self, small_scenario):
+        """Peak/retained bytes are attributed per phase, brick and subsystem."""
+        results = small_scenario().run(
+            start=date(2026, 1, 1), months=12, memory_report=True
+        )
+        report = results["meta"]["memory"]
+
+        phases = {p["name"]: p for p in report["phases"]}
+        assert list(phases)[:3] == ["compile", "initialize", "prepare"]
+        assert (
+            phases["simulate_bricks"]["peak_bytes"]
+            >= phases["first_pass"]["peak_bytes"]
+        )
+        assert report["peak_bytes"] >= phases["simulate_bricks"]["peak_bytes"] > 0
+        assert report["retained_bytes"] > 0
+
+        bricks = {b["name"]: b for b in report["bricks"]}
+        assert bricks["salary"]["phase"] == "first_pass"
+        assert bricks["cash"]["phase"] == "cash_pass"
+
+        subsystems = report["subsystems"]
+        assert set(subsystems) == {
+            "events",
+            "brick_outputs",
+            "journal_metadata",
+            "journal",
+            "struct_aggregates",
+            "results",
+            "unattributed",
+        }
+        assert subsystems["journal"] > 0 and subsystems["journal_metadata"] > 0
+        assert report["journal_entries"] == len(results["journal"])
+        assert report["bytes_per_journal_entry"] == (
+            subsystems["journal"] + subsystems["journal_metadata"]
+        ) / len(results["journal"])
+        assert report["top_allocations"][0]["bytes"] > 0
+        assert not tracemalloc.is_tracing()
+
+    def test_combines_with_timings_and_columnar_storage(self, small_scenario):
+        """Timings are still recorded; columnar metadata is sized too."""
+        config = ScenarioConfig(profile=True, journal_storage="columnar")
+        results = small_scenario(config).run(
+            start=date(2026, 1, 1), months=6, memory_report=True
+        )
+
+        assert "simulate_bricks" in {
+            p["name"] for p in results["meta"]["timings"]["phases"]
+        }
+        assert results["meta"]["memory"]["subsystems"]["journal_metadata"] > 0
+
+    def test_keeps_caller_tracing(self, small_scenario):
+        """A tracemalloc session started by the caller is left running."""
+        tracemalloc.start()
+        try:
+            results = small_scenario().run(
+                start=date(2026, 1, 1), months=6, memory_report=True
+            )
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+        assert results["meta"]["memory"]["retained_bytes"] > 0
+
+
+class TestDeepSizeof:
+    """Test recursive object sizing."""
+
+    def test_shared_objects_counted_once(self):
+        """Objects in the shared seen set are not counted again."""
+        array = np.zeros(1000)
+        seen = set()
+        first = deep_sizeof({"a": array}, seen)
+        assert first >= array.nbytes
+        assert deep_sizeof([array], seen) < array.nbytes
+
+    def test_views_count_their_base(self):
+        """A view is sized with the buffer it refers to."""
+        array = np.zeros(1000)
+        assert deep_sizeof(array[::2]) >= array.nbytes
@@ -0,0 +1,123 @@
+"""
+Tests for compiled scenario plans reused across Scenario.run calls.
+"""
+
+import dataclasses
+from datetime import date
+
+import pandas as pd
+import pytest
+from finbricklab.core.bricks import ABrick, FBrick
+from finbricklab.core.errors import ConfigError
+from finbricklab.core.kinds import K
+from finbricklab.core.macrobrick import MacroBrick
+from finbricklab.core.plan import ScenarioPlan
+from finbricklab.core.scenario import Scenario
+
+
+def _scenario():
+    return Scenario(
+        id="planned",
+        name="Planned",
+        bricks=[
+            ABrick(
+                id="cash",
+                name="Cash",
+                kind=K.A_CASH,
+                spec={"initial_balance": 1000.0, "interest_pa": 0.02},
+            ),
+            FBrick(
+                id="salary",
+                name="Salary",
+                kind=K.F_INCOME_RECURRING,
+                spec={"amount_monthly": 3000.0},
+            ),
+            ABrick(
+                id="etf",
+                name="ETF",
+                kind=K.A_SECURITY_UNITIZED,
+                spec={"initial_units": 10.0, "price0": 100.0, "drift_pa": 0.05},
+            ),
+        ],
+        macrobricks=[MacroBrick(id="portfolio", name="Portfolio", members=["etf"])],
+    )
+
+
+class TestScenarioPlan:
+    """Test Scenario.compile and run(plan=...)."""
+
+    def test_compile_matches_run_meta(self):
+        """The plan carries the execution order and accounts of a run."""
+        scenario = _scenario()
+        plan = scenario.compile()
+        results = scenario.run(start=date(2026, 1, 1), months=6)
+
+        assert isinstance(plan, ScenarioPlan)
+        assert list(plan.execution_order) == results["meta"]["execution_order"]
+        assert plan.cash_ids == ("cash",)
+        assert plan.struct_members == {"portfolio": frozenset({"etf"})}
+        registry = results["journal"].account_registry
+        assert all(registry.has_account(a.id) for a in plan.accounts)
+
+    def test_run_with_plan_matches_plain_run(self):
+        """Reusing a plan produces the same results as compiling per run."""
+        plain = _scenario().run(start=date(2026, 1, 1), months=12)
+
+        scenario = _scenario()
+        plan = scenario.compile()
+        planned = scenario.run(start=date(2026, 1, 1), months=12, plan=plan)
+
+        pd.testing.assert_frame_equal(planned["totals"], plain["totals"])
+        assert [e.id for e in planned["journal"].entries] == [
+            e.id for e in plain["journal"].entries
+        ]
+        assert set(planned["by_struct"]) == {"portfolio"}
+
+    def test_plan_stays_valid_across_runs(self):
+        """Running a scenario does not invalidate its plan."""
+        scenario = _scenario()
+        plan = scenario.compile()
+        scenario.run(start=date(2026, 1, 1), months=6, plan=plan)
+        assert plan.is_valid_for(scenario)
+
+    def test_plan_invalidated_by_changed_bricks(self):
+        """Changing links or bricks invalidates the plan and run recompiles."""
+        scenario = _scenario()
+        plan = scenario.compile()
+
+        scenario.bricks[1].links = {"route": {"to": "cash"}}
+        assert not plan.is_valid_for(scenario)
+
+        scenario.bricks.append(
+            FBrick(
+                id="bonus",
+                name="Bonus",
+                kind=K.F_INCOME_RECURRING,
+                spec={"amount_monthly": 500.0},
+            )
+        )
+        scenario._registry = scenario._build_registry()
+        results = scenario.run(start=date(2026, 1, 1), months=6, plan=plan)
+        assert "bonus" in results["meta"]["execution_order"]
+
+    def test_selection_defaults_to_plan(self):
+        """Without a selection, run uses the plan's selection."""
+        scenario = _scenario()
+        plan = scenario.compile(selection=["cash", "salary"])
+        results = scenario.run(start=date(2026, 1, 1), months=6, plan=plan)
+        assert set(results["outputs"]) == {"cash", "salary"}
+
+    def test_selection_mismatch_raises(self):
+        """A selection different from the plan's is rejected."""
+        scenario = _scenario()
+        plan = scenario.compile(selection=["cash", "salary"])
+        with pytest.raises(ConfigError, match="does not match"):
+            scenario.run(
+                start=date(2026, 1, 1), months=6, selection=["cash"], plan=plan
+            )
+
+    def test_plan_is_frozen(self):
+        """Plans are immutable."""
+        plan = _scenario().compile()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            plan.execution_order = ()
@@ -0,0 +1,56 @@
+"""
+Tests for opt-in per-phase timing instrumentation of scenario runs.
+"""
+
+import json
+from datetime import date
+
+from finbricklab.core.profiling import chrome_trace
+from finbricklab.core.scenario import ScenarioConfig
+
+
+class TestScenarioProfiling:
+    """Test timings recorded with ScenarioConfig(profile=True)."""
+
+    def test_timings_only_when_enabled(self, small_scenario):
+        """Default runs carry no timings."""
+        results = small_scenario().run(start=date(2026, 1, 1), months=6)
+        assert "timings" not in results["meta"]
+
+    def test_phases_and_bricks_are_recorded(self, small_scenario):
+        """Each phase and brick gets wall time and journal-entry counts."""
+        results = small_scenario(ScenarioConfig(profile=True)).run(
+            start=date(2026, 1, 1), months=6
+        )
+        timings = results["meta"]["timings"]
+
+        phases = {p["name"]: p for p in timings["phases"]}
+        assert list(phases)[:3] == ["compile", "initialize", "prepare"]
+        assert {
+            "first_pass",
+            "capture_monthly_transactions",
+            "cash_pass",
+            "validate_journal",
+            "aggregation",
+        } <= set(phases)
+        assert phases["simulate_bricks"]["entries"] == len(results["journal"].entries)
+        assert all(p["seconds"] >= 0 for p in timings["phases"])
+        assert timings["total_seconds"] >= phases["simulate_bricks"]["seconds"]
+
+        bricks = {b["name"]: b for b in timings["bricks"]}
+        assert bricks["salary"]["strategy"] == "FlowIncomeRecurring"
+        assert bricks["salary"]["phase"] == "first_pass"
+        assert bricks["salary"]["entries"] == 6
+        assert bricks["cash"]["phase"] == "cash_pass"
+
+    def test_chrome_trace_export(self, small_scenario, tmp_path):
+        """profile_trace_path writes complete events in microseconds."""
+        path = tmp_path / "trace.json"
+        config = ScenarioConfig(profile=True, profile_trace_path=str(path))
+        results = small_scenario(config).run(start=date(2026, 1, 1), months=3)
+
+        trace = json.loads(path.read_text())
+        assert trace == json.loads(json.dumps(chrome_trace(results["meta"]["timings"])))
+        names = [e["name"] for e in trace["traceEvents"]]
+        assert "simulate_bricks" in names and "salary" in names
+        assert all(e["ph"] == "X" and e["dur"] >= 0 for e in trace["traceEvents"])
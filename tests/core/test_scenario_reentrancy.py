@@ -0,0 +1,145 @@
+"""
+Tests for side-effect-free scenario runs (repeated and concurrent).
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pandas as pd
+from finbricklab.core.bricks import ABrick, FBrick, LBrick
+from finbricklab.core.context import ScenarioContext
+from finbricklab.core.journal import Journal
+from finbricklab.core.kinds import K
+from finbricklab.core.scenario import Scenario
+from finbricklab.core.utils import month_range
+
+
+def _scenario():
+    return Scenario(
+        id="reentrant",
+        name="Reentrant",
+        bricks=[
+            ABrick(
+                id="cash",
+                name="Cash",
+                kind=K.A_CASH,
+                spec={"initial_balance": 100000.0, "interest_pa": 0.02},
+            ),
+            FBrick(
+                id="salary",
+                name="Salary",
+                kind=K.F_INCOME_RECURRING,
+                spec={"amount_monthly": 5000.0},
+            ),
+            ABrick(
+                id="house",
+                name="House",
+                kind=K.A_PROPERTY,
+                spec={
+                    "initial_value": 300000.0,
+                    "fees_pct": 0.05,
+                    "appreciation_pa": 0.03,
+                },
+            ),
+            LBrick(
+                id="mortgage",
+                name="Mortgage",
+                kind=K.L_LOAN_ANNUITY,
+                links={"principal": {"from_house": "house"}},
+                spec={"rate_pa": 0.035, "term_months": 300},
+            ),
+        ],
+        settlement_default_cash_id="cash",
+    )
+
+
+def _snapshot(scenario):
+    return [
+        (b.id, repr(b.spec), repr(b.links), b.start_date, b.end_date, b.duration_m)
+        for b in scenario.bricks
+    ]
+
+
+class TestScenarioReentrancy:
+    """Test that runs leave bricks untouched and can be repeated or overlapped."""
+
+    def test_run_leaves_bricks_unmodified(self):
+        """Specs, links and activation windows are unchanged by a run."""
+        scenario = _scenario()
+        before = _snapshot(scenario)
+        results = scenario.run(start=date(2026, 1, 1), months=12)
+
+        assert _snapshot(scenario) == before
+        assert "external_in" not in scenario.bricks[0].spec
+        working = {b.id: b for b in results["_scenario_bricks"]}
+        assert "external_in" in working["cash"].spec
+        assert working["cash"] is not scenario.bricks[0]
+
+    def test_routed_flows_live_in_run_state(self):
+        """Routed cash flows stay on the run's context, not in specs."""
+        results = _scenario().run(start=date(2026, 1, 1), months=12)
+        cash = {b.id: b for b in results["_scenario_bricks"]}["cash"]
+        assert not cash.spec["external_in"].any()
+
+        def simulate(inflow):
+            ctx = ScenarioContext(
+                t_index=month_range(date(2026, 1, 1), 12),
+                currency="EUR",
+                registry={"cash": cash},
+                journal=Journal(),
+            )
+            if inflow:
+                ctx.run_state.cash_flow("cash", "external_in", 12)[:] = inflow
+            return cash.simulate(ctx)["assets"]
+
+        assert simulate(100.0)[-1] - simulate(0.0)[-1] >= 1200.0
+        assert not cash.spec["external_in"].any()
+
+    def test_working_copies_share_unmodified_values(self):
+        """Only spec dicts and nested containers are copied per run."""
+        scenario = _scenario()
+        scenario.bricks[1].spec["schedule"] = {"months": [1, 2]}
+        original, working = scenario.bricks[1], scenario._working_copies()[1]
+
+        assert working.spec is not original.spec
+        assert working.spec["schedule"] is not original.spec["schedule"]
+        assert working.spec["schedule"] == original.spec["schedule"]
+        assert working.links is original.links
+
+    def test_repeated_runs_match_fresh_scenarios(self):
+        """Rerunning with other horizons gives the results of a fresh scenario."""
+        scenario = _scenario()
+        expected = {
+            months: _scenario().run(start=date(2026, 1, 1), months=months)
+            for months in (24, 60)
+        }
+
+        for months in (60, 24, 60):
+            results = scenario.run(start=date(2026, 1, 1), months=months)
+            pd.testing.assert_frame_equal(results["totals"], expected[months]["totals"])
+            assert [e.id for e in results["journal"].entries] == [
+                e.id for e in expected[months]["journal"].entries
+            ]
+
+    def test_concurrent_runs_share_bricks(self):
+        """Runs on a thread pool share bricks and plan without cloning."""
+        scenario = _scenario()
+        expected = {
+            months: _scenario().run(start=date(2026, 1, 1), months=months)["totals"]
+            for months in (24, 60)
+        }
+        plan = scenario.compile()
+        horizons = [24, 60] * 4
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            totals = list(
+                pool.map(
+                    lambda months: scenario.run(
+                        start=date(2026, 1, 1), months=months, plan=plan
+                    )["totals"],
+                    horizons,
+                )
+            )
+
+        for months, frame in zip(horizons, totals, strict=True):
+            pd.testing.assert_frame_equal(frame, expected[months])
@@ -0,0 +1,166 @@
+"""
+Tests for Scenario.sweep parameter sweeps.
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+from finbricklab.core.bricks import ABrick, FBrick, LBrick
+from finbricklab.core.errors import ConfigError
+from finbricklab.core.kinds import K
+from finbricklab.core.scenario import Scenario
+from finbricklab.core.sweep import affected_bricks, sweep_design
+
+START = date(2026, 1, 1)
+
+
+def _scenario():
+    return Scenario(
+        id="sweep",
+        name="Sweep",
+        bricks=[
+            ABrick(
+                id="cash",
+                name="Cash",
+                kind=K.A_CASH,
+                spec={"initial_balance": 50000.0, "interest_pa": 0.02},
+            ),
+            FBrick(
+                id="salary",
+                name="Salary",
+                kind=K.F_INCOME_RECURRING,
+                spec={"amount_monthly": 5000.0},
+            ),
+            FBrick(
+                id="rent",
+                name="Rent",
+                kind=K.F_EXPENSE_RECURRING,
+                spec={"amount_monthly": 1500.0},
+            ),
+            ABrick(
+                id="house",
+                name="House",
+                kind=K.A_PROPERTY,
+                spec={
+                    "initial_value": 200000.0,
+                    "fees_pct": 0.05,
+                    "appreciation_pa": 0.02,
+                },
+            ),
+            LBrick(
+                id="mortgage",
+                name="Mortgage",
+                kind=K.L_LOAN_ANNUITY,
+                links={"principal": {"from_house": "house"}},
+                spec={"rate_pa": 0.035, "term_months": 240},
+            ),
+        ],
+        settlement_default_cash_id="cash",
+    )
+
+
+def _variant_totals(frame, variant, columns):
+    """Pivot one variant of a long-format sweep frame back to a totals frame."""
+    wide = frame[frame["variant"] == variant].pivot(
+        index="month", columns="metric", values="value"
+    )[columns]
+    wide.index = pd.PeriodIndex(wide.index, freq="M")
+    wide.index.name = None
+    wide.columns.name = None
+    return wide
+
+
+class TestScenarioSweep:
+    """Test sweep designs, results and upstream reuse."""
+
+    def test_grid_matches_individual_runs(self):
+        """Each variant's totals equal a fresh run with the override applied."""
+        params = {
+            "mortgage.spec.rate_pa": [0.02, 0.05],
+            "salary.spec.amount_monthly": [4000.0, 6000.0],
+        }
+        frame = _scenario().sweep(params, START, 12)
+
+        assert list(frame.columns) == [
+            "variant",
+            *params,
+            "month",
+            "metric",
+            "value",
+        ]
+        for i, overrides in enumerate(sweep_design(params)):
+            scenario = _scenario()
+            bricks = {b.id: b for b in scenario.bricks}
+            bricks["mortgage"].spec["rate_pa"] = overrides["mortgage.spec.rate_pa"]
+            bricks["salary"].spec["amount_monthly"] = overrides[
+                "salary.spec.amount_monthly"
+            ]
+            expected = scenario.run(start=START, months=12)["totals"]
+
+            pd.testing.assert_frame_equal(
+                _variant_totals(frame, i, expected.columns), expected
+            )
+
+    def test_unaffected_bricks_are_simulated_once(self, monkeypatch):
+        """Bricks no override can reach are reused across variants."""
+        calls: list[str] = []
+        original = Scenario._simulate_single_brick
+
+        def counting(self, brick, ctx, t_index):
+            calls.append(brick.id)
+            return original(self, brick, ctx, t_index)
+
+        monkeypatch.setattr(Scenario, "_simulate_single_brick", counting)
+        _scenario().sweep({"house.spec.initial_value": [1.5e5, 2e5, 3e5]}, START, 6)
+
+        assert calls.count("house") == 3
+        assert calls.count("mortgage") == 3  # linked to the house
+        assert calls.count("salary") == 1
+        assert calls.count("rent") == 1
+
+    def test_affected_bricks_follow_links(self):
+        """Links to non-cash bricks propagate; references to cash do not."""
+        scenario = _scenario()
+        assert affected_bricks(scenario, {"house"}) == {"house", "mortgage"}
+        assert affected_bricks(scenario, {"cash"}) == {"cash"}
+
+    def test_sweep_leaves_scenario_untouched(self):
+        """Overrides and in-place spec normalization stay on variant copies."""
+        scenario = _scenario()
+        scenario.sweep({"mortgage.spec.rate_pa": [0.01, 0.02]}, START, 3)
+
+        mortgage = next(b for b in scenario.bricks if b.id == "mortgage")
+        assert mortgage.spec == {"rate_pa": 0.035, "term_months": 240}
+        assert "totals" in scenario.run(start=START, months=3)
+
+    def test_parallel_matches_sequential(self):
+        """Workers return the same frame in variant order."""
+        params = {"rent.spec.amount_monthly": [1000.0, 1200.0, 1400.0]}
+        sequential = _scenario().sweep(params, START, 6)
+        parallel = _scenario().sweep(params, START, 6, workers=2)
+        pd.testing.assert_frame_equal(parallel, sequential)
+
+    def test_random_design(self):
+        """Random designs draw a reproducible number of variants."""
+        params = {"a.spec.x": [1, 2, 3], "b.spec.y": ["p", "q"]}
+        variants = sweep_design(params, design="random", samples=5, seed=3)
+
+        assert len(variants) == 5
+        assert variants == sweep_design(params, design="random", samples=5, seed=3)
+        assert all(v["a.spec.x"] in (1, 2, 3) for v in variants)
+
+    @pytest.mark.parametrize(
+        "params, kwargs, match",
+        [
+            ({"mortgage.rate_pa": [0.01]}, {}, "Invalid sweep parameter"),
+            ({"nope.spec.x": [1]}, {}, "unknown brick"),
+            ({"rent.spec.amount_monthly": []}, {}, "has no values"),
+            ({"rent.spec.amount_monthly": [1.0]}, {"design": "lhs"}, "Unknown"),
+            ({"rent.spec.amount_monthly": [1.0]}, {"design": "random"}, "samples"),
+        ],
+    )
+    def test_invalid_sweeps(self, params, kwargs, match):
+        """Invalid parameter paths and designs raise ConfigError."""
+        with pytest.raises(ConfigError, match=match):
+            _scenario().sweep(params, START, 3, **kwargs)
@@ -0,0 +1,86 @@
+"""
+Tests for the shared read-only zero arrays of shell brick outputs.
+"""
+
+import json
+import pickle
+from datetime import date
+
+import numpy as np
+import pytest
+from finbricklab import Scenario
+from finbricklab.core.results import ScenarioResults, is_shared_zeros, shared_zeros
+
+ARRAYS = ("cash_in", "cash_out", "assets", "liabilities", "interest")
+
+
+@pytest.fixture
+def scenario(small_scenario):
+    """Small scenario whose savings account opens in April."""
+    return small_scenario(savings_start=date(2026, 4, 1))
+
+
+class TestSharedZeros:
+    """Test the shared zero buffers and their use in brick outputs."""
+
+    def test_shared_per_length_and_read_only(self):
+        """One read-only array is handed out per length."""
+        zeros = shared_zeros(12)
+        assert zeros is shared_zeros(12)
+        assert is_shared_zeros(zeros)
+        assert not is_shared_zeros(np.zeros(12))
+        with pytest.raises(ValueError):
+            zeros[0] = 1.0
+
+    def test_shell_arrays_are_shared(self, scenario):
+        """Flows return shared arrays only; shifted outputs keep them shared."""
+        outputs = scenario.run(start=date(2026, 1, 1), months=12)["outputs"]
+        for key in ARRAYS:
+            assert outputs["salary"][key] is shared_zeros(12)
+
+        savings = outputs["savings"]
+        assert savings["liabilities"] is shared_zeros(12)
+        assert not is_shared_zeros(savings["assets"])
+        np.testing.assert_array_equal(savings["assets"][:3], 0.0)
+        assert savings["assets"][3] == pytest.approx(500.0)
+
+    def test_struct_aggregates_are_private(self, scenario):
+        """MacroBrick aggregates are writable sums; the shared zeros stay zero."""
+        results = scenario.run(start=date(2026, 1, 1), months=12)
+        outputs = results["outputs"]
+        liquid = results["by_struct"]["liquid"]
+
+        for key in ARRAYS:
+            np.testing.assert_allclose(
+                liquid[key], outputs["cash"][key] + outputs["savings"][key]
+            )
+        assert liquid["assets"] is not outputs["cash"]["assets"]
+        assert liquid["assets"].flags.writeable
+        assert not np.any(shared_zeros(12))
+
+    def test_compact_results_keep_sharing(self, scenario):
+        """Pickled compact results unpickle to the shared arrays."""
+        results = scenario.run(start=date(2026, 1, 1), months=12)
+
+        compact = pickle.loads(pickle.dumps(Scenario._compact_results(results)))
+        restored = scenario._restore_results(compact)
+
+        assert restored["outputs"]["salary"]["assets"] is shared_zeros(12)
+        for key in ARRAYS:
+            np.testing.assert_array_equal(
+                restored["outputs"]["savings"][key], results["outputs"]["savings"][key]
+            )
+
+    def test_archive_writes_zeros_once(self, scenario, tmp_path):
+        """Archives store one zero file per length and load it once."""
+        scenario.run(start=date(2026, 1, 1), months=12)["views"].save(tmp_path / "run")
+        manifest = json.loads((tmp_path / "run" / "manifest.json").read_text())
+        files = {
+            name: manifest["outputs"][name]["liabilities"]
+            for name in ("salary", "savings")
+        }
+        assert files["salary"] == files["savings"]
+
+        loaded = ScenarioResults.load(tmp_path / "run")
+        outputs = loaded._outputs
+        assert outputs["salary"]["liabilities"] is outputs["savings"]["liabilities"]
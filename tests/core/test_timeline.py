@@ -0,0 +1,97 @@
+"""
+Tests for the precomputed scenario timeline.
+"""
+
+import dataclasses
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from finbricklab.core.context import ScenarioContext
+from finbricklab.core.scenario import Scenario
+from finbricklab.core.timeline import Timeline
+from finbricklab.core.utils import month_range
+
+
+class TestTimeline:
+    """Test Timeline conversions and lookups."""
+
+    def test_views_match_per_month_conversions(self):
+        """Each view equals the conversion strategies used to do per month."""
+        t_index = month_range(date(2026, 11, 1), 4)
+        timeline = Timeline.from_index(t_index)
+
+        assert len(timeline) == 4
+        assert timeline.datetimes == tuple(
+            pd.Timestamp(t).to_pydatetime() for t in t_index
+        )
+        assert timeline.dates == tuple(
+            t.astype("datetime64[D]").astype(date) for t in t_index
+        )
+        assert timeline.labels == ("2026-11", "2026-12", "2027-01", "2027-02")
+        assert timeline.period_index.equals(pd.PeriodIndex(t_index, freq="M"))
+        assert timeline.month_index["2027-01"] == 2
+
+    def test_from_period_index(self):
+        """A PeriodIndex gives the same timeline as the datetime64 array."""
+        t_index = month_range(date(2026, 1, 1), 3)
+        from_periods = Timeline.from_index(pd.PeriodIndex(t_index, freq="M"))
+
+        assert from_periods.datetimes == Timeline.from_index(t_index).datetimes
+
+    def test_index_of(self):
+        """Months are found from datetimes, dates, datetime64 and labels."""
+        timeline = Timeline.from_index(month_range(date(2026, 1, 1), 3))
+
+        assert timeline.index_of(datetime(2026, 2, 1)) == 1
+        assert timeline.index_of(date(2026, 3, 15)) == 2
+        assert timeline.index_of(np.datetime64("2026-01-20")) == 0
+        assert timeline.index_of(pd.Period("2026-02", freq="M")) == 1
+        assert timeline.index_of("2026-03-01") == 2
+        assert timeline.index_of(datetime(2027, 1, 1)) is None
+
+    def test_immutable(self):
+        """Fields cannot be reassigned and the months array is read-only."""
+        timeline = Timeline.from_index(month_range(date(2026, 1, 1), 3))
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            timeline.labels = ()
+        with pytest.raises(ValueError):
+            timeline.months[0] = np.datetime64("2030-01")
+
+    def test_context_builds_timeline(self):
+        """A context without an explicit timeline derives it from t_index."""
+        t_index = month_range(date(2026, 1, 1), 2)
+        ctx = ScenarioContext(t_index=t_index, currency="EUR", registry={})
+
+        assert ctx.timeline.labels == ("2026-01", "2026-02")
+
+    def test_tail_matches_sliced_index(self):
+        """A tail equals the timeline built from the sliced time index."""
+        t_index = month_range(date(2026, 11, 1), 5)
+        tail = Timeline.from_index(t_index).tail(2)
+        expected = Timeline.from_index(t_index[2:])
+
+        for name in ("datetimes", "dates", "labels", "month_index"):
+            assert getattr(tail, name) == getattr(expected, name)
+        np.testing.assert_array_equal(tail.months, expected.months)
+        assert tail.period_index.equals(expected.period_index)
+        assert not tail.months.flags.writeable
+
+    def test_delayed_context_shares_run_state(self):
+        """Delayed bricks get a slice of the run timeline and its fingerprints."""
+        t_index = month_range(date(2026, 1, 1), 6)
+        ctx = ScenarioContext(t_index=t_index, currency="EUR", registry={})
+        scenario = Scenario(name="Delayed", bricks=[])
+
+        delayed = scenario._create_delayed_context(ctx, 2)
+
+        assert delayed.fingerprints is ctx.fingerprints
+        assert delayed.timeline.labels == ctx.timeline.labels[2:]
+        assert delayed.timeline.month_index == {
+            "2026-03": 0,
+            "2026-04": 1,
+            "2026-05": 2,
+            "2026-06": 3,
+        }
@@ -0,0 +1,88 @@
+"""
+Tests for the per-brick spec fingerprint used by generate_transaction_id.
+"""
+
+from datetime import date, datetime
+
+import numpy as np
+from finbricklab import ABrick, FBrick, Scenario
+from finbricklab.core.context import ScenarioContext
+from finbricklab.core.journal import TransactionFingerprint, generate_transaction_id
+from finbricklab.core.kinds import K
+
+TIMESTAMP = datetime(2026, 3, 1)
+
+
+class TestTransactionFingerprint:
+    """Test that fingerprints speed up ID generation without changing IDs."""
+
+    def test_ids_match_plain_rendering(self):
+        """IDs with a fingerprint equal IDs rendered from the dicts."""
+        spec = {"amount_monthly": 100.0, "profile": np.linspace(0, 1, 2000)}
+        for links in ({}, {"route": {"to": "cash"}}):
+            fingerprint = TransactionFingerprint(spec, links)
+            for sequence in range(3):
+                assert generate_transaction_id(
+                    "salary", TIMESTAMP, spec, links, sequence, fingerprint
+                ) == generate_transaction_id("salary", TIMESTAMP, spec, links, sequence)
+
+    def test_only_used_for_its_own_dicts(self):
+        """Other spec/links dicts are rendered as before."""
+        spec = {"amount": 1.0}
+        links = {"route": {"to": "cash"}}
+        fingerprint = TransactionFingerprint(spec, links)
+
+        other = {"fee": 2.0}
+        assert generate_transaction_id(
+            "t", TIMESTAMP, other, links, 0, fingerprint
+        ) == generate_transaction_id("t", TIMESTAMP, other, links, 0)
+        assert generate_transaction_id(
+            "t", TIMESTAMP, spec, {}, 0, fingerprint
+        ) == generate_transaction_id("t", TIMESTAMP, spec, {}, 0)
+
+    def test_context_caches_per_brick(self):
+        """The context reuses a fingerprint until the spec object changes."""
+        brick = FBrick(
+            id="salary",
+            name="Salary",
+            kind=K.F_INCOME_RECURRING,
+            spec={"amount_monthly": 100.0},
+        )
+        ctx = ScenarioContext(
+            t_index=np.arange("2026-01", "2026-04", dtype="datetime64[M]"),
+            currency="EUR",
+            registry={},
+        )
+
+        fingerprint = ctx.transaction_fingerprint(brick)
+        assert ctx.transaction_fingerprint(brick) is fingerprint
+
+        brick.spec = {"amount_monthly": 200.0}
+        assert ctx.transaction_fingerprint(brick) is not fingerprint
+
+    def test_simulate_drops_cached_fingerprint(self):
+        """A brick re-renders its spec on every simulation."""
+        cash = ABrick(
+            id="cash",
+            name="Cash",
+            kind=K.A_CASH,
+            spec={"initial_balance": 1000.0, "interest_pa": 0.12},
+        )
+        scenario = Scenario(id="s", name="S", bricks=[cash])
+        results = scenario.run(start=date(2026, 1, 1), months=3)
+        journal = results["journal"]
+        # The run prepared a working copy of the brick
+        (cash,) = results["_scenario_bricks"]
+        ctx = ScenarioContext(
+            t_index=np.arange("2026-01", "2026-04", dtype="datetime64[M]"),
+            currency="EUR",
+            registry={"cash": cash},
+            journal=journal,
+        )
+        stale = ctx.transaction_fingerprint(cash)
+        cash.spec["external_in"] = np.array([0.0, 50.0, 0.0])
+
+        cash.simulate(ctx)
+
+        assert ctx.fingerprints["cash"] is not stale
+        assert "50." in ctx.fingerprints["cash"].spec_str
@@ -0,0 +1,171 @@
+"""
+Smoke tests for the benchmark scenario generator and harness.
+"""
+
+import json
+
+import pytest
+from benchmarks.__main__ import main
+from benchmarks.generator import (
+    BENCH_START,
+    ScenarioShape,
+    generate_entity,
+    generate_scenario,
+)
+from benchmarks.harness import BenchmarkRunner, read_results
+from benchmarks.micro import CASES, compare_results, micro_payload, run_micro
+from finbricklab.core.kinds import K
+
+
+class TestScenarioGenerator:
+    """Test synthetic scenario generation."""
+
+    def test_shape_counts(self):
+        """Brick counts follow the mix and keep two cash accounts for transfers."""
+        shape = ScenarioShape(
+            bricks=10,
+            months=12,
+            mix={"cash": 0, "loan": 1, "etf": 1, "flow": 2, "transfer": 1},
+        )
+        counts = shape.counts()
+        assert counts == {"cash": 2, "loan": 2, "etf": 2, "flow": 4, "transfer": 2}
+
+    def test_generated_scenario_runs_funded(self):
+        """Generated scenarios run and keep every cash account positive."""
+        shape = ScenarioShape(bricks=40, months=60, macro_depth=2, macro_fanout=4)
+        scenario = generate_scenario(shape, seed=3)
+        results = scenario.run(start=BENCH_START, months=shape.months)
+
+        kinds = {brick.kind for brick in scenario.bricks}
+        assert K.L_LOAN_ANNUITY in kinds and K.T_TRANSFER_RECURRING in kinds
+        assert {mb.id.split("_")[1][:3] for mb in scenario.macrobricks} == {
+            "mb1",
+            "mb2",
+        }
+        for brick in scenario.bricks:
+            if brick.kind == K.A_CASH:
+                assert results["outputs"][brick.id]["assets"].min() > 0
+
+    def test_deterministic(self):
+        """The same seed produces the same scenario."""
+        shape = ScenarioShape(bricks=20, months=12)
+        first = generate_scenario(shape, seed=7)
+        second = generate_scenario(shape, seed=7)
+        assert [(b.id, b.spec, b.links) for b in first.bricks] == [
+            (b.id, b.spec, b.links) for b in second.bricks
+        ]
+
+    def test_entity(self):
+        """Generated entities can run and compare their scenarios."""
+        entity = generate_entity(ScenarioShape(bricks=8, months=6), scenarios=3)
+        ids = [scenario.id for scenario in entity.scenarios]
+        entity.run_many(ids, start=BENCH_START, months=6)
+        assert set(entity.compare()["scenario_id"]) == set(ids)
+
+
+class TestBenchmarkHarness:
+    """Test measurement records and the result file."""
+
+    def test_measure_records(self):
+        """Records carry wall times, peak memory and journal size."""
+        runner = BenchmarkRunner(repeat=2)
+        scenario = generate_scenario(ScenarioShape(bricks=8, months=6))
+        runner.measure(
+            "tiny",
+            "run",
+            lambda: scenario.run(start=BENCH_START, months=6),
+            journal_of=lambda res: res["journal"],
+        )
+
+        (record,) = runner.records
+        assert record["wall_time_s"]["repeat"] == 2
+        assert record["wall_time_s"]["min"] <= record["wall_time_s"]["median"]
+        assert record["peak_memory_bytes"] > 0
+        assert record["journal_postings"] >= 2 * record["journal_entries"] > 0
+
+    def test_cli_writes_result_file(self, tmp_path):
+        """The CLI writes a readable result file for the selected workload."""
+        path = tmp_path / "results.json"
+        main(
+            [
+                "-w",
+                "household_40y",
+                "--quick",
+                "-r",
+                "1",
+                "--no-memory",
+                "-o",
+                str(path),
+            ]
+        )
+
+        payload = read_results(path)
+        assert payload["environment"]["finbricklab"]
+        assert [r["operation"] for r in payload["results"]] == [
+            "run",
+            "filter",
+            "journal",
+            "export_run_json",
+            "export_ledger_csv",
+        ]
+
+    def test_read_rejects_other_files(self, tmp_path):
+        """Reading a file that is not a result file fails clearly."""
+        path = tmp_path / "other.json"
+        path.write_text(json.dumps({"format": "other"}))
+        with pytest.raises(ValueError, match="not a FinBrickLab benchmark"):
+            read_results(path)
+
+
+class TestMicroBenchmarks:
+    """Test primitive micro-benchmarks and result comparison."""
+
+    def test_run_records(self):
+        """Every case reports time and allocations per operation."""
+        records = run_micro(list(CASES), repeat=1, min_time=0.0, alloc_ops=20)
+
+        assert [r["name"] for r in records] == list(CASES)
+        for record in records:
+            assert record["ns_per_op"] > 0
+            assert record["alloc_blocks_per_op"] >= 0
+        by_name = {r["name"]: r for r in records}
+        # Each new Amount stays alive in the batch result
+        assert by_name["amount_from_int"]["alloc_blocks_per_op"] >= 1
+
+    def test_unknown_case(self):
+        """Unknown case names are rejected."""
+        with pytest.raises(ValueError, match="Unknown micro-benchmark"):
+            run_micro(["no_such_case"])
+
+    def test_compare_flags_regressions(self):
+        """Slowdowns and new allocations above the threshold are flagged."""
+
+        def record(name, ns, blocks, size):
+            return {
+                "name": name,
+                "ns_per_op": ns,
+                "alloc_blocks_per_op": blocks,
+                "alloc_bytes_per_op": size,
+            }
+
+        base = micro_payload(
+            [
+                record("fast", 100, 1, 64),
+                record("lean", 100, 1, 64),
+                record("old", 1, 0, 0),
+            ]
+        )
+        new = micro_payload(
+            [
+                record("fast", 105, 1, 64),
+                record("lean", 100, 2, 128),
+                record("slow", 1, 0, 0),
+            ]
+        )
+        rows = {row["name"]: row for row in compare_results(base, new, threshold=0.1)}
+
+        assert set(rows) == {"fast", "lean"}
+        assert not rows["fast"]["regressed"]
+        assert rows["lean"]["alloc_regressed"] and not rows["lean"]["time_regressed"]
+        rows = compare_results(base, new, threshold=0.01)
+        assert rows[0]["time_regressed"]
@@ -5,6 +5,7 @@ This module tests the new Entity builder methods that allow creating
 bricks, MacroBricks, and scenarios through the Entity class.
 """
 
+import pickle
 from datetime import date
 
 import pytest
@@ -308,6 +309,11 @@ class TestEntityBuilder:
         assert error.scenario_id == "invalid_scenario"
         assert "nonexistent_brick" in error.problem_ids
 
+        # Survives pickling, e.g. when raised in a run_many worker process
+        restored = pickle.loads(pickle.dumps(error))
+        assert str(restored) == str(error)
+        assert restored.problem_ids == error.problem_ids
+
     def test_unique_id_enforcement(self):
         """Test that duplicate IDs are rejected."""
         entity = Entity(id="person", name="John")
@@ -2,8 +2,10 @@
 Tests for Entity.run_scenario and Entity.run_many methods.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 
+import pandas as pd
 import pytest
 from finbricklab.core.entity import Entity
 from finbricklab.core.kinds import K
@@ -133,3 +135,65 @@ def test_run_scenario_error_message_format():
     assert "Available:" in error_msg
     assert "scenario1" in error_msg
     assert "scenario2" in error_msg
+
+
+def _two_scenario_entity():
+    """Create an entity with two scenarios that differ in salary."""
+    e = Entity(id="e1", name="Test Entity")
+    e.new_ABrick("cash", "Cash", K.A_CASH, {"initial_balance": 1000.0})
+    for brick_id, amount in [("salary", 5000.0), ("raise", 5500.0)]:
+        e.new_FBrick(
+            brick_id,
+            brick_id.title(),
+            K.F_INCOME_RECURRING,
+            {"amount_monthly": amount},
+            links={"route": {"to": "cash"}},
+        )
+    e.create_scenario(
+        "base", "Base", brick_ids=["cash", "salary"], settlement_default_cash_id="cash"
+    )
+    e.create_scenario(
+        "raise", "Raise", brick_ids=["cash", "raise"], settlement_default_cash_id="cash"
+    )
+    return e
+
+
+def test_run_many_parallel_matches_sequential():
+    """Test that run_many with workers returns the sequential results in order."""
+    ids = ["raise", "base"]
+    sequential = _two_scenario_entity().run_many(ids, start=date(2026, 1, 1), months=6)
+    parallel = _two_scenario_entity().run_many(
+        ids, start=date(2026, 1, 1), months=6, workers=2
+    )
+
+    assert list(parallel) == ids
+    for sid in ids:
+        assert list(parallel[sid]) == list(sequential[sid])
+        pd.testing.assert_frame_equal(
+            parallel[sid]["totals"], sequential[sid]["totals"]
+        )
+        assert type(parallel[sid]["journal"]) is type(sequential[sid]["journal"])
+        assert [e.id for e in parallel[sid]["journal"].entries] == [
+            e.id for e in sequential[sid]["journal"].entries
+        ]
+        pd.testing.assert_frame_equal(
+            parallel[sid]["views"].monthly(), sequential[sid]["views"].monthly()
+        )
+
+
+def test_run_many_with_executor():
+    """Test that run_many submits to a caller-provided executor."""
+    e = _two_scenario_entity()
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        results = e.run_many(
+            ["base", "raise"], start=date(2026, 1, 1), months=2, executor=pool
+        )
+    assert results["raise"]["totals"]["cash_in"].iloc[0] == 5500.0
+    assert e.get_scenario("raise")._last_results is results["raise"]
+
+
+def test_run_many_parallel_missing_id():
+    """Test that the parallel path raises the same error for a missing ID."""
+    e = _two_scenario_entity()
+    with pytest.raises(ValueError, match="not found in Entity 'e1'"):
+        e.run_many(["base", "nope"], start=date(2026, 1, 1), months=1, workers=2)
@@ -195,3 +195,80 @@ class TestValuationCash:
         # Should raise ValueError for negative min buffer
         with pytest.raises(ValueError, match="min_buffer must be >= 0"):
             strategy.prepare(brick, ctx)
+
+    def test_cash_balance_recurrence_with_window(self):
+        """Balances follow the monthly recurrence and stay zero outside the window."""
+        inflows = np.linspace(0.0, 1100.0, 12)
+        outflows = np.full(12, 400.0)
+        post_in = np.zeros(12)
+        post_in[6] = 250.0
+        brick = ABrick(
+            id="cash",
+            name="Test Cash",
+            kind="a.cash",
+            start_date=date(2026, 3, 1),
+            end_date=date(2026, 10, 1),
+            spec={
+                "initial_balance": 1000.0,
+                "interest_pa": 0.03,
+                "external_in": inflows,
+                "external_out": outflows,
+                "post_interest_in": post_in,
+            },
+        )
+        ctx = ScenarioContext(
+            t_index=month_range(date(2026, 1, 1), 12),
+            currency="EUR",
+            registry={},
+            journal=Journal(AccountRegistry()),
+        )
+
+        strategy = ValuationCash()
+        strategy.prepare(brick, ctx)
+        result = strategy.simulate(brick, ctx)
+
+        r_m = 0.03 / 12
+        expected = np.zeros(12)
+        balance = 1000.0
+        for t in range(2, 10):
+            balance = (balance + inflows[t] - outflows[t]) * (1 + r_m) + post_in[t]
+            expected[t] = balance
+        np.testing.assert_allclose(result["assets"], expected, rtol=1e-12)
+        assert np.all(result["interest"][[0, 1, 10, 11]] == 0)
+        assert len(ctx.journal.entries) == 8  # one interest entry per active month
+
+    def test_cash_overdraft_policies(self, caplog):
+        """Breaches are checked per month: 'warn' logs each, 'raise' the first."""
+        from finbricklab.core.errors import ConfigError
+
+        def simulate(policy):
+            brick = ABrick(
+                id="cash",
+                name="Test Cash",
+                kind="a.cash",
+                spec={
+                    "initial_balance": 100.0,
+                    "external_out": np.array([0.0, 300.0, 0.0, 0.0, -500.0, 0.0]),
+                    "overdraft_limit": 50.0,
+                    "overdraft_policy": policy,
+                },
+            )
+            ctx = ScenarioContext(
+                t_index=month_range(date(2026, 1, 1), 6),
+                currency="EUR",
+                registry={},
+                journal=Journal(AccountRegistry()),
+            )
+            strategy = ValuationCash()
+            strategy.prepare(brick, ctx)
+            return strategy.simulate(brick, ctx)
+
+        with caplog.at_level("WARNING"):
+            simulate("warn")
+        breaches = [
+            r for r in caplog.records if "overdraft_limit exceeded" in r.message
+        ]
+        assert [r.args[1] for r in breaches] == [1, 2, 3]
+
+        with pytest.raises(ConfigError, match="exceeded at month 1"):
+            simulate("raise")
@@ -5,8 +5,11 @@ Tests for ETF unitized strategy math invariants.
 from datetime import date
 
 import numpy as np
+import pytest
+from finbricklab.core.accounts import AccountRegistry
 from finbricklab.core.bricks import ABrick
 from finbricklab.core.context import ScenarioContext
+from finbricklab.core.journal import Journal
 from finbricklab.core.kinds import K
 from finbricklab.core.scenario import Scenario
 from finbricklab.strategies.valuation.security_unitized import ValuationSecurityUnitized
@@ -462,3 +465,95 @@ class TestETFScenarioIntegration:
         from finbricklab.core.scenario import validate_run
 
         validate_run(results, mode="warn")  # Should not raise
+
+
+def _mc_brick():
+    return ABrick(
+        id="etf",
+        name="Test ETF",
+        kind=K.A_SECURITY_UNITIZED,
+        end_date=date(2030, 6, 1),
+        spec={
+            "initial_units": 10.0,
+            "price0": 100.0,
+            "drift_pa": 0.05,
+            "volatility_pa": 0.18,
+            "seed": 7,
+            "div_yield_pa": 0.02,
+            "buy_at_start": {"amount": 5000.0},
+            "dca": {"mode": "amount", "amount": 300.0, "annual_step_pct": 0.03},
+            "sell": [{"date": date(2028, 3, 1), "percentage": 0.25}],
+            "sdca": {"mode": "units", "units": 2.0, "start_offset_m": 36},
+            "liquidate_on_window_end": True,
+            "sell_fees_pct": 0.01,
+        },
+    )
+
+
+def _mc_context():
+    t_index = np.arange("2026-01", "2031-01", dtype="datetime64[M]")
+    return ScenarioContext(
+        t_index=t_index,
+        currency="EUR",
+        registry={},
+        journal=Journal(AccountRegistry()),
+    )
+
+
+class TestETFMonteCarlo:
+    """Test the vectorized Monte Carlo mode."""
+
+    def test_first_path_matches_simulate(self):
+        """With the spec seed, path 0 reproduces the single-path simulation."""
+        strategy = ValuationSecurityUnitized()
+        ctx = _mc_context()
+        etf = _mc_brick()
+        strategy.prepare(etf, ctx)
+        single = strategy.simulate(etf, ctx)
+
+        paths = strategy.simulate_paths(etf, _mc_context(), paths=50)
+
+        np.testing.assert_allclose(paths["value"][0], single["assets"], rtol=1e-9)
+        cash = np.zeros(len(ctx.t_index))
+        for entry in ctx.journal.entries:
+            for posting in entry.postings:
+                if posting.account_id == "a:cash":
+                    month = np.datetime64(entry.timestamp, "M") - ctx.t_index[0]
+                    cash[month.astype(int)] += float(posting.amount.value)
+        # Journal amounts are rounded to cents per entry
+        np.testing.assert_allclose(paths["cash_flow"][0], cash, atol=0.02)
+
+    def test_shapes_and_bands(self):
+        """Arrays are (paths, months) and bands are ordered percentiles."""
+        strategy = ValuationSecurityUnitized()
+        ctx = _mc_context()
+        etf = _mc_brick()
+        strategy.prepare(etf, ctx)
+
+        out = strategy.simulate_paths(etf, ctx, paths=500, seed=1)
+
+        for key in ("price", "units", "value", "cash_flow", "net_worth"):
+            assert out[key].shape == (500, 60)
+        assert sorted(out["bands"]) == [5.0, 25.0, 50.0, 75.0, 95.0]
+        assert np.all(out["bands"][5.0] <= out["bands"][50.0])
+        assert np.all(out["bands"][50.0] <= out["bands"][95.0])
+        # Liquidated at window end: value zero, proceeds in net worth
+        assert np.all(out["value"][:, 53:] == 0.0)
+        np.testing.assert_allclose(
+            out["net_worth"][:, -1], out["cash_flow"].sum(axis=1)
+        )
+        assert ctx.journal.entries == []
+
+    def test_zero_volatility_paths_are_identical(self):
+        """Without volatility every path follows the drift."""
+        strategy = ValuationSecurityUnitized()
+        ctx = _mc_context()
+        etf = _mc_brick()
+        etf.spec["volatility_pa"] = 0.0
+        strategy.prepare(etf, ctx)
+
+        out = strategy.simulate_paths(etf, ctx, paths=3)
+
+        np.testing.assert_array_equal(out["value"], out["value"][[0, 0, 0]])
+        with pytest.raises(ValueError, match="paths must be >= 1"):
+            strategy.simulate_paths(etf, ctx, paths=0)